@@ -0,0 +1,19 @@
+-- Migration 019: Keyset pagination index for messages
+-- Created: 2026-10-18
+-- Purpose: (created_at, id) 복합 커서 페이지네이션을 인덱스 범위 스캔으로 처리
+
+BEGIN;
+
+-- ============================================
+-- 1. 인덱스 생성
+-- ============================================
+
+-- conversation_id + created_at + id 복합 인덱스
+-- (커서 조건 "created_at < T OR (created_at = T AND id < ID)" 및 최근 N개 조회 최적화)
+CREATE INDEX IF NOT EXISTS idx_messages_conversation_time_id
+ON public.messages (conversation_id, created_at DESC, id DESC);
+
+-- 기존 (conversation_id, created_at DESC) 인덱스는 위 인덱스의 prefix이므로 제거
+DROP INDEX IF EXISTS idx_messages_conversation_time;
+
+COMMIT;
@@ -0,0 +1,24 @@
+-- Migration 020: Chunk lookup indexes for diff-based embedding upsert
+-- Created: 2026-10-18
+-- Purpose: ingest/upsert_vector.py가 문서별 기존 청크(doc_id)와 동일 내용 청크(content_hash)를
+--          컬렉션 내에서 조회할 때 langchain_pg_embedding 전체 스캔 방지
+
+BEGIN;
+
+-- ============================================
+-- 1. 인덱스 생성
+-- ============================================
+
+-- 문서별 기존 청크 조회 (diff 업서트 / 문서 삭제)
+CREATE INDEX IF NOT EXISTS idx_langchain_pg_embedding_doc_id
+ON public.langchain_pg_embedding (collection_id, (cmetadata->>'doc_id'));
+
+-- 동일 내용 청크의 임베딩 재사용 조회
+CREATE INDEX IF NOT EXISTS idx_langchain_pg_embedding_content_hash
+ON public.langchain_pg_embedding (collection_id, (cmetadata->>'content_hash'));
+
+-- 청크 ID(custom_id) 기반 삭제/메타데이터 갱신
+CREATE INDEX IF NOT EXISTS idx_langchain_pg_embedding_custom_id
+ON public.langchain_pg_embedding (custom_id);
+
+COMMIT;
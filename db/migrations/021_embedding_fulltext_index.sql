@@ -0,0 +1,16 @@
+-- Migration 021: Full-text index for hybrid retrieval
+-- Created: 2026-10-18
+-- Purpose: core/hybrid_retriever.py의 전문 검색(to_tsvector('simple', document) @@ prefix tsquery)이
+--          langchain_pg_embedding 전체 스캔 없이 GIN 인덱스를 사용하도록 함
+
+BEGIN;
+
+-- ============================================
+-- 1. 인덱스 생성
+-- ============================================
+
+-- 청크 본문 전문 검색 (식이 쿼리와 동일해야 인덱스 사용)
+CREATE INDEX IF NOT EXISTS idx_langchain_pg_embedding_document_fts
+ON public.langchain_pg_embedding USING GIN (to_tsvector('simple', document));
+
+COMMIT;
@@ -0,0 +1,47 @@
+-- Migration 022: LLM response cache
+-- Created: 2026-10-18
+-- Purpose: core/llm_cache.py가 (모델, 파라미터, 정규화된 프롬프트 해시) 기준으로
+--          리포트 초안/검증 응답을 워커 및 재시작 간에 공유 (expires_at 기준 TTL)
+
+BEGIN;
+
+-- ============================================
+-- 1. 테이블 생성
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS v2_llm_response_cache (
+    cache_key TEXT PRIMARY KEY,                    -- sha256(모델 + 파라미터 + 프롬프트 해시)
+    request_model TEXT NOT NULL,                   -- 요청 모델 (예: gpt-4o-mini)
+    model TEXT NOT NULL,                           -- 실제 응답 모델 (폴백 시 다를 수 있음)
+    content TEXT NOT NULL,                         -- 최종 응답
+    input_tokens INTEGER NOT NULL DEFAULT 0,       -- 추정 입력 토큰 (절약 비용 계산용)
+    output_tokens INTEGER NOT NULL DEFAULT 0,      -- 추정 출력 토큰
+
+    hit_count INTEGER NOT NULL DEFAULT 0,          -- 캐시 히트 횟수
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,  -- 만료 시간
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    last_accessed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- ============================================
+-- 2. 인덱스 생성
+-- ============================================
+
+-- 만료된 캐시 정리
+CREATE INDEX IF NOT EXISTS idx_v2_llm_response_cache_expires
+ON v2_llm_response_cache (expires_at);
+
+-- ============================================
+-- 3. RLS (백엔드 서비스 역할 전용)
+-- ============================================
+
+ALTER TABLE v2_llm_response_cache ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role can manage llm response cache"
+    ON v2_llm_response_cache FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
+COMMIT;
@@ -1,21 +1,20 @@
 """ZipCheck AI FastAPI 애플리케이션."""
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Literal
 
 from fastapi import FastAPI, UploadFile, Form, HTTPException, status, Depends
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-import sentry_sdk
-from sentry_sdk.integrations.fastapi import FastApiIntegration
 
 from uuid import UUID, uuid4
 
 # 보안 모듈 임포트
 from core.auth import get_current_user, get_optional_user, require_admin
 from core.settings import settings
-from core.chains import build_contract_analysis_chain, single_model_analyze
 from core.database import (
     get_session_maker,
     create_contract,
@@ -23,8 +22,6 @@ from core.database import (
     update_contract_status,
 )
 from core.guardrails import check_question
-from ingest.pdf_parse import parse_pdf_to_text, validate_pdf
-from ingest.upsert_vector import upsert_contract_text
 from ingest.validators import (
     validate_pdf_file,
     validate_contract_id,
@@ -43,15 +40,15 @@ from routes.sms import router as sms_router
 # from routes.realestate import router as realestate_router
 from routes.chat import router as chat_router  # 채팅 라우터
 from routes.chat_orchestrator import router as chat_v2_router  # v2 GPT 채팅
-from routes.crawler_test import router as crawler_test_router  # 크롤러 테스트 (관리자)
 from routes.case import router as case_router  # 케이스 관리 API
 from routes.analysis import router as analysis_router  # 분석 오케스트레이터
 from routes.report import router as report_router  # 리포트 API
 from routes.report import router_single as report_router_single  # 단수 경로 호환
 from routes.parse import router as parse_router  # 파서 API (가이드 호환)
 from routes.public_data import router as public_data_router  # 공공 데이터 수집 API
-from routes.dev import router as dev_router  # Dev API (디버깅 전용)
-from routes.api_tester import router as api_tester_router  # API 테스터 (Step 2)
+# ⚡ Cold start: LangChain/PGVector/PyMuPDF 등 무거운 모듈은 엔드포인트 첫 호출 시 로드
+#    (core.chains, ingest.pdf_parse, ingest.upsert_vector) - scripts/startup_profile.py로 측정
+#    Dev/테스트 라우터는 설정 플래그로만 등록 (아래 라우터 등록 참고)
 
 # 로깅 설정
 logging.basicConfig(
@@ -61,8 +58,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Sentry 초기화
+# Sentry 초기화 (DSN 설정 시에만 SDK 로드)
 if settings.sentry_dsn:
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+
     sentry_sdk.init(
         dsn=settings.sentry_dsn,
         integrations=[FastApiIntegration()],
@@ -83,11 +83,24 @@ async def lifespan(app: FastAPI):
     logger.info(f"Primary LLM: {settings.primary_llm}")
     logger.info(f"Judge LLM: {settings.judge_llm}")
     logger.info(f"Embedding Model: {settings.embed_model}")
-    logger.info("=== 서비스 준비 완료 ===")
+
+    # 워밍업: 포트는 바로 열고 백그라운드에서 병렬 초기화 → 완료 시 /ready 200
+    warmup_task = None
+    if settings.warmup_enabled:
+        from core.warmup import run_warmup
+
+        warmup_task = asyncio.create_task(run_warmup())
+    logger.info("=== 서비스 시작 완료 (준비 상태: GET /ready) ===")
 
     yield
 
     # 종료 시
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
+    from core.llm_clients import close_llm_clients
+
+    await close_llm_clients()
     logger.info("ZipCheck AI 서비스 종료")
 
 
@@ -125,15 +138,24 @@ app.include_router(apt_trade_router)
 # 크롤러는 독립 서비스로 운영: https://github.com/Taewoong-Hong/zipcheck_rawl
 app.include_router(chat_router)  # 채팅 API
 app.include_router(chat_v2_router)  # v2 GPT 채팅
-app.include_router(crawler_test_router)  # 크롤러 테스트 (관리자 전용)
 app.include_router(case_router)  # 케이스 관리 API
 app.include_router(analysis_router)  # 분석 오케스트레이터
 app.include_router(report_router)  # 리포트 API
 app.include_router(report_router_single)  # /report/:id 호환 라우트
 app.include_router(parse_router)  # /parse/*
 app.include_router(public_data_router)  # /fetch/public
-app.include_router(dev_router)  # Dev API (디버깅 전용)
-app.include_router(api_tester_router)  # API 테스터 (Step 2 - 공공데이터 API 테스트)
+
+# Dev/테스트 라우터 (ENABLE_DEV_ROUTES / ENABLE_TEST_ROUTES)
+if settings.enable_dev_routes:
+    from routes.dev import router as dev_router
+
+    app.include_router(dev_router)  # Dev API (디버깅 전용)
+if settings.enable_test_routes:
+    from routes.api_tester import router as api_tester_router
+    from routes.crawler_test import router as crawler_test_router
+
+    app.include_router(crawler_test_router)  # 크롤러 테스트 (관리자 전용)
+    app.include_router(api_tester_router)  # API 테스터 (Step 2 - 공공데이터 API 테스트)
 
 
 # Pydantic 모델
@@ -150,6 +172,8 @@ class IngestResponse(BaseModel):
     contract_id: str
     length: int
     chunks: int
+    chunks_embedded: int = 0  # 임베딩 API로 새로 계산한 청크
+    chunks_skipped: int = 0  # 저장된 동일 청크 재사용/변경 없음
 
 
 class AnalyzeRequest(BaseModel):
@@ -199,6 +223,27 @@ async def health_check():
     )
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    레디니스 체크 엔드포인트.
+
+    워밍업(core/warmup.py)이 끝나기 전에는 503을 반환합니다.
+    Cloud Run startup probe를 이 경로로 설정하면 워밍업 완료 후에 트래픽이 들어옵니다.
+    `/health`는 프로세스 생존 확인(liveness)용으로 그대로 사용합니다.
+
+    Returns:
+        준비 여부 + 워밍업 단계별 상태/소요 시간
+    """
+    from core.warmup import get_warmup_state
+
+    state = get_warmup_state()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if state.ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=state.to_dict(),
+    )
+
+
 @app.post("/ingest", response_model=IngestResponse)
 async def ingest_contract(
     file: UploadFile,
@@ -304,6 +349,8 @@ async def ingest_contract(
 
         # 2. PDF 파싱
         try:
+            from ingest.pdf_parse import parse_pdf_to_text
+
             text = parse_pdf_to_text(str(temp_path))
 
             # 최소 텍스트 길이 검증
@@ -367,7 +414,10 @@ async def ingest_contract(
             "doc_id": str(document.id),
         }
         try:
-            chunks = upsert_contract_text(contract_id, text, metadata)
+            from ingest.upsert_vector import upsert_contract_text
+
+            upsert_report = upsert_contract_text(contract_id, text, metadata)
+            chunks = upsert_report.total_chunks
         except Exception as e:
             logger.error(f"벡터 DB 업서트 실패: {e}")
             update_contract_status(db_session, contract_db_id, "failed")
@@ -381,7 +431,7 @@ async def ingest_contract(
 
         logger.info(
             f"인제스트 완료: contract_id={contract_id}, "
-            f"db_id={contract_db_id}, 길이={len(text)}, 청크={chunks}"
+            f"db_id={contract_db_id}, 길이={len(text)}, {upsert_report.summary()}"
         )
 
         return IngestResponse(
@@ -389,6 +439,8 @@ async def ingest_contract(
             contract_id=contract_id,
             length=len(text),
             chunks=chunks,
+            chunks_embedded=upsert_report.embedded,
+            chunks_skipped=upsert_report.skipped,
         )
 
     except HTTPException:
@@ -455,38 +507,35 @@ async def analyze_contract(
 
     try:
         if request.mode == "single":
-            # 단일 모델 분석 (sources 포함) - 3회 재시도 + 타임아웃
-            import asyncio
-
-            async def run_once():
-                loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(
-                    None,
-                    lambda: single_model_analyze(
+            # 단일 모델 분석 (sources 포함) - 재시도 + 요청 기한
+            # 비동기 호출이라 시간 초과 시 진행 중인 LLM 요청도 취소됨 (실행기 스레드 없음)
+            from core.chains import asingle_model_analyze
+            from core.llm_router import call_with_deadline
+
+            try:
+                result = await call_with_deadline(
+                    lambda: asingle_model_analyze(
                         question=request.question,
                         provider=request.provider,
                     ),
+                    attempts=settings.analyze_max_attempts,
+                    attempt_timeout_sec=settings.analyze_attempt_timeout_sec,
+                    deadline_sec=settings.analyze_deadline_sec,
+                    label="LLM analyze",
                 )
-
-            last_err = None
-            for attempt in range(1, 4):
-                try:
-                    result = await asyncio.wait_for(run_once(), timeout=40)
-                    return AnalyzeResponse(
-                        answer=result["answer"],
-                        mode="single",
-                        provider=request.provider or settings.primary_llm,
-                        sources=[SourceInfo(**s) for s in result.get("sources", [])],
-                    )
-                except Exception as e:
-                    last_err = e
-                    logger.warning(f"LLM analyze attempt {attempt} failed: {e}")
-                    await asyncio.sleep(min(1 * attempt, 3))
+                return AnalyzeResponse(
+                    answer=result["answer"],
+                    mode="single",
+                    provider=request.provider or settings.primary_llm,
+                    sources=[SourceInfo(**s) for s in result.get("sources", [])],
+                )
+            except Exception as e:
+                logger.warning(f"LLM analyze 최종 실패: {e}")
 
             # 최종 실패: 프론트에서 새로고침/재시도 버튼을 노출할 수 있도록 503 반환
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="분석이 지연되고 있습니다. 잠시 후 새로고침하여 다시 시도해주세요 (최대 3회 재시도 실패)",
+                detail=f"분석이 지연되고 있습니다. 잠시 후 새로고침하여 다시 시도해주세요 (최대 {settings.analyze_max_attempts}회 재시도 실패)",
             )
 
         elif request.mode == "consensus":
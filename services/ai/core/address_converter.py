@@ -9,10 +9,20 @@ PDF에서 파싱된 한글 주소를 공공데이터 API가 요구하는 형식
 - bun: 본번 (예: "12")
 - ji: 지번 (예: "3")
 - lawd_cd: 법정동코드 5자리 (실거래가 API용)
+
+같은 주소가 공공데이터 수집, API 테스터, 분석 재실행에서 반복 변환되므로
+정규화된 주소 기준으로 정규식 파싱 / JusoAPI / 법정동코드 조회 / 변환 결과를
+프로세스 단위 캐시(TTL + 최대 항목 수)에 보관합니다.
 """
+import asyncio
+import copy
+import dataclasses
 import re
 import logging
-from typing import Optional, Dict, Any, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from pydantic import BaseModel
 import httpx
@@ -20,6 +30,75 @@ import httpx
 logger = logging.getLogger(__name__)
 
 
+def normalize_address(address: str) -> str:
+    """캐시 키용 주소 정규화 (공백 축약 - 정규식 파싱과 같은 기준)"""
+    return " ".join(address.split())
+
+
+class AddressCache:
+    """(종류, 정규화 주소) → 결과 LRU 캐시 (TTL + 최대 항목 수)"""
+
+    def __init__(self, max_size: int = 4096, ttl_sec: float = 86400.0):
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_sec:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+_cache: Optional[AddressCache] = None
+
+
+def get_address_cache() -> AddressCache:
+    global _cache
+    if _cache is None:
+        from core.settings import settings
+
+        _cache = AddressCache(settings.address_cache_size, settings.address_cache_ttl_sec)
+    return _cache
+
+
+def clear_address_cache() -> None:
+    get_address_cache().clear()
+
+
 @dataclass
 class ParsedAddress:
     """파싱된 주소 구조체"""
@@ -97,6 +176,7 @@ class AddressConverter:
         self.juso_api_key = juso_api_key or settings.keyword_juso_api_key
         self.public_data_api_key = public_data_api_key or settings.public_data_api_key
         self.client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[tuple, "asyncio.Future"] = {}
 
     async def __aenter__(self):
         self.client = httpx.AsyncClient(timeout=30.0)
@@ -115,6 +195,15 @@ class AddressConverter:
         - 지번주소: "서울특별시 강남구 역삼동 123-45"
         - 복합주소: "경기도 파주시 법원읍 동문리 356-2"
         """
+        key = ("parse", normalize_address(address))
+        cached = get_address_cache().get(key)
+        if cached is None:
+            cached = self._parse_address_regex(address)
+            get_address_cache().put(key, cached)
+        # 호출자가 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return dataclasses.replace(cached, raw_address=address)
+
+    def _parse_address_regex(self, address: str) -> ParsedAddress:
         parsed = ParsedAddress(raw_address=address)
 
         # 정규화: 여러 공백을 하나로
@@ -234,6 +323,9 @@ class AddressConverter:
             logger.warning("JUSO_API_KEY not configured")
             return None
 
+        return await self._memoized(("juso", normalize_address(address)), lambda: self._fetch_juso(address))
+
+    async def _fetch_juso(self, address: str) -> Optional[Dict[str, Any]]:
         if not self.client:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
@@ -287,6 +379,11 @@ class AddressConverter:
                 "sggCd": "390"
             }
         """
+        return await self._memoized(
+            ("legal_dong", normalize_address(address)), lambda: self._fetch_legal_dong_code(address)
+        )
+
+    async def _fetch_legal_dong_code(self, address: str) -> Optional[Dict[str, Any]]:
         from core.public_data_api import LegalDongCodeAPIClient
 
         if not self.client:
@@ -309,6 +406,37 @@ class AddressConverter:
             logger.error(f"LegalDongCode lookup failed: {e}")
             return None
 
+    async def _memoized(self, key: tuple, fetch) -> Optional[Dict[str, Any]]:
+        """
+        캐시 → 진행 중인 같은 조회 공유 → API 조회 순
+
+        convert_many에서 같은 동(洞)의 주소들이 동시에 같은 키워드를 조회하면 API는 1회만 호출됩니다.
+        공유 조회는 처음 요청한 쪽이 취소되어도 계속 실행됩니다.
+        실패(None)는 캐시하지 않습니다 (일시 오류 후 재시도 가능).
+        """
+        cached = get_address_cache().get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            async def load() -> Optional[Dict[str, Any]]:
+                try:
+                    result = await fetch()
+                finally:
+                    self._inflight.pop(key, None)
+                if result is not None:
+                    get_address_cache().put(key, result)
+                return result
+
+            pending = asyncio.ensure_future(load())
+            # 기다리는 호출이 모두 취소된 뒤 실패해도 "exception was never retrieved" 경고 없이 종료
+            pending.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = pending
+
+        # 호출자가 수정해도 캐시 / 같은 조회를 기다린 다른 호출의 결과가 오염되지 않도록 복사본 반환
+        return copy.deepcopy(await asyncio.shield(pending))
+
     def extract_codes_from_bdMgtSn(self, bd_mgt_sn: str) -> Tuple[str, str, str, str]:
         """
         건물관리번호에서 코드 추출
@@ -369,6 +497,68 @@ class AddressConverter:
         Returns:
             AddressConvertResult: 변환 결과
         """
+        key = ("convert", normalize_address(address), use_juso_api)
+        cached = get_address_cache().get(key)
+        if cached is not None:
+            logger.info(f"주소 변환 캐시 적중: {address}")
+            return cached.model_copy(deep=True)
+
+        result = await self._convert(address, use_juso_api)
+        if result.success:
+            get_address_cache().put(key, result.model_copy(deep=True))
+        return result
+
+    async def convert_many(
+        self,
+        addresses: List[str],
+        use_juso_api: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> List[AddressConvertResult]:
+        """
+        여러 주소 일괄 변환 (대량 케이스 등록용)
+
+        정규화 기준으로 중복을 제거하고, 캐시에 없는 주소만 동시에 조회합니다
+        (동시 조회 수는 max_concurrency로 제한 - 공공데이터 API 호출 한도 보호).
+
+        Args:
+            addresses: 한글 주소 목록
+            use_juso_api: JusoAPI 사용 여부
+            max_concurrency: 동시 조회 수 (기본값: settings.address_max_concurrency)
+
+        Returns:
+            입력 순서대로 AddressConvertResult 목록
+        """
+        from core.settings import settings
+
+        unique: Dict[str, str] = {}
+        for address in addresses:
+            unique.setdefault(normalize_address(address), address)
+
+        semaphore = asyncio.Semaphore(max_concurrency or settings.address_max_concurrency)
+
+        async def convert_one(address: str) -> AddressConvertResult:
+            async with semaphore:
+                try:
+                    return await self.convert(address, use_juso_api=use_juso_api)
+                except Exception as e:
+                    logger.error(f"주소 변환 오류: {address}: {e}")
+                    return AddressConvertResult(success=False, error=str(e))
+
+        owns_client = self.client is None
+        if owns_client:
+            self.client = httpx.AsyncClient(timeout=30.0)
+        try:
+            converted = await asyncio.gather(*(convert_one(address) for address in unique.values()))
+        finally:
+            if owns_client:
+                await self.client.aclose()
+                self.client = None
+
+        by_key = dict(zip(unique, converted))
+        logger.info(f"주소 일괄 변환: {len(addresses)}개 (고유 {len(unique)}개), 캐시 {get_address_cache().stats()}")
+        return [by_key[normalize_address(address)].model_copy(deep=True) for address in addresses]
+
+    async def _convert(self, address: str, use_juso_api: bool) -> AddressConvertResult:
         logger.info(f"주소 변환 시작: {address}")
 
         # Step 1: 정규식 파싱 (본번/지번 추출)
@@ -474,8 +664,6 @@ async def convert_address(address: str) -> AddressConvertResult:
 
 # 테스트용
 if __name__ == "__main__":
-    import asyncio
-
     async def test():
         test_addresses = [
             "경기도 파주시 하우고개길 356",
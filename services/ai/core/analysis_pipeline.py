@@ -12,7 +12,6 @@ SSE 스트리밍이나 LLM 호출과 무관한 순수 데이터 처리 레이어
 import logging
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +37,11 @@ class AnalysisContext:
     registry_data: Optional[Any] = None  # RegistryData 객체 (내부 분석용)
 
     # 공공 데이터 조회 결과
-    property_value_estimate: Optional[int] = None  # 평균 실거래가 (만원)
-    jeonse_market_average: Optional[int] = None  # 전세 시장 평균 (만원)
+    property_value_estimate: Optional[int] = None  # 비교사례 매매 시세 (만원)
+    jeonse_market_average: Optional[int] = None  # 비교사례 전세 시세 (만원)
     recent_transactions: List[Dict[str, Any]] = None  # 최근 거래 내역
+    market_stats: Optional[Any] = None  # 매매 MarketStats (비교 범위/표본 수)
+    jeonse_stats: Optional[Any] = None  # 전세 MarketStats
 
     # 리스크 분석 결과
     risk_result: Optional[Any] = None  # RiskAnalysisResult 객체
@@ -48,6 +49,7 @@ class AnalysisContext:
 
     # LLM 프롬프트 (생성만, 실행은 llm_streaming.py에서)
     llm_prompt: Optional[str] = None
+    prompt_budget: Optional[Dict[str, Any]] = None  # 섹션별 토큰 계산 (PromptBudget.to_dict())
 
     def __post_init__(self):
         """초기화 후 검증"""
@@ -178,33 +180,22 @@ async def _fetch_public_data(context: AnalysisContext) -> None:
     """
     공공데이터 조회 단계
 
-    법정동코드 조회 → 실거래가 조회 → property_value 추정
+    법정동코드 조회 → 실거래가 조회 → 비교사례 시세 추정 (core/market_query)
     결과는 context.property_value_estimate, context.recent_transactions에 저장됩니다.
+
+    상품(아파트/오피스텔/빌라/단독)은 case metadata.property_type, 없으면 주소로 추정하고
+    그래도 모르면 주거 상품을 동시에 조회해 비교사례가 가장 가까운 상품을 사용합니다.
     """
-    from core.public_data_api import AptTradeAPIClient, AptRentAPIClient, LegalDongCodeAPIClient
+    from core.public_data_api import LegalDongCodeAPIClient
+    from core.market_query import query_market
     from core.settings import settings
     import httpx
 
     logger.info(f"🔍 [3/6] 공공데이터 조회 시작")
 
-    # 헬퍼 함수들 (analysis.py에서 추출)
-    def get_previous_month(year: int, month: int, months_back: int = 1) -> str:
-        """이전 월 계산 (YYYYMM 형식)"""
-        from datetime import datetime
-        from dateutil.relativedelta import relativedelta
-        current_date = datetime(year, month, 1)
-        target_date = current_date - relativedelta(months=months_back)
-        return f"{target_date.year}{target_date.month:02d}"
-
-    def calculate_average_exclude_outliers(amounts: list[int]) -> Optional[int]:
-        """최댓값/최솟값 제외 평균 계산"""
-        if len(amounts) <= 2:
-            return sum(amounts) // len(amounts) if amounts else None
-        sorted_amounts = sorted(amounts)
-        filtered_amounts = sorted_amounts[1:-1]
-        if not filtered_amounts:
-            return None
-        return sum(filtered_amounts) // len(filtered_amounts)
+    address = context.case['property_address']
+    area_m2 = context.registry_doc.area_m2 if context.registry_doc else None
+    property_type = context.case.get('metadata', {}).get('property_type')
 
     async with httpx.AsyncClient() as client:
         # 법정동 코드 조회
@@ -213,7 +204,7 @@ async def _fetch_public_data(context: AnalysisContext) -> None:
             client=client
         )
         legal_dong_result = await legal_dong_client.get_legal_dong_code(
-            keyword=context.case['property_address']
+            keyword=address
         )
 
         lawd_cd = None
@@ -225,85 +216,45 @@ async def _fetch_public_data(context: AnalysisContext) -> None:
             logger.warning(f"⚠️ [3/6] 법정동코드 조회 실패")
             return
 
-        now = datetime.now()
-        contract_type = context.case.get('contract_type', '전세')
-
-        # 전세/월세: 듀얼 API (전세 6개월 + 매매 3개월)
-        if contract_type in ["전세", "월세"]:
-            logger.info(f"📊 [3/6] 듀얼 API - 전세(6개월) + 매매(3개월) 조회")
+    contract_type = context.case.get('contract_type', '전세')
 
-            # (1) 전세 실거래가 조회
-            apt_rent_client = AptRentAPIClient(
-                api_key=settings.public_data_api_key,
-                client=client
-            )
+    # 실거래가: 로컬 웨어하우스 우선 (확정된 과거 월은 API 호출 없음)
+    # 전세/월세: 전세 6개월 + 매매 3개월
+    if contract_type in ["전세", "월세"]:
+        logger.info(f"📊 [3/6] 전세(6개월) + 매매(3개월) 조회")
 
-            jeonse_amounts = []
-            for months_back in range(6):
-                deal_ymd = get_previous_month(now.year, now.month, months_back)
-                try:
-                    rent_result = await apt_rent_client.get_apt_rent_transactions(
-                        lawd_cd=lawd_cd,
-                        deal_ymd=deal_ymd
-                    )
-                    if rent_result['body']['items']:
-                        for item in rent_result['body']['items']:
-                            if item.get('deposit') and not item.get('monthlyRent'):
-                                jeonse_amounts.append(item['deposit'])
-                except Exception as e:
-                    logger.warning(f"전세 실거래가 조회 실패 ({deal_ymd}): {e}")
-
-            if jeonse_amounts:
-                context.jeonse_market_average = sum(jeonse_amounts) // len(jeonse_amounts)
-                logger.info(f"✅ [3/6] 전세 평균: {context.jeonse_market_average:,}만원 ({len(jeonse_amounts)}건)")
-
-            # (2) 매매 실거래가 조회
-            apt_trade_client = AptTradeAPIClient(
-                api_key=settings.public_data_api_key,
-                client=client
-            )
-
-            sale_amounts = []
-            for months_back in range(3):
-                deal_ymd = get_previous_month(now.year, now.month, months_back)
-                try:
-                    trade_result = await apt_trade_client.get_apt_trades(
-                        lawd_cd=lawd_cd,
-                        deal_ymd=deal_ymd
-                    )
-                    if trade_result['body']['items']:
-                        context.recent_transactions.extend(trade_result['body']['items'])
-                        for item in trade_result['body']['items']:
-                            if item.get('dealAmount'):
-                                sale_amounts.append(item['dealAmount'])
-                except Exception as e:
-                    logger.warning(f"매매 실거래가 조회 실패 ({deal_ymd}): {e}")
-
-            if sale_amounts:
-                context.property_value_estimate = calculate_average_exclude_outliers(sale_amounts)
-                logger.info(f"✅ [3/6] 매매 평균: {context.property_value_estimate:,}만원 ({len(sale_amounts)}건)")
-
-        # 매매: 단일 API (현재 월만)
-        else:
-            logger.info(f"📊 [3/6] 단일 API - 매매(현재 월) 조회")
-            deal_ymd = f"{now.year}{now.month:02d}"
-
-            apt_trade_client = AptTradeAPIClient(
-                api_key=settings.public_data_api_key,
-                client=client
-            )
-            trade_result = await apt_trade_client.get_apt_trades(
-                lawd_cd=lawd_cd,
-                deal_ymd=deal_ymd
-            )
+        # (1) 전세 실거래가: 전세만 (월세 제외), 대상 단지/면적 비교사례 기준
+        rent = await query_market(
+            lawd_cd, address, property_type=property_type, kind="rent", months=6,
+            area_m2=area_m2, exclude_monthly_rent=True, api_key=settings.public_data_api_key
+        )
+        context.jeonse_stats = rent.stats
+        if context.jeonse_stats and context.jeonse_stats.estimate:
+            context.jeonse_market_average = context.jeonse_stats.estimate
+            logger.info(f"✅ [3/6] 전세 시세 ({rent.property_type}): {context.jeonse_market_average:,}만원 "
+                        f"({context.jeonse_stats.level}, {context.jeonse_stats.sample_count}건)")
+
+        # (2) 매매 실거래가 (전세에서 상품이 정해졌으면 같은 상품)
+        if rent.stats and rent.property_type != "unknown":
+            property_type = rent.property_type
+        months = 3
+
+    # 매매: 매매 실거래가 (현재 월)
+    else:
+        logger.info(f"📊 [3/6] 매매(현재 월) 조회")
+        months = 1
 
-            if trade_result['body']['items']:
-                context.recent_transactions = trade_result['body']['items']
-                amounts = [item['dealAmount'] for item in context.recent_transactions
-                          if item.get('dealAmount')]
-                if amounts:
-                    context.property_value_estimate = sum(amounts) // len(amounts)
-                    logger.info(f"✅ [3/6] 매매 평균: {context.property_value_estimate:,}만원 ({len(amounts)}건)")
+    # 매매 시세: 대상 단지/면적/층 비교사례 기준 (표본 부족 시 범위 확대)
+    trade = await query_market(
+        lawd_cd, address, property_type=property_type, kind="trade", months=months,
+        area_m2=area_m2, api_key=settings.public_data_api_key
+    )
+    context.recent_transactions = [record.to_dict() for record in trade.records]
+    context.market_stats = trade.stats
+    if context.market_stats and context.market_stats.estimate:
+        context.property_value_estimate = context.market_stats.estimate
+        logger.info(f"✅ [3/6] 매매 시세 ({trade.property_type}): {context.property_value_estimate:,}만원 "
+                    f"({context.market_stats.level}, {context.market_stats.sample_count}건)")
 
 
 async def _analyze_risks(context: AnalysisContext) -> None:
@@ -408,17 +359,17 @@ async def _build_llm_prompt(context: AnalysisContext) -> None:
     """
     LLM 프롬프트 생성 단계
 
-    RegistryRiskFeatures → Markdown 프롬프트 변환
-    결과는 context.llm_prompt에 저장됩니다.
+    RegistryRiskFeatures → Markdown 프롬프트 변환 (모델별 최대 입력 토큰 안에서 섹션 조립)
+    결과는 context.llm_prompt, 섹션별 토큰 계산은 context.prompt_budget에 저장됩니다.
     LLM 실행은 llm_streaming.py에서 수행합니다.
     """
-    from core.report_generator import build_llm_prompt
+    from core.report_generator import build_llm_prompt_budget
 
     logger.info(f"📝 [6/6] LLM 프롬프트 생성 시작")
 
     if context.risk_features:
         contract_type = context.case.get('contract_type', '전세')
-        context.llm_prompt = build_llm_prompt(
+        budget = build_llm_prompt_budget(
             risk_features=context.risk_features,
             contract_type=contract_type,
             contract_deposit=context.case.get('metadata', {}).get('deposit'),
@@ -427,7 +378,12 @@ async def _build_llm_prompt(context: AnalysisContext) -> None:
             property_value_estimate=context.property_value_estimate,
             jeonse_market_average=context.jeonse_market_average,
             recent_transactions=context.recent_transactions,
+            market_stats=context.market_stats,
+            jeonse_stats=context.jeonse_stats,
+            model="gpt-4o-mini",  # simple_llm_analysis / 초안 모델
         )
+        context.llm_prompt = budget.text
+        context.prompt_budget = budget.to_dict()
     else:
         # 등기부 없는 경우 기본 프롬프트
         contract_type = context.case.get('contract_type', '전세')
@@ -442,4 +398,5 @@ async def _build_llm_prompt(context: AnalysisContext) -> None:
 위 정보만으로 간단한 분석을 제공하세요. 등기부가 없으므로 일반적인 주의사항을 안내해주세요.
 """
 
-    logger.info(f"✅ [6/6] LLM 프롬프트 생성 완료: {len(context.llm_prompt)}자")
+    tokens = f", {context.prompt_budget['total_tokens']}토큰" if context.prompt_budget else ""
+    logger.info(f"✅ [6/6] LLM 프롬프트 생성 완료: {len(context.llm_prompt)}자{tokens}")
@@ -4,6 +4,7 @@ from typing import Optional, Dict, Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .data_go_kr_quota import acquire_data_go_kr
 from .settings import settings
 
 logger = logging.getLogger(__name__)
@@ -110,6 +111,8 @@ class BuildingLedgerAPIClient:
             "_type": "json"  # JSON 응답 요청
         }
 
+        await acquire_data_go_kr(endpoint)
+
         try:
             response = await self.client.get(endpoint, params=params)
             response.raise_for_status()
@@ -259,6 +262,8 @@ class BuildingLedgerAPIClient:
             "_type": "json"
         }
 
+        await acquire_data_go_kr(endpoint)
+
         try:
             response = await self.client.get(endpoint, params=params)
             response.raise_for_status()
@@ -1,9 +1,11 @@
 """LangChain LCEL chains for contract analysis."""
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
-from langchain_core.runnables import Runnable
+from langchain_core.runnables import Runnable, RunnableLambda
 from langchain_core.output_parsers import StrOutputParser
 
+from .hybrid_retriever import focus_excerpt
 from .llm_factory import create_llm
 from .retriever import get_retriever
 from .prompts import SYSTEM_PROMPT
@@ -23,6 +25,41 @@ CONTRACT_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
 ])
 
 
+def format_context(docs: List[Document], question: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Format retrieved chunks as prompt context.
+
+    Long chunks are cut to an 800-char excerpt around the first query-term
+    hit (not blindly from the start) to stay within token limits.
+
+    Returns:
+        (context string, sources list)
+    """
+    context_parts = []
+    sources = []
+
+    for i, doc in enumerate(docs, 1):
+        content = focus_excerpt(doc.page_content, question, limit=800)
+        metadata = doc.metadata
+
+        # 출처 정보
+        source_info = f"[출처 {i}]"
+        if "doc_id" in metadata:
+            source_info += f" 문서ID: {metadata['doc_id']}"
+        if "page" in metadata:
+            source_info += f", 페이지: {metadata['page']}"
+
+        context_parts.append(f"{source_info}\n{content}")
+        sources.append({
+            "doc_id": metadata.get("doc_id"),
+            "chunk_index": metadata.get("chunk_index"),
+            "page": metadata.get("page"),
+            "content_preview": content[:200] + "..." if len(content) > 200 else content
+        })
+
+    return "\n\n---\n\n".join(context_parts), sources
+
+
 def build_contract_analysis_chain(
     provider: str | None = None,
     k: int = 6
@@ -49,26 +86,17 @@ def build_contract_analysis_chain(
     def retrieve_context(inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Retrieve relevant documents and format as context."""
         question = inputs["question"]
-        docs = retriever.get_relevant_documents(question)
-
-        # Format documents with truncation to avoid token limits
-        context_parts = []
-        for i, doc in enumerate(docs, 1):
-            content = doc.page_content[:800]  # Truncate long chunks
-            metadata = doc.metadata
-            source_info = f"[출처 {i}]"
-            if "doc_id" in metadata:
-                source_info += f" 문서ID: {metadata['doc_id']}"
-            if "page" in metadata:
-                source_info += f", 페이지: {metadata['page']}"
-
-            context_parts.append(f"{source_info}\n{content}")
-
-        context = "\n\n---\n\n".join(context_parts)
+        context, _ = format_context(retriever.invoke(question), question)
+        return {"context": context, "question": question}
+
+    async def aretrieve_context(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant used by chain.ainvoke / astream (no event-loop blocking)."""
+        question = inputs["question"]
+        context, _ = format_context(await retriever.ainvoke(question), question)
         return {"context": context, "question": question}
 
     # Build LCEL chain
-    chain = retrieve_context | prompt | llm | StrOutputParser()
+    chain = RunnableLambda(retrieve_context, afunc=aretrieve_context) | prompt | llm | StrOutputParser()
 
     return chain
 
@@ -103,36 +131,12 @@ def single_model_analyze(
     from .retriever import get_retriever
     from .llm_factory import create_llm
 
-    # 1. 벡터 검색으로 관련 문서 가져오기
+    # 1. 하이브리드(벡터 + 전문) 검색으로 관련 문서 가져오기
     retriever = get_retriever(k=k)
-    docs = retriever.get_relevant_documents(question)
+    docs = retriever.invoke(question)
 
-    # 2. 컨텍스트 생성
-    context_parts = []
-    sources = []
-
-    for i, doc in enumerate(docs, 1):
-        content = doc.page_content[:800]  # 토큰 제한 방지
-        metadata = doc.metadata
-
-        # 출처 정보
-        source_info = f"[출처 {i}]"
-        if "doc_id" in metadata:
-            source_info += f" 문서ID: {metadata['doc_id']}"
-        if "page" in metadata:
-            source_info += f", 페이지: {metadata['page']}"
-
-        context_parts.append(f"{source_info}\n{content}")
-
-        # Sources 배열에 추가
-        sources.append({
-            "doc_id": metadata.get("doc_id"),
-            "chunk_index": metadata.get("chunk_index"),
-            "page": metadata.get("page"),
-            "content_preview": content[:200] + "..." if len(content) > 200 else content
-        })
-
-    context = "\n\n---\n\n".join(context_parts)
+    # 2. 컨텍스트 생성 (검색어 주변 발췌)
+    context, sources = format_context(docs, question)
 
     # 3. LLM 호출
     llm = create_llm(provider=provider)
@@ -148,6 +152,49 @@ def single_model_analyze(
     }
 
 
+async def asingle_model_analyze(
+    question: str,
+    provider: str | None = None,
+    k: int = 6
+) -> Dict[str, Any]:
+    """
+    single_model_analyze 비동기 버전 (요청 처리 경로용).
+
+    검색(retriever.ainvoke)과 LLM 호출(llm.ainvoke)을 이벤트 루프에서 직접 실행하므로
+    실행기 스레드가 필요 없고, 취소(요청 기한 초과/연결 종료) 시 업스트림 호출도 중단됩니다.
+    provider를 지정하지 않으면 주 제공자가 느릴 때 보조 제공자에도 요청합니다 (헤징).
+
+    Returns:
+        single_model_analyze와 동일 ({"answer": ..., "sources": [...]})
+    """
+    from .retriever import get_retriever
+    from .llm_factory import create_llm
+    from .settings import settings
+
+    retriever = get_retriever(k=k)
+    docs = await retriever.ainvoke(question)
+    context, sources = format_context(docs, question)
+
+    messages = CONTRACT_ANALYSIS_PROMPT.invoke({"question": question, "context": context}).to_messages()
+    if provider is None and settings.llm_hedge_enabled:
+        from .dual_provider import approx_prompt_tokens, get_hedge_router
+
+        llms = {name: create_llm(provider=name) for name in ("openai", "claude")}
+        _, response = await get_hedge_router().ainvoke(
+            "analyze",
+            lambda name: llms[name].ainvoke(messages),
+            models={name: llm.model_name if name == "openai" else llm.model for name, llm in llms.items()},
+            prompt_tokens=approx_prompt_tokens(messages),
+        )
+    else:
+        response = await create_llm(provider=provider).ainvoke(messages)
+
+    return {
+        "answer": response.content,
+        "sources": sources
+    }
+
+
 def build_simple_chain(provider: str | None = None) -> Runnable:
     """
     Build a simple chain without RAG for testing.
@@ -2,44 +2,31 @@
 import base64
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 
 import anthropic
 from PIL import Image
-import fitz  # PyMuPDF
 import io
 
+from .llm_clients import get_llm_registry
+from .page_render import RenderedPage, render_pages
 from .settings import settings
 
 logger = logging.getLogger(__name__)
 
 
-def pdf_to_images(pdf_path: str, dpi: int = 200) -> List[Image.Image]:
+def pdf_to_images(pdf_path: str, dpi: Optional[int] = None) -> List[Image.Image]:
     """
-    Convert PDF pages to PIL Images.
+    Convert PDF pages to PIL Images (shared in-memory renderer, cached per document).
 
     Args:
         pdf_path: Path to PDF file
-        dpi: Resolution for image conversion (default 200 for OCR quality)
+        dpi: Fixed resolution (default None = adaptive per page, see core.page_render)
 
     Returns:
-        List of PIL Image objects
+        List of PIL Image objects (blank/duplicate pages skipped)
     """
-    images = []
-    pdf_document = fitz.open(pdf_path)
-
-    for page_num in range(len(pdf_document)):
-        page = pdf_document[page_num]
-        # Convert to pixmap with specified DPI
-        mat = fitz.Matrix(dpi / 72, dpi / 72)
-        pix = page.get_pixmap(matrix=mat)
-
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        images.append(img)
-
-    pdf_document.close()
-    return images
+    return [page.to_pil() for page in render_pages(pdf_path, dpi=dpi)]
 
 
 def load_image(image_path: str) -> Image.Image:
@@ -75,12 +62,12 @@ def image_to_base64(image: Image.Image, format: str = "PNG") -> tuple[str, str]:
     return img_base64, media_type
 
 
-def extract_text_from_image_with_claude(image: Image.Image) -> str:
+def extract_text_from_image_with_claude(image: Union[Image.Image, RenderedPage]) -> str:
     """
     Extract text from image using Claude Vision.
 
     Args:
-        image: PIL Image object
+        image: PIL Image object or rendered page (encoded bytes are sent as-is)
 
     Returns:
         Extracted text
@@ -91,10 +78,18 @@ def extract_text_from_image_with_claude(image: Image.Image) -> str:
     if not settings.anthropic_api_key:
         raise ValueError("ANTHROPIC_API_KEY not found in settings")
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    # 공유 커넥션 풀 (LLM 허가/속도 제한 대기 포함)
+    client = anthropic.Anthropic(
+        api_key=settings.anthropic_api_key,
+        http_client=get_llm_registry().sync_http_client("claude"),
+    )
 
-    # Convert image to base64
-    img_base64, media_type = image_to_base64(image)
+    # Convert image to base64 (rendered pages are already JPEG/WebP encoded)
+    if isinstance(image, RenderedPage):
+        img_base64 = base64.b64encode(image.data).decode("utf-8")
+        media_type = image.mime_type
+    else:
+        img_base64, media_type = image_to_base64(image)
 
     prompt = """이 이미지는 부동산 계약서의 한 페이지입니다.
 이미지에서 모든 텍스트를 정확하게 추출해주세요.
@@ -137,7 +132,7 @@ def extract_text_from_image_with_claude(image: Image.Image) -> str:
         raise
 
 
-def extract_text_from_pdf_with_claude(pdf_path: str, dpi: int = 200) -> str:
+def extract_text_from_pdf_with_claude(pdf_path: str, dpi: Optional[int] = None) -> str:
     """
     Extract text from PDF using Claude Vision OCR.
 
@@ -145,7 +140,7 @@ def extract_text_from_pdf_with_claude(pdf_path: str, dpi: int = 200) -> str:
 
     Args:
         pdf_path: Path to PDF file
-        dpi: Resolution for image conversion (default 200)
+        dpi: Fixed resolution (default None = adaptive per page)
 
     Returns:
         Extracted text from all pages
@@ -156,20 +151,21 @@ def extract_text_from_pdf_with_claude(pdf_path: str, dpi: int = 200) -> str:
     """
     logger.info(f"Starting Claude Vision OCR for PDF: {pdf_path}")
 
-    # Convert PDF to images
-    images = pdf_to_images(pdf_path, dpi=dpi)
-    logger.info(f"Converted PDF to {len(images)} images")
+    # Render pages in memory (cached, shared with Gemini OCR)
+    pages = render_pages(pdf_path, dpi=dpi)
+    logger.info(f"Rendered {len(pages)} pages")
 
     # Extract text from each page
     all_text = []
-    for i, image in enumerate(images):
-        logger.info(f"Claude processing page {i + 1}/{len(images)}")
+    for page in pages:
+        page_no = page.index + 1
+        logger.info(f"Claude processing page {page_no} ({len(page.data) // 1024}KB, {page.dpi}dpi)")
         try:
-            page_text = extract_text_from_image_with_claude(image)
-            all_text.append(f"\n\n--- 페이지 {i + 1} ---\n\n{page_text}")
+            page_text = extract_text_from_image_with_claude(page)
+            all_text.append(f"\n\n--- 페이지 {page_no} ---\n\n{page_text}")
         except Exception as e:
-            logger.warning(f"Failed to extract text from page {i + 1}: {e}")
-            all_text.append(f"\n\n--- 페이지 {i + 1} (추출 실패) ---\n\n")
+            logger.warning(f"Failed to extract text from page {page_no}: {e}")
+            all_text.append(f"\n\n--- 페이지 {page_no} (추출 실패) ---\n\n")
 
     result = "".join(all_text)
     logger.info(f"Claude Vision OCR completed. Extracted {len(result)} characters")
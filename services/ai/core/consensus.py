@@ -1,10 +1,33 @@
-"""Consensus logic for cross-validating OCR results from multiple models."""
+"""Consensus logic for cross-validating OCR results from multiple models.
+
+Similarity is computed in linear time from character shingle counts
+(SequenceMatcher over whole documents is roughly quadratic), and a
+line-level alignment reports which lines the two models disagree on.
+"""
+import asyncio
+import inspect
 import logging
+from collections import Counter
+from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Literal
+from itertools import zip_longest
+from typing import List, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
+SHINGLE_SIZE = 4  # character n-gram length for similarity
+MAX_DISAGREEMENTS = 50  # cap on reported line disagreements
+
+
+@dataclass
+class LineDisagreement:
+    """A line (or block of lines) where the two OCR outputs differ."""
+
+    gemini_line: Optional[str]  # None = line missing in Gemini output
+    claude_line: Optional[str]  # None = line missing in Claude output
+    gemini_index: Optional[int]
+    claude_index: Optional[int]
+
 
 class ConsensusResult:
     """Result of consensus validation between two OCR outputs."""
@@ -17,6 +40,7 @@ class ConsensusResult:
         agreed_text: str,
         confidence: Literal["high", "medium", "low"],
         needs_review: bool,
+        disagreements: Optional[List[LineDisagreement]] = None,
     ):
         self.gemini_text = gemini_text
         self.claude_text = claude_text
@@ -24,18 +48,34 @@ class ConsensusResult:
         self.agreed_text = agreed_text
         self.confidence = confidence
         self.needs_review = needs_review
+        self.disagreements = disagreements or []
 
     def __repr__(self):
         return (
             f"ConsensusResult(similarity={self.similarity_score:.2f}, "
             f"confidence={self.confidence}, "
-            f"needs_review={self.needs_review})"
+            f"needs_review={self.needs_review}, "
+            f"disagreements={len(self.disagreements)})"
         )
 
 
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> Counter:
+    if len(text) < size:
+        return Counter([text]) if text else Counter()
+    return Counter(text[i:i + size] for i in range(len(text) - size + 1))
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """
-    Calculate similarity between two texts using SequenceMatcher.
+    Calculate similarity between two texts from character shingle counts.
+
+    Dice coefficient over 4-character shingle multisets: 2·|A∩B| / (|A|+|B|).
+    Same scale as SequenceMatcher.ratio() (identical = 1.0, unrelated ≈ 0.0)
+    but O(n) instead of roughly O(n²), so full registry texts stay cheap.
 
     Args:
         text1: First text
@@ -45,11 +85,64 @@ def calculate_similarity(text1: str, text2: str) -> float:
         Similarity score between 0.0 and 1.0
     """
     # Normalize texts (remove extra whitespace, lowercase)
-    norm1 = " ".join(text1.split()).lower()
-    norm2 = " ".join(text2.split()).lower()
+    norm1 = _normalize(text1)
+    norm2 = _normalize(text2)
+    if norm1 == norm2:
+        return 1.0
 
-    matcher = SequenceMatcher(None, norm1, norm2)
-    return matcher.ratio()
+    shingles1 = _shingles(norm1)
+    shingles2 = _shingles(norm2)
+    total = sum(shingles1.values()) + sum(shingles2.values())
+    if total == 0:
+        return 1.0
+
+    common = sum((shingles1 & shingles2).values())
+    return 2 * common / total
+
+
+def find_line_disagreements(
+    text1: str,
+    text2: str,
+    limit: int = MAX_DISAGREEMENTS,
+) -> List[LineDisagreement]:
+    """
+    Align the two texts line by line and return the lines that differ.
+
+    Lines are compared after whitespace/case normalization; alignment runs
+    over whole lines (hundreds of items), not characters.
+
+    Args:
+        text1: Gemini text
+        text2: Claude text
+        limit: Maximum number of disagreements to return
+
+    Returns:
+        Differing line pairs in document order
+    """
+    lines1 = [line for line in text1.splitlines() if line.strip()]
+    lines2 = [line for line in text2.splitlines() if line.strip()]
+
+    matcher = SequenceMatcher(
+        None,
+        [_normalize(line) for line in lines1],
+        [_normalize(line) for line in lines2],
+        autojunk=False,
+    )
+
+    disagreements: List[LineDisagreement] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        for offset, (left, right) in enumerate(zip_longest(lines1[i1:i2], lines2[j1:j2])):
+            disagreements.append(LineDisagreement(
+                gemini_line=left,
+                claude_line=right,
+                gemini_index=i1 + offset if left is not None else None,
+                claude_index=j1 + offset if right is not None else None,
+            ))
+            if len(disagreements) >= limit:
+                return disagreements
+    return disagreements
 
 
 def validate_consensus(
@@ -79,10 +172,12 @@ def validate_consensus(
 
     # Calculate similarity
     similarity = calculate_similarity(gemini_text, claude_text)
+    disagreements = find_line_disagreements(gemini_text, claude_text) if similarity < 1.0 else []
 
     logger.info(
         f"Similarity score: {similarity:.2f} "
-        f"(Gemini: {len(gemini_text)} chars, Claude: {len(claude_text)} chars)"
+        f"(Gemini: {len(gemini_text)} chars, Claude: {len(claude_text)} chars, "
+        f"{len(disagreements)} differing lines)"
     )
 
     # Determine confidence level and agreed text
@@ -117,44 +212,82 @@ def validate_consensus(
         agreed_text=agreed_text,
         confidence=confidence,
         needs_review=needs_review,
+        disagreements=disagreements,
     )
 
 
+async def _run_ocr(ocr_func, file_path: str) -> str:
+    """Await async OCR functions; run sync ones in a worker thread."""
+    if inspect.iscoroutinefunction(ocr_func):
+        return await ocr_func(file_path)
+    return await asyncio.to_thread(ocr_func, file_path)
+
+
 async def parallel_ocr_with_consensus(
     file_path: str,
     file_type: Literal["pdf", "image"],
     gemini_ocr_func,
     claude_ocr_func,
+    timeout_sec: float = 120.0,
 ) -> ConsensusResult:
     """
-    Run Gemini and Claude OCR in parallel and validate consensus.
+    Run Gemini and Claude OCR concurrently and validate consensus.
 
     Args:
         file_path: Path to file (PDF or image)
         file_type: Type of file ("pdf" or "image")
-        gemini_ocr_func: Gemini OCR function
-        claude_ocr_func: Claude OCR function
+        gemini_ocr_func: Gemini OCR function (sync or async)
+        claude_ocr_func: Claude OCR function (sync or async)
+        timeout_sec: Shared deadline for both providers
 
     Returns:
         ConsensusResult with validation details
 
+    Raises:
+        RuntimeError: If neither provider returns text before the deadline
+
     Note:
-        In production, use asyncio.gather() for true parallel execution.
-        For now, we run sequentially for simplicity.
+        If only one provider succeeds in time, its text is used with
+        low confidence and needs_review=True.
     """
     logger.info(f"Starting parallel OCR for {file_type}: {file_path}")
 
-    # Run Gemini OCR
-    logger.info("Running Gemini OCR...")
-    gemini_text = gemini_ocr_func(file_path)
+    tasks = {
+        "gemini": asyncio.create_task(_run_ocr(gemini_ocr_func, file_path)),
+        "claude": asyncio.create_task(_run_ocr(claude_ocr_func, file_path)),
+    }
+    _, pending = await asyncio.wait(tasks.values(), timeout=timeout_sec)
+    for task in pending:
+        # Sync OCR threads cannot be interrupted; their result is discarded
+        task.cancel()
 
-    # Run Claude OCR
-    logger.info("Running Claude OCR...")
-    claude_text = claude_ocr_func(file_path)
+    texts = {}
+    for name, task in tasks.items():
+        if task in pending:
+            logger.warning(f"{name} OCR timed out after {timeout_sec:.1f}s")
+        elif task.exception() is not None:
+            logger.error(f"{name} OCR failed: {task.exception()}")
+        else:
+            texts[name] = task.result()
 
-    # Validate consensus
-    result = validate_consensus(gemini_text, claude_text)
+    if not texts:
+        raise RuntimeError(f"Both OCR providers failed or timed out for {file_path}")
+
+    if len(texts) == 1:
+        (name, text), = texts.items()
+        logger.warning(f"Only {name} OCR available - flagged for manual review")
+        result = ConsensusResult(
+            gemini_text=texts.get("gemini", ""),
+            claude_text=texts.get("claude", ""),
+            similarity_score=0.0,
+            agreed_text=text,
+            confidence="low",
+            needs_review=True,
+        )
+    else:
+        # Validate consensus
+        result = validate_consensus(texts["gemini"], texts["claude"])
 
     logger.info(f"Parallel OCR completed: {result}")
 
-    return result
\ No newline at end of file
+    return result
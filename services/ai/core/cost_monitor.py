@@ -19,6 +19,10 @@ PRICING = {
     "gpt-4o-mini": {"input": 0.000150, "output": 0.000600},
     "gpt-4o-mini-2024-07-18": {"input": 0.000150, "output": 0.000600},
 
+    # Claude (헤징 등 보조 호출 비용 추정용)
+    "claude-3-5-sonnet-latest": {"input": 0.003, "output": 0.015},
+    "claude-3-5-haiku-latest": {"input": 0.0008, "output": 0.004},
+
     # Embeddings
     "text-embedding-3-small": {"input": 0.000020, "output": 0.0},
     "text-embedding-3-large": {"input": 0.000130, "output": 0.0},
@@ -45,6 +49,9 @@ class CostMonitor:
             lambda: {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
         )
         self.cost_alerts: List[Dict[str, Any]] = []
+        self.cache_stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "saved_input_tokens": 0, "saved_output_tokens": 0, "saved_cost": 0.0}
+        )
 
         # 비용 임계값 (USD)
         self.daily_threshold = 10.0  # 일일 $10 초과 시 경고
@@ -166,6 +173,74 @@ class CostMonitor:
             self.cost_alerts.append(alert)
             logger.warning(alert["message"])
 
+    def track_cache(
+        self,
+        model: str,
+        hit: bool,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        metadata: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        LLM 응답 캐시 적중 / 미스를 기록합니다 (core/llm_cache.py).
+
+        적중 시 재생한 응답의 토큰 수만큼 절약한 토큰과 비용을 누적합니다.
+        실제 API 사용량(daily_usage)에는 포함하지 않습니다.
+
+        Args:
+            model: 모델 이름
+            hit: 캐시 적중 여부
+            input_tokens: 적중 시 절약한 입력 토큰 수
+            output_tokens: 적중 시 절약한 출력 토큰 수
+            metadata: 추가 메타데이터 (operation 등)
+
+        Returns:
+            절약 비용 정보 딕셔너리
+        """
+        operation = (metadata or {}).get("operation", "llm")
+        stats = self.cache_stats[operation]
+        if not hit:
+            stats["misses"] += 1
+            return {"model": model, "hit": False, "saved_cost": 0.0}
+
+        pricing = PRICING.get(model, {"input": 0.0, "output": 0.0})
+        saved_cost = (input_tokens / 1000) * pricing["input"] + (output_tokens / 1000) * pricing["output"]
+        stats["hits"] += 1
+        stats["saved_input_tokens"] += input_tokens
+        stats["saved_output_tokens"] += output_tokens
+        stats["saved_cost"] += saved_cost
+
+        logger.debug(
+            f"캐시 적중: {model}, operation={operation}, "
+            f"saved input={input_tokens}, output={output_tokens}, cost=${saved_cost:.4f}"
+        )
+        return {"model": model, "hit": True, "saved_cost": saved_cost}
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        LLM 응답 캐시 통계를 조회합니다.
+
+        Returns:
+            operation별 / 전체 적중률, 절약 토큰, 절약 비용
+        """
+        def summarize(stats: Dict[str, float]) -> Dict[str, Any]:
+            lookups = stats["hits"] + stats["misses"]
+            return {
+                **stats,
+                "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+                "saved_cost": round(stats["saved_cost"], 6),
+            }
+
+        total = {"hits": 0, "misses": 0, "saved_input_tokens": 0, "saved_output_tokens": 0, "saved_cost": 0.0}
+        for stats in self.cache_stats.values():
+            for name in total:
+                total[name] += stats[name]
+
+        return {
+            "total": summarize(total),
+            "operations": {operation: summarize(stats) for operation, stats in self.cache_stats.items()},
+        }
+
     def get_daily_stats(self, date: str | None = None) -> Dict[str, Any]:
         """
         특정 날짜의 사용량 통계를 조회합니다.
@@ -299,6 +374,15 @@ Model Breakdown (Last 30 days):
   - Cost: ${stats['cost']:.4f}
 """
 
+        cache = self.get_cache_stats()["total"]
+        if cache["hits"] or cache["misses"]:
+            report += f"""
+LLM Response Cache:
+  - Hit Ratio: {cache['hit_ratio'] * 100:.1f}% ({int(cache['hits']):,} / {int(cache['hits'] + cache['misses']):,})
+  - Saved Tokens: {int(cache['saved_input_tokens'] + cache['saved_output_tokens']):,}
+  - Saved Cost: ${cache['saved_cost']:.4f}
+"""
+
         if self.cost_alerts:
             report += "\n\nCost Alerts:\n"
             for alert in self.cost_alerts[-5:]:  # 최근 5개
@@ -344,3 +428,20 @@ def track_llm_usage(
     """
     monitor = get_cost_monitor()
     return monitor.track_usage(model, input_tokens, output_tokens, metadata)
+
+
+def track_cache_usage(
+    model: str,
+    hit: bool,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    **metadata
+) -> Dict[str, Any]:
+    """
+    LLM 응답 캐시 적중 / 미스를 전역 모니터에 기록합니다 (편의 함수).
+
+    Example:
+        >>> track_cache_usage("gpt-4o-mini", True, 1200, 800, operation="draft")
+    """
+    monitor = get_cost_monitor()
+    return monitor.track_cache(model, hit, input_tokens, output_tokens, metadata)
@@ -28,6 +28,22 @@ logger = logging.getLogger(__name__)
 SUCCESS_CODES = {"00", "000", "0000", "INFO-000", "03", "INFO-003"}
 
 
+def result_header(data: Dict[str, Any]) -> tuple:
+    """
+    파싱된 응답 → (resultCode, resultMsg)
+
+    정상 응답(response/header)과 오류 응답(OpenAPI_ServiceResponse/cmmMsgHeader:
+    인증키 오류, 호출 한도 초과 등)을 모두 처리합니다. 둘 다 없으면 ("", "").
+    """
+    if "OpenAPI_ServiceResponse" in data:
+        header = (data.get("OpenAPI_ServiceResponse") or {}).get("cmmMsgHeader") or {}
+        code = header.get("returnReasonCode") or "ERROR"
+        msg = header.get("returnAuthMsg") or header.get("errMsg") or "SERVICE ERROR"
+        return code, msg
+    header = (data.get("response") or {}).get("header") or {}
+    return header.get("resultCode", ""), header.get("resultMsg", "")
+
+
 def build_url(base_url: str, api_key: str, **params) -> str:
     """
     공공데이터포털 API URL 생성.
@@ -100,6 +116,11 @@ async def call_data_go_api(
         ...     params={"LAWD_CD": "11680", "DEAL_YMD": "202407"}
         ... )
     """
+    # 호출 한도 확인 (속도 제한 시 잠깐 대기, 일일 한도 소진 시 QuotaExhaustedError)
+    from core.data_go_kr_quota import acquire_data_go_kr
+
+    await acquire_data_go_kr(base_url)
+
     # URL 생성
     url = build_url(base_url, api_key, **params)
 
@@ -129,11 +150,8 @@ async def call_data_go_api(
             # XML → 딕셔너리 변환
             data = xmltodict.parse(xml_text)
 
-            # resultCode 체크
-            response_data = data.get("response", {})
-            header = response_data.get("header", {})
-            result_code = header.get("resultCode", "")
-            result_msg = header.get("resultMsg", "")
+            # resultCode 체크 (OpenAPI_ServiceResponse 오류 응답 포함)
+            result_code, result_msg = result_header(data)
 
             logger.info(f"[data.go.kr] resultCode: {result_code} - {result_msg}")
 
@@ -0,0 +1,329 @@
+"""
+공공데이터포털(data.go.kr) 호출 한도 관리
+
+모든 RTMS / 법정동코드 / 건축물대장 API가 같은 API 키(settings.public_data_api_key)를 쓰고,
+이 키에는 API(서비스)별 일일 호출 한도가 있습니다. 트래픽이 몰리면 한도가 소진되어
+그날 이후의 모든 분석이 실패하므로 호출 전에 다음을 확인합니다.
+
+- 단기 속도 제한: API별 토큰 버킷 (워커 단위). 한도를 넘으면 실패 대신 잠깐 대기
+- 일일 한도: API별 호출 수 카운터 (KST 자정 초기화)
+  - redis_url이 설정되어 있으면 Redis 카운터 → 모든 워커/인스턴스가 공유
+    (Redis 장애 시 STORE_RETRY_SEC 동안 메모리 카운터 사용 후 Redis 재시도)
+  - 없으면 프로세스 메모리 카운터
+- 예산 부족 (남은 비율 < public_data_low_budget_ratio): await is_budget_low()로 확인 →
+  RTMS 웨어하우스 등 캐시가 있는 호출부는 저장된 데이터를 우선 사용
+- 지표: get_public_data_quota().metrics() (GET /dev/public-data-quota)
+
+API 식별자는 URL의 서비스 경로입니다
+(예: .../1613000/RTMSDataSvcAptTrade/getRTMSDataSvcAptTrade → "RTMSDataSvcAptTrade").
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))  # data.go.kr 일일 한도 초기화 기준
+KEY_PREFIX = "data_go_kr:quota"
+STORE_RETRY_SEC = 30.0  # Redis 카운터 오류 후 메모리 카운터만 쓰는 시간
+
+
+class QuotaExhaustedError(Exception):
+    """일일 호출 한도 소진"""
+
+
+class RateLimitExceededError(Exception):
+    """단기 속도 제한 대기 시간 초과"""
+
+
+def quota_key(url: str) -> str:
+    """URL → API(서비스) 식별자"""
+    parsed = urlparse(url)
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) >= 2:
+        return parts[1]
+    return parts[0] if parts else parsed.netloc
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(KST)).astimezone(KST).strftime("%Y%m%d")
+
+
+# ===========================
+# 단기 속도 제한
+# ===========================
+
+class TokenBucket:
+    """
+    토큰 버킷 (초당 rate개, 최대 burst개 누적)
+
+    토큰을 미리 예약하고 부족한 만큼만 기다리므로 대기 순서대로 처리됩니다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, max_wait: float) -> float:
+        """
+        토큰 1개 획득 (필요하면 대기)
+
+        Returns:
+            대기한 시간 (초)
+
+        Raises:
+            RateLimitExceededError: 대기 시간이 max_wait를 넘을 때
+        """
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+
+        wait = -self._tokens / self.rate
+        if wait > max_wait:
+            self._tokens += 1  # 예약 취소
+            raise RateLimitExceededError(f"속도 제한 대기 {wait:.1f}초 > {max_wait:.1f}초")
+        await asyncio.sleep(wait)
+        return wait
+
+
+# ===========================
+# 일일 카운터 저장소
+# ===========================
+
+class MemoryQuotaStore:
+    """프로세스 메모리 카운터 (워커 간 공유 안 됨)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+
+    async def incr(self, key: str, ttl_sec: int) -> int:
+        self._counts[key] = self._counts.get(key, 0) + 1
+        return self._counts[key]
+
+    async def decr(self, key: str) -> None:
+        self._counts[key] = max(0, self._counts.get(key, 0) - 1)
+
+    async def get(self, key: str) -> int:
+        return self._counts.get(key, 0)
+
+
+class RedisQuotaStore:
+    """Redis 카운터 (INCR + EXPIRE, 모든 워커 공유)"""
+
+    name = "redis"
+
+    def __init__(self, redis_url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(redis_url, decode_responses=True)
+
+    async def incr(self, key: str, ttl_sec: int) -> int:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, ttl_sec)
+            count, _ = await pipe.execute()
+        return int(count)
+
+    async def decr(self, key: str) -> None:
+        await self._redis.decr(key)
+
+    async def get(self, key: str) -> int:
+        return int(await self._redis.get(key) or 0)
+
+
+# ===========================
+# 한도 관리
+# ===========================
+
+class PublicDataQuota:
+    """API별 토큰 버킷 + 일일 한도 카운터"""
+
+    def __init__(
+        self,
+        store,
+        daily_quota: int = 10000,
+        daily_quotas: Optional[Dict[str, int]] = None,
+        rate_per_sec: float = 8.0,
+        burst: int = 16,
+        max_wait_sec: float = 10.0,
+        low_budget_ratio: float = 0.1,
+        store_retry_sec: float = STORE_RETRY_SEC,
+    ):
+        self.store = store
+        self.daily_quota = daily_quota
+        self.daily_quotas = daily_quotas or {}
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self.max_wait_sec = max_wait_sec
+        self.low_budget_ratio = low_budget_ratio
+        self.store_retry_sec = store_retry_sec
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._used: Dict[str, int] = {}  # 마지막으로 확인한 오늘 사용량 (metrics 표시용)
+        self._day = quota_day()
+        self._fallback: Optional[MemoryQuotaStore] = None
+        self._store_failed_at: Optional[float] = None
+
+    def limit(self, api: str) -> int:
+        return self.daily_quotas.get(api, self.daily_quota)
+
+    def _bucket(self, api: str) -> TokenBucket:
+        if api not in self._buckets:
+            self._buckets[api] = TokenBucket(self.rate_per_sec, self.burst)
+        return self._buckets[api]
+
+    def _counter_key(self, api: str) -> str:
+        day = quota_day()
+        if day != self._day:
+            self._day = day
+            self._used.clear()
+        return f"{KEY_PREFIX}:{api}:{day}"
+
+    def _active_store(self):
+        """현재 사용할 저장소 (Redis 오류 후 store_retry_sec 동안은 메모리 카운터)"""
+        failed_at = self._store_failed_at
+        if failed_at is not None and time.monotonic() - failed_at < self.store_retry_sec:
+            return self._fallback
+        return self.store
+
+    async def _store_call(self, method: str, *args):
+        """저장소 호출 (Redis 장애 시 잠시 메모리 카운터로 전환 - 호출 자체는 막지 않음)"""
+        store = self._active_store()
+        try:
+            result = await getattr(store, method)(*args)
+        except Exception as e:
+            if store is self._fallback or isinstance(store, MemoryQuotaStore):
+                raise
+            logger.warning(
+                f"[data.go.kr 한도] {store.name} 카운터 오류 ({self.store_retry_sec:.0f}초 동안 메모리 카운터 사용): {e}"
+            )
+            self._store_failed_at = time.monotonic()
+            self._fallback = self._fallback or MemoryQuotaStore()
+            return await getattr(self._fallback, method)(*args)
+
+        if store is self.store and self._store_failed_at is not None:
+            logger.info(f"[data.go.kr 한도] {store.name} 카운터 복구")
+            self._store_failed_at = None
+        return result
+
+    async def acquire(self, api: str) -> None:
+        """
+        호출 1회 허가 (속도 제한 대기 → 일일 한도 차감)
+
+        Raises:
+            RateLimitExceededError: 단기 속도 제한 대기 시간 초과
+            QuotaExhaustedError: 일일 한도 소진
+        """
+        waited = await self._bucket(api).acquire(self.max_wait_sec)
+        if waited:
+            logger.info(f"[data.go.kr 한도] {api}: 속도 제한으로 {waited:.2f}초 대기")
+
+        key = self._counter_key(api)
+        used = await self._store_call("incr", key, 2 * 24 * 3600)
+        limit = self.limit(api)
+        if used > limit:
+            await self._store_call("decr", key)
+            self._used[api] = limit
+            raise QuotaExhaustedError(f"{api} 일일 호출 한도 소진 ({limit}회)")
+        self._used[api] = used
+
+    async def _read_used(self, api: str) -> int:
+        """오늘 사용량 (저장소에서 읽음 - Redis면 모든 워커 합계)"""
+        used = await self._store_call("get", self._counter_key(api))
+        self._used[api] = used
+        return used
+
+    def _is_low(self, api: str, remaining: int) -> bool:
+        limit = self.limit(api)
+        return limit <= 0 or remaining / limit < self.low_budget_ratio
+
+    async def remaining(self, api: str) -> int:
+        """남은 호출 수 (저장소의 오늘 사용량 기준)"""
+        return max(0, self.limit(api) - await self._read_used(api))
+
+    async def is_low(self, api: str) -> bool:
+        return self._is_low(api, await self.remaining(api))
+
+    async def metrics(self) -> Dict[str, Any]:
+        """API별 사용량 / 남은 예산 (저장소에서 다시 읽음)"""
+        apis = sorted(set(self._used) | set(self._buckets) | set(self.daily_quotas))
+        per_api = {}
+        for api in apis:
+            used = await self._read_used(api)
+            limit = self.limit(api)
+            remaining = max(0, limit - used)
+            per_api[api] = {
+                "used": used,
+                "limit": limit,
+                "remaining": remaining,
+                "remaining_ratio": round(remaining / limit, 4) if limit else 0.0,
+                "low": self._is_low(api, remaining),
+                "tokens": round(self._bucket(api).tokens, 2),
+            }
+        return {
+            "backend": self._active_store().name,
+            "day": self._day,
+            "rate_per_sec": self.rate_per_sec,
+            "burst": self.burst,
+            "apis": per_api,
+        }
+
+
+_quota: Optional[PublicDataQuota] = None
+
+
+def get_public_data_quota() -> PublicDataQuota:
+    """전역 PublicDataQuota (redis_url이 있으면 Redis 카운터)"""
+    global _quota
+    if _quota is None:
+        from core.settings import settings
+
+        store = MemoryQuotaStore()
+        if settings.redis_url:
+            try:
+                store = RedisQuotaStore(settings.redis_url)
+            except ImportError:
+                logger.warning("redis 패키지가 없어 data.go.kr 한도를 워커별 메모리 카운터로 관리합니다")
+
+        _quota = PublicDataQuota(
+            store,
+            daily_quota=settings.public_data_daily_quota,
+            daily_quotas=settings.public_data_daily_quotas,
+            rate_per_sec=settings.public_data_rate_per_sec,
+            burst=settings.public_data_rate_burst,
+            max_wait_sec=settings.public_data_rate_max_wait_sec,
+            low_budget_ratio=settings.public_data_low_budget_ratio,
+        )
+    return _quota
+
+
+async def acquire_data_go_kr(url: str) -> None:
+    """data.go.kr 호출 직전에 호출 (public_data_quota_enabled=False면 통과)"""
+    from core.settings import settings
+
+    if settings.public_data_quota_enabled:
+        await get_public_data_quota().acquire(quota_key(url))
+
+
+async def is_budget_low(url: str) -> bool:
+    """남은 일일 예산이 적으면 True → 캐시/저장 데이터 우선 사용"""
+    from core.settings import settings
+
+    return settings.public_data_quota_enabled and await get_public_data_quota().is_low(quota_key(url))
@@ -1,6 +1,7 @@
 """데이터베이스 모델 및 세션 관리."""
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID, uuid4
 
@@ -136,8 +137,9 @@ class Report(Base):
 # Database Session Management
 # ============================================
 
+@lru_cache(maxsize=1)
 def get_engine():
-    """SQLAlchemy 엔진 생성."""
+    """SQLAlchemy 엔진 생성 (프로세스 단위 재사용 - 커넥션 풀 공유)."""
     # psycopg3를 위한 URL 스킴 변경 (postgresql:// -> postgresql+psycopg://)
     db_url = settings.database_url
     if db_url.startswith("postgresql://"):
@@ -154,6 +156,7 @@ def get_engine():
     )
 
 
+@lru_cache(maxsize=1)
 def get_session_maker():
     """SessionMaker 생성."""
     engine = get_engine()
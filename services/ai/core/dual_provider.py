@@ -1,6 +1,40 @@
-"""Dual provider wrapper with fallback and retry logic."""
+"""
+Dual provider wrapper with fallback, retry and latency-driven hedging.
+
+Fallback alone only helps when the primary provider raises; a primary that is
+slow (but eventually answers) makes users wait for the full timeout. Hedging
+races the providers instead:
+
+- The primary request starts immediately.
+- If it has not produced its first token within the hedge delay (a configurable
+  percentile of its recent first-token latency for this call site), the same
+  request is fired at the secondary provider.
+- The first stream to produce a token wins; the loser is cancelled, which
+  closes its HTTP connection so the provider stops generating.
+- A primary error before the first token falls back to the secondary at once.
+- Providers that keep failing or losing races are skipped by a circuit breaker
+  (core.endpoint_health) until a probe request succeeds again.
+- Tail latency (served first-token p50/p95/p99), hedge rate and the extra cost
+  of cancelled requests are reported by HedgeRouter.snapshot()
+  (GET /dev/llm-hedging); loser cost is also recorded in the CostMonitor.
+
+Example:
+    >>> router = get_hedge_router()
+    >>> async for chunk in router.astream(
+    ...     "chat_draft",
+    ...     lambda provider: llms[provider].astream(messages),
+    ...     models={"openai": "gpt-4o-mini", "claude": "claude-3-5-sonnet-latest"},
+    ...     prompt_tokens=approx_prompt_tokens(messages),
+    ... ):
+    ...     ...
+"""
+import asyncio
 import logging
-from typing import Any, Callable, Literal
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Literal, Optional, Sequence, Tuple
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -9,11 +43,16 @@ from tenacity import (
 )
 from langchain_core.runnables import Runnable
 
+from .endpoint_health import EndpointHealthRegistry
 from .llm_factory import create_llm
 from .settings import settings
 
 logger = logging.getLogger(__name__)
 
+Provider = Literal["openai", "claude"]
+
+BREAKER_GROUP = "llm_provider"
+
 
 class ProviderError(Exception):
     """Base exception for provider errors."""
@@ -33,6 +72,8 @@ class ClaudeError(ProviderError):
 def create_fallback_chain(
     chain_factory: Callable[[str], Runnable],
     primary: Literal["openai", "claude"] | None = None,
+    hedge: bool | None = None,
+    label: str = "fallback_chain",
 ) -> Runnable:
     """
     Create a chain with automatic fallback between providers.
@@ -40,9 +81,13 @@ def create_fallback_chain(
     Args:
         chain_factory: Function that takes provider name and returns a chain
         primary: Primary provider to try first
+        hedge: Race the secondary provider when the primary is slow
+            (ainvoke / astream only; defaults to settings.llm_hedge_enabled)
+        label: Call-site name for hedge latency tracking and metrics
 
     Returns:
-        Chain with fallback logic
+        Chain with fallback logic (invoke: sequential fallback,
+        ainvoke / astream: hedged when enabled)
 
     Example:
         >>> def make_chain(provider):
@@ -52,9 +97,11 @@ def create_fallback_chain(
     """
     primary = primary or settings.primary_llm
     secondary = "claude" if primary == "openai" else "openai"
+    hedge = settings.llm_hedge_enabled if hedge is None else hedge
 
     primary_chain = chain_factory(primary)
     secondary_chain = chain_factory(secondary)
+    chains = {primary: primary_chain, secondary: secondary_chain}
 
     def invoke_with_fallback(inputs: dict[str, Any]) -> Any:
         """Invoke chain with fallback on provider failure."""
@@ -84,9 +131,55 @@ def create_fallback_chain(
         def invoke(self, inputs: dict[str, Any], *args, **kwargs) -> Any:
             return invoke_with_fallback(inputs)
 
+        async def ainvoke(self, inputs: dict[str, Any], *args, **kwargs) -> Any:
+            if hedge:
+                _, result = await get_hedge_router().ainvoke(
+                    label, lambda provider: chains[provider].ainvoke(inputs), primary=primary
+                )
+                return result
+            try:
+                return await primary_chain.ainvoke(inputs)
+            except Exception as e:
+                logger.warning(f"Primary provider ({primary}) failed: {e}. Falling back to {secondary}")
+                try:
+                    return await secondary_chain.ainvoke(inputs)
+                except Exception as fallback_error:
+                    raise ProviderError(f"All providers failed. Last error: {fallback_error}") from fallback_error
+
+        async def astream(self, inputs: dict[str, Any], *args, **kwargs) -> AsyncIterator[Any]:
+            if hedge:
+                stream = get_hedge_router().astream(
+                    label, lambda provider: chains[provider].astream(inputs), primary=primary
+                )
+            else:
+                stream = _fallback_stream(lambda provider: chains[provider].astream(inputs), [primary, secondary])
+            async for chunk in stream:
+                yield chunk
+
     return FallbackChain()
 
 
+async def _fallback_stream(
+    stream_factory: Callable[[str], AsyncIterator[Any]],
+    providers: Sequence[str],
+) -> AsyncIterator[Any]:
+    """Stream from the first provider that yields; fall back only before the first chunk."""
+    last_error: Exception | None = None
+    for provider in providers:
+        started = False
+        try:
+            async for chunk in stream_factory(provider):
+                started = True
+                yield chunk
+            return
+        except Exception as e:
+            if started:
+                raise
+            logger.warning(f"Provider ({provider}) failed before first chunk: {e}")
+            last_error = e
+    raise ProviderError(f"All providers failed. Last error: {last_error}") from last_error
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -111,3 +204,380 @@ def invoke_with_retry(chain: Runnable, inputs: dict[str, Any]) -> Any:
     except Exception as e:
         logger.error(f"Chain invocation failed: {e}")
         raise ProviderError(f"Chain invocation failed: {e}") from e
+
+
+# ===========================
+# Hedged requests
+# ===========================
+
+def approx_prompt_tokens(messages: Sequence[Any]) -> int:
+    """Rough prompt size for cost reporting (same heuristic as the LLM governor)."""
+    from .llm_governor import CHARS_PER_TOKEN
+
+    chars = 0
+    for message in messages:
+        content = getattr(message, "content", message)
+        chars += len(content) if isinstance(content, str) else len(str(content))
+    return chars // CHARS_PER_TOKEN
+
+
+def _has_token(chunk: Any) -> bool:
+    content = getattr(chunk, "content", chunk)
+    return bool(content)
+
+
+def _percentile(samples: Sequence[float], p: float) -> Optional[float]:
+    """Nearest-rank percentile (None without samples)."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(p * len(ordered)) - 1))]
+
+
+@dataclass
+class HedgeStats:
+    """Per call-site hedging counters."""
+
+    requests: int = 0
+    hedged: int = 0
+    secondary_wins: int = 0
+    fallbacks: int = 0  # primary failed before its first token
+    skipped: int = 0  # primary circuit open → secondary only
+    failures: int = 0
+    extra_input_tokens: int = 0
+    extra_output_tokens: int = 0
+    extra_cost_usd: float = 0.0
+    served_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=500))
+    recent_hedges: Deque[bool] = field(default_factory=lambda: deque(maxlen=100))
+
+    def hedge_ratio(self) -> float:
+        return sum(self.recent_hedges) / len(self.recent_hedges) if self.recent_hedges else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        served = list(self.served_ms)
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_rate": round(self.hedged / self.requests, 3) if self.requests else 0.0,
+            "secondary_wins": self.secondary_wins,
+            "fallbacks": self.fallbacks,
+            "skipped_degraded": self.skipped,
+            "failures": self.failures,
+            "tail_latency_ms": {
+                name: round(value, 1) if value is not None else None
+                for name, value in (
+                    ("p50", _percentile(served, 0.5)),
+                    ("p95", _percentile(served, 0.95)),
+                    ("p99", _percentile(served, 0.99)),
+                )
+            },
+            "extra_tokens": {"input": self.extra_input_tokens, "output": self.extra_output_tokens},
+            "extra_cost_usd": round(self.extra_cost_usd, 6),
+        }
+
+
+class _Contender:
+    """One provider's attempt: first-token time plus chunks buffered up to it."""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.started = time.perf_counter()
+        self.first_token_ms: Optional[float] = None
+        self.buffered: List[Any] = []
+        self.iterator: Optional[AsyncIterator[Any]] = None
+        self.result: Any = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+
+class HedgeRouter:
+    """Latency-driven hedging between the primary and secondary provider."""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        default_delay_sec: float = 2.0,
+        min_delay_sec: float = 0.3,
+        max_hedge_ratio: float = 0.2,
+        window: int = 200,
+        breaker: Optional[EndpointHealthRegistry] = None,
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay_sec = default_delay_sec
+        self.min_delay_sec = min_delay_sec
+        self.max_hedge_ratio = max_hedge_ratio
+        self.window = window
+        self.breaker = breaker or EndpointHealthRegistry()
+        self._latency: Dict[Tuple[str, str], Deque[float]] = {}
+        self.stats: Dict[str, HedgeStats] = {}
+
+    # --- latency / policy ---
+
+    def _samples(self, label: str, provider: str) -> Deque[float]:
+        key = (label, provider)
+        if key not in self._latency:
+            self._latency[key] = deque(maxlen=self.window)
+        return self._latency[key]
+
+    def hedge_delay_sec(self, label: str, provider: str) -> float:
+        """Percentile of the provider's recent first-token latency for this call site."""
+        samples = self._samples(label, provider)
+        if len(samples) < self.min_samples:
+            return self.default_delay_sec
+        return max(self.min_delay_sec, _percentile(samples, self.percentile) / 1000)
+
+    def _candidates(self, primary: str) -> List[str]:
+        secondary = "claude" if primary == "openai" else "openai"
+        providers = [p for p in (primary, secondary) if p != "claude" or settings.anthropic_api_key]
+        allowed = set(self.breaker.order(BREAKER_GROUP, providers))
+        if not allowed:
+            raise ProviderError("All LLM providers are temporarily skipped (circuit open)")
+        return [provider for provider in (primary, secondary) if provider in allowed]
+
+    # --- race ---
+
+    async def _race(
+        self,
+        label: str,
+        candidates: List[str],
+        start: Callable[[_Contender], Awaitable[None]],
+    ) -> Tuple[_Contender, List[_Contender]]:
+        """
+        Start the primary, hedge (slow) or fall back (error) to the secondary.
+
+        Returns:
+            (winner, losers) - losers are contenders that were cancelled or finished
+            second; their tasks are done when this returns
+        """
+        stats = self.stats.setdefault(label, HedgeStats())
+        stats.requests += 1
+        primary, queued = candidates[0], list(candidates[1:])
+        delay: Optional[float] = self.hedge_delay_sec(label, primary)
+        began = time.perf_counter()
+        tasks: Dict[asyncio.Task, _Contender] = {}
+        launched: List[_Contender] = []
+        failed: List[_Contender] = []
+        hedged = False
+        last_error: Optional[BaseException] = None
+
+        def launch(provider: str) -> None:
+            contender = _Contender(provider)
+            launched.append(contender)
+            tasks[asyncio.ensure_future(start(contender))] = contender
+
+        launch(primary)
+        try:
+            while tasks:
+                timeout = max(0.0, delay - (time.perf_counter() - began)) if queued and delay is not None else None
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # primary is slow; the recent hedge ratio caps how much extra traffic we add
+                    if self.max_hedge_ratio >= 1.0 or stats.hedge_ratio() < self.max_hedge_ratio:
+                        hedged = True
+                        stats.hedged += 1
+                        logger.info(f"[hedge] {label}: {primary} no first token after {delay:.2f}s → also trying {queued[0]}")
+                        launch(queued.pop(0))
+                    else:
+                        # cap reached: no hedge, but keep the secondary queued as the error fallback
+                        delay = None
+                    continue
+
+                winner = None
+                for task in sorted(done, key=lambda t: launched.index(tasks[t])):
+                    contender = tasks.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        winner = winner or contender
+                        continue
+                    failed.append(contender)
+                    last_error = error
+                    self.breaker.record_failure(BREAKER_GROUP, contender.provider, error)
+                    logger.warning(f"[hedge] {label}: {contender.provider} failed before first token: {error}")
+                    if queued:
+                        stats.fallbacks += 1
+                        launch(queued.pop(0))
+
+                if winner is not None:
+                    stats.recent_hedges.append(hedged)
+                    stats.served_ms.append((time.perf_counter() - began) * 1000)  # what the caller waited
+                    return winner, [c for c in launched if c is not winner and c not in failed]
+
+            stats.recent_hedges.append(hedged)
+            stats.failures += 1
+            raise ProviderError(f"All providers failed. Last error: {last_error}") from last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _settle(
+        self,
+        label: str,
+        primary: str,
+        winner: _Contender,
+        losers: List[_Contender],
+        models: Optional[Dict[str, str]],
+        prompt_tokens: int,
+    ) -> None:
+        """Record latency, breaker state and the cost of the losing requests."""
+        stats = self.stats[label]
+        self._samples(label, winner.provider).append(winner.first_token_ms)
+        self.breaker.record_success(BREAKER_GROUP, winner.provider, winner.first_token_ms)
+        if winner.provider != primary:
+            stats.secondary_wins += 1
+
+        for loser in losers:
+            # cancelled before its first token: its latency is at least this long
+            waited = loser.first_token_ms or loser.elapsed_ms()
+            self._samples(label, loser.provider).append(waited)
+            self.breaker.record_failure(BREAKER_GROUP, loser.provider, f"slow: lost hedge after {waited:.0f}ms")
+
+            output_tokens = len(loser.buffered)  # ~1 token per streamed chunk
+            stats.extra_input_tokens += prompt_tokens
+            stats.extra_output_tokens += output_tokens
+            model = (models or {}).get(loser.provider)
+            if model:
+                from .cost_monitor import track_llm_usage
+
+                cost = track_llm_usage(model, prompt_tokens, output_tokens, operation="hedge_cancelled", label=label)
+                stats.extra_cost_usd += cost.get("cost", 0.0)
+
+    def _start_candidates(self, label: str, primary: Optional[str]) -> Tuple[str, List[str]]:
+        primary = primary or settings.primary_llm
+        candidates = self._candidates(primary)
+        if candidates[0] != primary:
+            self.stats.setdefault(label, HedgeStats()).skipped += 1
+        return primary, candidates
+
+    async def astream(
+        self,
+        label: str,
+        stream_factory: Callable[[str], AsyncIterator[Any]],
+        primary: Optional[str] = None,
+        *,
+        models: Optional[Dict[str, str]] = None,
+        prompt_tokens: int = 0,
+        on_select: Optional[Callable[[str], None]] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Hedged streaming: yields the chunks of whichever provider produced a token first.
+
+        Args:
+            label: Call-site name (latency window / metrics key)
+            stream_factory: provider → async iterator of chunks (e.g. llm.astream(messages))
+            primary: Provider to start with (defaults to settings.primary_llm)
+            models: provider → model name (pricing for the extra-cost report)
+            prompt_tokens: Approximate prompt size (see approx_prompt_tokens)
+            on_select: Called with the winning provider before the first chunk
+
+        Raises:
+            ProviderError: Every provider failed before its first token
+        """
+        primary, candidates = self._start_candidates(label, primary)
+
+        async def start(contender: _Contender) -> None:
+            iterator = stream_factory(contender.provider).__aiter__()
+            contender.iterator = iterator
+            try:
+                async for chunk in iterator:
+                    contender.buffered.append(chunk)
+                    if _has_token(chunk):
+                        break
+            except BaseException:
+                # cancelled (lost the race) or failed: close the stream → HTTP connection closed
+                await _aclose(iterator)
+                raise
+            contender.first_token_ms = contender.elapsed_ms()
+
+        winner, losers = await self._race(label, candidates, start)
+        for loser in losers:
+            await _aclose(loser.iterator)  # finished second: stop its generation too
+        self._settle(label, primary, winner, losers, models, prompt_tokens)
+        if on_select is not None:
+            on_select(winner.provider)
+
+        try:
+            for chunk in winner.buffered:
+                yield chunk
+            async for chunk in winner.iterator:
+                yield chunk
+        finally:
+            await _aclose(winner.iterator)
+
+    async def ainvoke(
+        self,
+        label: str,
+        invoke_factory: Callable[[str], Awaitable[Any]],
+        primary: Optional[str] = None,
+        *,
+        models: Optional[Dict[str, str]] = None,
+        prompt_tokens: int = 0,
+    ) -> Tuple[str, Any]:
+        """
+        Hedged non-streaming call (the whole response counts as the first token).
+
+        Returns:
+            (winning provider, result)
+        """
+        primary, candidates = self._start_candidates(label, primary)
+
+        async def start(contender: _Contender) -> None:
+            contender.result = await invoke_factory(contender.provider)
+            contender.first_token_ms = contender.elapsed_ms()
+
+        winner, losers = await self._race(label, candidates, start)
+        self._settle(label, primary, winner, losers, models, prompt_tokens)
+        return winner.provider, winner.result
+
+    def snapshot(self) -> Dict[str, Any]:
+        providers: Dict[str, Dict[str, Any]] = {}
+        for (label, provider), samples in self._latency.items():
+            providers.setdefault(label, {})[provider] = {
+                "samples": len(samples),
+                "ttft_p50_ms": round(_percentile(samples, 0.5), 1) if samples else None,
+                "ttft_p95_ms": round(_percentile(samples, 0.95), 1) if samples else None,
+                "hedge_delay_sec": round(self.hedge_delay_sec(label, provider), 3),
+            }
+        return {
+            "percentile": self.percentile,
+            "labels": {
+                label: {**stats.to_dict(), "providers": providers.get(label, {})}
+                for label, stats in self.stats.items()
+            },
+            "breaker": self.breaker.snapshot().get(BREAKER_GROUP, {}),
+        }
+
+
+async def _aclose(iterator: Optional[AsyncIterator[Any]]) -> None:
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
+
+
+_hedge_router: Optional[HedgeRouter] = None
+
+
+def get_hedge_router() -> HedgeRouter:
+    """Global HedgeRouter (settings.llm_hedge_* / llm_breaker_*)."""
+    global _hedge_router
+    if _hedge_router is None:
+        _hedge_router = HedgeRouter(
+            percentile=settings.llm_hedge_percentile,
+            min_samples=settings.llm_hedge_min_samples,
+            default_delay_sec=settings.llm_hedge_default_delay_sec,
+            min_delay_sec=settings.llm_hedge_min_delay_sec,
+            max_hedge_ratio=settings.llm_hedge_max_ratio,
+            breaker=EndpointHealthRegistry(
+                failure_threshold=settings.llm_breaker_failure_threshold,
+                open_sec=settings.llm_breaker_open_sec,
+            ),
+        )
+    return _hedge_router
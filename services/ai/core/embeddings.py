@@ -1,27 +1,204 @@
-"""Embeddings configuration and factory."""
-from langchain_openai import OpenAIEmbeddings
+"""Embeddings configuration and factory.
+
+Backends (settings.embed_backend):
+- openai: OpenAIEmbeddings (API)
+- local: sentence-transformers CPU model (optional ONNX/quantized), no API round trip
+
+Both are wrapped with an LRU cache for query embeddings.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional
+
 from langchain_core.embeddings import Embeddings
 
 from .settings import settings
 
+logger = logging.getLogger(__name__)
 
-def get_embedder() -> Embeddings:
+OPENAI_MODEL_DIMENSIONS = {
+    "text-embedding-3-large": 3072,
+    "text-embedding-3-small": 1536,
+    "text-embedding-ada-002": 1536,
+}
+
+
+class LocalEmbeddings(Embeddings):
     """
-    Get configured embeddings instance.
+    sentence-transformers CPU embeddings.
 
-    Returns:
-        Configured embeddings model
+    - Model loads lazily on first use (thread-safe).
+    - Texts are sorted by length and grouped under a token budget, so short
+      chunks share large batches and long chunks get small ones (less padding).
+    - E5-family models get their "query: " / "passage: " prefixes automatically.
+    """
 
-    Note:
-        Currently uses OpenAI embeddings. Can be extended to support
-        other providers (nomic, bge, etc.) based on settings.
+    def __init__(
+        self,
+        model_name: str,
+        onnx_file: Optional[str] = None,
+        batch_tokens: int = 8192,
+        max_batch_size: int = 128,
+    ):
+        self.model_name = model_name
+        self.onnx_file = onnx_file
+        self.batch_tokens = batch_tokens
+        self.max_batch_size = max_batch_size
+
+        is_e5 = "e5" in model_name.lower()
+        self.query_prefix = "query: " if is_e5 else ""
+        self.passage_prefix = "passage: " if is_e5 else ""
+
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._load_model()
+        return self._model
+
+    def _load_model(self):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "embed_backend='local' requires sentence-transformers "
+                "(pip install -r requirements-full.txt)"
+            ) from e
+
+        kwargs = {"device": "cpu"}
+        if self.onnx_file:
+            # sentence-transformers>=3.2 + optimum[onnxruntime]
+            kwargs["backend"] = "onnx"
+            kwargs["model_kwargs"] = {"file_name": self.onnx_file}
+
+        logger.info(f"로컬 임베딩 모델 로드: {self.model_name} (onnx={self.onnx_file or 'no'})")
+        return SentenceTransformer(self.model_name, **kwargs)
+
+    @property
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def _batches(self, texts: List[str]) -> List[List[int]]:
+        """길이순 정렬 후 토큰 예산 단위로 묶은 인덱스 배치"""
+        max_tokens = self.model.max_seq_length or 512
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+        batches: List[List[int]] = []
+        current: List[int] = []
+        for i in order:
+            # 한국어 기준 대략 1토큰 ≈ 1.5자, 모델 최대 길이에서 잘림
+            tokens = min(int(len(texts[i]) / 1.5) + 2, max_tokens)
+            # 패딩 포함 비용 = 배치 크기 × 가장 긴 텍스트 (정렬되어 있으므로 현재 텍스트)
+            if current and (
+                (len(current) + 1) * tokens > self.batch_tokens
+                or len(current) >= self.max_batch_size
+            ):
+                batches.append(current)
+                current = []
+            current.append(i)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        for batch in self._batches(texts):
+            encoded = self.model.encode(
+                [texts[i] for i in batch],
+                batch_size=len(batch),
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            for i, vector in zip(batch, encoded):
+                vectors[i] = vector.tolist()
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._encode([self.passage_prefix + t for t in texts])
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._encode([self.query_prefix + text])[0]
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """Query embedding LRU cache wrapper (documents pass through)."""
+
+    def __init__(self, inner: Embeddings, max_size: int = 1024):
+        self.inner = inner
+        self.max_size = max_size
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        with self._lock:
+            if text in self._cache:
+                self._cache.move_to_end(text)
+                self.hits += 1
+                return self._cache[text]
+
+        vector = self.inner.embed_query(text)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[text] = vector
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return vector
+
+
+def create_embedder(backend: Optional[str] = None) -> Embeddings:
+    """
+    Create an uncached embeddings instance for the given backend.
+
+    Args:
+        backend: "openai" or "local" (default: settings.embed_backend)
     """
+    backend = backend or settings.embed_backend
+
+    if backend == "local":
+        return LocalEmbeddings(
+            settings.local_embed_model,
+            onnx_file=settings.local_embed_onnx_file,
+            batch_tokens=settings.local_embed_batch_tokens,
+        )
+
+    from langchain_openai import OpenAIEmbeddings
+
     return OpenAIEmbeddings(
         model=settings.embed_model,
         api_key=settings.openai_api_key,
     )
 
 
+@lru_cache(maxsize=None)
+def get_embedder() -> Embeddings:
+    """
+    Get configured embeddings instance (process-wide, local model loads once).
+
+    Returns:
+        Configured embeddings model with query-embedding cache
+    """
+    embedder = create_embedder()
+    if settings.embed_query_cache_size > 0:
+        embedder = CachedQueryEmbeddings(embedder, max_size=settings.embed_query_cache_size)
+    return embedder
+
+
 def get_embedding_dimension() -> int:
     """
     Get the dimension of the embedding model.
@@ -30,13 +207,25 @@ def get_embedding_dimension() -> int:
         Embedding dimension size
 
     Note:
+        local: resolved from the loaded sentence-transformers model
         text-embedding-3-large: 3072 dimensions
         text-embedding-3-small: 1536 dimensions
         text-embedding-ada-002: 1536 dimensions
     """
-    model_dimensions = {
-        "text-embedding-3-large": 3072,
-        "text-embedding-3-small": 1536,
-        "text-embedding-ada-002": 1536,
-    }
-    return model_dimensions.get(settings.embed_model, 1536)
+    embedder = get_embedder()
+    inner = getattr(embedder, "inner", embedder)
+    if isinstance(inner, LocalEmbeddings):
+        return inner.dimension
+    return OPENAI_MODEL_DIMENSIONS.get(settings.embed_model, settings.embed_dimensions)
+
+
+def embedding_collection_name(collection_name: str) -> str:
+    """
+    Vector collection name for the active backend.
+
+    Vectors from different models are not comparable, so non-OpenAI backends
+    use a separate collection (e.g. v2_contract_docs__local).
+    """
+    if settings.embed_backend == "openai":
+        return collection_name
+    return f"{collection_name}__{settings.embed_backend}"
@@ -0,0 +1,162 @@
+"""
+엔드포인트 상태 기억 (서킷 브레이커 레지스트리)
+
+같은 데이터를 주는 업스트림이 여러 개인 클라이언트(예: AptTradeAPIClient의 new/old URL)가
+매 호출마다 장애 난 엔드포인트를 먼저 시도해 타임아웃만큼 기다리지 않도록
+엔드포인트별 최근 상태를 기억합니다.
+
+- closed: 정상. 최근 실패 없고 지연 시간(EWMA)이 짧은 순으로 시도 (측정 전이면 선언 순서)
+- open: 연속 failure_threshold회 실패 → open_sec 동안 시도하지 않음 (실패 경로 지연 ≈ 0)
+- half_open: open_sec 경과 후 요청 1개만 먼저 보내 회복 여부 확인 (성공 → closed, 실패 → open)
+
+사용 예:
+    registry = get_endpoint_registry()
+    for name in registry.order("apt_trade", ["new", "old"]):
+        start = time.perf_counter()
+        try:
+            result = await call(urls[name])
+        except Exception as e:
+            registry.record_failure("apt_trade", name, e)
+            continue
+        registry.record_success("apt_trade", name, (time.perf_counter() - start) * 1000)
+        return result
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class EndpointHealth:
+    """엔드포인트 1개 상태"""
+
+    name: str
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    successes: int = 0
+    failures: int = 0
+    latency_ms: Optional[float] = None  # 성공 호출 지연 시간 EWMA
+    opened_at: float = 0.0
+    probe_started_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class EndpointHealthRegistry:
+    """(그룹, 엔드포인트) → 상태"""
+
+    def __init__(self, failure_threshold: int = 2, open_sec: float = 120.0, latency_alpha: float = 0.3):
+        self.failure_threshold = failure_threshold
+        self.open_sec = open_sec
+        self.latency_alpha = latency_alpha
+        self._groups: Dict[str, Dict[str, EndpointHealth]] = {}
+
+    def _health(self, group: str, name: str) -> EndpointHealth:
+        endpoints = self._groups.setdefault(group, {})
+        if name not in endpoints:
+            endpoints[name] = EndpointHealth(name)
+        return endpoints[name]
+
+    def order(self, group: str, names: Sequence[str]) -> List[str]:
+        """
+        시도 순서 (열린 서킷은 제외)
+
+        1. 회복 확인 시점이 된 half_open 엔드포인트 (요청 1개만 할당)
+        2. closed 엔드포인트: 최근 실패 없는 것 → 지연 시간 짧은 순 (측정 전이면 뒤로, 같으면 선언 순서)
+
+        Returns:
+            시도할 엔드포인트 목록 (모두 열려 있으면 빈 목록 → 호출부에서 즉시 실패)
+        """
+        now = time.monotonic()
+        probes: List[str] = []
+        closed: List[tuple] = []
+
+        for index, name in enumerate(names):
+            health = self._health(group, name)
+            if health.state == CLOSED:
+                latency = health.latency_ms if health.latency_ms is not None else float("inf")
+                closed.append((health.consecutive_failures > 0, latency, index, name))
+                continue
+
+            if now - health.opened_at < self.open_sec:
+                continue
+            # 회복 확인 요청은 1개만 (이전 확인 요청이 open_sec 넘게 끝나지 않았으면 다시 허용)
+            if health.probe_started_at is not None and now - health.probe_started_at < self.open_sec:
+                continue
+            health.state = HALF_OPEN
+            health.probe_started_at = now
+            probes.append(name)
+
+        return probes + [entry[-1] for entry in sorted(closed)]
+
+    def record_success(self, group: str, name: str, latency_ms: float) -> None:
+        health = self._health(group, name)
+        if health.state != CLOSED:
+            logger.info(f"[endpoint] {group}/{name} 회복 → closed")
+        health.state = CLOSED
+        health.consecutive_failures = 0
+        health.probe_started_at = None
+        health.successes += 1
+        health.latency_ms = (
+            latency_ms if health.latency_ms is None
+            else self.latency_alpha * latency_ms + (1 - self.latency_alpha) * health.latency_ms
+        )
+
+    def record_failure(self, group: str, name: str, error: Any = None) -> None:
+        health = self._health(group, name)
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.last_error = str(error)[:200] if error is not None else None
+
+        if health.state == HALF_OPEN or health.consecutive_failures >= self.failure_threshold:
+            if health.state != OPEN:
+                logger.warning(
+                    f"[endpoint] {group}/{name} → open ({self.open_sec:.0f}초 동안 건너뜀): {health.last_error}"
+                )
+            health.state = OPEN
+            health.opened_at = time.monotonic()
+            health.probe_started_at = None
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """그룹별 엔드포인트 상태 (디버깅용)"""
+        now = time.monotonic()
+        return {
+            group: {
+                name: {
+                    "state": health.state,
+                    "consecutive_failures": health.consecutive_failures,
+                    "successes": health.successes,
+                    "failures": health.failures,
+                    "latency_ms": round(health.latency_ms, 1) if health.latency_ms is not None else None,
+                    "retry_in_sec": (
+                        round(max(0.0, self.open_sec - (now - health.opened_at)), 1)
+                        if health.state == OPEN else None
+                    ),
+                    "last_error": health.last_error,
+                }
+                for name, health in endpoints.items()
+            }
+            for group, endpoints in self._groups.items()
+        }
+
+
+_registry: Optional[EndpointHealthRegistry] = None
+
+
+def get_endpoint_registry() -> EndpointHealthRegistry:
+    """전역 EndpointHealthRegistry"""
+    global _registry
+    if _registry is None:
+        from core.settings import settings
+
+        _registry = EndpointHealthRegistry(
+            failure_threshold=settings.endpoint_breaker_failure_threshold,
+            open_sec=settings.endpoint_breaker_open_sec,
+        )
+    return _registry
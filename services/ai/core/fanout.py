@@ -0,0 +1,109 @@
+"""
+독립적인 비동기 호출 동시 실행 (fan-out)
+
+공공데이터 API처럼 서로 의존하지 않는 호출을 한꺼번에 실행합니다.
+- 호출별 타임아웃 (느린 API 하나가 전체 응답을 붙잡지 않음)
+- 부분 결과: 실패/타임아웃은 기록만 하고 나머지 결과는 그대로 반환
+- 동시 실행 수 제한 (선택)
+- 호출별 소요 시간 표 (latency_table)
+
+전체 소요 시간 ≈ 가장 느린 호출 1개 (순차 실행 시 모든 호출의 합).
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CallFactory = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class FanoutResult:
+    """호출 1건 결과 (status: ok | error | timeout - timeout은 fan-out 제한 시간 초과만)"""
+
+    name: str
+    status: str
+    value: Any = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+async def _run_call(
+    name: str,
+    factory: CallFactory,
+    timeout_sec: Optional[float],
+    semaphore: Optional[asyncio.Semaphore],
+) -> FanoutResult:
+    start = time.perf_counter()
+    deadline = None
+    try:
+        if semaphore is None:
+            async with asyncio.timeout(timeout_sec) as deadline:
+                value = await factory()
+        else:
+            async with semaphore:
+                # 대기 시간은 제외하고 실제 호출에만 타임아웃 적용
+                start = time.perf_counter()
+                async with asyncio.timeout(timeout_sec) as deadline:
+                    value = await factory()
+        result = FanoutResult(name, "ok", value=value)
+    except Exception as e:
+        if isinstance(e, asyncio.TimeoutError) and deadline is not None and deadline.expired():
+            result = FanoutResult(name, "timeout", error=f"{timeout_sec:.1f}초 내 응답 없음")
+        else:
+            # 호출 내부에서 발생한 TimeoutError(HTTP 클라이언트 타임아웃 등)는 오류로 기록
+            result = FanoutResult(name, "error", error=f"{type(e).__name__}: {e}")
+
+    result.elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    if not result.ok:
+        logger.warning(f"[fan-out] {name}: {result.status} ({result.elapsed_ms:.0f}ms) {result.error}")
+    return result
+
+
+async def fan_out(
+    calls: Sequence[Tuple[str, CallFactory]],
+    timeout_sec: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[FanoutResult]:
+    """
+    독립 호출 동시 실행
+
+    Args:
+        calls: [(이름, 코루틴 생성 함수), ...] - 함수는 fan_out 안에서 호출됨
+        timeout_sec: 호출별 제한 시간 (None이면 무제한)
+        max_concurrency: 동시 실행 수 (None이면 전부 동시)
+
+    Returns:
+        calls 순서대로 FanoutResult 목록 (예외를 던지지 않음)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        _run_call(name, factory, timeout_sec, semaphore) for name, factory in calls
+    ))
+    total_ms = (time.perf_counter() - start) * 1000
+
+    ok_count = sum(1 for r in results if r.ok)
+    slowest = max(results, key=lambda r: r.elapsed_ms, default=None)
+    logger.info(
+        f"[fan-out] {ok_count}/{len(results)} 성공, {total_ms:.0f}ms "
+        f"(합계 {sum(r.elapsed_ms for r in results):.0f}ms"
+        + (f", 최장 {slowest.name} {slowest.elapsed_ms:.0f}ms)" if slowest else ")")
+    )
+    return list(results)
+
+
+def latency_table(results: Sequence[FanoutResult]) -> List[Dict[str, Any]]:
+    """호출별 상태/소요 시간 (응답에 그대로 포함하는 용도, 호출 순서 유지)"""
+    return [
+        {"name": r.name, "status": r.status, "elapsed_ms": r.elapsed_ms, "error": r.error}
+        for r in results
+    ]
@@ -2,12 +2,13 @@
 import base64
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 
 import google.generativeai as genai
 from PIL import Image
-import fitz  # PyMuPDF
 
+from .llm_governor import DEFAULT_COMPLETION_TOKENS, IMAGE_TOKENS, llm_slot
+from .page_render import RenderedPage, render_pages
 from .settings import settings
 
 logger = logging.getLogger(__name__)
@@ -20,32 +21,18 @@ def configure_gemini():
     genai.configure(api_key=settings.gemini_api_key)
 
 
-def pdf_to_images(pdf_path: str, dpi: int = 200) -> List[Image.Image]:
+def pdf_to_images(pdf_path: str, dpi: Optional[int] = None) -> List[Image.Image]:
     """
-    Convert PDF pages to PIL Images.
+    Convert PDF pages to PIL Images (shared in-memory renderer, cached per document).
 
     Args:
         pdf_path: Path to PDF file
-        dpi: Resolution for image conversion (default 200 for OCR quality)
+        dpi: Fixed resolution (default None = adaptive per page, see core.page_render)
 
     Returns:
-        List of PIL Image objects
+        List of PIL Image objects (blank/duplicate pages skipped)
     """
-    images = []
-    pdf_document = fitz.open(pdf_path)
-
-    for page_num in range(len(pdf_document)):
-        page = pdf_document[page_num]
-        # Convert to pixmap with specified DPI
-        mat = fitz.Matrix(dpi / 72, dpi / 72)
-        pix = page.get_pixmap(matrix=mat)
-
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        images.append(img)
-
-    pdf_document.close()
-    return images
+    return [page.to_pil() for page in render_pages(pdf_path, dpi=dpi)]
 
 
 def load_image(image_path: str) -> Image.Image:
@@ -61,12 +48,12 @@ def load_image(image_path: str) -> Image.Image:
     return Image.open(image_path)
 
 
-def extract_text_from_image_with_gemini(image: Image.Image) -> str:
+def extract_text_from_image_with_gemini(image: Union[Image.Image, RenderedPage]) -> str:
     """
     Extract text from image using Gemini Vision.
 
     Args:
-        image: PIL Image object
+        image: PIL Image object or rendered page (encoded bytes are sent as-is)
 
     Returns:
         Extracted text
@@ -91,15 +78,20 @@ def extract_text_from_image_with_gemini(image: Image.Image) -> str:
 
 추출된 텍스트:"""
 
+    if isinstance(image, RenderedPage):
+        image = {"mime_type": image.mime_type, "data": image.data}
+
     try:
-        response = model.generate_content([prompt, image])
+        # httpx 트랜스포트를 거치지 않아 직접 LLM 허가 (이미지 1장 + 출력)
+        with llm_slot("gemini", tokens=IMAGE_TOKENS + DEFAULT_COMPLETION_TOKENS):
+            response = model.generate_content([prompt, image])
         return response.text
     except Exception as e:
         logger.error(f"Gemini Vision OCR failed: {e}")
         raise
 
 
-def extract_text_from_pdf_with_gemini(pdf_path: str, dpi: int = 200) -> str:
+def extract_text_from_pdf_with_gemini(pdf_path: str, dpi: Optional[int] = None) -> str:
     """
     Extract text from PDF using Gemini Vision OCR.
 
@@ -108,7 +100,7 @@ def extract_text_from_pdf_with_gemini(pdf_path: str, dpi: int = 200) -> str:
 
     Args:
         pdf_path: Path to PDF file
-        dpi: Resolution for image conversion (default 200)
+        dpi: Fixed resolution (default None = adaptive per page)
 
     Returns:
         Extracted text from all pages
@@ -119,20 +111,21 @@ def extract_text_from_pdf_with_gemini(pdf_path: str, dpi: int = 200) -> str:
     """
     logger.info(f"Starting Gemini Vision OCR for PDF: {pdf_path}")
 
-    # Convert PDF to images
-    images = pdf_to_images(pdf_path, dpi=dpi)
-    logger.info(f"Converted PDF to {len(images)} images")
+    # Render pages in memory (cached, shared with Claude cross-validation)
+    pages = render_pages(pdf_path, dpi=dpi)
+    logger.info(f"Rendered {len(pages)} pages")
 
     # Extract text from each page
     all_text = []
-    for i, image in enumerate(images):
-        logger.info(f"Gemini processing page {i + 1}/{len(images)}")
+    for page in pages:
+        page_no = page.index + 1
+        logger.info(f"Gemini processing page {page_no} ({len(page.data) // 1024}KB, {page.dpi}dpi)")
         try:
-            page_text = extract_text_from_image_with_gemini(image)
-            all_text.append(f"\n\n--- 페이지 {i + 1} ---\n\n{page_text}")
+            page_text = extract_text_from_image_with_gemini(page)
+            all_text.append(f"\n\n--- 페이지 {page_no} ---\n\n{page_text}")
         except Exception as e:
-            logger.warning(f"Failed to extract text from page {i + 1}: {e}")
-            all_text.append(f"\n\n--- 페이지 {i + 1} (추출 실패) ---\n\n")
+            logger.warning(f"Failed to extract text from page {page_no}: {e}")
+            all_text.append(f"\n\n--- 페이지 {page_no} (추출 실패) ---\n\n")
 
     result = "".join(all_text)
     logger.info(f"Gemini Vision OCR completed. Extracted {len(result)} characters")
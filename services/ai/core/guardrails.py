@@ -2,9 +2,14 @@
 ZipCheck AI Guardrails - 부동산 전용 질문 필터링 시스템
 
 부동산/계약서 관련 질문만 허용하고, 무관한 질문은 거부합니다.
+
+키워드 매칭은 프로세스당 한 번 만든 Aho-Corasick 오토마톤으로 질문을 한 번만 훑고
+(키워드 수와 무관하게 질문 길이에 비례), 패턴은 미리 컴파일해 둡니다.
 """
 
-from typing import Optional, Dict, Any
+from collections import deque
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List
 from enum import Enum
 import re
 
@@ -77,6 +82,27 @@ FORBIDDEN_KEYWORDS = {
     "번역", "통역", "작사", "작곡", "시", "소설", "이야기"
 }
 
+# 카테고리 판단 키워드
+CONTRACT_KEYWORDS = {"계약서", "계약", "특약"}
+LEGAL_KEYWORDS = {"법", "소송", "권리", "의무"}
+
+# 부동산 관련 패턴 (매칭 1개당 0.2점)
+REAL_ESTATE_PATTERNS = [
+    # 계약 관련 질문 패턴
+    r"계약.*(?:어떻|괜찮|위험|문제|확인)",
+    r"(?:전세|월세|매매).*(?:계약|금|보증)",
+
+    # 등기/법률 관련
+    r"등기.*(?:확인|문제|내용)",
+    r"(?:취득세|양도세|재산세)",
+
+    # 리스크 관련
+    r"(?:사기|위험|문제|하자|리스크)",
+
+    # 절차 관련
+    r"(?:이사|입주|명도|잔금).*(?:절차|방법|어떻게)"
+]
+
 # 거부 응답 템플릿
 REJECTION_TEMPLATES = {
     QuestionCategory.OFF_TOPIC: """고객님, 안녕하십니까.
@@ -97,6 +123,97 @@ REJECTION_TEMPLATES = {
 }
 
 
+class KeywordAutomaton:
+    """
+    Aho-Corasick 다중 키워드 매처
+
+    모든 키워드를 트라이 + 실패 링크로 묶어 텍스트를 한 번만 훑습니다.
+    매칭 결과는 키워드 인덱스 비트마스크(int)로 반환하므로 그룹별 개수는
+    `(mask & group_mask).bit_count()`로 바로 계산할 수 있습니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = sorted({kw for kw in keywords if kw})
+        self._index = {kw: i for i, kw in enumerate(self.keywords)}
+
+        goto: List[Dict[str, int]] = [{}]
+        output: List[int] = [0]
+        for i, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    output.append(0)
+                    goto[state][ch] = next_state
+                state = next_state
+            output[state] |= 1 << i
+
+        # 실패 링크 (BFS) + 실패 경로의 출력 병합
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                if state == 0:
+                    continue
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(ch, 0)
+                output[next_state] |= output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def mask_of(self, keywords: Iterable[str]) -> int:
+        """키워드 그룹 → 비트마스크 (오토마톤에 없는 키워드는 무시)"""
+        mask = 0
+        for keyword in keywords:
+            if keyword in self._index:
+                mask |= 1 << self._index[keyword]
+        return mask
+
+    def scan(self, text: str) -> int:
+        """텍스트에 등장한 키워드 비트마스크 (겹치는 매칭 포함)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        found = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            found |= output[state]
+        return found
+
+    def matches(self, text: str) -> List[str]:
+        """텍스트에 등장한 키워드 목록"""
+        found = self.scan(text)
+        return [kw for i, kw in enumerate(self.keywords) if found >> i & 1]
+
+
+class _GuardrailMatcher:
+    """가드레일 키워드 그룹 오토마톤 + 컴파일된 패턴 (프로세스당 1회 생성)"""
+
+    def __init__(self):
+        self.automaton = KeywordAutomaton(
+            REAL_ESTATE_KEYWORDS | FORBIDDEN_KEYWORDS | CONTRACT_KEYWORDS | LEGAL_KEYWORDS
+        )
+        self.real_estate_mask = self.automaton.mask_of(REAL_ESTATE_KEYWORDS)
+        self.forbidden_mask = self.automaton.mask_of(FORBIDDEN_KEYWORDS)
+        self.contract_mask = self.automaton.mask_of(CONTRACT_KEYWORDS)
+        self.legal_mask = self.automaton.mask_of(LEGAL_KEYWORDS)
+        self.patterns = [re.compile(pattern) for pattern in REAL_ESTATE_PATTERNS]
+
+
+@lru_cache(maxsize=1)
+def _get_matcher() -> _GuardrailMatcher:
+    return _GuardrailMatcher()
+
+
 class RealEstateGuardrail:
     """부동산 전용 가드레일 클래스"""
 
@@ -118,8 +235,11 @@ class RealEstateGuardrail:
         Returns:
             GuardrailResponse: 허용 여부와 카테고리
         """
+        # 키워드는 질문을 한 번만 훑어 모든 그룹을 동시에 매칭
+        found = _get_matcher().automaton.scan(question.lower())
+
         # 0. 금지 키워드 체크 (최우선)
-        if self._has_forbidden_keywords(question):
+        if self._has_forbidden_keywords(found):
             return GuardrailResponse(
                 is_allowed=False,
                 category=QuestionCategory.OFF_TOPIC,
@@ -128,7 +248,7 @@ class RealEstateGuardrail:
             )
 
         # 1. 키워드 매칭으로 1차 필터링
-        keyword_score = self._calculate_keyword_score(question)
+        keyword_score = self._calculate_keyword_score(found)
 
         # 2. 패턴 매칭으로 2차 필터링
         pattern_score = self._calculate_pattern_score(question)
@@ -137,7 +257,7 @@ class RealEstateGuardrail:
         final_score = (keyword_score * 0.7) + (pattern_score * 0.3)
 
         # 4. 카테고리 판단
-        category = self._determine_category(question, final_score)
+        category = self._determine_category(found, final_score)
 
         # 5. 허용 여부 결정
         is_allowed = final_score >= self.min_confidence_threshold
@@ -152,23 +272,30 @@ class RealEstateGuardrail:
             reason=reason
         )
 
-    def _has_forbidden_keywords(self, question: str) -> bool:
+    def check_questions(self, questions: List[str]) -> List[GuardrailResponse]:
+        """
+        여러 질문 일괄 검사 (같은 질문은 한 번만 검사)
+
+        Args:
+            questions: 사용자 질문 목록
+
+        Returns:
+            입력 순서대로 GuardrailResponse 목록
+        """
+        results: Dict[str, GuardrailResponse] = {}
+        for question in questions:
+            if question not in results:
+                results[question] = self.check_question(question)
+        return [results[question] for question in questions]
+
+    def _has_forbidden_keywords(self, found: int) -> bool:
         """금지 키워드 포함 여부 확인"""
-        question_lower = question.lower()
-        return any(
-            keyword in question_lower
-            for keyword in FORBIDDEN_KEYWORDS
-        )
+        return bool(found & _get_matcher().forbidden_mask)
 
-    def _calculate_keyword_score(self, question: str) -> float:
+    def _calculate_keyword_score(self, found: int) -> float:
         """키워드 매칭 점수 계산"""
-        question_lower = question.lower()
-
         # 부동산 키워드 매칭 개수
-        matched_keywords = sum(
-            1 for keyword in REAL_ESTATE_KEYWORDS
-            if keyword in question_lower
-        )
+        matched_keywords = (found & _get_matcher().real_estate_mask).bit_count()
 
         # 점수 정규화 (최대 3개 키워드면 1.0점)
         score = min(matched_keywords / 3.0, 1.0)
@@ -179,44 +306,29 @@ class RealEstateGuardrail:
         """패턴 매칭 점수 계산"""
         score = 0.0
 
-        # 부동산 관련 패턴들
-        patterns = [
-            # 계약 관련 질문 패턴
-            r"계약.*(?:어떻|괜찮|위험|문제|확인)",
-            r"(?:전세|월세|매매).*(?:계약|금|보증)",
-
-            # 등기/법률 관련
-            r"등기.*(?:확인|문제|내용)",
-            r"(?:취득세|양도세|재산세)",
-
-            # 리스크 관련
-            r"(?:사기|위험|문제|하자|리스크)",
-
-            # 절차 관련
-            r"(?:이사|입주|명도|잔금).*(?:절차|방법|어떻게)"
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, question):
+        for pattern in _get_matcher().patterns:
+            if pattern.search(question):
                 score += 0.2
 
         return min(score, 1.0)
 
     def _determine_category(
         self,
-        question: str,
+        found: int,
         score: float
     ) -> QuestionCategory:
         """질문 카테고리 결정"""
         if score < self.min_confidence_threshold:
             return QuestionCategory.OFF_TOPIC
 
+        matcher = _get_matcher()
+
         # 계약서 관련 키워드
-        if any(kw in question for kw in ["계약서", "계약", "특약"]):
+        if found & matcher.contract_mask:
             return QuestionCategory.CONTRACT
 
         # 법률 관련 키워드
-        if any(kw in question for kw in ["법", "소송", "권리", "의무"]):
+        if found & matcher.legal_mask:
             return QuestionCategory.LEGAL
 
         # 기본: 부동산 관련
@@ -263,8 +375,10 @@ def check_question(question: str, strict: bool = True) -> Dict[str, Any]:
         }
     """
     guardrail = get_guardrail(strict_mode=strict)
-    response = guardrail.check_question(question)
+    return _to_result(guardrail, guardrail.check_question(question))
 
+
+def _to_result(guardrail: RealEstateGuardrail, response: GuardrailResponse) -> Dict[str, Any]:
     result = {
         "allowed": response.is_allowed,
         "category": response.category.value,
@@ -275,3 +389,11 @@ def check_question(question: str, strict: bool = True) -> Dict[str, Any]:
         result["message"] = guardrail.format_rejection_message(response)
 
     return result
+
+
+def check_questions(questions: List[str], strict: bool = True) -> List[Dict[str, Any]]:
+    """
+    여러 질문 일괄 검사 (check_question과 같은 형식의 결과 목록)
+    """
+    guardrail = get_guardrail(strict_mode=strict)
+    return [_to_result(guardrail, response) for response in guardrail.check_questions(questions)]
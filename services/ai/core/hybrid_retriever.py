@@ -0,0 +1,289 @@
+"""Hybrid lexical + vector retrieval with a result cache.
+
+- Vector: PGVector similarity (k * fetch_multiplier candidates)
+- Lexical: Postgres full-text search on the chunk text
+  (to_tsvector('simple'), prefix query per term so "근저당" matches "근저당권이")
+- Fusion: weighted Reciprocal Rank Fusion (no score normalization needed)
+- Cache: LRU of (normalized question, collection, k) → documents,
+  invalidated per collection on upsert/delete and expired after a TTL
+- Stats: request count, cache hit rate, average/last latency (get_retrieval_stats)
+"""
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+RRF_K = 60  # Reciprocal Rank Fusion 상수
+
+# 검색어 끝에 붙는 조사/어미 (길이가 긴 것부터 제거)
+_KOREAN_SUFFIXES = sorted(
+    ["으로", "에서", "까지", "부터", "에게", "하고", "이나", "관련", "대한", "인가요", "나요", "은", "는",
+     "이", "가", "을", "를", "에", "의", "와", "과", "도", "로", "만"],
+    key=len,
+    reverse=True,
+)
+_STOPWORDS = {"무엇", "어떻게", "어떤", "알려줘", "알려주세요", "해주세요", "있나요", "뭔가요", "분석"}
+_TOKEN_RE = re.compile(r"[가-힣A-Za-z0-9]+")
+
+
+def normalize_question(question: str) -> str:
+    """캐시 키용 질문 정규화 (소문자, 공백 축약, 끝 문장부호 제거)"""
+    return " ".join(question.lower().split()).rstrip("?!.。 ")
+
+
+def lexical_terms(question: str) -> List[str]:
+    """질문 → 전문 검색어 (조사 제거, 1글자/불용어 제외)"""
+    terms: List[str] = []
+    for token in _TOKEN_RE.findall(question.lower()):
+        for suffix in _KOREAN_SUFFIXES:
+            if len(token) > len(suffix) + 1 and token.endswith(suffix):
+                token = token[: -len(suffix)]
+                break
+        if len(token) >= 2 and token not in _STOPWORDS and token not in terms:
+            terms.append(token)
+    return terms
+
+
+def focus_excerpt(text: str, question: str, limit: int = 800) -> str:
+    """
+    긴 청크에서 검색어가 처음 등장하는 위치 중심으로 limit자 발췌
+
+    검색어가 앞부분(limit 이내)에 있거나 없으면 앞에서부터 자릅니다.
+    """
+    if len(text) <= limit:
+        return text
+
+    positions = [text.find(term) for term in lexical_terms(question)]
+    positions = [p for p in positions if p >= 0]
+    if not positions or min(positions) < limit:
+        return text[:limit]
+
+    start = max(0, min(min(positions) - limit // 4, len(text) - limit))
+    return "…" + text[start:start + limit]
+
+
+def _doc_key(doc: Document) -> str:
+    metadata = doc.metadata or {}
+    content_hash = metadata.get("content_hash") or hashlib.sha1(doc.page_content.encode("utf-8")).hexdigest()
+    return f"{metadata.get('doc_id')}:{content_hash}"
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[Tuple[List[Document], float]],
+    k: int,
+) -> List[Document]:
+    """
+    가중 RRF: score(d) = Σ weight / (RRF_K + rank)
+
+    Args:
+        ranked_lists: [(순위순 문서 목록, 가중치), ...]
+        k: 반환 개수
+    """
+    scores: Dict[str, float] = {}
+    docs: Dict[str, Document] = {}
+    for ranked, weight in ranked_lists:
+        for rank, doc in enumerate(ranked, 1):
+            key = _doc_key(doc)
+            scores[key] = scores.get(key, 0.0) + weight / (RRF_K + rank)
+            docs.setdefault(key, doc)
+
+    ordered = sorted(scores, key=scores.get, reverse=True)[:k]
+    return [docs[key] for key in ordered]
+
+
+# ===========================
+# 캐시 / 통계
+# ===========================
+
+@dataclass
+class RetrievalStats:
+    requests: int = 0
+    cache_hits: int = 0
+    total_latency_ms: float = 0.0
+    last_latency_ms: float = 0.0
+    lexical_failures: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        misses = self.requests - self.cache_hits
+        return self.total_latency_ms / misses if misses else 0.0
+
+
+class RetrievalCache:
+    """(정규화 질문, 컬렉션, k) → 문서 LRU 캐시 (컬렉션별 세대 번호로 무효화)"""
+
+    def __init__(self, max_size: int = 256, ttl_sec: float = 300.0):
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._entries: "OrderedDict[tuple, Tuple[float, int, List[Document]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[List[Document]]:
+        collection = key[1]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, generation, docs = entry
+            if generation != self._generations.get(collection, 0) or time.monotonic() - stored_at > self.ttl_sec:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return docs
+
+    def put(self, key: tuple, docs: List[Document]) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), self._generations.get(key[1], 0), docs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """컬렉션(또는 전체) 캐시 무효화"""
+        with self._lock:
+            if collection is None:
+                self._entries.clear()
+                return
+            self._generations[collection] = self._generations.get(collection, 0) + 1
+
+
+_cache = RetrievalCache(settings.retrieval_cache_size, settings.retrieval_cache_ttl_sec)
+_stats = RetrievalStats()
+_stats_lock = threading.Lock()
+
+
+def invalidate_retrieval_cache(collection_name: Optional[str] = None) -> None:
+    """업서트/삭제 후 호출 (collection_name=None이면 전체)"""
+    if collection_name is not None:
+        from .embeddings import embedding_collection_name
+
+        collection_name = embedding_collection_name(collection_name)
+    _cache.invalidate(collection_name)
+
+
+def get_retrieval_stats() -> Dict[str, Any]:
+    """검색 지연 시간 / 캐시 적중률"""
+    with _stats_lock:
+        data = asdict(_stats)
+        data["hit_rate"] = round(_stats.hit_rate, 4)
+        data["avg_latency_ms"] = round(_stats.avg_latency_ms, 2)
+    data["cache_entries"] = len(_cache._entries)
+    return data
+
+
+# ===========================
+# 검색
+# ===========================
+
+def _lexical_search(vectorstore, question: str, limit: int) -> List[Document]:
+    """Postgres 전문 검색 (simple 사전 + 검색어별 prefix 매칭, ts_rank_cd 순)"""
+    from sqlalchemy import func
+
+    terms = lexical_terms(question)
+    if not terms:
+        return []
+
+    store = vectorstore.EmbeddingStore
+    tsquery = func.to_tsquery("simple", " | ".join(f"{term}:*" for term in terms))
+    tsvector = func.to_tsvector("simple", store.document)
+    rank = func.ts_rank_cd(tsvector, tsquery)
+
+    with vectorstore._make_session() as session:
+        collection = vectorstore.get_collection(session)
+        if collection is None:
+            return []
+        rows = (
+            session.query(store.document, store.cmetadata)
+            .filter(store.collection_id == collection.uuid)
+            .filter(tsvector.op("@@")(tsquery))
+            .order_by(rank.desc())
+            .limit(limit)
+            .all()
+        )
+    return [Document(page_content=document, metadata=cmetadata or {}) for document, cmetadata in rows]
+
+
+class HybridRetriever(BaseRetriever):
+    """PGVector + Postgres 전문 검색 RRF 하이브리드 리트리버 (결과 캐시 포함)"""
+
+    collection_name: str = "v2_contract_docs"
+    k: int = 6
+    fetch_multiplier: int = 3
+    vector_weight: float = 1.0
+    lexical_weight: float = 1.0
+
+    def _search(self, question: str) -> List[Document]:
+        from .embeddings import embedding_collection_name
+        from .retriever import get_vectorstore
+
+        key = (normalize_question(question), embedding_collection_name(self.collection_name), self.k)
+        cached = _cache.get(key)
+        if cached is not None:
+            with _stats_lock:
+                _stats.requests += 1
+                _stats.cache_hits += 1
+            return list(cached)
+
+        start = time.perf_counter()
+        vectorstore = get_vectorstore(collection_name=self.collection_name)
+        fetch_k = self.k * self.fetch_multiplier
+
+        vector_docs = vectorstore.similarity_search(question, k=fetch_k)
+
+        lexical_docs: List[Document] = []
+        lexical_failed = False
+        if self.lexical_weight > 0:
+            try:
+                lexical_docs = _lexical_search(vectorstore, question, fetch_k)
+            except Exception as e:
+                # 전문 검색 실패 시 벡터 결과만 사용
+                logger.warning(f"전문 검색 실패 (벡터 검색만 사용): {e}")
+                lexical_failed = True
+
+        docs = reciprocal_rank_fusion(
+            [(vector_docs, self.vector_weight), (lexical_docs, self.lexical_weight)],
+            k=self.k,
+        )
+        _cache.put(key, docs)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with _stats_lock:
+            _stats.requests += 1
+            _stats.total_latency_ms += elapsed_ms
+            _stats.last_latency_ms = elapsed_ms
+            _stats.lexical_failures += int(lexical_failed)
+
+        logger.info(
+            f"하이브리드 검색: vector={len(vector_docs)}, lexical={len(lexical_docs)} → {len(docs)}개 "
+            f"({elapsed_ms:.0f}ms)"
+        )
+        return list(docs)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self._search(query)
+
+    async def _aget_relevant_documents(self, query: str, *, run_manager=None) -> List[Document]:
+        # DB 조회/임베딩은 동기 → 스레드에서 실행해 이벤트 루프 블로킹 방지
+        return await asyncio.to_thread(self._search, query)
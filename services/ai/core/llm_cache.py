@@ -0,0 +1,380 @@
+"""
+LLM 응답 캐시 (리포트 생성용)
+
+build_llm_prompt()는 리스크 특징 / 계약 조건 / 시세의 결정적 함수라서, 바뀌지 않은 케이스를
+다시 분석하면 같은 GPT 초안과 Claude 검증을 같은 비용과 지연으로 다시 생성합니다.
+(모델, 파라미터, 정규화된 프롬프트 해시) 기준으로 최종 응답을 보관합니다.
+
+- 1차: 프로세스 메모리 LRU + TTL (AddressCache와 동일 구조)
+- 2차: Postgres v2_llm_response_cache (워커 / 재시작 간 공유, expires_at 기준 TTL)
+  - DB 오류 시 경고 후 일정 시간 메모리만 사용 (요청마다 연결 타임아웃을 기다리지 않음)
+- 우회: bypass=True (조회 없이 새로 생성 후 캐시 갱신) 또는 settings.llm_cache_enabled=False
+- 적중한 응답은 원래 스트림과 같은 이벤트 형식으로 일정 간격 재생 → 프론트엔드 동작 동일
+- 적중률 / 절약 토큰 / 절약 비용은 CostMonitor에 기록 (GET /dev/llm-cache)
+
+사용 예:
+    async for event in cached_llm_stream(
+        lambda: stream_gpt_draft(prompt),
+        model="gpt-4o-mini", params={"temperature": 0.3}, prompt=prompt, phase="draft",
+    ):
+        ...
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from core.address_converter import AddressCache
+
+logger = logging.getLogger(__name__)
+
+TABLE = "v2_llm_response_cache"
+
+# DB 오류 후 Postgres 계층을 다시 시도하기까지 대기 (초)
+DB_RETRY_SEC = 60.0
+
+
+def normalize_prompt(prompt: str) -> str:
+    """캐시 키용 프롬프트 정규화 (줄바꿈 통일, 줄 끝 / 앞뒤 공백 제거 - 본문 들여쓰기는 유지)"""
+    lines = prompt.replace("\r\n", "\n").replace("\r", "\n").strip().split("\n")
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def cache_key(model: str, params: Optional[Dict[str, Any]], prompt: str) -> str:
+    """(모델, 생성 파라미터, 정규화된 프롬프트 해시) → 캐시 키"""
+    prompt_hash = hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+    payload = json.dumps({"model": model, "params": params or {}, "prompt": prompt_hash}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def pricing_model(name: str, fallback: str) -> str:
+    """이벤트 모델 표기(예: 'claude-3-5-haiku') → CostMonitor 가격표 모델 이름"""
+    from core.cost_monitor import PRICING
+
+    if name in PRICING:
+        return name
+    return f"{name}-latest" if f"{name}-latest" in PRICING else fallback
+
+
+def same_model(requested: str, responded: Optional[str]) -> bool:
+    """응답 모델(이벤트 표기, 예: 'claude-3-5-sonnet')이 요청 모델과 같은지 (표기 없으면 같다고 봄)"""
+    return not responded or responded == requested or f"{responded}-latest" == requested
+
+
+def _approx_tokens(text: str) -> int:
+    from core.llm_governor import CHARS_PER_TOKEN
+
+    return len(text) // CHARS_PER_TOKEN
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 최종 응답"""
+
+    content: str
+    model: str  # 실제 응답한 모델의 이벤트 표기 (폴백 시 요청 모델과 다를 수 있음, 예: 'claude-3-5-haiku')
+    input_tokens: int
+    output_tokens: int
+
+
+class LLMResponseCache:
+    """메모리 LRU + Postgres 2단계 LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        memory_size: int = 256,
+        ttl_sec: float = 86400.0,
+        persist: bool = True,
+        engine_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.ttl_sec = ttl_sec
+        self.persist = persist
+        self._memory = AddressCache(memory_size, ttl_sec)
+        self._engine_factory = engine_factory
+        self._db_failed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.db_hits = 0
+        self.db_errors = 0
+        self.bypassed = 0
+        self.stores = 0
+
+    # ---------- Postgres 계층 ----------
+
+    def _engine(self):
+        if self._engine_factory is not None:
+            return self._engine_factory()
+        from core.database import get_engine
+
+        return get_engine()
+
+    def _db_available(self) -> bool:
+        if not self.persist:
+            return False
+        failed_at = self._db_failed_at
+        return failed_at is None or time.monotonic() - failed_at > DB_RETRY_SEC
+
+    def _db_failed(self, action: str, error: Exception) -> None:
+        with self._lock:
+            self.db_errors += 1
+            self._db_failed_at = time.monotonic()
+        logger.warning(f"[llm_cache] Postgres {action} 실패 ({DB_RETRY_SEC:.0f}초 동안 메모리만 사용): {error}")
+
+    def _db_get(self, key: str) -> Optional[CachedResponse]:
+        from sqlalchemy import text
+
+        now = datetime.now(timezone.utc)
+        with self._engine().begin() as conn:
+            row = conn.execute(
+                text(
+                    f"SELECT content, model, input_tokens, output_tokens FROM {TABLE} "
+                    "WHERE cache_key = :key AND expires_at > :now"
+                ),
+                {"key": key, "now": now},
+            ).first()
+            if row is None:
+                return None
+            conn.execute(
+                text(f"UPDATE {TABLE} SET hit_count = hit_count + 1, last_accessed_at = :now WHERE cache_key = :key"),
+                {"key": key, "now": now},
+            )
+        return CachedResponse(content=row[0], model=row[1], input_tokens=row[2], output_tokens=row[3])
+
+    def _db_put(self, key: str, response: CachedResponse, request_model: str) -> None:
+        from sqlalchemy import text
+
+        now = datetime.now(timezone.utc)
+        with self._engine().begin() as conn:
+            conn.execute(
+                text(
+                    f"INSERT INTO {TABLE} (cache_key, request_model, model, content, input_tokens, output_tokens, "
+                    "hit_count, expires_at, created_at, last_accessed_at) "
+                    "VALUES (:key, :request_model, :model, :content, :input_tokens, :output_tokens, 0, :expires_at, :now, :now) "
+                    "ON CONFLICT (cache_key) DO UPDATE SET model = excluded.model, content = excluded.content, "
+                    "input_tokens = excluded.input_tokens, output_tokens = excluded.output_tokens, "
+                    "expires_at = excluded.expires_at, created_at = excluded.created_at"
+                ),
+                {
+                    "key": key,
+                    "request_model": request_model,
+                    **asdict(response),
+                    "expires_at": now + timedelta(seconds=self.ttl_sec),
+                    "now": now,
+                },
+            )
+
+    # ---------- 조회 / 저장 ----------
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """메모리 → Postgres 순서로 조회 (Postgres 적중 시 메모리에도 적재)"""
+        cached = self._memory.get((key,))
+        if cached is not None or not self._db_available():
+            return cached
+        return self._get_persisted(key)
+
+    def _get_persisted(self, key: str) -> Optional[CachedResponse]:
+        try:
+            cached = self._db_get(key)
+        except Exception as e:
+            self._db_failed("조회", e)
+            return None
+        if cached is not None:
+            with self._lock:
+                self.db_hits += 1
+            self._memory.put((key,), cached)
+        return cached
+
+    def put(self, key: str, response: CachedResponse, request_model: str = "") -> None:
+        self._memory.put((key,), response)
+        with self._lock:
+            self.stores += 1
+        if not self._db_available():
+            return
+        try:
+            self._db_put(key, response, request_model or response.model)
+        except Exception as e:
+            self._db_failed("저장", e)
+
+    async def aget(self, key: str) -> Optional[CachedResponse]:
+        cached = self._memory.get((key,))
+        if cached is not None or not self._db_available():
+            return cached
+        return await asyncio.to_thread(self._get_persisted, key)
+
+    async def aput(self, key: str, response: CachedResponse, request_model: str = "") -> None:
+        await asyncio.to_thread(self.put, key, response, request_model)
+
+    def clear(self) -> None:
+        """메모리 계층만 비움 (Postgres 항목은 TTL로 만료)"""
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "memory": self._memory.stats(),
+            "persist": self.persist,
+            "db_hits": self.db_hits,
+            "db_errors": self.db_errors,
+            "db_available": self._db_available(),
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "ttl_sec": self.ttl_sec,
+        }
+
+
+_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    global _cache
+    if _cache is None:
+        from core.settings import settings
+
+        _cache = LLMResponseCache(
+            memory_size=settings.llm_cache_memory_size,
+            ttl_sec=settings.llm_cache_ttl_sec,
+            persist=settings.llm_cache_persist,
+        )
+    return _cache
+
+
+# ===========================
+# 조회 + 비용 기록
+# ===========================
+
+async def lookup(
+    model: str,
+    params: Optional[Dict[str, Any]],
+    prompt: str,
+    *,
+    bypass: bool = False,
+    operation: str = "llm",
+) -> tuple[Optional[str], Optional[CachedResponse]]:
+    """
+    캐시 조회 후 적중 / 미스를 CostMonitor에 기록
+
+    Returns:
+        (캐시 키, 적중한 응답) - 캐시 비활성이면 키가 None, 우회면 응답이 None (새 응답으로 갱신)
+    """
+    from core.cost_monitor import track_cache_usage
+    from core.settings import settings
+
+    if not settings.llm_cache_enabled:
+        return None, None
+    cache = get_llm_cache()
+    key = cache_key(model, params, prompt)
+    if bypass:
+        with cache._lock:
+            cache.bypassed += 1
+        return key, None
+
+    cached = await cache.aget(key)
+    if cached is not None:
+        track_cache_usage(
+            pricing_model(cached.model, model), True, cached.input_tokens, cached.output_tokens, operation=operation
+        )
+    else:
+        track_cache_usage(model, False, operation=operation)
+    return key, cached
+
+
+async def store(key: Optional[str], model: str, prompt: str, content: str, response_model: Optional[str] = None) -> None:
+    """최종 응답 저장 (빈 응답 / 캐시 미사용은 무시)"""
+    if key is None or not content:
+        return
+    response = CachedResponse(
+        content=content,
+        model=response_model or model,
+        input_tokens=_approx_tokens(normalize_prompt(prompt)),
+        output_tokens=_approx_tokens(content),
+    )
+    await get_llm_cache().aput(key, response, request_model=model)
+
+
+# ===========================
+# 스트림 캐시 / 재생
+# ===========================
+
+async def replay_events(
+    cached: CachedResponse,
+    phase: str,
+    chunk_chars: Optional[int] = None,
+    interval_sec: Optional[float] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    캐시된 응답을 stream_gpt_draft() / stream_claude_validation()과 같은 이벤트로 재생
+
+    chunk_chars 단위로 interval_sec 간격을 두고 내보내므로 프론트엔드의 진행 표시가
+    실제 생성과 같은 흐름으로 동작합니다. 모든 이벤트에 cached=True가 붙습니다.
+    """
+    from core.settings import settings
+
+    chunk_chars = chunk_chars or settings.llm_cache_replay_chunk_chars
+    interval_sec = settings.llm_cache_replay_interval_sec if interval_sec is None else interval_sec
+    content = cached.content
+
+    for start in range(0, len(content), chunk_chars):
+        if start:
+            await asyncio.sleep(interval_sec)
+        yield {
+            "phase": phase,
+            "model": cached.model,
+            "content": content[start:start + chunk_chars],
+            "total_length": min(start + chunk_chars, len(content)),
+            "done": False,
+            "cached": True,
+        }
+
+    yield {
+        "phase": phase,
+        "model": cached.model,
+        "content": "",
+        "total_length": len(content),
+        "done": True,
+        "final_content": content,
+        "cached": True,
+    }
+
+
+async def cached_llm_stream(
+    events_factory: Callable[[], AsyncIterator[Dict[str, Any]]],
+    *,
+    model: str,
+    params: Optional[Dict[str, Any]],
+    prompt: str,
+    phase: str,
+    bypass: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    LLM 스트림 이벤트 생성기 캐시 래퍼
+
+    - 적중: LLM을 호출하지 않고 replay_events()로 재생
+    - 미스: events_factory() 이벤트를 그대로 전달하고, 오류 없이 완료되면 final_content 저장
+      (폴백 모델이 응답한 경우는 요청 모델 키로 저장하지 않음)
+
+    Args:
+        events_factory: 이벤트 생성기 팩토리 (적중 시 호출하지 않음)
+        model: 요청 모델 이름 (캐시 키)
+        params: 응답에 영향을 주는 생성 파라미터 (temperature, max_tokens 등 - 캐시 키)
+        prompt: 프롬프트 원문 (정규화 후 해시)
+        phase: 이벤트 phase ('draft' / 'validation')
+        bypass: True면 캐시를 조회하지 않고 새로 생성 (완료되면 캐시 갱신)
+    """
+    key, cached = await lookup(model, params, prompt, bypass=bypass, operation=phase)
+    if cached is not None:
+        logger.info(f"[llm_cache] {phase} 캐시 적중 ({model}, {len(cached.content)}자) → 재생")
+        async for event in replay_events(cached, phase):
+            yield event
+        return
+
+    async for event in events_factory():
+        if event.get("done") and not event.get("error"):
+            responded = event.get("model")
+            if same_model(model, responded):
+                await store(key, model, prompt, event.get("final_content") or "", response_model=responded)
+            else:
+                logger.info(f"[llm_cache] {phase} 폴백 응답 미저장 (요청 {model}, 응답 {responded})")
+        yield event
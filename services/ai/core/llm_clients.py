@@ -0,0 +1,440 @@
+"""
+LLM 클라이언트 레지스트리 (프로세스 전역, 커넥션 풀 공유)
+
+스트리밍 분석/채팅이 요청마다 ChatOpenAI/ChatAnthropic를 새로 만들면 SDK 클라이언트와
+HTTP 연결도 요청마다 새로 생겨 TCP/TLS 핸드셰이크가 첫 토큰 지연(TTFT)에 그대로 더해졌습니다.
+
+- 제공자(openai | claude)별 HTTP 커넥션 풀 1개를 모든 모델이 공유
+  (비동기 풀은 이벤트 루프별로 분리 - vision의 동기 래퍼처럼 asyncio.run을 쓰는 호출부 대응)
+- (제공자, 모델, timeout, max_retries) → 기본 인스턴스 1개 캐시
+- temperature / max_tokens / streaming 등 요청별 값은 model_copy로 덮어씀
+  (검증/클라이언트 생성 없이 얕은 복사, HTTP 연결은 그대로 공유)
+- 계측: 제공자별 요청 수 / 새 연결 수 (연결 재사용률), 모델별 TTFT·응답 시간 EWMA
+  → GET /dev/llm-clients
+- 모든 요청(SDK 재시도 포함)은 보내기 전에 core/llm_governor.py 허가를 받고,
+  응답이 끝나면(스트리밍은 스트림 종료 시) 반납합니다
+
+사용 예:
+    llm = get_chat_model("openai", "gpt-4o-mini", temperature=0.3, streaming=True)
+    async for chunk in llm.astream(messages):
+        ...
+"""
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Literal, Optional, Tuple
+
+import httpx
+
+from .llm_governor import LLMPermit, estimate_request_tokens, get_llm_governor
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+Provider = Literal["openai", "claude"]
+
+# model_copy로 덮어쓰는 요청별 값 (기본 인스턴스 캐시 키에서 제외)
+REQUEST_OVERRIDES = ("temperature", "max_tokens", "streaming")
+
+
+# ===========================
+# 계측
+# ===========================
+
+@dataclass
+class TransportStats:
+    """제공자별 HTTP 연결 통계"""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        reused = max(self.requests - self.connections_opened, 0)
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "reuse_ratio": round(reused / self.requests, 3) if self.requests else None,
+        }
+
+
+@dataclass
+class ModelStats:
+    """모델별 호출 지연 (EWMA, ms)"""
+
+    calls: int = 0
+    errors: int = 0
+    ttft_ms: Optional[float] = None  # 스트리밍 첫 토큰까지
+    latency_ms: Optional[float] = None  # 응답 완료까지
+    last_ttft_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "ttft_ms": round(self.ttft_ms, 1) if self.ttft_ms is not None else None,
+            "last_ttft_ms": round(self.last_ttft_ms, 1) if self.last_ttft_ms is not None else None,
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+        }
+
+
+def _ewma(current: Optional[float], value: float, alpha: float = 0.3) -> float:
+    return value if current is None else alpha * value + (1 - alpha) * current
+
+
+def _metrics_handler(stats: ModelStats):
+    """LangChain 콜백: 호출 시작 → 첫 토큰 / 완료 시각 기록"""
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class LLMMetricsHandler(BaseCallbackHandler):
+        run_inline = True  # 비동기 호출에서도 executor 없이 바로 실행
+
+        def __init__(self) -> None:
+            self._started: Dict[Any, float] = {}
+            self._first_token: set = set()
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+            self._started[run_id] = time.perf_counter()
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs) -> None:
+            self._started[run_id] = time.perf_counter()
+
+        def on_llm_new_token(self, token, *, run_id, **kwargs) -> None:
+            started = self._started.get(run_id)
+            if started is None or run_id in self._first_token:
+                return
+            self._first_token.add(run_id)
+            elapsed = (time.perf_counter() - started) * 1000
+            stats.last_ttft_ms = elapsed
+            stats.ttft_ms = _ewma(stats.ttft_ms, elapsed)
+
+        def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+            started = self._started.pop(run_id, None)
+            self._first_token.discard(run_id)
+            stats.calls += 1
+            if started is not None:
+                stats.latency_ms = _ewma(stats.latency_ms, (time.perf_counter() - started) * 1000)
+
+        def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+            self._started.pop(run_id, None)
+            self._first_token.discard(run_id)
+            stats.calls += 1
+            stats.errors += 1
+
+    return LLMMetricsHandler()
+
+
+# ===========================
+# 공유 HTTP 커넥션 풀
+# ===========================
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.llm_pool_max_connections,
+        max_keepalive_connections=settings.llm_pool_max_keepalive,
+        keepalive_expiry=settings.llm_pool_keepalive_expiry_sec,
+    )
+
+
+def _request_tokens(request: httpx.Request) -> int:
+    try:
+        content = request.content
+    except httpx.RequestNotRead:  # 스트리밍 업로드 - 본문 추정 생략
+        content = b""
+    return estimate_request_tokens(content)
+
+
+class _PermitAsyncStream(httpx.AsyncByteStream):
+    """응답 스트림이 닫히면 LLM 허가 반납 (스트리밍 응답은 마지막 청크까지 동시 요청으로 셈)"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, permit: LLMPermit):
+        self._stream = stream
+        self._permit = permit
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._permit.release()
+
+
+class _PermitSyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, permit: LLMPermit):
+        self._stream = stream
+        self._permit = permit
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._permit.release()
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    이벤트 루프별 연결 풀 (비동기 연결은 생성한 루프에서만 재사용 가능)
+
+    같은 루프(서버 프로세스)의 모든 요청이 하나의 풀을 공유하고,
+    asyncio.run으로 잠깐 돌고 끝나는 루프는 따로 풀을 만들었다가 루프와 함께 버립니다.
+    """
+
+    def __init__(self, provider: str, limits: httpx.Limits, stats: TransportStats):
+        self._provider = provider
+        self._limits = limits
+        self._stats = stats
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = self._pools[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+        return pool
+
+    async def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            self._stats.connections_opened += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not settings.llm_governor_enabled:
+            return await self._send(request)
+
+        permit = await get_llm_governor().acquire(self._provider, _request_tokens(request))
+        try:
+            response = await self._send(request)
+        except BaseException:
+            permit.release()
+            raise
+        permit.observe(response.status_code, response.headers)
+        response.stream = _PermitAsyncStream(response.stream, permit)
+        return response
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        self._stats.requests += 1
+        request.extensions["trace"] = self._trace
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        for pool in list(self._pools.values()):
+            await pool.aclose()
+        self._pools.clear()
+
+
+class _CountingTransport(httpx.HTTPTransport):
+    """동기 풀 (스레드 안전) + 연결 통계"""
+
+    def __init__(self, provider: str, limits: httpx.Limits, stats: TransportStats):
+        super().__init__(limits=limits)
+        self._provider = provider
+        self._stats = stats
+
+    def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            self._stats.connections_opened += 1
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not settings.llm_governor_enabled:
+            return self._send(request)
+
+        permit = get_llm_governor().acquire_sync(self._provider, _request_tokens(request))
+        try:
+            response = self._send(request)
+        except BaseException:
+            permit.release()
+            raise
+        permit.observe(response.status_code, response.headers)
+        response.stream = _PermitSyncStream(response.stream, permit)
+        return response
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        self._stats.requests += 1
+        request.extensions["trace"] = self._trace
+        return super().handle_request(request)
+
+
+# ===========================
+# 레지스트리
+# ===========================
+
+class LLMClientRegistry:
+    """(제공자, 모델, 연결 설정) → 채팅 모델 (HTTP 풀은 제공자별 공유)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._models: Dict[Tuple, Any] = {}
+        self._async_http: Dict[str, httpx.AsyncClient] = {}
+        self._sync_http: Dict[str, httpx.Client] = {}
+        self._sdk_clients: Dict[str, Any] = {}
+        self.transport_stats: Dict[str, TransportStats] = {}
+        self.model_stats: Dict[Tuple[str, str], ModelStats] = {}
+        self.created = 0
+        self.reused = 0
+
+    def _transport_stats(self, provider: str) -> TransportStats:
+        return self.transport_stats.setdefault(provider, TransportStats())
+
+    def async_http_client(self, provider: str) -> httpx.AsyncClient:
+        """제공자별 공유 비동기 HTTP 클라이언트 (timeout은 SDK가 요청마다 지정)"""
+        with self._lock:
+            client = self._async_http.get(provider)
+            if client is None:
+                transport = _LoopLocalTransport(provider, _pool_limits(), self._transport_stats(provider))
+                client = self._async_http[provider] = httpx.AsyncClient(transport=transport)
+            return client
+
+    def sync_http_client(self, provider: str) -> httpx.Client:
+        """제공자별 공유 동기 HTTP 클라이언트 (.invoke 호출부)"""
+        with self._lock:
+            client = self._sync_http.get(provider)
+            if client is None:
+                transport = _CountingTransport(provider, _pool_limits(), self._transport_stats(provider))
+                client = self._sync_http[provider] = httpx.Client(transport=transport)
+            return client
+
+    def openai_sdk_client(self):
+        """openai.AsyncOpenAI (공유 풀) - LangChain을 거치지 않는 Function Calling 호출부용"""
+        with self._lock:
+            client = self._sdk_clients.get("openai")
+        if client is None:
+            from openai import AsyncOpenAI
+
+            client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=self.async_http_client("openai"))
+            with self._lock:
+                client = self._sdk_clients.setdefault("openai", client)
+        return client
+
+    def _build(self, provider: str, model: str, timeout: Optional[float], max_retries: Optional[int]):
+        stats = self.model_stats.setdefault((provider, model), ModelStats())
+        callbacks = [_metrics_handler(stats)]
+
+        if provider == "openai":
+            from langchain_openai import ChatOpenAI
+
+            params: Dict[str, Any] = {}
+            if max_retries is not None:
+                params["max_retries"] = max_retries
+            return ChatOpenAI(
+                model=model,
+                api_key=settings.openai_api_key,
+                timeout=timeout,
+                http_client=self.sync_http_client(provider),
+                http_async_client=self.async_http_client(provider),
+                callbacks=callbacks,
+                **params,
+            )
+
+        if provider == "claude":
+            import anthropic
+            from langchain_anthropic import ChatAnthropic
+
+            params = {"default_request_timeout": timeout}
+            if max_retries is not None:
+                params["max_retries"] = max_retries
+            if settings.anthropic_api_key:  # 없으면 ANTHROPIC_API_KEY 환경 변수
+                params["api_key"] = settings.anthropic_api_key
+            llm = ChatAnthropic(model=model, callbacks=callbacks, **params)
+            # ChatAnthropic은 http_client 인자가 없어 SDK 클라이언트(cached_property)를 미리 채워 둠
+            client_params = llm._client_params
+            llm.__dict__["_client"] = anthropic.Client(**client_params, http_client=self.sync_http_client(provider))
+            llm.__dict__["_async_client"] = anthropic.AsyncClient(
+                **client_params, http_client=self.async_http_client(provider)
+            )
+            return llm
+
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    def get(
+        self,
+        provider: Provider,
+        model: str,
+        *,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        **overrides: Any,
+    ):
+        """
+        채팅 모델 가져오기
+
+        Args:
+            provider: "openai" | "claude"
+            model: 모델명
+            timeout: 요청 제한 시간 (초, 캐시 키에 포함)
+            max_retries: SDK 재시도 횟수 (캐시 키에 포함)
+            **overrides: temperature / max_tokens / streaming (요청별, None이면 모델 기본값)
+        """
+        unknown = set(overrides) - set(REQUEST_OVERRIDES)
+        if unknown:
+            raise ValueError(f"Unsupported LLM override: {sorted(unknown)}")
+
+        key = (provider, model, timeout, max_retries)
+        with self._lock:
+            base = self._models.get(key)
+            if base is not None:
+                self.reused += 1
+        if base is None:
+            built = self._build(provider, model, timeout, max_retries)
+            with self._lock:
+                base = self._models.setdefault(key, built)
+                if base is built:
+                    self.created += 1
+
+        update = {name: value for name, value in overrides.items() if value is not None}
+        return base.model_copy(update=update) if update else base
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "models": len(self._models),
+            "created": self.created,
+            "reused": self.reused,
+            "transports": {provider: stats.to_dict() for provider, stats in self.transport_stats.items()},
+            "latency": {
+                f"{provider}:{model}": stats.to_dict() for (provider, model), stats in self.model_stats.items()
+            },
+        }
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시)"""
+        for client in self._async_http.values():
+            await client.aclose()
+        for client in self._sync_http.values():
+            client.close()
+        self._models.clear()
+        self._sdk_clients.clear()
+        self._async_http.clear()
+        self._sync_http.clear()
+
+
+# 전역 레지스트리 인스턴스
+_registry: Optional[LLMClientRegistry] = None
+
+
+def get_llm_registry() -> LLMClientRegistry:
+    """전역 LLMClientRegistry 인스턴스를 가져옵니다."""
+    global _registry
+    if _registry is None:
+        _registry = LLMClientRegistry()
+    return _registry
+
+
+def get_chat_model(provider: Provider, model: str, **kwargs: Any):
+    """get_llm_registry().get() 단축 함수"""
+    return get_llm_registry().get(provider, model, **kwargs)
+
+
+async def close_llm_clients() -> None:
+    """공유 HTTP 연결 종료 (생성된 적 없으면 아무것도 하지 않음)"""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
@@ -1,9 +1,8 @@
 """LLM factory for creating OpenAI and Claude instances."""
 from typing import Literal
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models import BaseChatModel
 
+from .llm_clients import get_chat_model
 from .settings import settings
 
 
@@ -29,7 +28,7 @@ def create_llm(
         model_type: Specialized model type for automatic model selection
 
     Returns:
-        Configured LLM instance
+        Configured LLM instance (shared via core.llm_clients; HTTP connections are pooled)
 
     Raises:
         ValueError: If provider is invalid or API key is missing
@@ -59,22 +58,22 @@ def create_llm(
         if model_type == "vision" and max_tokens == settings.llm_max_tokens:
             max_tokens = settings.vision_max_tokens
 
-        return ChatOpenAI(
-            model=model_name or settings.openai_analysis_model,
+        return get_chat_model(
+            "openai",
+            model_name or settings.openai_analysis_model,
+            timeout=30,
+            max_retries=0,
             temperature=temperature,
             max_tokens=max_tokens,
-            api_key=settings.openai_api_key,
-            max_retries=0,
-            timeout=30,
         )
     elif provider == "claude":
-        return ChatAnthropic(
-            model=model_name or "claude-3-5-sonnet-latest",
+        return get_chat_model(
+            "claude",
+            model_name or "claude-3-5-sonnet-latest",
+            timeout=30,
+            max_retries=0,
             temperature=temperature,
             max_tokens=max_tokens,
-            api_key=settings.anthropic_api_key,
-            max_retries=0,
-            timeout=30,
         )
     else:
         raise ValueError(f"Unsupported provider: {provider}")
@@ -0,0 +1,564 @@
+"""
+LLM 동시 호출 제어 (제공자별 요청/토큰 예산 + 우선순위 대기열)
+
+채팅 스트리밍, 분석 초안/검증, 비전 OCR, 부가 평가가 같은 제공자 한도를 나눠 쓰는데
+워커 안에서 동시 호출 수를 제한하지 않아, 트래픽이 몰리면 429가 나고 SDK/tenacity
+재시도가 부하를 더 키웠습니다. 모든 LLM HTTP 요청이 호출 전에 허가를 받습니다.
+
+- 제공자별 예산 (워커 단위): 동시 요청 수, 분당 요청 수, 분당 토큰 수 (요청 본문으로 추정)
+- 예산이 없으면 실패 대신 대기열에서 기다림
+  - 우선순위: interactive(채팅) > analysis(분석, 기본값) > background(백그라운드 분석 파이프라인)
+  - 오래 기다린 요청은 llm_priority_aging_sec마다 한 단계씩 올라감 (기아 방지)
+  - 우선순위별 최대 대기 시간을 넘으면 LLMQueueTimeoutError
+- 한도 자동 조정 (AIMD)
+  - 429/529 → 동시 요청 수 절반 + retry-after 동안 허가 중지 (SDK 재시도도 함께 대기)
+  - 성공 → 동시 요청 수를 설정값까지 천천히 회복
+  - 응답 헤더의 남은 요청/토큰 수(x-ratelimit-remaining-*, anthropic-ratelimit-*-remaining)로 예산 보정
+- 지표: 대기열 길이, 우선순위별 대기 시간, 현재 한도 → GET /dev/llm-governor
+
+연결 지점:
+- OpenAI / Claude: core/llm_clients.py 공유 HTTP 트랜스포트 (SDK 재시도 포함 모든 요청)
+- Gemini 등 httpx를 쓰지 않는 SDK: llm_slot() 컨텍스트 매니저
+
+사용 예:
+    with llm_priority("interactive"):
+        async for chunk in llm.astream(messages):
+            ...
+"""
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+Priority = Literal["interactive", "analysis", "background"]
+
+PRIORITIES: Dict[str, int] = {"interactive": 0, "analysis": 1, "background": 2}
+DEFAULT_PRIORITY: Priority = "analysis"
+
+CHARS_PER_TOKEN = 3  # 한국어/영어 혼합 프롬프트 기준 대략치
+IMAGE_TOKENS = 1000  # 이미지 1장 (base64 길이로 세지 않음)
+DEFAULT_COMPLETION_TOKENS = 1024  # max_tokens가 없는 요청
+RATE_LIMIT_STATUS = (429, 529)  # 529: Anthropic overloaded
+DEFAULT_RETRY_AFTER_SEC = 1.0
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("llm_priority", default=DEFAULT_PRIORITY)
+
+
+class LLMQueueTimeoutError(Exception):
+    """LLM 대기열 최대 대기 시간 초과"""
+
+
+# ===========================
+# 우선순위 (contextvar)
+# ===========================
+
+@contextlib.contextmanager
+def llm_priority(priority: Priority) -> Iterator[None]:
+    """이 블록 안의 LLM 호출 우선순위 (asyncio 태스크는 생성 시점 값을 물려받음)"""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown LLM priority: {priority}")
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        try:
+            _priority.reset(token)
+        except ValueError:
+            pass  # 다른 컨텍스트에서 닫힌 제너레이터 (응답 스트림 GC 등)
+
+
+async def with_llm_priority(stream: AsyncIterator[Any], priority: Priority) -> AsyncIterator[Any]:
+    """StreamingResponse 제너레이터를 감싸 스트림 안의 LLM 호출에 우선순위 지정"""
+    with llm_priority(priority):
+        async for item in stream:
+            yield item
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+# ===========================
+# 요청 추정
+# ===========================
+
+def _count_chars(value: Any) -> tuple[int, int]:
+    """JSON 본문 → (텍스트 글자 수, 이미지 수)"""
+    if isinstance(value, str):
+        return len(value), 0
+    if isinstance(value, list):
+        chars = images = 0
+        for item in value:
+            c, i = _count_chars(item)
+            chars += c
+            images += i
+        return chars, images
+    if isinstance(value, dict):
+        if value.get("type") in ("image", "image_url", "input_image"):
+            return 0, 1
+        chars = images = 0
+        for key, item in value.items():
+            if key in ("tools", "response_format"):
+                c, i = len(json.dumps(item, ensure_ascii=False)), 0
+            else:
+                c, i = _count_chars(item)
+            chars += c
+            images += i
+        return chars, images
+    return 0, 0
+
+
+def estimate_tokens(body: Mapping[str, Any]) -> int:
+    """채팅 요청 본문 → 예상 토큰 수 (프롬프트 추정 + 최대 출력)"""
+    chars, images = _count_chars({k: v for k, v in body.items() if k in ("messages", "system", "tools")})
+    completion = body.get("max_tokens") or body.get("max_completion_tokens") or DEFAULT_COMPLETION_TOKENS
+    return chars // CHARS_PER_TOKEN + images * IMAGE_TOKENS + int(completion)
+
+
+def estimate_request_tokens(content: bytes) -> int:
+    """HTTP 요청 본문(JSON) → 예상 토큰 수 (JSON이 아니면 출력 기본값만)"""
+    try:
+        body = json.loads(content) if content else {}
+    except ValueError:
+        body = {}
+    return estimate_tokens(body) if isinstance(body, dict) else DEFAULT_COMPLETION_TOKENS
+
+
+def retry_after_sec(headers: Mapping[str, str]) -> Optional[float]:
+    """retry-after-ms / retry-after(초) 헤더 → 초 (HTTP 날짜 형식은 무시)"""
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value:
+            try:
+                return max(float(value) * scale, 0.0)
+            except ValueError:
+                continue
+    return None
+
+
+# ===========================
+# 예산
+# ===========================
+
+class _Budget:
+    """분당 예산 (토큰 버킷, 잠금은 호출자가 관리)"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait(self, amount: float, now: float) -> float:
+        """amount를 쓰려면 기다려야 하는 시간 (용량보다 큰 요청은 가득 찼을 때 허가)"""
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.tokens
+        return needed / self.rate if needed > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        self.tokens -= amount
+
+    def clamp(self, remaining: float) -> None:
+        """제공자가 알려준 남은 양보다 많이 갖고 있지 않도록 보정"""
+        self.tokens = min(self.tokens, remaining)
+
+
+@dataclass
+class PriorityStats:
+    """우선순위별 대기 통계"""
+
+    admitted: int = 0
+    timeouts: int = 0
+    wait_ms: Optional[float] = None  # EWMA
+    max_wait_ms: float = 0.0
+
+    def record(self, waited_ms: float) -> None:
+        self.admitted += 1
+        self.wait_ms = waited_ms if self.wait_ms is None else 0.3 * waited_ms + 0.7 * self.wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "admitted": self.admitted,
+            "timeouts": self.timeouts,
+            "wait_ms": round(self.wait_ms, 1) if self.wait_ms is not None else None,
+            "max_wait_ms": round(self.max_wait_ms, 1),
+        }
+
+
+class _Waiter:
+    """대기열 항목 (비동기: 루프의 Event, 동기: threading.Event로 깨움)"""
+
+    __slots__ = ("priority", "rank", "seq", "tokens", "enqueued", "loop", "event")
+
+    def __init__(self, priority: str, seq: int, tokens: int, loop=None):
+        self.priority = priority
+        self.rank = PRIORITIES[priority]
+        self.seq = seq
+        self.tokens = tokens
+        self.enqueued = time.monotonic()
+        self.loop = loop
+        self.event = asyncio.Event() if loop is not None else threading.Event()
+
+    def wake(self) -> None:
+        if self.loop is None:
+            self.event.set()
+        elif not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.event.set)
+
+
+class LLMPermit:
+    """허가 1건 (응답 종료 시 release, 응답 상태/헤더는 observe로 전달)"""
+
+    __slots__ = ("_governor", "_released")
+
+    def __init__(self, governor: "ProviderGovernor"):
+        self._governor = governor
+        self._released = False
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        self._governor.on_response(status_code, headers)
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._governor.release()
+
+
+# ===========================
+# 제공자별 제어
+# ===========================
+
+class ProviderGovernor:
+    """제공자 1개의 동시 요청 한도 + 분당 요청/토큰 예산 + 우선순위 대기열"""
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrency: int,
+        requests_per_min: int,
+        tokens_per_min: int,
+        max_wait_sec: Mapping[str, float],
+        aging_sec: float = 10.0,
+    ):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)  # 429에 따라 줄었다가 회복
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.rate_limited = 0
+        self.max_wait_sec = dict(max_wait_sec)
+        self.aging_sec = aging_sec
+        self._requests = _Budget(requests_per_min)
+        self._tokens = _Budget(tokens_per_min)
+        self._waiters: List[_Waiter] = []
+        self._seq = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self.stats: Dict[str, PriorityStats] = {name: PriorityStats() for name in PRIORITIES}
+
+    # --- 대기열 (self._lock 안에서 호출) ---
+
+    def _head(self, now: float) -> Optional[_Waiter]:
+        """다음 허가 대상: 우선순위 - 대기 시간 보정, 같으면 먼저 온 순서"""
+        if not self._waiters:
+            return None
+        return min(self._waiters, key=lambda w: (w.rank - (now - w.enqueued) / self.aging_sec, w.seq))
+
+    def _wake_head(self) -> None:
+        head = self._head(time.monotonic())
+        if head is not None:
+            head.wake()
+
+    def _try_admit(self, waiter: _Waiter) -> Optional[float]:
+        """
+        허가 시도
+
+        Returns:
+            0: 허가됨 / 양수: 그만큼 뒤 다시 시도 (예산 충전, 429 대기) / None: 다른 요청이 끝날 때까지 대기
+        """
+        now = time.monotonic()
+        head = self._head(now)
+        if head is not waiter:
+            head.wake()  # 대기 시간 보정으로 순서가 바뀌었을 수 있음
+            return None
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= int(self.limit):
+            return None
+        wait = max(self._requests.wait(1, now), self._tokens.wait(waiter.tokens, now))
+        if wait > 0:
+            return wait
+
+        self._requests.take(1)
+        self._tokens.take(min(waiter.tokens, self._tokens.capacity))
+        self.in_flight += 1
+        self._waiters.remove(waiter)
+        self.stats[waiter.priority].record((now - waiter.enqueued) * 1000)
+        self._wake_head()  # 여유가 남았으면 다음 요청도 바로 허가
+        return 0.0
+
+    def _enqueue(self, priority: str, tokens: int, loop=None) -> _Waiter:
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown LLM priority: {priority}")
+        with self._lock:
+            self._seq += 1
+            waiter = _Waiter(priority, self._seq, tokens, loop)
+            self._waiters.append(waiter)
+        return waiter
+
+    def _abandon(self, waiter: _Waiter, timed_out: bool) -> None:
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._wake_head()
+            if timed_out:
+                self.stats[waiter.priority].timeouts += 1
+
+    def _timeout_error(self, waiter: _Waiter) -> LLMQueueTimeoutError:
+        logger.warning(
+            f"[LLM 대기열] {self.provider}/{waiter.priority}: {self._max_wait(waiter):.1f}초 대기 후 포기 "
+            f"(대기 {len(self._waiters)}건, 진행 {self.in_flight}/{int(self.limit)})"
+        )
+        return LLMQueueTimeoutError(f"{self.provider} LLM 대기열 대기 시간 초과 ({waiter.priority})")
+
+    def _max_wait(self, waiter: _Waiter) -> float:
+        return self.max_wait_sec.get(waiter.priority, 60.0)
+
+    # --- 허가 ---
+
+    async def acquire(self, tokens: int = 0, priority: Optional[str] = None) -> LLMPermit:
+        """허가 대기 (비동기, 취소되면 대기열에서 빠짐)"""
+        waiter = self._enqueue(priority or current_priority(), tokens, asyncio.get_running_loop())
+        deadline = waiter.enqueued + self._max_wait(waiter)
+        timed_out = False
+        try:
+            with self._lock:
+                delay = self._try_admit(waiter)
+            while delay != 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    raise self._timeout_error(waiter)
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), remaining if delay is None else min(delay, remaining))
+                except asyncio.TimeoutError:
+                    pass
+                waiter.event.clear()
+                with self._lock:
+                    delay = self._try_admit(waiter)
+        except BaseException:
+            self._abandon(waiter, timed_out)
+            raise
+        return LLMPermit(self)
+
+    def acquire_sync(self, tokens: int = 0, priority: Optional[str] = None) -> LLMPermit:
+        """
+        허가 대기 (동기 호출부 - 스레드를 블록)
+
+        이벤트 루프 스레드에서 부르면 허가를 돌려줄 비동기 요청들이 진행하지 못해
+        대기 시간 상한까지 워커가 멈추므로 즉시 RuntimeError (ainvoke / asyncio.to_thread 사용).
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                f"{self.provider}: 이벤트 루프 스레드에서 동기 LLM 호출은 허용되지 않습니다 "
+                f"(ainvoke 또는 asyncio.to_thread 사용)"
+            )
+        waiter = self._enqueue(priority or current_priority(), tokens)
+        deadline = waiter.enqueued + self._max_wait(waiter)
+        timed_out = False
+        try:
+            with self._lock:
+                delay = self._try_admit(waiter)
+            while delay != 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    raise self._timeout_error(waiter)
+                waiter.event.wait(remaining if delay is None else min(delay, remaining))
+                waiter.event.clear()
+                with self._lock:
+                    delay = self._try_admit(waiter)
+        except BaseException:
+            self._abandon(waiter, timed_out)
+            raise
+        return LLMPermit(self)
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._wake_head()
+
+    # --- 한도 조정 ---
+
+    def on_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """응답 상태/헤더 → 한도 조정 (429: 절반 + 일시 중지, 성공: 천천히 회복)"""
+        if status_code in RATE_LIMIT_STATUS:
+            self.on_rate_limited(retry_after_sec(headers))
+            return
+        if status_code >= 400:
+            return
+
+        with self._lock:
+            self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+            for names, budget in (
+                (("x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining"), self._requests),
+                (("x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining"), self._tokens),
+            ):
+                for name in names:
+                    value = headers.get(name)
+                    if value:
+                        try:
+                            budget.clamp(float(value))
+                        except ValueError:
+                            pass
+            self._wake_head()
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        retry_after = DEFAULT_RETRY_AFTER_SEC if retry_after is None else retry_after
+        with self._lock:
+            now = time.monotonic()
+            self.rate_limited += 1
+            self.paused_until = max(self.paused_until, now + retry_after)
+            # 동시에 진행 중이던 요청들의 429는 한 번만 반영
+            if now - self._last_decrease >= max(retry_after, DEFAULT_RETRY_AFTER_SEC):
+                self._last_decrease = now
+                self.limit = max(1.0, self.limit / 2)
+            limit = int(self.limit)
+        logger.warning(
+            f"[LLM 대기열] {self.provider}: 속도 제한 응답 → 동시 요청 {limit}개, {retry_after:.1f}초 대기"
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            queued = {name: 0 for name in PRIORITIES}
+            oldest = 0.0
+            for waiter in self._waiters:
+                queued[waiter.priority] += 1
+                oldest = max(oldest, now - waiter.enqueued)
+            self._requests._refill(now)
+            self._tokens._refill(now)
+            return {
+                "limit": int(self.limit),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "queue_depth": len(self._waiters),
+                "queued": queued,
+                "oldest_wait_ms": round(oldest * 1000, 1),
+                "paused_for_sec": round(max(0.0, self.paused_until - now), 2),
+                "requests_budget": int(self._requests.tokens),
+                "tokens_budget": int(self._tokens.tokens),
+                "rate_limited": self.rate_limited,
+                "priorities": {name: stats.to_dict() for name, stats in self.stats.items()},
+            }
+
+
+class LLMGovernor:
+    """제공자 → ProviderGovernor (설정에서 예산을 읽어 처음 사용할 때 생성)"""
+
+    def __init__(
+        self,
+        max_concurrency: Mapping[str, int],
+        requests_per_min: Mapping[str, int],
+        tokens_per_min: Mapping[str, int],
+        max_wait_sec: Mapping[str, float],
+        aging_sec: float = 10.0,
+    ):
+        self.max_concurrency = dict(max_concurrency)
+        self.requests_per_min = dict(requests_per_min)
+        self.tokens_per_min = dict(tokens_per_min)
+        self.max_wait_sec = dict(max_wait_sec)
+        self.aging_sec = aging_sec
+        self._providers: Dict[str, ProviderGovernor] = {}
+        self._lock = threading.Lock()
+
+    def provider(self, provider: str) -> ProviderGovernor:
+        with self._lock:
+            governor = self._providers.get(provider)
+            if governor is None:
+                governor = self._providers[provider] = ProviderGovernor(
+                    provider,
+                    max_concurrency=self.max_concurrency.get(provider, 8),
+                    requests_per_min=self.requests_per_min.get(provider, 60),
+                    tokens_per_min=self.tokens_per_min.get(provider, 100_000),
+                    max_wait_sec=self.max_wait_sec,
+                    aging_sec=self.aging_sec,
+                )
+            return governor
+
+    async def acquire(self, provider: str, tokens: int = 0, priority: Optional[str] = None) -> LLMPermit:
+        return await self.provider(provider).acquire(tokens, priority)
+
+    def acquire_sync(self, provider: str, tokens: int = 0, priority: Optional[str] = None) -> LLMPermit:
+        return self.provider(provider).acquire_sync(tokens, priority)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            providers = dict(self._providers)
+        return {name: governor.snapshot() for name, governor in providers.items()}
+
+
+_governor: Optional[LLMGovernor] = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    """전역 LLMGovernor 인스턴스를 가져옵니다."""
+    global _governor
+    if _governor is None:
+        from core.settings import settings
+
+        _governor = LLMGovernor(
+            max_concurrency=settings.llm_max_concurrency,
+            requests_per_min=settings.llm_requests_per_min,
+            tokens_per_min=settings.llm_tokens_per_min,
+            max_wait_sec=settings.llm_queue_max_wait_sec,
+            aging_sec=settings.llm_priority_aging_sec,
+        )
+    return _governor
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return status in RATE_LIMIT_STATUS or type(error).__name__ in ("ResourceExhausted", "RateLimitError", "TooManyRequests")
+
+
+@contextlib.contextmanager
+def llm_slot(provider: str, tokens: int = DEFAULT_COMPLETION_TOKENS) -> Iterator[None]:
+    """
+    httpx 트랜스포트를 거치지 않는 동기 SDK 호출용 허가 (Gemini 등)
+
+    블록 안에서 속도 제한 예외가 나면 한도 조정에 반영합니다.
+    """
+    from core.settings import settings
+
+    if not settings.llm_governor_enabled:
+        yield
+        return
+
+    permit = get_llm_governor().acquire_sync(provider, tokens)
+    try:
+        yield
+    except Exception as e:
+        if _is_rate_limit_error(e):
+            permit.observe(429, {})
+        raise
+    else:
+        permit.observe(200, {})
+    finally:
+        permit.release()
@@ -3,16 +3,20 @@ LLM 라우터
 
 ChatGPT (초안 생성) + Claude (검증) 듀얼 시스템
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional, Literal, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Literal, Any, TypeVar
 from pydantic import BaseModel
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
+from core.llm_clients import get_chat_model
 from core.settings import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # ===========================
 # 타입 변환 헬퍼 함수
@@ -74,45 +78,26 @@ class DualAnalysisResult(BaseModel):
 # ===========================
 def get_openai_client(model: str = "gpt-4o-mini", temperature: float = 0.2) -> ChatOpenAI:
     """
-    OpenAI 클라이언트 생성
+    OpenAI 클라이언트 (core/llm_clients 레지스트리 - HTTP 연결 재사용)
 
     Default: gpt-4o-mini (빠르고 저렴)
     """
-    return ChatOpenAI(
-        model=model,
-        temperature=temperature,
-        max_tokens=4096,
-    )
+    return get_chat_model("openai", model, temperature=temperature, max_tokens=4096)
 
 
 def get_claude_client(model: str = "claude-3-5-sonnet-latest", temperature: float = 0.1) -> ChatAnthropic:
     """
-    Claude 클라이언트 생성
+    Claude 클라이언트 (core/llm_clients 레지스트리 - HTTP 연결 재사용)
 
     Default: claude-3-5-sonnet (검증용)
     """
-    return ChatAnthropic(
-        model=model,
-        temperature=temperature,
-        max_tokens=4096,
-    )
+    return get_chat_model("claude", model, temperature=temperature, max_tokens=4096)
 
 
 # ===========================
-# 단일 모델 분석 (기존)
+# 프롬프트 / 응답 헬퍼 (동기·비동기 공통)
 # ===========================
-def single_model_analyze(
-    question: str,
-    context: str,
-    provider: Literal["openai", "claude"] = "openai"
-) -> LLMResponse:
-    """
-    단일 모델로 분석
-
-    - provider: "openai" 또는 "claude"
-    - context: 검색된 문서 컨텍스트
-    """
-    system_prompt = """너는 부동산 계약 리스크 점검 전문가이다.
+SINGLE_SYSTEM_PROMPT = """너는 부동산 계약 리스크 점검 전문가이다.
 
 사용자 질문에 대해 다음 근거 문서를 참고하여 답변하라:
 
@@ -125,47 +110,7 @@ def single_model_analyze(
 - 출처 정보는 절대 노출하지 말 것
 """
 
-    if provider == "openai":
-        llm = get_openai_client()
-    else:
-        llm = get_claude_client()
-
-    messages = [
-        SystemMessage(content=system_prompt.format(context=context)),
-        HumanMessage(content=question),
-    ]
-
-    response = llm.invoke(messages)
-
-    return LLMResponse(
-        content=ensure_text(response.content),
-        model=llm.model_name,
-        provider=provider,
-        tokens=response.response_metadata.get("token_usage", {}).get("total_tokens"),
-    )
-
-
-# ===========================
-# 듀얼 시스템 분석 (ChatGPT → Claude)
-# ===========================
-def dual_model_analyze(
-    question: str,
-    context: str,
-    draft_model: str = "gpt-4o-mini",
-    judge_model: str = "claude-3-5-sonnet-latest"
-) -> DualAnalysisResult:
-    """
-    듀얼 시스템 분석
-
-    1. ChatGPT로 초안 생성
-    2. Claude로 초안 검증
-    3. 불일치 항목 추출
-    4. 최종 답변 생성
-    """
-    logger.info(f"듀얼 분석 시작: draft={draft_model}, judge={judge_model}")
-
-    # Step 1: ChatGPT 초안 생성
-    draft_prompt = """너는 부동산 계약 리스크 점검 전문가이다.
+DRAFT_SYSTEM_PROMPT = """너는 부동산 계약 리스크 점검 전문가이다.
 
 사용자 질문에 대해 다음 근거 문서를 참고하여 초안을 작성하라:
 
@@ -177,23 +122,7 @@ def dual_model_analyze(
 - 법률 단정 표현은 지양하고, "참고", "검토", "전문가 상담" 등으로 권장
 """
 
-    draft_llm = ChatOpenAI(model=draft_model, temperature=0.3, max_tokens=4096)
-    draft_messages = [
-        SystemMessage(content=draft_prompt.format(context=context)),
-        HumanMessage(content=question),
-    ]
-    draft_response = draft_llm.invoke(draft_messages)
-    draft = LLMResponse(
-        content=ensure_text(draft_response.content),
-        model=draft_model,
-        provider="openai",
-        tokens=draft_response.response_metadata.get("token_usage", {}).get("total_tokens"),
-    )
-
-    logger.info(f"초안 생성 완료 ({draft.tokens} tokens)")
-
-    # Step 2: Claude 검증
-    judge_prompt = """너는 부동산 계약 리스크 점검 검증자이다.
+JUDGE_SYSTEM_PROMPT = """너는 부동산 계약 리스크 점검 검증자이다.
 
 다음은 ChatGPT가 생성한 초안이다:
 
@@ -216,42 +145,44 @@ def dual_model_analyze(
 ...
 """
 
-    judge_llm = ChatAnthropic(model=judge_model, temperature=0.1, max_tokens=4096)
-    judge_messages = [
-        SystemMessage(content=judge_prompt.format(draft=draft.content)),
-        HumanMessage(content=question),
-    ]
-    try:
-        judge_response = judge_llm.invoke(judge_messages)
-    except Exception as e:
-        msg = str(e)
-        if "NotFound" in msg or "not_found_error" in msg or "model:" in msg:
-            fallback_model = "claude-3-5-haiku-latest"
-            logger.warning(
-                f"Judge model '{judge_model}' unavailable. Falling back to '{fallback_model}'."
-            )
-            judge_llm = ChatAnthropic(model=fallback_model, temperature=0.1, max_tokens=4096)
-            judge_response = judge_llm.invoke(judge_messages)
-            judge_model = fallback_model
-        else:
-            raise
-    validation = LLMResponse(
-        content=ensure_text(judge_response.content),
-        model=judge_model,
+JUDGE_FALLBACK_MODEL = "claude-3-5-haiku-latest"
+
+
+def _messages(system_prompt: str, question: str) -> list:
+    return [SystemMessage(content=system_prompt), HumanMessage(content=question)]
+
+
+def _openai_response(response, model: str) -> LLMResponse:
+    return LLMResponse(
+        content=ensure_text(response.content),
+        model=model,
+        provider="openai",
+        tokens=response.response_metadata.get("token_usage", {}).get("total_tokens"),
+    )
+
+
+def _claude_response(response, model: str) -> LLMResponse:
+    return LLMResponse(
+        content=ensure_text(response.content),
+        model=model,
         provider="claude",
-        tokens=judge_response.response_metadata.get("usage", {}).get("total_tokens"),
+        tokens=response.response_metadata.get("usage", {}).get("total_tokens"),
     )
 
-    logger.info(f"검증 완료 ({validation.tokens} tokens)")
 
-    # Step 3: 불일치 항목 추출 (간단한 휴리스틱)
+def _is_model_unavailable(error: Exception) -> bool:
+    msg = str(error)
+    return "NotFound" in msg or "not_found_error" in msg or "model:" in msg
+
+
+def _combine(draft: LLMResponse, validation: LLMResponse) -> DualAnalysisResult:
+    """불일치 항목 추출 (간단한 휴리스틱) → 최종 답변"""
     conflicts = []
     if "수정 필요" in validation.content:
         conflicts.append("Claude가 초안에 수정이 필요하다고 판단했습니다.")
     if "추가 필요" in validation.content:
         conflicts.append("Claude가 누락된 항목이 있다고 판단했습니다.")
 
-    # Step 4: 최종 답변 생성
     if len(conflicts) == 0:
         # 불일치 없음 → 초안 그대로 사용
         final_answer = ensure_text(draft.content)
@@ -279,6 +210,163 @@ def dual_model_analyze(
     )
 
 
+# ===========================
+# 요청 기한 (재시도 포함 전체 제한 시간)
+# ===========================
+async def call_with_deadline(
+    factory: Callable[[], Awaitable[T]],
+    *,
+    attempts: int = 1,
+    attempt_timeout_sec: float,
+    deadline_sec: float,
+    label: str = "LLM",
+) -> T:
+    """
+    재시도 + 요청 전체 기한
+
+    시도마다 min(attempt_timeout_sec, 남은 기한)만큼 기다리고, 시간이 지나면 진행 중인
+    코루틴을 취소합니다. 비동기 LLM 호출(ainvoke/astream)은 취소 시 HTTP 연결을 닫으므로
+    업스트림 생성도 함께 멈춥니다 (실행기 스레드처럼 남아서 토큰을 쓰지 않음).
+    호출한 쪽이 취소되면(클라이언트 연결 종료 등) 재시도 없이 그대로 전파합니다.
+
+    Raises:
+        마지막 시도의 예외 (기한 초과는 asyncio.TimeoutError)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + deadline_sec
+    last_err: Exception = asyncio.TimeoutError(f"{label}: {deadline_sec}초 기한 초과")
+
+    for attempt in range(1, attempts + 1):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            return await asyncio.wait_for(factory(), timeout=min(attempt_timeout_sec, remaining))
+        except asyncio.TimeoutError as e:
+            last_err = e
+            logger.warning(f"{label} 시도 {attempt} 시간 초과 ({min(attempt_timeout_sec, remaining):.1f}초, 호출 취소)")
+        except Exception as e:
+            last_err = e
+            logger.warning(f"{label} 시도 {attempt} 실패: {e}")
+
+        if attempt < attempts:
+            # 백오프: 1초, 2초, 3초 (남은 기한 안에서만)
+            backoff = min(1 * attempt, 3, max(deadline - loop.time(), 0))
+            await asyncio.sleep(backoff)
+
+    raise last_err
+
+
+# ===========================
+# 단일 모델 분석 (기존)
+# ===========================
+def single_model_analyze(
+    question: str,
+    context: str,
+    provider: Literal["openai", "claude"] = "openai"
+) -> LLMResponse:
+    """
+    단일 모델로 분석 (동기 - 스크립트/배치용, 요청 처리 경로는 asingle_model_analyze)
+
+    - provider: "openai" 또는 "claude"
+    - context: 검색된 문서 컨텍스트
+    """
+    llm = get_openai_client() if provider == "openai" else get_claude_client()
+    response = llm.invoke(_messages(SINGLE_SYSTEM_PROMPT.format(context=context), question))
+    to_response = _openai_response if provider == "openai" else _claude_response
+    return to_response(response, llm.model_name if provider == "openai" else llm.model)
+
+
+async def asingle_model_analyze(
+    question: str,
+    context: str,
+    provider: Literal["openai", "claude"] = "openai"
+) -> LLMResponse:
+    """single_model_analyze 비동기 버전 (ainvoke - 취소하면 업스트림 호출도 중단)"""
+    llm = get_openai_client() if provider == "openai" else get_claude_client()
+    response = await llm.ainvoke(_messages(SINGLE_SYSTEM_PROMPT.format(context=context), question))
+    to_response = _openai_response if provider == "openai" else _claude_response
+    return to_response(response, llm.model_name if provider == "openai" else llm.model)
+
+
+# ===========================
+# 듀얼 시스템 분석 (ChatGPT → Claude)
+# ===========================
+def dual_model_analyze(
+    question: str,
+    context: str,
+    draft_model: str = "gpt-4o-mini",
+    judge_model: str = "claude-3-5-sonnet-latest"
+) -> DualAnalysisResult:
+    """
+    듀얼 시스템 분석 (동기 - 스크립트/배치용, 요청 처리 경로는 adual_model_analyze)
+
+    1. ChatGPT로 초안 생성
+    2. Claude로 초안 검증
+    3. 불일치 항목 추출
+    4. 최종 답변 생성
+    """
+    logger.info(f"듀얼 분석 시작: draft={draft_model}, judge={judge_model}")
+
+    # Step 1: ChatGPT 초안 생성
+    draft_llm = get_openai_client(draft_model, temperature=0.3)
+    draft = _openai_response(
+        draft_llm.invoke(_messages(DRAFT_SYSTEM_PROMPT.format(context=context), question)), draft_model
+    )
+    logger.info(f"초안 생성 완료 ({draft.tokens} tokens)")
+
+    # Step 2: Claude 검증
+    judge_messages = _messages(JUDGE_SYSTEM_PROMPT.format(draft=draft.content), question)
+    try:
+        judge_response = get_claude_client(judge_model, temperature=0.1).invoke(judge_messages)
+    except Exception as e:
+        if not _is_model_unavailable(e):
+            raise
+        logger.warning(f"Judge model '{judge_model}' unavailable. Falling back to '{JUDGE_FALLBACK_MODEL}'.")
+        judge_model = JUDGE_FALLBACK_MODEL
+        judge_response = get_claude_client(judge_model, temperature=0.1).invoke(judge_messages)
+    validation = _claude_response(judge_response, judge_model)
+    logger.info(f"검증 완료 ({validation.tokens} tokens)")
+
+    # Step 3-4: 불일치 항목 추출 → 최종 답변
+    return _combine(draft, validation)
+
+
+async def adual_model_analyze(
+    question: str,
+    context: str,
+    draft_model: str = "gpt-4o-mini",
+    judge_model: str = "claude-3-5-sonnet-latest"
+) -> DualAnalysisResult:
+    """
+    dual_model_analyze 비동기 버전 (ainvoke)
+
+    이벤트 루프를 막지 않고, call_with_deadline 등으로 취소하면 진행 중인 초안/검증 호출이
+    HTTP 연결과 함께 중단됩니다.
+    """
+    logger.info(f"듀얼 분석 시작: draft={draft_model}, judge={judge_model}")
+
+    draft_llm = get_openai_client(draft_model, temperature=0.3)
+    draft = _openai_response(
+        await draft_llm.ainvoke(_messages(DRAFT_SYSTEM_PROMPT.format(context=context), question)), draft_model
+    )
+    logger.info(f"초안 생성 완료 ({draft.tokens} tokens)")
+
+    judge_messages = _messages(JUDGE_SYSTEM_PROMPT.format(draft=draft.content), question)
+    try:
+        judge_response = await get_claude_client(judge_model, temperature=0.1).ainvoke(judge_messages)
+    except Exception as e:
+        if not _is_model_unavailable(e):
+            raise
+        logger.warning(f"Judge model '{judge_model}' unavailable. Falling back to '{JUDGE_FALLBACK_MODEL}'.")
+        judge_model = JUDGE_FALLBACK_MODEL
+        judge_response = await get_claude_client(judge_model, temperature=0.1).ainvoke(judge_messages)
+    validation = _claude_response(judge_response, judge_model)
+    logger.info(f"검증 완료 ({validation.tokens} tokens)")
+
+    return _combine(draft, validation)
+
+
 # ===========================
 # 스트리밍 응답 (향후 구현)
 # ===========================
@@ -10,6 +10,7 @@ ZipCheck AI - LLM 스트리밍 모듈
 Architecture:
 - stream_gpt_draft(): GPT-4o-mini 초안 생성
 - stream_claude_validation(): Claude Sonnet 검증
+  (같은 프롬프트의 응답은 core/llm_cache.py 캐시에서 재생, bypass_cache=True로 우회)
 - merge_dual_streams(): 두 스트림을 병렬로 실행하고 SSE 이벤트 머지
 - dual_stream_analysis(): 통합 래퍼 함수 (conflicts 감지 포함)
 """
@@ -17,13 +18,16 @@ import asyncio
 import json
 import logging
 from typing import AsyncGenerator, Callable, Dict, Any, Tuple, Optional, List
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage
+from core.llm_clients import get_chat_model
 from core.prompts import build_judge_prompt
 
 logger = logging.getLogger(__name__)
 
+# 응답에 영향을 주는 생성 파라미터 (LLM 응답 캐시 키에 포함)
+DRAFT_PARAMS = {"temperature": 0.3}
+VALIDATION_PARAMS = {"temperature": 0.1}
+
 
 # ===========================
 # 타입 변환 헬퍼 함수
@@ -63,12 +67,13 @@ def ensure_text(content: Any) -> str:
 # ===========================
 # 개별 LLM 스트리밍 함수
 # ===========================
-async def stream_gpt_draft(llm_prompt: str) -> AsyncGenerator[Dict[str, Any], None]:
+async def stream_gpt_draft(llm_prompt: str, bypass_cache: bool = False) -> AsyncGenerator[Dict[str, Any], None]:
     """
     GPT-4o-mini 초안 생성 스트리밍
 
     Args:
         llm_prompt: LLM에 전달할 프롬프트 (분석 컨텍스트 포함)
+        bypass_cache: True면 캐시를 조회하지 않고 새로 생성 (완료 후 캐시 갱신)
 
     Yields:
         Dict with keys:
@@ -79,12 +84,24 @@ async def stream_gpt_draft(llm_prompt: str) -> AsyncGenerator[Dict[str, Any], No
         - done: 완료 여부
         - final_content: (done=True일 때) 최종 전체 텍스트
         - error: (에러 시) 에러 메시지
+        - cached: (캐시 재생 시) True
     """
-    llm_draft = ChatOpenAI(
+    from core.llm_cache import cached_llm_stream
+
+    async for event in cached_llm_stream(
+        lambda: _generate_gpt_draft(llm_prompt),
         model="gpt-4o-mini",
-        temperature=0.3,
-        streaming=True
-    )
+        params=DRAFT_PARAMS,
+        prompt=llm_prompt,
+        phase="draft",
+        bypass=bypass_cache,
+    ):
+        yield event
+
+
+async def _generate_gpt_draft(llm_prompt: str) -> AsyncGenerator[Dict[str, Any], None]:
+    """GPT-4o-mini 초안 실제 생성 (캐시 미스)"""
+    llm_draft = get_chat_model("openai", "gpt-4o-mini", **DRAFT_PARAMS, streaming=True)
     draft_content = ""
     chunk_count = 0
 
@@ -124,12 +141,13 @@ async def stream_gpt_draft(llm_prompt: str) -> AsyncGenerator[Dict[str, Any], No
         }
 
 
-async def stream_claude_validation(draft_content: str) -> AsyncGenerator[Dict[str, Any], None]:
+async def stream_claude_validation(draft_content: str, bypass_cache: bool = False) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Claude Sonnet 검증 스트리밍 (초안 기반)
 
     Args:
         draft_content: GPT-4o-mini가 생성한 초안 텍스트
+        bypass_cache: True면 캐시를 조회하지 않고 새로 생성 (완료 후 캐시 갱신)
 
     Yields:
         Dict with keys:
@@ -142,22 +160,31 @@ async def stream_claude_validation(draft_content: str) -> AsyncGenerator[Dict[st
         - error: (에러 시) 에러 메시지
 
     Note:
-        - 초안이 충분히 생성될 때까지 3초 대기
-        - 초안이 2000자를 초과하면 앞 2000자만 사용
+        - 초안이 충분히 생성될 때까지 3초 대기 (캐시 적중 시 대기 없이 재생)
+        - 초안이 settings.llm_judge_draft_max_tokens를 초과하면 앞/뒤만 남기고 중략
         - Claude Sonnet 실패 시 자동으로 Haiku로 폴백
     """
+    from core.llm_cache import cached_llm_stream
+
+    async for event in cached_llm_stream(
+        lambda: _generate_claude_validation(draft_content),
+        model="claude-3-5-sonnet-latest",
+        params=VALIDATION_PARAMS,
+        prompt=build_judge_prompt(draft_content),
+        phase="validation",
+        bypass=bypass_cache,
+    ):
+        yield event
+
+
+async def _generate_claude_validation(draft_content: str) -> AsyncGenerator[Dict[str, Any], None]:
+    """Claude Sonnet 검증 실제 생성 (캐시 미스)"""
     # 초안이 충분히 생성될 때까지 대기
     await asyncio.sleep(3)
 
     judge_prompt = build_judge_prompt(draft_content)
 
-    llm_judge = ChatAnthropic(
-        model_name="claude-3-5-sonnet-latest",
-        temperature=0.1,
-        streaming=True,
-        timeout=60,
-        stop=None
-    )
+    llm_judge = get_chat_model("claude", "claude-3-5-sonnet-latest", timeout=60, **VALIDATION_PARAMS, streaming=True)
     validation_content = ""
     chunk_count = 0
 
@@ -193,12 +220,8 @@ async def stream_claude_validation(draft_content: str) -> AsyncGenerator[Dict[st
         if "NotFound" in msg or "not_found_error" in msg or "model:" in msg:
             logger.warning("Claude Sonnet 실패, Haiku로 폴백")
 
-            llm_haiku = ChatAnthropic(
-                model_name="claude-3-5-haiku-latest",
-                temperature=0.1,
-                streaming=True,
-                timeout=60,
-                stop=None
+            llm_haiku = get_chat_model(
+                "claude", "claude-3-5-haiku-latest", timeout=60, **VALIDATION_PARAMS, streaming=True
             )
             validation_content = ""
 
@@ -234,6 +257,42 @@ async def stream_claude_validation(draft_content: str) -> AsyncGenerator[Dict[st
 # ===========================
 # 병렬 스트리밍 오케스트레이션
 # ===========================
+class StreamPoller:
+    """
+    이벤트 생성기를 timeout 단위로 폴링 (timeout 시 진행 중인 __anext__를 취소하지 않음)
+
+    asyncio.wait_for(gen.__anext__(), timeout)은 timeout마다 생성기 안으로 CancelledError를 던져
+    첫 이벤트가 timeout보다 늦는 생성기(콜드 스타트, 캐시 DB 조회 등)를 조용히 끝내 버립니다.
+    """
+
+    def __init__(self, generator: AsyncGenerator[Dict[str, Any], None]):
+        self.generator = generator
+        self._pending: Optional[asyncio.Future] = None
+
+    async def next(self, timeout: float) -> Dict[str, Any]:
+        """
+        다음 이벤트 (timeout 안에 없으면 asyncio.TimeoutError, 다음 호출에서 이어서 대기)
+
+        Raises:
+            asyncio.TimeoutError: timeout 안에 이벤트 없음
+            StopAsyncIteration: 생성기 종료
+        """
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self.generator.__anext__())
+        done, _ = await asyncio.wait({self._pending}, timeout=timeout)
+        if not done:
+            raise asyncio.TimeoutError()
+        pending, self._pending = self._pending, None
+        return pending.result()
+
+    async def aclose(self) -> None:
+        if self._pending is not None:
+            self._pending.cancel()
+            await asyncio.gather(self._pending, return_exceptions=True)
+            self._pending = None
+        await self.generator.aclose()
+
+
 async def merge_dual_streams(
     draft_generator: AsyncGenerator[Dict[str, Any], None],
     validation_generator_factory: Callable[[str], AsyncGenerator[Dict[str, Any], None]],
@@ -249,7 +308,7 @@ async def merge_dual_streams(
     validation_done = False
     last_validation_event: Optional[Dict[str, Any]] = None
 
-    draft_gen = draft_generator
+    draft_gen = StreamPoller(draft_generator)
     validation_gen = None
     draft_start_time = asyncio.get_event_loop().time()
 
@@ -258,7 +317,7 @@ async def merge_dual_streams(
             # GPT 초안 스트림 처리
             if not draft_done:
                 try:
-                    draft_event = await asyncio.wait_for(draft_gen.__anext__(), timeout=0.1)
+                    draft_event = await draft_gen.next(timeout=0.1)
 
                     if draft_event.get("done"):
                         draft_done = True
@@ -277,7 +336,7 @@ async def merge_dual_streams(
 
                         # Claude 검증 시작
                         if validation_gen is None:
-                            validation_gen = validation_generator_factory(draft_content)
+                            validation_gen = StreamPoller(validation_generator_factory(draft_content))
                             payload = {
                                 "step": step_base + 0.2,
                                 "phase": "validation",
@@ -308,9 +367,7 @@ async def merge_dual_streams(
             # Claude 검증 스트림 처리
             if validation_gen is not None and not validation_done:
                 try:
-                    validation_event = await asyncio.wait_for(
-                        validation_gen.__anext__(), timeout=0.1
-                    )
+                    validation_event = await validation_gen.next(timeout=0.1)
                     last_validation_event = validation_event
 
                     if validation_event.get("done"):
@@ -361,7 +418,7 @@ async def merge_dual_streams(
                 asyncio.get_event_loop().time() - draft_start_time
             ) > 3:
                 if draft_content:
-                    validation_gen = validation_generator_factory(draft_content)
+                    validation_gen = StreamPoller(validation_generator_factory(draft_content))
                     payload = {
                         "step": step_base + 0.2,
                         "phase": "validation",
@@ -376,6 +433,10 @@ async def merge_dual_streams(
             logger.error(f"병렬 스트리밍 루프 오류: {e}")
             break
 
+    for poller in (draft_gen, validation_gen):
+        if poller is not None:
+            await poller.aclose()
+
     # 최종 결과를 tuple로 yield (async generator는 return 불가)
     yield (draft_content, validation_content, last_validation_event)  # type: ignore
 
@@ -385,7 +446,8 @@ async def merge_dual_streams(
 async def dual_stream_analysis(
     llm_prompt: str,
     step_base: float = 6.0,
-    progress_base: float = 0.78
+    progress_base: float = 0.78,
+    bypass_cache: bool = False,
 ) -> AsyncGenerator[str | Tuple[str, str, float, List[str]], None]:
     """
     듀얼 LLM 병렬 스트리밍 분석 (통합 래퍼)
@@ -398,6 +460,7 @@ async def dual_stream_analysis(
         llm_prompt: LLM에 전달할 분석 프롬프트
         step_base: SSE 이벤트 step 기준값 (기본값: 6.0)
         progress_base: SSE 이벤트 progress 기준값 (기본값: 0.78)
+        bypass_cache: True면 LLM 응답 캐시를 조회하지 않고 새로 생성
 
     Yields:
         SSE 이벤트 문자열 (data: {...}\n\n)
@@ -421,8 +484,10 @@ async def dual_stream_analysis(
         ```
     """
     # Step 1: 병렬 스트리밍 실행
-    draft_gen = stream_gpt_draft(llm_prompt)
-    validation_factory = stream_claude_validation
+    draft_gen = stream_gpt_draft(llm_prompt, bypass_cache=bypass_cache)
+
+    def validation_factory(draft_content: str) -> AsyncGenerator[Dict[str, Any], None]:
+        return stream_claude_validation(draft_content, bypass_cache=bypass_cache)
 
     async for event in merge_dual_streams(
         draft_generator=draft_gen,
@@ -463,7 +528,8 @@ async def simple_llm_analysis(
     max_retries: int = 3,
     temperature: float = 0.3,
     max_tokens: int = 4096,
-    timeout: int = 30
+    timeout: int = 30,
+    bypass_cache: bool = False,
 ) -> str:
     """
     백그라운드 작업용 Non-Streaming LLM 분석
@@ -478,6 +544,7 @@ async def simple_llm_analysis(
         temperature: LLM temperature (기본값: 0.3)
         max_tokens: 생성할 최대 토큰 수 (기본값: 4096)
         timeout: 요청 타임아웃 (초 단위, 기본값: 30)
+        bypass_cache: True면 LLM 응답 캐시를 조회하지 않고 새로 생성 (완료 후 캐시 갱신)
 
     Returns:
         최종 LLM 응답 내용
@@ -494,29 +561,41 @@ async def simple_llm_analysis(
         ```
     """
     from fastapi import HTTPException
-
-    llm = ChatOpenAI(
-        model=model,
-        temperature=temperature,
+    from core import llm_cache
+    from core.llm_router import call_with_deadline
+
+    params = {"temperature": temperature}
+    key, cached = await llm_cache.lookup(model, params, llm_prompt, bypass=bypass_cache, operation="summary")
+    if cached is not None:
+        logger.info(f"LLM 해석 캐시 적중: {len(cached.content)}자")
+        return cached.content
+
+    llm = get_chat_model(
+        "openai", model,
+        timeout=timeout,
         max_retries=0,  # 재시도는 수동으로 처리
-        timeout=timeout
+        temperature=temperature,
     )
     messages = [HumanMessage(content=llm_prompt)]
 
-    last_err = None
-    for attempt in range(1, max_retries + 1):
-        try:
-            response = llm.invoke(messages)
-            final_content = ensure_text(response.content)
-            logger.info(f"LLM 해석 완료 (시도 {attempt}): {len(final_content)}자")
-            return final_content
-        except Exception as e:
-            last_err = e
-            logger.warning(f"LLM 호출 시도 {attempt} 실패: {e}")
-            if attempt < max_retries:
-                # 지수 백오프: 1초, 2초, 3초
-                await asyncio.sleep(min(1 * attempt, 3))
-
-    # 모든 재시도 실패
-    logger.error(f"LLM 호출 전체 실패 ({max_retries}회 시도): {last_err}")
-    raise HTTPException(503, "분석이 지연됩니다. 잠시 후 다시 시도해주세요.")
+    async def run_once() -> str:
+        response = await llm.ainvoke(messages)
+        return ensure_text(response.content)
+
+    try:
+        # 시도별 timeout + 전체 기한 (백오프 1초, 2초 포함), 초과 시 진행 중인 호출 취소
+        final_content = await call_with_deadline(
+            run_once,
+            attempts=max_retries,
+            attempt_timeout_sec=timeout,
+            deadline_sec=timeout * max_retries + sum(min(i, 3) for i in range(1, max_retries)),
+            label="LLM 해석",
+        )
+        logger.info(f"LLM 해석 완료: {len(final_content)}자")
+    except Exception as e:
+        # 모든 재시도 실패
+        logger.error(f"LLM 호출 전체 실패 ({max_retries}회 시도): {e}")
+        raise HTTPException(503, "분석이 지연됩니다. 잠시 후 다시 시도해주세요.")
+
+    await llm_cache.store(key, model, llm_prompt, final_content)
+    return final_content
@@ -0,0 +1,288 @@
+"""
+상품 통합 시세 조회 (아파트 / 오피스텔 / 연립다세대 / 단독다가구 / 분양권 / 토지 / 상업업무용 / 공장창고)
+
+RTMS API는 상품별로 나뉘어 있어 분석 파이프라인은 아파트만 조회했고,
+빌라·오피스텔은 시세 추정이 없었습니다. query_market() 한 번으로:
+
+- property_type 지정 ("apt", "officetel", "rh", "sh", ... 또는 "아파트", "빌라" 등 한글 이름):
+  해당 상품만 조회
+- "unknown": 주소에서 상품을 알 수 있으면 (예: "○○오피스텔") 해당 상품,
+  아니면 주거 상품 4종을 동시에 조회(fan-out 1회)하고 대상 물건과 가장 가까운
+  비교사례(같은 단지 > 같은 법정동 > 시군구)를 찾은 상품을 선택
+- 모든 상품 거래를 공통 레코드(MARKET_RECORD_SCHEMA, 슬롯 레코드)로 정규화
+  (단지/건물명: aptNm|offiNm|mhouseNm → name, 면적: 전용|연면적|계약|거래|건물면적 → area)
+- 같은 (상품, 법정동, 기간) 동시 조회는 1번만 실행하고 결과는 market_query_cache_ttl_sec 동안 재사용
+  (하위 저장소는 RTMS 웨어하우스 - 확정된 과거 월은 API 호출 없음)
+
+사용 예:
+    result = await query_market("11680", "서울 강남구 역삼동 123-4 101호", property_type="unknown")
+    result.property_type, result.stats.estimate, result.candidates
+"""
+import asyncio
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .address_converter import AddressCache
+from .fanout import fan_out
+from .market_stats import LEVEL_LABELS, MarketStats, summarize_market
+from .rtms_records import I, S, RecordSchema, TransactionRecord
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN = "unknown"
+
+# 상품 → {거래 종류: RTMS 웨어하우스 상품 키}
+MARKET_TYPES: Dict[str, Dict[str, str]] = {
+    "apt": {"trade": "apt_trade", "rent": "apt_rent"},
+    "officetel": {"trade": "officetel_trade", "rent": "officetel_rent"},
+    "rh": {"trade": "rh_trade", "rent": "rh_rent"},  # 연립다세대 (빌라)
+    "sh": {"trade": "sh_trade", "rent": "sh_rent"},  # 단독/다가구
+    "apt_presale": {"trade": "apt_silv_trade"},  # 아파트 분양권
+    "land": {"trade": "land_trade"},
+    "commercial": {"trade": "nrg_trade"},  # 상업업무용
+    "industrial": {"trade": "indu_trade"},  # 공장/창고
+}
+
+# "unknown"일 때 동시에 조회할 상품 (앞쪽 우선)
+RESIDENTIAL_TYPES = ("apt", "officetel", "rh", "sh")
+
+# 한글 이름 (risk_engine.PropertyType 값 포함) → 상품
+TYPE_ALIASES: Dict[str, str] = {
+    "아파트": "apt",
+    "오피스텔": "officetel",
+    "빌라": "rh", "연립": "rh", "다세대": "rh", "연립다세대": "rh",
+    "단독주택": "sh", "단독": "sh", "다가구": "sh", "단독다가구": "sh",
+    "분양권": "apt_presale",
+    "토지": "land",
+    "상가": "commercial", "상업업무용": "commercial",
+    "공장": "industrial", "창고": "industrial",
+}
+
+# 주소 속 건물명으로 상품 추정 (앞쪽 우선: "○○오피스텔"이 "아파트"보다 구체적)
+_ADDRESS_HINTS: Tuple[Tuple[re.Pattern, str], ...] = (
+    (re.compile(r"오피스텔"), "officetel"),
+    (re.compile(r"아파트"), "apt"),
+    (re.compile(r"빌라|연립|다세대|맨션|빌리지"), "rh"),
+)
+
+# 비교 범위 → 관련도 (작을수록 대상 물건과 가까움)
+LEVEL_RANK = {level: rank for rank, level in enumerate(LEVEL_LABELS)}
+
+MARKET_RECORD_SCHEMA = RecordSchema("MarketRecord", [
+    S("product"),  # RTMS 상품 키 (예: "rh_trade")
+    S("umdNm"),
+    S("name", "aptNm", "offiNm", "mhouseNm", "aptName"),
+    S("jibun"),
+    S("area", "excluUseAr", "exclusiveArea", "totalFloorAr", "contractArea", "dealArea", "buildingAr"),
+    S("floor"),
+    I("dealYear"),
+    I("dealMonth"),
+    I("dealDay"),
+    I("dealAmount"),
+    I("deposit"),
+    I("monthlyRent"),
+    I("buildYear"),
+    S("cdealType"),
+])
+
+
+def resolve_property_type(value: Optional[str]) -> str:
+    """상품 키 / 한글 이름 → 상품 키 (알 수 없으면 "unknown")"""
+    if not value:
+        return UNKNOWN
+    value = str(getattr(value, "value", value)).strip()
+    if value in MARKET_TYPES:
+        return value
+    return TYPE_ALIASES.get(value, UNKNOWN)
+
+
+def infer_property_type(address: Optional[str]) -> str:
+    """주소 속 건물명으로 상품 추정 (예: "역삼오피스텔" → "officetel")"""
+    for pattern, property_type in _ADDRESS_HINTS:
+        if address and pattern.search(address):
+            return property_type
+    return UNKNOWN
+
+
+def to_market_record(item: Dict[str, Any], product: str) -> TransactionRecord:
+    """웨어하우스 정규화 item → 공통 레코드"""
+    record = MARKET_RECORD_SCHEMA.from_mapping(item)
+    record.product = product
+    return record
+
+
+# ===========================
+# 조회 (중복 제거 + 캐시)
+# ===========================
+
+_cache: Optional[AddressCache] = None
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+def get_market_query_cache() -> AddressCache:
+    """(웨어하우스, 상품, 법정동, 기간) → 공통 레코드 목록 (LRU + TTL)"""
+    global _cache
+    if _cache is None:
+        from core.settings import settings
+
+        _cache = AddressCache(settings.market_query_cache_size, settings.market_query_cache_ttl_sec)
+    return _cache
+
+
+async def fetch_market_records(
+    product: str,
+    lawd_cd: str,
+    deal_ymds: Sequence[str],
+    api_key: Optional[str] = None,
+    warehouse=None,
+) -> List[TransactionRecord]:
+    """
+    상품 1종 거래 → 공통 레코드 (캐시 → 진행 중인 같은 조회 공유 → 웨어하우스/API)
+
+    빈 결과는 캐시하지 않습니다 (API 일시 오류 후 재시도 가능).
+    공유 조회는 처음 요청한 쪽이 취소되어도 계속 실행됩니다 (뒤에 합류한 요청이 같은 결과를 받음).
+    """
+    from core.rtms_warehouse import fetch_transactions, get_rtms_warehouse
+
+    warehouse = warehouse or get_rtms_warehouse()
+    key = (id(warehouse), product, lawd_cd, tuple(deal_ymds))
+
+    cached = get_market_query_cache().get(key)
+    if cached is not None:
+        return cached
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    async def load() -> List[TransactionRecord]:
+        try:
+            items = await fetch_transactions(product, lawd_cd, deal_ymds, api_key=api_key, warehouse=warehouse)
+            records = [to_market_record(item, product) for item in items]
+        finally:
+            _inflight.pop(key, None)
+        if records:
+            get_market_query_cache().put(key, records)
+        return records
+
+    task = asyncio.ensure_future(load())
+    # 기다리는 요청이 모두 취소된 뒤 실패해도 "exception was never retrieved" 경고 없이 종료
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _inflight[key] = task
+    return await asyncio.shield(task)
+
+
+@dataclass
+class MarketQueryResult:
+    """통합 시세 조회 결과 (property_type: 선택된 상품, 없으면 "unknown")"""
+
+    property_type: str
+    kind: str
+    stats: Optional[MarketStats] = None
+    records: List[TransactionRecord] = field(default_factory=list)
+    candidates: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # 상품별 조회 요약
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "property_type": self.property_type,
+            "kind": self.kind,
+            "stats": self.stats.model_dump() if self.stats else None,
+            "transaction_count": len(self.records),
+            "candidates": self.candidates,
+        }
+
+
+def _relevance(stats: MarketStats, order: int) -> tuple:
+    return (LEVEL_RANK.get(stats.level, len(LEVEL_RANK)), -stats.sample_count, order)
+
+
+async def query_market(
+    lawd_cd: str,
+    address: Optional[str],
+    property_type: Optional[str] = UNKNOWN,
+    kind: str = "trade",
+    months: int = 3,
+    area_m2: Optional[float] = None,
+    exclude_monthly_rent: bool = False,
+    api_key: Optional[str] = None,
+    warehouse=None,
+) -> MarketQueryResult:
+    """
+    상품 통합 시세 조회
+
+    Args:
+        lawd_cd: 법정동코드 5자리
+        address: 대상 주소 (비교사례 선택 / 상품 추정용)
+        property_type: 상품 키 또는 한글 이름, "unknown"이면 여러 상품 동시 조회
+        kind: "trade" (매매, dealAmount) | "rent" (전월세, deposit)
+        months: 최근 몇 개월 거래를 쓸지
+        area_m2: 대상 면적
+        exclude_monthly_rent: True면 월세 제외 (전세 시세)
+
+    Returns:
+        MarketQueryResult (조회 가능한 상품이 없거나 거래가 없으면 stats=None)
+    """
+    from core.rtms_warehouse import recent_months
+    from core.settings import settings
+
+    resolved = resolve_property_type(property_type)
+    if resolved == UNKNOWN:
+        resolved = infer_property_type(address)
+    candidates = [resolved] if resolved != UNKNOWN else list(RESIDENTIAL_TYPES)
+    candidates = [t for t in candidates if kind in MARKET_TYPES[t]]
+    if not candidates:
+        return MarketQueryResult(property_type=resolved, kind=kind)
+
+    deal_ymds = recent_months(months)
+    amount_field = "deposit" if kind == "rent" else "dealAmount"
+
+    results = await fan_out(
+        [
+            (t, lambda t=t: fetch_market_records(MARKET_TYPES[t][kind], lawd_cd, deal_ymds, api_key, warehouse))
+            for t in candidates
+        ],
+        timeout_sec=settings.public_data_call_timeout_sec,
+        max_concurrency=settings.public_data_max_concurrency,
+    )
+
+    summary: Dict[str, Dict[str, Any]] = {}
+    best: Optional[Tuple[tuple, str, MarketStats, List[TransactionRecord]]] = None
+    for order, result in enumerate(results):
+        if not result.ok:
+            summary[result.name] = {"status": result.status, "error": result.error, "elapsed_ms": result.elapsed_ms}
+            continue
+
+        records = result.value
+        stats = summarize_market(
+            records, address, area_m2=area_m2,
+            amount_field=amount_field, exclude_monthly_rent=exclude_monthly_rent,
+        ) if records else None
+        summary[result.name] = {
+            "status": "ok",
+            "transactions": len(records),
+            "level": stats.level if stats else None,
+            "sample_count": stats.sample_count if stats else 0,
+            "estimate": stats.estimate if stats else None,
+            "elapsed_ms": result.elapsed_ms,
+        }
+        if stats and stats.estimate:
+            rank = _relevance(stats, order)
+            if best is None or rank < best[0]:
+                best = (rank, result.name, stats, records)
+
+    if best is None:
+        logger.info(f"통합 시세 조회: {lawd_cd} {kind} {candidates} → 거래 없음")
+        return MarketQueryResult(
+            property_type=candidates[0] if len(candidates) == 1 else UNKNOWN,
+            kind=kind,
+            candidates=summary,
+        )
+
+    _, selected, stats, records = best
+    logger.info(
+        f"통합 시세 조회: {lawd_cd} {kind} {candidates} → {selected} "
+        f"({stats.level}, {stats.sample_count}건, {stats.estimate}만원)"
+    )
+    return MarketQueryResult(property_type=selected, kind=kind, stats=stats, records=records, candidates=summary)
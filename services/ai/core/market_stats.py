@@ -0,0 +1,467 @@
+"""
+실거래가 시세 통계 엔진 (Market Statistics Engine)
+
+정규화된 RTMS 거래 목록(core/public_data_api의 normalized items)을 컬럼 배열로
+인덱싱하고, 대상 물건과 비교 가능한 거래(비교사례)만 골라 시세를 추정합니다.
+
+인덱스 키: (umdNm, 단지명, 전용면적 구간, 층 구간, 계약년월)
+- 문자열 컬럼은 정수 코드로 인코딩(factorize) → 조건 검색이 모두 NumPy 마스크 연산
+- 수천 건 규모의 시군구 거래도 수 ms 내 요약
+
+비교사례 선택 (표본 부족 시 넓은 범위로 단계적 완화):
+    1. 같은 단지 + 같은 면적 구간 + 같은 층 구간
+    2. 같은 단지 + 같은 면적 구간
+    3. 같은 단지 (㎡당 가격 × 대상 면적)
+    4. 같은 법정동 + 같은 면적 구간
+    5. 같은 법정동 (㎡당 가격 × 대상 면적)
+    6. 시군구 전체 (㎡당 가격 × 대상 면적)
+
+통계: 절사평균(trimmed mean), 중앙값, ㎡당 가격 중앙값, 표본 수
+"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+# 전용면적 구간 경계 (㎡): 소형 ~ 국민주택규모(85) ~ 대형
+AREA_BUCKET_EDGES = np.array([40.0, 50.0, 60.0, 70.0, 85.0, 102.0, 135.0])
+
+# 층 구간 경계: 지하(<1) / 저층(1~3) / 중층(4~10) / 고층(11~20) / 초고층(21~)
+FLOOR_BAND_EDGES = np.array([1, 4, 11, 21])
+
+# 단지/건물명 필드 (상품별로 다름: 아파트/오피스텔/연립다세대, name = core/market_query 공통 레코드)
+NAME_FIELDS = ("aptNm", "offiNm", "mhouseNm", "aptName", "name")
+
+# 비교 범위 → 표시용 라벨
+LEVEL_LABELS = {
+    "complex_area_floor": "같은 단지·면적·층",
+    "complex_area": "같은 단지·면적",
+    "complex": "같은 단지",
+    "dong_area": "같은 법정동·면적",
+    "dong": "같은 법정동",
+    "district": "시군구 전체",
+}
+
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_TRIM_RATIO = 0.1
+
+
+def area_bucket(area_m2: Optional[float]) -> int:
+    """전용면적 → 구간 코드 (면적 없음 = -1)"""
+    if area_m2 is None or area_m2 <= 0:
+        return -1
+    return int(np.digitize(area_m2, AREA_BUCKET_EDGES))
+
+
+def floor_band(floor: Optional[int]) -> int:
+    """층 → 구간 코드 (층 없음 = -1)"""
+    if floor is None:
+        return -1
+    return int(np.digitize(floor, FLOOR_BAND_EDGES))
+
+
+def trimmed_mean(values: np.ndarray, ratio: float = DEFAULT_TRIM_RATIO) -> Optional[float]:
+    """
+    양쪽 ratio 비율을 잘라낸 평균
+
+    표본이 작아도 최소 1건씩은 잘라내되(3건 이상일 때), 최소 1건은 남깁니다.
+    """
+    n = len(values)
+    if n == 0:
+        return None
+    if n < 3:
+        return float(values.mean())
+    cut = max(1, int(n * ratio))
+    if n - 2 * cut < 1:
+        cut = (n - 1) // 2
+    ordered = np.sort(values)
+    return float(ordered[cut:n - cut].mean())
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        s = str(value).replace(",", "").strip()
+        return float(s) if s else np.nan
+    except ValueError:
+        return np.nan
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"\s+", "", name or "")
+
+
+# ===========================
+# 결과 모델
+# ===========================
+class MarketStats(BaseModel):
+    """비교사례 시세 통계"""
+    level: str  # 선택된 비교 범위 (예: "complex_area_floor", "district")
+    sample_count: int
+    estimate: Optional[int] = None  # 추정 시세 (만원)
+    trimmed_mean: Optional[int] = None  # 절사평균 (만원)
+    median: Optional[int] = None  # 중앙값 (만원)
+    price_per_m2: Optional[float] = None  # ㎡당 가격 중앙값 (만원)
+    min_amount: Optional[int] = None
+    max_amount: Optional[int] = None
+    area_adjusted: bool = False  # ㎡당 가격 × 대상 면적으로 추정했는지 여부
+    deal_months: List[int] = []  # 사용된 계약년월 (YYYYMM)
+
+    def describe(self) -> str:
+        """비교 근거 요약 (예: "같은 단지·면적 비교사례 12건")"""
+        label = LEVEL_LABELS.get(self.level, self.level)
+        text = f"{label} 비교사례 {self.sample_count}건"
+        if self.area_adjusted:
+            text += ", ㎡당 가격 환산"
+        return text
+
+
+@dataclass
+class ComparableTarget:
+    """
+    비교 대상 물건
+
+    모든 항목은 선택값이며, 비어 있는 항목은 해당 조건을 건너뜁니다.
+    """
+    umd_nm: Optional[str] = None  # 법정동 (예: "역삼동")
+    complex_name: Optional[str] = None  # 단지명 (예: "래미안")
+    jibun: Optional[str] = None  # 지번 (예: "123-45", 단지명이 없을 때 단지 식별용)
+    area_m2: Optional[float] = None  # 전용면적
+    floor: Optional[int] = None  # 층
+
+    @classmethod
+    def from_address(
+        cls,
+        address: Optional[str],
+        area_m2: Optional[float] = None,
+        floor: Optional[int] = None
+    ) -> "ComparableTarget":
+        """
+        주소 문자열에서 법정동/지번/층을 추출
+
+        층은 인자로 주지 않으면 "12층" 또는 "1203호"(앞자리 = 층)에서 추정합니다.
+        """
+        if not address:
+            return cls(area_m2=area_m2, floor=floor)
+
+        from core.address_converter import AddressConverter
+
+        parsed = AddressConverter().parse_address_regex(address)
+
+        jibun = None
+        if parsed.bun and not parsed.road_name:
+            jibun = f"{parsed.bun}-{parsed.ji}" if parsed.ji else parsed.bun
+
+        if floor is None:
+            floor_match = re.search(r"(\d{1,2})\s*층", address)
+            ho_match = re.search(r"(\d{3,4})\s*호", address)
+            if floor_match:
+                floor = int(floor_match.group(1))
+            elif ho_match:
+                floor = int(ho_match.group(1)) // 100
+
+        return cls(
+            umd_nm=parsed.eupmyeondong,
+            jibun=jibun,
+            area_m2=area_m2,
+            floor=floor,
+            complex_name=None,
+        )
+
+
+# ===========================
+# 엔진
+# ===========================
+class MarketStatsEngine:
+    """
+    정규화된 거래 목록에 대한 컬럼형 인덱스 + 비교사례 통계
+
+    사용 예:
+    ```python
+    engine = MarketStatsEngine.from_items(trade_items)
+    target = ComparableTarget.from_address(address, area_m2=84.9)
+    stats = engine.summarize(target, raw_address=address)
+    stats.estimate  # 만원
+    ```
+    """
+
+    def __init__(
+        self,
+        umd: np.ndarray,
+        names: np.ndarray,
+        jibun: np.ndarray,
+        area: np.ndarray,
+        floor: np.ndarray,
+        deal_month: np.ndarray,
+        amount: np.ndarray,
+        umd_labels: Sequence[str],
+        name_labels: Sequence[str],
+        jibun_labels: Sequence[str],
+    ):
+        self.umd = umd
+        self.names = names
+        self.jibun = jibun
+        self.area = area
+        self.floor = floor
+        self.deal_month = deal_month
+        self.amount = amount
+
+        self.area_bucket = np.where(area > 0, np.digitize(np.nan_to_num(area), AREA_BUCKET_EDGES), -1)
+        self.floor_band = np.where(floor > -999, np.digitize(floor, FLOOR_BAND_EDGES), -1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.price_per_m2 = np.where(area > 0, amount / area, np.nan)
+
+        self.umd_labels = list(umd_labels)
+        self.name_labels = list(name_labels)
+        self.jibun_labels = list(jibun_labels)
+        self._umd_index = {label: i for i, label in enumerate(self.umd_labels)}
+        self._name_index = {_normalize_name(label): i for i, label in enumerate(self.name_labels)}
+        self._jibun_index = {label: i for i, label in enumerate(self.jibun_labels)}
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        amount_field: str = "dealAmount",
+        exclude_monthly_rent: bool = False,
+    ) -> "MarketStatsEngine":
+        """
+        정규화된 거래 목록으로 엔진 생성
+
+        Args:
+            items: public_data_api의 정규화된 item 목록 (매매/전월세)
+            amount_field: 가격 필드 ("dealAmount" = 매매, "deposit" = 전세 보증금)
+            exclude_monthly_rent: True면 월세 거래 제외 (전세 시세용)
+
+        해제(취소)된 거래와 가격이 없는 거래는 제외됩니다.
+        """
+        umd, names, jibun, area, floor, month, amount = [], [], [], [], [], [], []
+
+        for item in items:
+            price = item.get(amount_field)
+            if not price:
+                continue
+            if (item.get("cdealType") or "").strip().upper() == "O":
+                continue
+            if exclude_monthly_rent and item.get("monthlyRent"):
+                continue
+
+            name = ""
+            for field_name in NAME_FIELDS:
+                if item.get(field_name):
+                    name = str(item[field_name]).strip()
+                    break
+
+            floor_value = _to_float(item.get("floor"))
+            year = item.get("dealYear") or 0
+            mon = item.get("dealMonth") or 0
+
+            umd.append((item.get("umdNm") or item.get("dong") or "").strip())
+            names.append(name)
+            jibun.append((item.get("jibun") or "").strip())
+            area.append(_to_float(item.get("excluUseAr") or item.get("exclusiveArea") or item.get("area")))
+            floor.append(-999 if np.isnan(floor_value) else int(floor_value))
+            month.append(int(year) * 100 + int(mon))
+            amount.append(float(price))
+
+        umd_labels, umd_codes = np.unique(np.asarray(umd, dtype=object).astype(str), return_inverse=True) \
+            if umd else (np.array([]), np.array([], dtype=np.int64))
+        name_labels, name_codes = np.unique(np.asarray(names, dtype=object).astype(str), return_inverse=True) \
+            if names else (np.array([]), np.array([], dtype=np.int64))
+        jibun_labels, jibun_codes = np.unique(np.asarray(jibun, dtype=object).astype(str), return_inverse=True) \
+            if jibun else (np.array([]), np.array([], dtype=np.int64))
+
+        return cls(
+            umd=umd_codes.astype(np.int64),
+            names=name_codes.astype(np.int64),
+            jibun=jibun_codes.astype(np.int64),
+            area=np.asarray(area, dtype=np.float64),
+            floor=np.asarray(floor, dtype=np.int64),
+            deal_month=np.asarray(month, dtype=np.int64),
+            amount=np.asarray(amount, dtype=np.float64),
+            umd_labels=umd_labels.tolist(),
+            name_labels=name_labels.tolist(),
+            jibun_labels=jibun_labels.tolist(),
+        )
+
+    # ---------- 대상 식별 ----------
+
+    def resolve_complex(self, target: ComparableTarget, raw_address: Optional[str] = None) -> Optional[int]:
+        """
+        대상 단지 코드 결정
+
+        1. target.complex_name 정확 일치 (공백 무시)
+        2. 같은 법정동 + 같은 지번의 거래가 가장 많은 단지
+        3. 단지명이 원본 주소 문자열에 포함된 경우 (가장 긴 이름 우선)
+        """
+        if target.complex_name:
+            code = self._name_index.get(_normalize_name(target.complex_name))
+            if code is not None:
+                return code
+
+        umd_code = self._umd_index.get(target.umd_nm) if target.umd_nm else None
+
+        if target.jibun and umd_code is not None:
+            jibun_code = self._jibun_index.get(target.jibun)
+            if jibun_code is not None:
+                mask = (self.umd == umd_code) & (self.jibun == jibun_code)
+                if mask.any():
+                    return int(np.bincount(self.names[mask]).argmax())
+
+        if raw_address:
+            address_key = _normalize_name(raw_address)
+            candidates = [
+                (len(key), code) for key, code in self._name_index.items()
+                if len(key) >= 2 and key in address_key
+            ]
+            if candidates:
+                return max(candidates)[1]
+
+        return None
+
+    # ---------- 통계 ----------
+
+    def _stats(
+        self,
+        mask: np.ndarray,
+        level: str,
+        target_area: Optional[float],
+        area_adjusted: bool,
+        trim_ratio: float,
+    ) -> MarketStats:
+        amounts = self.amount[mask]
+        ppm2 = self.price_per_m2[mask]
+        ppm2 = ppm2[~np.isnan(ppm2)]
+
+        tmean = trimmed_mean(amounts, trim_ratio)
+        median = float(np.median(amounts)) if len(amounts) else None
+        ppm2_median = float(np.median(ppm2)) if len(ppm2) else None
+
+        estimate = tmean
+        if area_adjusted:
+            if target_area and ppm2_median is not None:
+                estimate = trimmed_mean(ppm2, trim_ratio) * target_area
+            else:
+                area_adjusted = False
+
+        return MarketStats(
+            level=level,
+            sample_count=int(mask.sum()),
+            estimate=int(estimate) if estimate is not None else None,
+            trimmed_mean=int(tmean) if tmean is not None else None,
+            median=int(median) if median is not None else None,
+            price_per_m2=round(ppm2_median, 2) if ppm2_median is not None else None,
+            min_amount=int(amounts.min()) if len(amounts) else None,
+            max_amount=int(amounts.max()) if len(amounts) else None,
+            area_adjusted=area_adjusted,
+            deal_months=sorted(int(m) for m in np.unique(self.deal_month[mask])),
+        )
+
+    def summarize(
+        self,
+        target: ComparableTarget,
+        raw_address: Optional[str] = None,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        trim_ratio: float = DEFAULT_TRIM_RATIO,
+        since_month: Optional[int] = None,
+    ) -> Optional[MarketStats]:
+        """
+        대상 물건의 비교사례 시세 통계
+
+        좁은 범위부터 시도하여 표본이 min_samples 이상인 첫 범위를 사용합니다.
+        어느 범위도 충분하지 않으면 표본이 있는 가장 좁은 범위를 반환합니다.
+
+        Args:
+            target: 비교 대상
+            raw_address: 원본 주소 (단지명 추정용)
+            min_samples: 범위 확정에 필요한 최소 거래 수
+            trim_ratio: 절사평균 비율 (양쪽)
+            since_month: 이 계약년월(YYYYMM) 이후 거래만 사용
+
+        Returns:
+            MarketStats (거래가 하나도 없으면 None)
+        """
+        if len(self) == 0:
+            return None
+
+        base = np.ones(len(self), dtype=bool)
+        if since_month:
+            base &= self.deal_month >= since_month
+
+        complex_code = self.resolve_complex(target, raw_address)
+        umd_code = self._umd_index.get(target.umd_nm) if target.umd_nm else None
+        bucket = area_bucket(target.area_m2)
+        band = floor_band(target.floor)
+
+        same_complex = base & (self.names == complex_code) if complex_code is not None else None
+        same_umd = base & (self.umd == umd_code) if umd_code is not None else None
+        same_area = self.area_bucket == bucket if bucket >= 0 else None
+        same_floor = self.floor_band == band if band >= 0 else None
+
+        # (level, mask, area_adjusted)
+        levels: List[Tuple[str, Optional[np.ndarray], bool]] = []
+        if same_complex is not None and same_area is not None:
+            if same_floor is not None:
+                levels.append(("complex_area_floor", same_complex & same_area & same_floor, False))
+            levels.append(("complex_area", same_complex & same_area, False))
+        if same_complex is not None:
+            levels.append(("complex", same_complex, True))
+        if same_umd is not None and same_area is not None:
+            levels.append(("dong_area", same_umd & same_area, False))
+        if same_umd is not None:
+            levels.append(("dong", same_umd, True))
+        levels.append(("district", base, True))
+
+        fallback = None
+        for level, mask, area_adjusted in levels:
+            count = int(mask.sum())
+            if count >= min_samples:
+                return self._stats(mask, level, target.area_m2, area_adjusted, trim_ratio)
+            if count and fallback is None:
+                fallback = (level, mask, area_adjusted)
+
+        if fallback:
+            level, mask, area_adjusted = fallback
+            return self._stats(mask, level, target.area_m2, area_adjusted, trim_ratio)
+        return None
+
+
+def summarize_market(
+    items: List[Dict[str, Any]],
+    address: Optional[str],
+    area_m2: Optional[float] = None,
+    amount_field: str = "dealAmount",
+    exclude_monthly_rent: bool = False,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+) -> Optional[MarketStats]:
+    """
+    거래 목록 + 대상 주소 → 비교사례 시세 통계 (편의 함수)
+
+    Args:
+        items: 정규화된 거래 목록
+        address: 대상 주소 (법정동/지번/층/단지명 추출)
+        area_m2: 대상 전용면적 (등기부 표제부)
+        amount_field: "dealAmount" (매매) 또는 "deposit" (전세)
+        exclude_monthly_rent: 월세 거래 제외 여부
+    """
+    engine = MarketStatsEngine.from_items(items, amount_field=amount_field,
+                                         exclude_monthly_rent=exclude_monthly_rent)
+    target = ComparableTarget.from_address(address, area_m2=area_m2)
+    stats = engine.summarize(target, raw_address=address, min_samples=min_samples)
+
+    if stats:
+        logger.info(
+            f"시세 통계: level={stats.level}, 표본={stats.sample_count}건, "
+            f"추정={stats.estimate}만원, 중앙값={stats.median}만원, ㎡당={stats.price_per_m2}만원"
+        )
+    return stats
@@ -0,0 +1,283 @@
+"""PDF 페이지 렌더링 서비스 (OCR/Vision 공용, 메모리 전용).
+
+- 임시 PNG 파일 없이 페이지를 메모리 버퍼로 렌더링
+- DPI 적응: 텍스트 레이어 밀도(없으면 저해상도 썸네일의 잉크 비율)로 150~250 DPI 선택
+- OCR용 인코딩: 그레이스케일 + JPEG/WebP (PNG 대비 수 배 작음 → 업로드/base64 비용 감소)
+- 빈 페이지 / 중복 페이지(렌더링 픽셀이 완전히 같은 페이지만) 건너뜀
+  (양식이 같고 금액/이름만 다른 페이지는 dHash가 거의 같으므로 유사도로는 판단하지 않음)
+- 문서 해시(sha256) + 렌더링 옵션 단위 캐시 → OCR 재시도, 컨센서스(Gemini+Claude) 재렌더링 없음
+"""
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+ImageFormat = Literal["jpeg", "webp", "png"]
+
+THUMBNAIL_DPI = 36
+INK_THRESHOLD = 200  # 그레이스케일 값이 이보다 어두우면 잉크로 간주
+BLANK_INK_RATIO = 0.002  # 잉크 비율이 이보다 낮고 텍스트 레이어도 없으면 빈 페이지
+HASH_SIZE = 16  # dHash 16x16 = 256비트
+
+_MIME_TYPES = {"jpeg": "image/jpeg", "webp": "image/webp", "png": "image/png"}
+
+
+@dataclass(slots=True)
+class RenderedPage:
+    """렌더링된 페이지 (index는 원본 PDF 기준 0부터)"""
+
+    index: int
+    data: bytes
+    mime_type: str
+    dpi: int
+    width: int
+    height: int
+    phash: int
+
+    def to_pil(self) -> Image.Image:
+        return Image.open(io.BytesIO(self.data))
+
+
+def document_hash(source: Union[str, bytes]) -> str:
+    """PDF 내용 sha256 (경로 또는 bytes)"""
+    if isinstance(source, bytes):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def difference_hash(image: Image.Image, size: int = HASH_SIZE) -> int:
+    """차이 해시 (dHash): 인접 픽셀 밝기 비교 비트열"""
+    small = image.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS)
+    pixels = list(small.getdata())
+    bits = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            bits = (bits << 1) | int(pixels[offset + col] > pixels[offset + col + 1])
+    return bits
+
+
+def ink_ratio(image: Image.Image) -> float:
+    """그레이스케일 이미지에서 잉크(어두운 픽셀) 비율"""
+    histogram = image.convert("L").histogram()
+    total = sum(histogram)
+    return sum(histogram[:INK_THRESHOLD]) / total if total else 0.0
+
+
+def choose_dpi(text_chars: int, page_area_in2: float, thumbnail_ink: float) -> int:
+    """
+    페이지 밀도 → 렌더링 DPI
+
+    텍스트 레이어가 있으면 제곱인치당 글자 수, 없으면(스캔) 썸네일 잉크 비율 기준.
+    작은 글씨가 빽빽한 등기부/약관 페이지는 높게, 여백이 많은 페이지는 낮게.
+    """
+    if text_chars > 0 and page_area_in2 > 0:
+        density = text_chars / page_area_in2
+        dense, sparse = density >= 25, density < 8
+    else:
+        dense, sparse = thumbnail_ink >= 0.12, thumbnail_ink < 0.04
+
+    if dense:
+        return settings.page_render_dpi_max
+    if sparse:
+        return settings.page_render_dpi_min
+    return settings.page_render_dpi
+
+
+def _encode(image: Image.Image, image_format: ImageFormat, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if image_format == "png":
+        image.save(buffer, format="PNG", optimize=False)
+    elif image_format == "webp":
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+    else:
+        image.save(buffer, format="JPEG", quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _render_document(
+    source: Union[str, bytes],
+    dpi: Optional[int],
+    image_format: ImageFormat,
+    quality: int,
+    grayscale: bool,
+    skip_blank: bool,
+    skip_duplicates: bool,
+) -> List[RenderedPage]:
+    if isinstance(source, bytes):
+        doc = fitz.open(stream=source, filetype="pdf")  # type: ignore[attr-defined]
+    else:
+        doc = fitz.open(source)  # type: ignore[attr-defined]
+
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    mode = "L" if grayscale else "RGB"
+    pages: List[RenderedPage] = []
+    seen_pixels = set()  # 렌더링 픽셀 sha256 (완전히 같은 페이지만 중복)
+    skipped_blank = skipped_duplicate = 0
+
+    try:
+        for page in doc:
+            thumb_pix = page.get_pixmap(dpi=THUMBNAIL_DPI, colorspace=fitz.csGRAY)
+            thumbnail = Image.frombytes("L", (thumb_pix.width, thumb_pix.height), thumb_pix.samples)
+            text_chars = len("".join(page.get_text("text").split()))
+            thumbnail_ink = ink_ratio(thumbnail)
+
+            if skip_blank and text_chars == 0 and thumbnail_ink < BLANK_INK_RATIO:
+                skipped_blank += 1
+                continue
+
+            page_dpi = dpi or choose_dpi(
+                text_chars,
+                (page.rect.width / 72) * (page.rect.height / 72),
+                thumbnail_ink,
+            )
+            pix = page.get_pixmap(dpi=page_dpi, colorspace=colorspace)
+            if skip_duplicates:
+                pixels = hashlib.sha256(pix.samples).digest()
+                if pixels in seen_pixels:
+                    skipped_duplicate += 1
+                    continue
+                seen_pixels.add(pixels)
+            image = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+            pages.append(RenderedPage(
+                index=page.number,
+                data=_encode(image, image_format, quality),
+                mime_type=_MIME_TYPES[image_format],
+                dpi=page_dpi,
+                width=pix.width,
+                height=pix.height,
+                phash=difference_hash(thumbnail),
+            ))
+    finally:
+        doc.close()
+
+    logger.info(
+        f"페이지 렌더링 완료: {len(pages)}개 (빈 페이지 {skipped_blank}, 중복 {skipped_duplicate} 건너뜀), "
+        f"{sum(len(p.data) for p in pages) / 1024:,.0f}KB, DPI={sorted({p.dpi for p in pages})}"
+    )
+    return pages
+
+
+class PageRenderCache:
+    """(문서 해시, 렌더링 옵션) → 페이지 목록 LRU (총 바이트 수 제한, 같은 키 동시 렌더링 1회)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Tuple[List[RenderedPage], int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+
+    def get(self, key: tuple) -> Optional[List[RenderedPage]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, pages: List[RenderedPage]) -> None:
+        size = sum(len(p.data) for p in pages)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (pages, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def key_lock(self, key: tuple) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def release_key(self, key: tuple) -> None:
+        with self._lock:
+            self._key_locks.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_cache = PageRenderCache(settings.page_render_cache_mb * 1024 * 1024)
+
+
+def render_pages(
+    source: Union[str, bytes],
+    dpi: Optional[int] = None,
+    image_format: Optional[ImageFormat] = None,
+    quality: Optional[int] = None,
+    grayscale: bool = True,
+    skip_blank: bool = True,
+    skip_duplicates: bool = True,
+) -> List[RenderedPage]:
+    """
+    PDF → OCR용 페이지 이미지 (메모리, 캐시)
+
+    Args:
+        source: PDF 파일 경로 또는 PDF bytes
+        dpi: 고정 DPI (None이면 페이지별 적응 DPI)
+        image_format: "jpeg" | "webp" | "png" (기본값: settings.page_render_format)
+        quality: JPEG/WebP 품질 (기본값: settings.page_render_quality)
+        grayscale: 그레이스케일 렌더링 (OCR에는 색 정보 불필요)
+        skip_blank: 빈 페이지 건너뜀
+        skip_duplicates: 앞 페이지와 픽셀이 완전히 같은 페이지 건너뜀 (값만 다른 같은 양식 페이지는 유지)
+
+    Returns:
+        RenderedPage 목록 (원본 페이지 순서, 건너뛴 페이지 제외)
+
+    Raises:
+        FileNotFoundError: PDF 파일 없음
+        ValueError: 렌더링 실패
+    """
+    image_format = image_format or settings.page_render_format
+    quality = quality or settings.page_render_quality
+
+    try:
+        doc_hash = document_hash(source)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {source}")
+
+    key = (doc_hash, dpi, image_format, quality, grayscale, skip_blank, skip_duplicates)
+    cached = _cache.get(key)
+    if cached is not None:
+        logger.info(f"페이지 렌더링 캐시 적중: {doc_hash[:12]} ({len(cached)}개)")
+        return cached
+
+    # 동시에 같은 문서를 요청한 호출(예: Gemini/Claude 병렬 OCR)은 한 번만 렌더링
+    try:
+        with _cache.key_lock(key):
+            cached = _cache.get(key)
+            if cached is not None:
+                return cached
+            try:
+                pages = _render_document(source, dpi, image_format, quality, grayscale, skip_blank, skip_duplicates)
+            except Exception as e:
+                raise ValueError(f"PDF 페이지 렌더링 실패: {e}") from e
+            _cache.put(key, pages)
+            return pages
+    finally:
+        _cache.release_key(key)
+
+
+def clear_render_cache() -> None:
+    _cache.clear()
@@ -0,0 +1,96 @@
+"""
+Keyset 페이지네이션 헬퍼
+
+(created_at, id) 복합 키 기반 커서 페이지네이션.
+- 커서는 불투명(opaque) 문자열: base64url(JSON{"t": created_at, "id": id})
+- 커서 메시지를 다시 조회하지 않고 커서 자체에 키를 담아 페이지당 1회 쿼리
+- created_at이 같은 메시지가 여러 개여도 id로 순서가 결정되어 누락/중복 없음
+- 커서 값은 PostgREST 필터에 그대로 들어가므로 디코딩 시 형식 검증 (ISO 시각 + 불투명 TEXT/ULID 또는 정수 id)
+"""
+import base64
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# id는 불투명 토큰 (messages.id = TEXT ULID, UUID도 허용) - PostgREST 필터 문법 문자(, . " ( ) 등) 차단
+ID_PATTERN = re.compile(r"[0-9A-Za-z_-]{1,64}")
+
+
+class InvalidCursorError(ValueError):
+    """커서 디코딩 실패"""
+
+
+def encode_cursor(created_at: str, row_id: Any) -> str:
+    """(created_at, id)를 불투명 커서 문자열로 인코딩"""
+    payload = json.dumps({"t": created_at, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, Any]:
+    """
+    커서 문자열을 (created_at, id)로 디코딩
+
+    Raises:
+        InvalidCursorError: 형식이 잘못된 커서 (created_at이 ISO 시각이 아니거나 id가 토큰/정수가 아님)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at, row_id = payload["t"], payload["id"]
+        datetime.fromisoformat(created_at)
+        if isinstance(row_id, bool) or not isinstance(row_id, (int, str)):
+            raise TypeError(f"id: {type(row_id).__name__}")
+        if isinstance(row_id, str) and not ID_PATTERN.fullmatch(row_id):
+            raise ValueError(f"id: {row_id!r}")
+        return created_at, row_id
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def apply_keyset(query, cursor: Optional[str], desc: bool = True,
+                 time_column: str = "created_at", id_column: str = "id"):
+    """
+    Supabase 쿼리에 keyset 정렬 + 커서 필터 적용
+
+    desc=True: 커서보다 오래된 행 (최신순 목록의 다음 페이지)
+    desc=False: 커서보다 최신 행 (시간순 목록의 다음 페이지)
+
+    Args:
+        query: supabase.table(...).select(...) 빌더
+        cursor: encode_cursor()로 만든 커서 (None이면 첫 페이지)
+        desc: 정렬 방향
+
+    Returns:
+        정렬/필터가 적용된 쿼리 빌더
+    """
+    query = query.order(time_column, desc=desc).order(id_column, desc=desc)
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        op = "lt" if desc else "gt"
+        # PostgREST: (t < T) OR (t = T AND id < ID)
+        query = query.or_(
+            f'{time_column}.{op}."{created_at}",'
+            f'and({time_column}.eq."{created_at}",{id_column}.{op}.{row_id})'
+        )
+
+    return query
+
+
+def split_page(rows: List[Dict[str, Any]], limit: int,
+               time_column: str = "created_at",
+               id_column: str = "id") -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    limit + 1개 조회 결과를 (페이지, 다음 커서)로 분리
+
+    limit보다 많이 조회되었으면 다음 페이지가 존재하므로
+    페이지 마지막 행의 키로 커서를 만든다.
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last[time_column], last[id_column])
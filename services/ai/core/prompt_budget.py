@@ -0,0 +1,277 @@
+"""
+프롬프트 토큰 예산 (섹션별 토큰 계산 + 우선순위 압축)
+
+프롬프트 크기는 첫 토큰 지연과 비용을 같이 결정하므로, 모델별 최대 입력 토큰
+(settings.llm_max_input_tokens)을 넘지 않게 섹션 단위로 조립합니다.
+
+줄이는 순서 (예산 안에 들어오면 즉시 중단):
+    1) 압축: 우선순위가 낮은 섹션부터 compress (예: 거래 목록 → 건수/중앙값/범위 통계)
+    2) 제외: 우선순위가 낮은 섹션부터 통째로 제외 (REQUIRED 제외)
+    3) 자르기: 그래도 넘치면 가장 큰 섹션의 앞부분만 남김
+
+토큰 수는 tiktoken으로 계산하고, tiktoken이 없거나 인코딩 파일을 받을 수 없으면
+(오프라인) LLM 거버너와 같은 글자 수 기반 추정치를 사용합니다.
+
+사용 예:
+    sections = [
+        PromptSection("header", header, priority=REQUIRED),
+        PromptSection("transactions", rows, priority=LOW, compress=lambda: stats),
+    ]
+    budget = assemble_prompt(sections, model="gpt-4o-mini")
+    budget.text, budget.to_dict()  # 섹션별 토큰/조치는 로그 + 리포트 metadata로 기록
+"""
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 섹션 우선순위 (낮을수록 먼저 압축/제외)
+LOW = 10
+NORMAL = 50
+HIGH = 80
+REQUIRED = 100  # 제외하지 않음 (예산이 부족하면 자르기만)
+
+SECTION_SEPARATOR = "\n"
+TRUNCATION_MARKER = "\n...(중략)...\n"
+FALLBACK_ENCODING = "o200k_base"  # tiktoken이 모르는 모델 (Claude 등)
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    """모델 → tiktoken 인코딩 (없으면 None, 글자 수 추정 사용)"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩 로드 실패 ({model}), 글자 수 추정 사용: {e}")
+        return None
+
+    try:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩 로드 실패 ({FALLBACK_ENCODING}), 글자 수 추정 사용: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """텍스트 토큰 수 (tiktoken, 사용 불가 시 글자 수 / CHARS_PER_TOKEN 올림)"""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    from .llm_governor import CHARS_PER_TOKEN
+
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str = "gpt-4o-mini", tail_tokens: int = 0) -> str:
+    """
+    토큰 수 상한으로 자르기
+
+    tail_tokens > 0이면 앞부분 + 중략 표시 + 뒤 tail_tokens를 남깁니다
+    (리포트 초안처럼 결론이 끝에 있는 텍스트).
+    """
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    marker_tokens = count_tokens(TRUNCATION_MARKER, model)
+    tail_tokens = min(tail_tokens, max(0, max_tokens - marker_tokens) // 2)
+    head_tokens = max_tokens - (marker_tokens + tail_tokens if tail_tokens else 0)
+    if head_tokens <= 0:
+        tail_tokens, head_tokens = 0, max_tokens
+
+    encoding = _encoding(model)
+    if encoding is not None:
+        ids = encoding.encode(text, disallowed_special=())
+        head = encoding.decode(ids[:head_tokens])
+        tail = encoding.decode(ids[-tail_tokens:]) if tail_tokens else ""
+    else:
+        from .llm_governor import CHARS_PER_TOKEN
+
+        head = text[:head_tokens * CHARS_PER_TOKEN]
+        tail = text[-tail_tokens * CHARS_PER_TOKEN:] if tail_tokens else ""
+
+    return f"{head}{TRUNCATION_MARKER}{tail}" if tail else head
+
+
+def take_recent(
+    items: Sequence[str],
+    max_tokens: int,
+    model: str = "gpt-4o-mini",
+    max_item_tokens: Optional[int] = None,
+) -> List[str]:
+    """
+    시간순 목록에서 최근 항목부터 max_tokens 안에 들어가는 만큼 (오래된 항목부터 제외)
+
+    max_item_tokens: 항목 1개 상한 (긴 답변 하나가 예산을 다 쓰지 않도록, 초과분은 자름)
+    반환 순서는 입력과 같은 시간순입니다.
+    """
+    kept: List[str] = []
+    remaining = max_tokens
+    separator_tokens = count_tokens(SECTION_SEPARATOR, model)
+    for item in reversed(items):
+        if max_item_tokens is not None:
+            item = truncate_tokens(item, max_item_tokens, model)
+        tokens = count_tokens(item, model) + (separator_tokens if kept else 0)
+        if tokens > remaining:
+            if not kept and remaining > 0:
+                kept.append(truncate_tokens(item, remaining, model))
+            break
+        kept.append(item)
+        remaining -= tokens
+    kept.reverse()
+    return kept
+
+
+def max_input_tokens(model: str) -> int:
+    """모델별 최대 입력 토큰 (settings.llm_max_input_tokens: 정확한 이름 → 가장 긴 접두사 → 기본값)"""
+    from .settings import settings
+
+    limits = settings.llm_max_input_tokens
+    if model in limits:
+        return limits[model]
+    prefixes = [name for name in limits if model.startswith(name)]
+    if prefixes:
+        return limits[max(prefixes, key=len)]
+    return settings.llm_max_input_tokens_default
+
+
+@dataclass
+class PromptSection:
+    """프롬프트 섹션 1개 (compress: 압축본 생성 함수, 필요할 때만 호출)"""
+    name: str
+    text: str
+    priority: int = NORMAL
+    compress: Optional[Callable[[], str]] = None
+
+
+@dataclass
+class PromptBudget:
+    """조립 결과 + 섹션별 토큰 계산 (action: kept / compressed / dropped / truncated)"""
+    text: str
+    model: str
+    max_input_tokens: int
+    total_tokens: int
+    original_tokens: int
+    sections: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def reduced(self) -> bool:
+        return any(section["action"] != "kept" for section in self.sections)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_input_tokens": self.max_input_tokens,
+            "total_tokens": self.total_tokens,
+            "original_tokens": self.original_tokens,
+            "sections": [dict(section) for section in self.sections],
+        }
+
+
+def assemble_prompt(
+    sections: Sequence[PromptSection],
+    model: str = "gpt-4o-mini",
+    max_tokens: Optional[int] = None,
+    label: str = "prompt",
+) -> PromptBudget:
+    """
+    섹션 → 예산 안의 프롬프트
+
+    Args:
+        sections: 프롬프트 순서대로의 섹션 (빈 섹션은 무시)
+        model: 토큰 계산/예산 기준 모델
+        max_tokens: 최대 입력 토큰 (None이면 max_input_tokens(model))
+        label: 로그 표시용 이름
+
+    Returns:
+        PromptBudget (text + 섹션별 토큰 계산)
+    """
+    budget = max_tokens if max_tokens is not None else max_input_tokens(model)
+    sections = [section for section in sections if section.text]
+    texts = [section.text for section in sections]
+    tokens = [count_tokens(text, model) for text in texts]
+    original = list(tokens)
+    actions = ["kept"] * len(sections)
+    separator_tokens = count_tokens(SECTION_SEPARATOR, model) * max(0, len(sections) - 1)
+
+    def total() -> int:
+        return sum(tokens) + separator_tokens
+
+    # 낮은 우선순위부터, 같은 우선순위면 뒤쪽 섹션부터
+    order = sorted(range(len(sections)), key=lambda i: (sections[i].priority, -i))
+
+    # 1) 압축
+    for i in order:
+        if total() <= budget:
+            break
+        if sections[i].compress is None:
+            continue
+        compressed = sections[i].compress()
+        compressed_tokens = count_tokens(compressed, model)
+        if compressed_tokens < tokens[i]:
+            texts[i], tokens[i], actions[i] = compressed, compressed_tokens, "compressed"
+
+    # 2) 제외 (뒤에서 큰 섹션을 뺀 덕분에 다시 들어가는 섹션은 복원)
+    dropped = {}
+    for i in order:
+        if total() <= budget:
+            break
+        if sections[i].priority >= REQUIRED:
+            continue
+        dropped[i] = (texts[i], tokens[i], actions[i])
+        texts[i], tokens[i], actions[i] = "", 0, "dropped"
+    for i in reversed(order):
+        if i in dropped and total() + dropped[i][1] <= budget:
+            texts[i], tokens[i], actions[i] = dropped[i]
+
+    # 3) 자르기 (큰 섹션부터)
+    while total() > budget:
+        i = max(range(len(sections)), key=lambda j: tokens[j])
+        if tokens[i] == 0:
+            break
+        target = max(0, tokens[i] - (total() - budget))
+        texts[i] = truncate_tokens(texts[i], target, model)
+        tokens[i] = count_tokens(texts[i], model) if texts[i] else 0
+        actions[i] = "truncated" if texts[i] else "dropped"
+
+    text = SECTION_SEPARATOR.join(t for t in texts if t)
+    result = PromptBudget(
+        text=text,
+        model=model,
+        max_input_tokens=budget,
+        total_tokens=count_tokens(text, model),
+        original_tokens=sum(original) + separator_tokens,
+        sections=[
+            {
+                "name": section.name,
+                "priority": section.priority,
+                "tokens": tokens[i],
+                "original_tokens": original[i],
+                "action": actions[i],
+            }
+            for i, section in enumerate(sections)
+        ],
+    )
+
+    summary = ", ".join(f"{s['name']}={s['tokens']}" for s in result.sections)
+    if result.reduced:
+        changed = ", ".join(f"{s['name']}:{s['action']}" for s in result.sections if s["action"] != "kept")
+        logger.info(
+            f"프롬프트 예산 적용 ({label}, {model}): {result.original_tokens} → {result.total_tokens}/{budget} 토큰 "
+            f"[{changed}]"
+        )
+    logger.debug(f"프롬프트 섹션 토큰 ({label}, {model}): {summary}")
+    return result
@@ -210,16 +210,24 @@ def build_analysis_llm_prompt(
     )
 
 
-def build_judge_prompt(draft_content: str, max_draft_length: int = 2000) -> str:
+def build_judge_prompt(
+    draft_content: str,
+    max_draft_tokens: int = None,
+    model: str = "claude-3-5-sonnet-latest",
+) -> str:
     """
     Claude 검증용 프롬프트 생성
 
     GPT-4o-mini가 생성한 초안을 Claude Sonnet이 검증하기 위한 프롬프트입니다.
     Phase 3.2에서 stream_claude_validation()의 하드코딩된 프롬프트를 추출했습니다.
 
+    초안이 길면 토큰 기준으로 앞부분과 끝부분을 남기고 중략합니다
+    (리포트 끝의 권장 조치/종합 의견이 검증에서 빠지지 않도록).
+
     Args:
         draft_content: GPT-4o-mini가 생성한 초안 텍스트
-        max_draft_length: 초안 최대 길이 (기본값: 2000자)
+        max_draft_tokens: 초안 최대 토큰 (기본값: settings.llm_judge_draft_max_tokens)
+        model: 검증 모델 (토큰 계산 기준)
 
     Returns:
         Claude 검증용 프롬프트 (한국어)
@@ -231,8 +239,12 @@ def build_judge_prompt(draft_content: str, max_draft_length: int = 2000) -> str:
         response = llm_judge.invoke([HumanMessage(content=judge_prompt)])
         ```
     """
-    # 초안 길이 제한 (너무 길면 Claude 토큰 낭비)
-    truncated_draft = draft_content[:max_draft_length] if len(draft_content) > max_draft_length else draft_content
+    from core.prompt_budget import truncate_tokens
+    from core.settings import settings
+
+    # 초안 길이 제한 (너무 길면 Claude 토큰 낭비) - 끝부분 1/3은 유지
+    max_draft_tokens = max_draft_tokens or settings.llm_judge_draft_max_tokens
+    truncated_draft = truncate_tokens(draft_content, max_draft_tokens, model, tail_tokens=max_draft_tokens // 3)
 
     prompt = f"""너는 부동산 계약 리스크 점검 검증자이다.
 
@@ -1,11 +1,28 @@
 """Public Data API Client for Korean Real Estate Information."""
 import logging
+import time
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlencode
+from xml.etree.ElementTree import ParseError
 import httpx
 import xmltodict
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .data_go_kr_quota import acquire_data_go_kr
+from .endpoint_health import get_endpoint_registry
+from .rtms_records import (
+    APT_RENT_SCHEMA,
+    APT_TRADE_SCHEMA,
+    OFFI_RENT_SCHEMA,
+    OFFI_TRADE_SCHEMA,
+    RH_RENT_SCHEMA,
+    RH_TRADE_SCHEMA,
+    SH_RENT_SCHEMA,
+    SH_TRADE_SCHEMA,
+    RecordSchema,
+    RTMSParseResult,
+    RTMSStreamParser,
+)
 from .settings import settings
 
 logger = logging.getLogger(__name__)
@@ -16,6 +33,11 @@ class PublicDataAPIError(Exception):
     pass
 
 
+class PublicDataEndpointError(PublicDataAPIError):
+    """엔드포인트 장애 (5xx / 응답 형식 오류) - 엔드포인트 서킷 브레이커에 반영"""
+    pass
+
+
 class BasePublicDataAPI:
     """
     공공데이터포털 API 베이스 클래스.
@@ -52,6 +74,37 @@ class BasePublicDataAPI:
         if self._owns_client and self.client is not None:
             await self.client.aclose()
 
+    async def _get_rtms_records(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        schema: RecordSchema,
+        as_records: bool = False,
+    ) -> RTMSParseResult:
+        """
+        RTMS 조회 응답을 받는 대로 스트리밍 파싱 (xmltodict 트리 / 중간 dict 없음).
+
+        Args:
+            as_records: True면 슬롯 레코드, False면 정규화 dict
+
+        Raises:
+            PublicDataEndpointError: 5xx / XML 형식 오류 (엔드포인트 장애)
+            PublicDataAPIError: 그 밖의 HTTP 오류 (4xx)
+        """
+        parser = RTMSStreamParser(schema, as_records=as_records)
+        async with self.client.stream("GET", url, params=params) as response:
+            logger.info(f"{schema.name} API 응답: status={response.status_code}")
+            if response.is_server_error:
+                raise PublicDataEndpointError(f"HTTP {response.status_code}")
+            if not response.is_success:
+                raise PublicDataAPIError(f"HTTP {response.status_code}")
+            try:
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                return parser.close()
+            except ParseError as e:
+                raise PublicDataEndpointError(f"XML parse error: {e}") from e
+
 
 class JusoAPIClient:
     """도로명주소 검색 API 클라이언트 (행정안전부)."""
@@ -187,6 +240,8 @@ class LegalDongCodeAPIClient(BasePublicDataAPI):
         if self.client is None:
             raise PublicDataAPIError("HTTP client not initialized. Use async context manager or provide client.")
 
+        await acquire_data_go_kr(self.BASE_URL)
+
         try:
             response = await self.client.get(url)
 
@@ -296,7 +351,8 @@ class AptTradeAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """
         아파트 실거래가 조회.
@@ -306,6 +362,7 @@ class AptTradeAPIClient(BasePublicDataAPI):
             deal_ymd: 거래년월 6자리 (예: "202501")
             page_no: 페이지 번호 (기본값: 1)
             num_of_rows: 한 페이지 결과 수 (기본값: 100)
+            as_records: True면 items를 dict 대신 슬롯 레코드로 반환 (core/rtms_records.py)
 
         Returns:
             거래 내역 딕셔너리
@@ -326,8 +383,16 @@ class AptTradeAPIClient(BasePublicDataAPI):
         if self.client is None:
             raise PublicDataAPIError("HTTP client not initialized. Use async context manager or provide client.")
 
-        # 새 버전 API 먼저 시도, 실패하면 구 버전 시도
-        for version, base_url in self.API_URLS.items():
+        # 최근 상태 기준으로 엔드포인트 시도 (장애 중인 버전은 건너뜀, 주기적으로 회복 확인)
+        registry = get_endpoint_registry()
+        versions = registry.order("apt_trade", list(self.API_URLS))
+        if not versions:
+            raise PublicDataAPIError("All API endpoints unavailable (circuit open)")
+
+        last_error: Optional[Exception] = None
+        for version in versions:
+            base_url = self.API_URLS[version]
+            start = time.perf_counter()
             try:
                 logger.info(f"아파트 실거래가 API 시도: {version}")
 
@@ -339,28 +404,11 @@ class AptTradeAPIClient(BasePublicDataAPI):
                     "numOfRows": str(num_of_rows)
                 }
 
-                response = await self.client.get(base_url, params=params)
-
-                logger.info(f"아파트 실거래가 API 응답: status={response.status_code}")
-
-                if not response.is_success:
-                    logger.warning(f"{version} API 실패: {response.status_code}")
-                    continue
+                await acquire_data_go_kr(base_url)
 
-                # XML 파싱
-                text = response.text.replace("\ufeff", "")  # BOM 제거
-                data = xmltodict.parse(text)
-
-                # 결과 코드 확인
-                result_code = (
-                    data.get("response", {}).get("header", {}).get("resultCode") or
-                    data.get("OpenAPI_ServiceResponse", {}).get("cmmMsgHeader", {}).get("returnAuthMsg", {}).get("resultCode")
-                )
-
-                result_msg = (
-                    data.get("response", {}).get("header", {}).get("resultMsg") or
-                    data.get("OpenAPI_ServiceResponse", {}).get("cmmMsgHeader", {}).get("returnAuthMsg", {}).get("resultMessage")
-                )
+                # XML 스트리밍 파싱 + 결과 코드 (OpenAPI_ServiceResponse 오류 응답 포함)
+                parsed = await self._get_rtms_records(base_url, params, APT_TRADE_SCHEMA, as_records)
+                result_code, result_msg = parsed.result_code, parsed.result_msg
 
                 # 성공 코드 (TypeScript 코드와 동일 + "000" 추가)
                 success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
@@ -370,6 +418,8 @@ class AptTradeAPIClient(BasePublicDataAPI):
                     logger.error(f"아파트 실거래가 API 오류: {result_code} - {result_msg}")
                     raise PublicDataAPIError(f"API Error: {result_msg}")
 
+                registry.record_success("apt_trade", version, (time.perf_counter() - start) * 1000)
+
                 # NO_DATA 처리
                 if is_no_data:
                     logger.info(f"아파트 실거래가 조회: 데이터 없음 (lawd_cd={lawd_cd}, deal_ymd={deal_ymd})")
@@ -384,117 +434,35 @@ class AptTradeAPIClient(BasePublicDataAPI):
                         }
                     }
 
-                # rows 추출
-                rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-                items = rows if isinstance(rows, list) else ([rows] if rows else [])
+                items = parsed.records
 
                 logger.info(f"아파트 실거래가 조회 성공: {len(items)}개 결과")
 
-                # DEBUG: 첫 번째 아이템의 원본 필드 확인 (전용면적 디버깅)
-                if items:
-                    first_item = items[0]
-                    logger.info(f"[DEBUG] 원본 아이템 키: {list(first_item.keys())}")
-                    logger.info(f"[DEBUG] excluUseAr 값: '{first_item.get('excluUseAr')}'")
-                    logger.info(f"[DEBUG] 전용면적 값: '{first_item.get('전용면적')}'")
-                    # 모든 필드 값 로깅 (처음 3개 아이템)
-                    for i, item in enumerate(items[:3]):
-                        area_fields = {k: v for k, v in item.items() if '면적' in str(k) or 'UseAr' in str(k) or 'Area' in str(k)}
-                        logger.info(f"[DEBUG] item[{i}] 면적 관련 필드: {area_fields}")
-
                 return {
                     "header": {
                         "resultCode": result_code or "000",
                         "resultMsg": result_msg or "OK"
                     },
                     "body": {
-                        "items": self._normalize_apt_trade_items(items),
+                        "items": items,
                         "totalCount": len(items)
                     }
                 }
 
-            except Exception as e:
+            except (httpx.TransportError, PublicDataEndpointError) as e:
+                # 엔드포인트 장애 (연결/타임아웃/5xx)만 서킷에 반영하고 다음 버전 시도
                 logger.error(f"{version} API 호출 실패: {e}")
-                if version == "old":  # 마지막 시도였으면 에러 발생
-                    raise PublicDataAPIError(f"All API endpoints failed: {e}") from e
+                registry.record_failure("apt_trade", version, e)
+                last_error = e
+                continue
+            except PublicDataAPIError as e:
+                # 4xx / 결과 코드 오류 (서비스 키 미등록 등): 버전별 서비스 문제일 수 있어 다음 버전 시도,
+                # 엔드포인트 장애는 아니므로 서킷에는 반영하지 않음 (호출 한도 오류는 그대로 올림)
+                logger.error(f"{version} API 오류 (서킷 미반영): {e}")
+                last_error = e
                 continue
 
-        raise PublicDataAPIError("All API endpoints failed")
-
-    def _normalize_apt_trade_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """아파트 거래 데이터 정규화."""
-        normalized = []
-
-        for item in items:
-            # 안전한 변환 헬퍼
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            # 아파트명 추출
-            apt_name = safe_str(
-                item.get("aptNm") or
-                item.get("아파트") or
-                item.get("단지명") or
-                ""
-            )
-
-            # 법정동 추출
-            dong = safe_str(
-                item.get("dong") or
-                item.get("법정동") or
-                item.get("읍면동") or
-                ""
-            )
-
-            # PDF 스펙에 따른 전체 필드 매핑
-            normalized_item = {
-                # 기본 거래 정보
-                "sggCd": safe_str(item.get("sggCd")),  # 지역코드 (5자리)
-                "umdNm": safe_str(item.get("umdNm") or dong),  # 법정동 (60자)
-                "aptNm": safe_str(item.get("aptNm") or apt_name),  # 단지명 (100자)
-                "jibun": safe_str(item.get("지번") or item.get("jibun")),  # 지번 (20자)
-                "excluUseAr": safe_str(item.get("excluUseAr") or item.get("전용면적")),  # 전용면적 (22자)
-
-                # 계약 정보
-                "dealYear": safe_int(item.get("년") or item.get("dealYear")),  # 계약년도 (4자)
-                "dealMonth": safe_int(item.get("월") or item.get("dealMonth")),  # 계약월 (2자)
-                "dealDay": safe_int(item.get("일") or item.get("dealDay")),  # 계약일 (2자)
-                "dealAmount": safe_int(item.get("거래금액") or item.get("dealAmount")),  # 거래금액(만원) (40자)
-
-                # 건물 정보
-                "floor": safe_str(item.get("층") or item.get("floor")),  # 층 (10자)
-                "buildYear": safe_int(item.get("건축년도") or item.get("buildYear")),  # 건축년도 (4자)
-                "aptDong": safe_str(item.get("aptDong")),  # 아파트 동명 (400자)
-
-                # 거래 상세 정보
-                "cdealType": safe_str(item.get("해제여부") or item.get("cancelDealType") or item.get("cdealType")),  # 해제여부 (1자)
-                "cdealDay": safe_str(item.get("해제사유발생일") or item.get("cancelDealDate") or item.get("cdealDay")),  # 해제사유발생일 (8자)
-                "dealingGbn": safe_str(item.get("dealingGbn") or item.get("거래유형") or item.get("거래구분") or item.get("중개구분")),  # 거래유형 중개 및 직거래여부 (10자)
-                "estateAgentSggNm": safe_str(item.get("estateAgentSggNm")),  # 중개사소재지 시군구단위 (3000자)
-                "rgstDate": safe_str(item.get("rgstDate")),  # 등기일자 (8자)
-
-                # 거래 주체 정보
-                "slerGbn": safe_str(item.get("slerGbn")),  # 매도자 거래주체정보 (100자)
-                "buyerGbn": safe_str(item.get("buyerGbn")),  # 매수자 거래주체정보 (100자)
-                "landLeaseholdGbn": safe_str(item.get("landLeaseholdGbn")),  # 토지임대부 아파트 여부 (1자)
-
-                # 하위 호환성을 위한 기존 필드명 유지
-                "aptName": apt_name,
-                "dong": dong,
-                "exclusiveArea": safe_int(item.get("전용면적") or item.get("exclusiveArea") or item.get("excluUseAr")),
-                "cancelDealType": safe_str(item.get("해제여부") or item.get("cancelDealType") or item.get("cdealType")),
-                "cancelDealDate": safe_str(item.get("해제사유발생일") or item.get("cancelDealDate") or item.get("cdealDay")),
-            }
-
-            normalized.append(normalized_item)
-
-        return normalized
+        raise PublicDataAPIError(f"All API endpoints failed: {last_error}") from last_error
 
 
 class OffiTradeAPIClient(BasePublicDataAPI):
@@ -510,7 +478,8 @@ class OffiTradeAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """오피스텔 매매 실거래가 조회."""
         logger.info(f"오피스텔 매매 실거래가 조회: lawd_cd={lawd_cd}, deal_ymd={deal_ymd}")
@@ -530,16 +499,9 @@ class OffiTradeAPIClient(BasePublicDataAPI):
                 "pageNo": str(page_no),
                 "numOfRows": str(num_of_rows)
             }
-            response = await self.client.get(self.API_URL, params=params)
-
-            if not response.is_success:
-                raise PublicDataAPIError(f"HTTP {response.status_code}")
-
-            text = response.text.replace("\ufeff", "")
-            data = xmltodict.parse(text)
-
-            result_code = data.get("response", {}).get("header", {}).get("resultCode")
-            result_msg = data.get("response", {}).get("header", {}).get("resultMsg")
+            await acquire_data_go_kr(self.API_URL)
+            parsed = await self._get_rtms_records(self.API_URL, params, OFFI_TRADE_SCHEMA, as_records)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
 
             success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
             is_no_data = result_code in ["03", "INFO-003"] or "NO_DATA" in str(result_msg)
@@ -551,48 +513,16 @@ class OffiTradeAPIClient(BasePublicDataAPI):
                 return {"header": {"resultCode": result_code, "resultMsg": result_msg or "NO_DATA"},
                         "body": {"items": [], "totalCount": 0}}
 
-            rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            items = rows if isinstance(rows, list) else ([rows] if rows else [])
+            items = parsed.records
 
             logger.info(f"오피스텔 매매 실거래가 조회 성공: {len(items)}개 결과")
 
             return {"header": {"resultCode": result_code or "000", "resultMsg": result_msg or "OK"},
-                    "body": {"items": self._normalize_items(items, "trade"), "totalCount": len(items)}}
+                    "body": {"items": items, "totalCount": len(items)}}
 
         except httpx.HTTPError as e:
             raise PublicDataAPIError(f"HTTP Error: {e}") from e
 
-    def _normalize_items(self, items: List[Dict], trade_type: str) -> List[Dict[str, Any]]:
-        """오피스텔 거래 데이터 정규화."""
-        normalized = []
-        for item in items:
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            normalized_item = {
-                "sggCd": safe_str(item.get("sggCd")),
-                "umdNm": safe_str(item.get("umdNm")),
-                "offiNm": safe_str(item.get("offiNm")),  # 오피스텔명
-                "jibun": safe_str(item.get("jibun")),
-                "excluUseAr": safe_str(item.get("excluUseAr")),
-                "dealYear": safe_int(item.get("dealYear")),
-                "dealMonth": safe_int(item.get("dealMonth")),
-                "dealDay": safe_int(item.get("dealDay")),
-                "dealAmount": safe_int(item.get("dealAmount")),  # 거래금액(만원)
-                "floor": safe_str(item.get("floor")),
-                "buildYear": safe_int(item.get("buildYear")),
-                "cdealType": safe_str(item.get("cdealType")),
-                "cdealDay": safe_str(item.get("cdealDay")),
-            }
-            normalized.append(normalized_item)
-        return normalized
-
 
 class OffiRentAPIClient(BasePublicDataAPI):
     """국토교통부 오피스텔 전월세 실거래가 조회 API 클라이언트."""
@@ -607,7 +537,8 @@ class OffiRentAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """오피스텔 전월세 실거래가 조회."""
         logger.info(f"오피스텔 전월세 실거래가 조회: lawd_cd={lawd_cd}, deal_ymd={deal_ymd}")
@@ -627,16 +558,9 @@ class OffiRentAPIClient(BasePublicDataAPI):
                 "pageNo": str(page_no),
                 "numOfRows": str(num_of_rows)
             }
-            response = await self.client.get(self.API_URL, params=params)
-
-            if not response.is_success:
-                raise PublicDataAPIError(f"HTTP {response.status_code}")
-
-            text = response.text.replace("\ufeff", "")
-            data = xmltodict.parse(text)
-
-            result_code = data.get("response", {}).get("header", {}).get("resultCode")
-            result_msg = data.get("response", {}).get("header", {}).get("resultMsg")
+            await acquire_data_go_kr(self.API_URL)
+            parsed = await self._get_rtms_records(self.API_URL, params, OFFI_RENT_SCHEMA, as_records)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
 
             success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
             is_no_data = result_code in ["03", "INFO-003"] or "NO_DATA" in str(result_msg)
@@ -648,49 +572,16 @@ class OffiRentAPIClient(BasePublicDataAPI):
                 return {"header": {"resultCode": result_code, "resultMsg": result_msg or "NO_DATA"},
                         "body": {"items": [], "totalCount": 0}}
 
-            rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            items = rows if isinstance(rows, list) else ([rows] if rows else [])
+            items = parsed.records
 
             logger.info(f"오피스텔 전월세 실거래가 조회 성공: {len(items)}개 결과")
 
             return {"header": {"resultCode": result_code or "000", "resultMsg": result_msg or "OK"},
-                    "body": {"items": self._normalize_items(items), "totalCount": len(items)}}
+                    "body": {"items": items, "totalCount": len(items)}}
 
         except httpx.HTTPError as e:
             raise PublicDataAPIError(f"HTTP Error: {e}") from e
 
-    def _normalize_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """오피스텔 전월세 거래 데이터 정규화."""
-        normalized = []
-        for item in items:
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            normalized_item = {
-                "sggCd": safe_str(item.get("sggCd")),
-                "umdNm": safe_str(item.get("umdNm")),
-                "offiNm": safe_str(item.get("offiNm")),
-                "jibun": safe_str(item.get("jibun")),
-                "excluUseAr": safe_str(item.get("excluUseAr")),
-                "dealYear": safe_int(item.get("dealYear")),
-                "dealMonth": safe_int(item.get("dealMonth")),
-                "dealDay": safe_int(item.get("dealDay")),
-                "deposit": safe_int(item.get("deposit")),
-                "monthlyRent": safe_int(item.get("monthlyRent")),
-                "floor": safe_str(item.get("floor")),
-                "buildYear": safe_int(item.get("buildYear")),
-                "contractTerm": safe_str(item.get("contractTerm")),
-                "contractType": safe_str(item.get("contractType")),
-            }
-            normalized.append(normalized_item)
-        return normalized
-
 
 class RHTradeAPIClient(BasePublicDataAPI):
     """국토교통부 연립다세대 매매 실거래가 조회 API 클라이언트."""
@@ -705,7 +596,8 @@ class RHTradeAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """연립다세대 매매 실거래가 조회."""
         logger.info(f"연립다세대 매매 실거래가 조회: lawd_cd={lawd_cd}, deal_ymd={deal_ymd}")
@@ -725,16 +617,9 @@ class RHTradeAPIClient(BasePublicDataAPI):
                 "pageNo": str(page_no),
                 "numOfRows": str(num_of_rows)
             }
-            response = await self.client.get(self.API_URL, params=params)
-
-            if not response.is_success:
-                raise PublicDataAPIError(f"HTTP {response.status_code}")
-
-            text = response.text.replace("\ufeff", "")
-            data = xmltodict.parse(text)
-
-            result_code = data.get("response", {}).get("header", {}).get("resultCode")
-            result_msg = data.get("response", {}).get("header", {}).get("resultMsg")
+            await acquire_data_go_kr(self.API_URL)
+            parsed = await self._get_rtms_records(self.API_URL, params, RH_TRADE_SCHEMA, as_records)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
 
             success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
             is_no_data = result_code in ["03", "INFO-003"] or "NO_DATA" in str(result_msg)
@@ -746,48 +631,16 @@ class RHTradeAPIClient(BasePublicDataAPI):
                 return {"header": {"resultCode": result_code, "resultMsg": result_msg or "NO_DATA"},
                         "body": {"items": [], "totalCount": 0}}
 
-            rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            items = rows if isinstance(rows, list) else ([rows] if rows else [])
+            items = parsed.records
 
             logger.info(f"연립다세대 매매 실거래가 조회 성공: {len(items)}개 결과")
 
             return {"header": {"resultCode": result_code or "000", "resultMsg": result_msg or "OK"},
-                    "body": {"items": self._normalize_items(items), "totalCount": len(items)}}
+                    "body": {"items": items, "totalCount": len(items)}}
 
         except httpx.HTTPError as e:
             raise PublicDataAPIError(f"HTTP Error: {e}") from e
 
-    def _normalize_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """연립다세대 매매 거래 데이터 정규화."""
-        normalized = []
-        for item in items:
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            normalized_item = {
-                "sggCd": safe_str(item.get("sggCd")),
-                "umdNm": safe_str(item.get("umdNm")),
-                "mhouseNm": safe_str(item.get("mhouseNm")),  # 연립다세대명
-                "jibun": safe_str(item.get("jibun")),
-                "excluUseAr": safe_str(item.get("excluUseAr")),
-                "dealYear": safe_int(item.get("dealYear")),
-                "dealMonth": safe_int(item.get("dealMonth")),
-                "dealDay": safe_int(item.get("dealDay")),
-                "dealAmount": safe_int(item.get("dealAmount")),
-                "floor": safe_str(item.get("floor")),
-                "buildYear": safe_int(item.get("buildYear")),
-                "cdealType": safe_str(item.get("cdealType")),
-                "cdealDay": safe_str(item.get("cdealDay")),
-            }
-            normalized.append(normalized_item)
-        return normalized
-
 
 class RHRentAPIClient(BasePublicDataAPI):
     """국토교통부 연립다세대 전월세 실거래가 조회 API 클라이언트."""
@@ -802,7 +655,8 @@ class RHRentAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """연립다세대 전월세 실거래가 조회."""
         logger.info(f"연립다세대 전월세 실거래가 조회: lawd_cd={lawd_cd}, deal_ymd={deal_ymd}")
@@ -822,16 +676,9 @@ class RHRentAPIClient(BasePublicDataAPI):
                 "pageNo": str(page_no),
                 "numOfRows": str(num_of_rows)
             }
-            response = await self.client.get(self.API_URL, params=params)
-
-            if not response.is_success:
-                raise PublicDataAPIError(f"HTTP {response.status_code}")
-
-            text = response.text.replace("\ufeff", "")
-            data = xmltodict.parse(text)
-
-            result_code = data.get("response", {}).get("header", {}).get("resultCode")
-            result_msg = data.get("response", {}).get("header", {}).get("resultMsg")
+            await acquire_data_go_kr(self.API_URL)
+            parsed = await self._get_rtms_records(self.API_URL, params, RH_RENT_SCHEMA, as_records)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
 
             success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
             is_no_data = result_code in ["03", "INFO-003"] or "NO_DATA" in str(result_msg)
@@ -843,49 +690,16 @@ class RHRentAPIClient(BasePublicDataAPI):
                 return {"header": {"resultCode": result_code, "resultMsg": result_msg or "NO_DATA"},
                         "body": {"items": [], "totalCount": 0}}
 
-            rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            items = rows if isinstance(rows, list) else ([rows] if rows else [])
+            items = parsed.records
 
             logger.info(f"연립다세대 전월세 실거래가 조회 성공: {len(items)}개 결과")
 
             return {"header": {"resultCode": result_code or "000", "resultMsg": result_msg or "OK"},
-                    "body": {"items": self._normalize_items(items), "totalCount": len(items)}}
+                    "body": {"items": items, "totalCount": len(items)}}
 
         except httpx.HTTPError as e:
             raise PublicDataAPIError(f"HTTP Error: {e}") from e
 
-    def _normalize_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """연립다세대 전월세 거래 데이터 정규화."""
-        normalized = []
-        for item in items:
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            normalized_item = {
-                "sggCd": safe_str(item.get("sggCd")),
-                "umdNm": safe_str(item.get("umdNm")),
-                "mhouseNm": safe_str(item.get("mhouseNm")),
-                "jibun": safe_str(item.get("jibun")),
-                "excluUseAr": safe_str(item.get("excluUseAr")),
-                "dealYear": safe_int(item.get("dealYear")),
-                "dealMonth": safe_int(item.get("dealMonth")),
-                "dealDay": safe_int(item.get("dealDay")),
-                "deposit": safe_int(item.get("deposit")),
-                "monthlyRent": safe_int(item.get("monthlyRent")),
-                "floor": safe_str(item.get("floor")),
-                "buildYear": safe_int(item.get("buildYear")),
-                "contractTerm": safe_str(item.get("contractTerm")),
-                "contractType": safe_str(item.get("contractType")),
-            }
-            normalized.append(normalized_item)
-        return normalized
-
 
 class SHTradeAPIClient(BasePublicDataAPI):
     """국토교통부 단독/다가구 매매 실거래가 조회 API 클라이언트."""
@@ -900,7 +714,8 @@ class SHTradeAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """단독/다가구 매매 실거래가 조회."""
         logger.info(f"단독/다가구 매매 실거래가 조회: lawd_cd={lawd_cd}, deal_ymd={deal_ymd}")
@@ -920,16 +735,9 @@ class SHTradeAPIClient(BasePublicDataAPI):
                 "pageNo": str(page_no),
                 "numOfRows": str(num_of_rows)
             }
-            response = await self.client.get(self.API_URL, params=params)
-
-            if not response.is_success:
-                raise PublicDataAPIError(f"HTTP {response.status_code}")
-
-            text = response.text.replace("\ufeff", "")
-            data = xmltodict.parse(text)
-
-            result_code = data.get("response", {}).get("header", {}).get("resultCode")
-            result_msg = data.get("response", {}).get("header", {}).get("resultMsg")
+            await acquire_data_go_kr(self.API_URL)
+            parsed = await self._get_rtms_records(self.API_URL, params, SH_TRADE_SCHEMA, as_records)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
 
             success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
             is_no_data = result_code in ["03", "INFO-003"] or "NO_DATA" in str(result_msg)
@@ -941,48 +749,16 @@ class SHTradeAPIClient(BasePublicDataAPI):
                 return {"header": {"resultCode": result_code, "resultMsg": result_msg or "NO_DATA"},
                         "body": {"items": [], "totalCount": 0}}
 
-            rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            items = rows if isinstance(rows, list) else ([rows] if rows else [])
+            items = parsed.records
 
             logger.info(f"단독/다가구 매매 실거래가 조회 성공: {len(items)}개 결과")
 
             return {"header": {"resultCode": result_code or "000", "resultMsg": result_msg or "OK"},
-                    "body": {"items": self._normalize_items(items), "totalCount": len(items)}}
+                    "body": {"items": items, "totalCount": len(items)}}
 
         except httpx.HTTPError as e:
             raise PublicDataAPIError(f"HTTP Error: {e}") from e
 
-    def _normalize_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """단독/다가구 매매 거래 데이터 정규화."""
-        normalized = []
-        for item in items:
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            normalized_item = {
-                "sggCd": safe_str(item.get("sggCd")),
-                "umdNm": safe_str(item.get("umdNm")),
-                "houseType": safe_str(item.get("houseType")),  # 주택유형
-                "jibun": safe_str(item.get("jibun")),
-                "totalFloorAr": safe_str(item.get("totalFloorAr")),  # 연면적
-                "plottageAr": safe_str(item.get("plottageAr")),  # 대지면적
-                "dealYear": safe_int(item.get("dealYear")),
-                "dealMonth": safe_int(item.get("dealMonth")),
-                "dealDay": safe_int(item.get("dealDay")),
-                "dealAmount": safe_int(item.get("dealAmount")),
-                "buildYear": safe_int(item.get("buildYear")),
-                "cdealType": safe_str(item.get("cdealType")),
-                "cdealDay": safe_str(item.get("cdealDay")),
-            }
-            normalized.append(normalized_item)
-        return normalized
-
 
 class SHRentAPIClient(BasePublicDataAPI):
     """국토교통부 단독/다가구 전월세 실거래가 조회 API 클라이언트."""
@@ -997,7 +773,8 @@ class SHRentAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """단독/다가구 전월세 실거래가 조회."""
         logger.info(f"단독/다가구 전월세 실거래가 조회: lawd_cd={lawd_cd}, deal_ymd={deal_ymd}")
@@ -1017,16 +794,9 @@ class SHRentAPIClient(BasePublicDataAPI):
                 "pageNo": str(page_no),
                 "numOfRows": str(num_of_rows)
             }
-            response = await self.client.get(self.API_URL, params=params)
-
-            if not response.is_success:
-                raise PublicDataAPIError(f"HTTP {response.status_code}")
-
-            text = response.text.replace("\ufeff", "")
-            data = xmltodict.parse(text)
-
-            result_code = data.get("response", {}).get("header", {}).get("resultCode")
-            result_msg = data.get("response", {}).get("header", {}).get("resultMsg")
+            await acquire_data_go_kr(self.API_URL)
+            parsed = await self._get_rtms_records(self.API_URL, params, SH_RENT_SCHEMA, as_records)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
 
             success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
             is_no_data = result_code in ["03", "INFO-003"] or "NO_DATA" in str(result_msg)
@@ -1038,47 +808,16 @@ class SHRentAPIClient(BasePublicDataAPI):
                 return {"header": {"resultCode": result_code, "resultMsg": result_msg or "NO_DATA"},
                         "body": {"items": [], "totalCount": 0}}
 
-            rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            items = rows if isinstance(rows, list) else ([rows] if rows else [])
+            items = parsed.records
 
             logger.info(f"단독/다가구 전월세 실거래가 조회 성공: {len(items)}개 결과")
 
             return {"header": {"resultCode": result_code or "000", "resultMsg": result_msg or "OK"},
-                    "body": {"items": self._normalize_items(items), "totalCount": len(items)}}
+                    "body": {"items": items, "totalCount": len(items)}}
 
         except httpx.HTTPError as e:
             raise PublicDataAPIError(f"HTTP Error: {e}") from e
 
-    def _normalize_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """단독/다가구 전월세 거래 데이터 정규화."""
-        normalized = []
-        for item in items:
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            normalized_item = {
-                "sggCd": safe_str(item.get("sggCd")),
-                "umdNm": safe_str(item.get("umdNm")),
-                "jibun": safe_str(item.get("jibun")),
-                "contractArea": safe_str(item.get("contractArea")),  # 계약면적
-                "dealYear": safe_int(item.get("dealYear")),
-                "dealMonth": safe_int(item.get("dealMonth")),
-                "dealDay": safe_int(item.get("dealDay")),
-                "deposit": safe_int(item.get("deposit")),
-                "monthlyRent": safe_int(item.get("monthlyRent")),
-                "buildYear": safe_int(item.get("buildYear")),
-                "contractTerm": safe_str(item.get("contractTerm")),
-                "contractType": safe_str(item.get("contractType")),
-            }
-            normalized.append(normalized_item)
-        return normalized
-
 
 class AptRentAPIClient(BasePublicDataAPI):
     """국토교통부 아파트 전월세 실거래가 조회 API 클라이언트."""
@@ -1093,7 +832,8 @@ class AptRentAPIClient(BasePublicDataAPI):
         lawd_cd: str,
         deal_ymd: str,
         page_no: int = 1,
-        num_of_rows: int = 100
+        num_of_rows: int = 100,
+        as_records: bool = False,
     ) -> Dict[str, Any]:
         """
         아파트 전월세 실거래가 조회.
@@ -1103,6 +843,7 @@ class AptRentAPIClient(BasePublicDataAPI):
             deal_ymd: 계약년월 6자리 (예: "202407")
             page_no: 페이지 번호 (기본값: 1)
             num_of_rows: 한 페이지 결과 수 (기본값: 100)
+            as_records: True면 items를 dict 대신 슬롯 레코드로 반환 (core/rtms_records.py)
 
         Returns:
             전월세 거래 내역 딕셔너리
@@ -1132,28 +873,11 @@ class AptRentAPIClient(BasePublicDataAPI):
                 "numOfRows": str(num_of_rows)
             }
 
-            response = await self.client.get(self.API_URL, params=params)
-
-            logger.info(f"아파트 전월세 실거래가 API 응답: status={response.status_code}")
+            await acquire_data_go_kr(self.API_URL)
 
-            if not response.is_success:
-                logger.error(f"아파트 전월세 실거래가 API HTTP 오류: {response.status_code}")
-                raise PublicDataAPIError(f"HTTP {response.status_code}")
-
-            # XML 파싱
-            text = response.text.replace("\ufeff", "")  # BOM 제거
-            data = xmltodict.parse(text)
-
-            # 결과 코드 확인
-            result_code = (
-                data.get("response", {}).get("header", {}).get("resultCode") or
-                data.get("OpenAPI_ServiceResponse", {}).get("cmmMsgHeader", {}).get("returnAuthMsg", {}).get("resultCode")
-            )
-
-            result_msg = (
-                data.get("response", {}).get("header", {}).get("resultMsg") or
-                data.get("OpenAPI_ServiceResponse", {}).get("cmmMsgHeader", {}).get("returnAuthMsg", {}).get("resultMessage")
-            )
+            # XML 스트리밍 파싱 + 결과 코드 (OpenAPI_ServiceResponse 오류 응답 포함)
+            parsed = await self._get_rtms_records(self.API_URL, params, APT_RENT_SCHEMA, as_records)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
 
             # 성공 코드
             success_codes = ["00", "000", "0000", "INFO-000", "03", "INFO-003"]
@@ -1177,9 +901,7 @@ class AptRentAPIClient(BasePublicDataAPI):
                     }
                 }
 
-            # rows 추출
-            rows = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            items = rows if isinstance(rows, list) else ([rows] if rows else [])
+            items = parsed.records
 
             logger.info(f"아파트 전월세 실거래가 조회 성공: {len(items)}개 결과")
 
@@ -1189,7 +911,7 @@ class AptRentAPIClient(BasePublicDataAPI):
                     "resultMsg": result_msg or "OK"
                 },
                 "body": {
-                    "items": self._normalize_apt_rent_items(items),
+                    "items": items,
                     "totalCount": len(items)
                 }
             }
@@ -1200,44 +922,3 @@ class AptRentAPIClient(BasePublicDataAPI):
         except Exception as e:
             logger.error(f"아파트 전월세 실거래가 API 호출 실패: {e}")
             raise PublicDataAPIError(f"API call failed: {e}") from e
-
-    def _normalize_apt_rent_items(self, items: List[Dict]) -> List[Dict[str, Any]]:
-        """아파트 전월세 거래 데이터 정규화."""
-        normalized = []
-
-        for item in items:
-            # 안전한 변환 헬퍼
-            def safe_str(v) -> str:
-                return str(v).strip() if v is not None else ""
-
-            def safe_int(v) -> Optional[int]:
-                s = safe_str(v).replace(" ", "").replace(",", "")
-                try:
-                    return int(s) if s else None
-                except ValueError:
-                    return None
-
-            # PDF 스펙에 따른 필드 매핑
-            normalized_item = {
-                "sggCd": safe_str(item.get("sggCd")),  # 지역코드 (5자리)
-                "umdNm": safe_str(item.get("umdNm")),  # 법정동 (30자)
-                "aptNm": safe_str(item.get("aptNm")),  # 아파트명 (100자)
-                "jibun": safe_str(item.get("jibun")),  # 지번 (20자)
-                "excluUseAr": safe_str(item.get("excluUseAr")),  # 전용면적 (22자)
-                "dealYear": safe_int(item.get("dealYear")),  # 계약년도 (4자)
-                "dealMonth": safe_int(item.get("dealMonth")),  # 계약월 (2자)
-                "dealDay": safe_int(item.get("dealDay")),  # 계약일 (2자)
-                "deposit": safe_int(item.get("deposit")),  # 보증금액(만원) (40자)
-                "monthlyRent": safe_int(item.get("monthlyRent")),  # 월세금액(만원) (40자)
-                "floor": safe_str(item.get("floor")),  # 층 (10자)
-                "buildYear": safe_int(item.get("buildYear")),  # 건축년도 (4자)
-                "contractTerm": safe_str(item.get("contractTerm")),  # 계약기간 (12자)
-                "contractType": safe_str(item.get("contractType")),  # 계약구분 (4자)
-                "useRRRight": safe_str(item.get("useRRRight")),  # 갱신요구권사용 (4자)
-                "preDeposit": safe_int(item.get("preDeposit")),  # 종전계약보증금 (40자)
-                "preMonthlyRent": safe_int(item.get("preMonthlyRent")),  # 종전계약월세 (40자)
-            }
-
-            normalized.append(normalized_item)
-
-        return normalized
@@ -4,7 +4,8 @@
 건축물대장, 실거래가 등 여러 API를 통합 호출
 """
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -32,6 +33,8 @@ class PublicDataResult(BaseModel):
     fetched_at: str = datetime.utcnow().isoformat()
     success_count: int = 0
     total_count: int = 3
+    total_execution_time_ms: float = 0.0
+    latencies: List[Dict[str, Any]] = []  # 호출별 상태/소요 시간
 
 
 # ===========================
@@ -51,70 +54,88 @@ async def fetch_all_public_data(
     - 실거래가: routes/apt_trade.py::get_apt_trade_transactions() 사용
     - 공시지가: routes/land_price.py::get_individual_land_price() 사용
 
-    에러가 발생해도 다른 API는 계속 호출 (부분 성공 허용)
+    세 API는 서로 독립적이므로 동시에 호출합니다 (호출별 타임아웃).
+    에러가 발생해도 다른 API 결과는 그대로 사용 (부분 성공 허용)
     """
-    result = PublicDataResult()
+    from core.fanout import fan_out, latency_table
+    from core.settings import settings
 
-    # 1️⃣ 건축물대장 조회
-    try:
+    # 기본값: 이번 달
+    if not deal_year or not deal_month:
+        now = datetime.now()
+        deal_year = now.year
+        deal_month = now.month
+
+    async def fetch_building():
         from routes.building import fetch_building_ledger_data
 
-        building_data = await fetch_building_ledger_data(
+        return await fetch_building_ledger_data(
             sigungu_code=sigungu_code or "11680",  # 기본값: 강남구
             bjdong_code=bjdong_code or "10300",
             bun="0012",  # TODO: 주소에서 번지 파싱 필요
             ji="0004"
         )
 
-        result.building_ledger = building_data
-        result.success_count += 1
-        logger.info("건축물대장 조회 성공")
-
-    except Exception as e:
-        result.building_error = str(e)
-        logger.warning(f"건축물대장 조회 실패: {e}")
-
-    # 2️⃣ 실거래가 조회 (아파트)
-    try:
+    async def fetch_trades():
         from routes.apt_trade import fetch_apt_trade_data
 
-        # 기본값: 최근 3개월
-        if not deal_year or not deal_month:
-            now = datetime.now()
-            deal_year = now.year
-            deal_month = now.month
-
-        trade_data = await fetch_apt_trade_data(
+        return await fetch_apt_trade_data(
             lawd_cd=sigungu_code or "11680",
             deal_ymd=f"{deal_year}{deal_month:02d}"
         )
 
-        result.apt_trades = trade_data.get("items", [])
-        result.success_count += 1
-        logger.info(f"실거래가 조회 성공: {len(result.apt_trades)}건")
-
-    except Exception as e:
-        result.apt_trades_error = str(e)
-        logger.warning(f"실거래가 조회 실패: {e}")
-
-    # 3️⃣ 공시지가 조회
-    try:
+    async def fetch_land_price():
         from routes.land_price import fetch_land_price_data
 
-        land_data = await fetch_land_price_data(
+        return await fetch_land_price_data(
             pnu=f"{sigungu_code}{bjdong_code}",  # PNU 코드 조합
             stdr_year=str(datetime.now().year)
         )
 
-        result.land_price = land_data
+    start = time.perf_counter()
+    building, trades, land = await fan_out(
+        [
+            ("building_ledger", fetch_building),
+            ("apt_trades", fetch_trades),
+            ("land_price", fetch_land_price),
+        ],
+        timeout_sec=settings.public_data_call_timeout_sec,
+    )
+
+    result = PublicDataResult(latencies=latency_table([building, trades, land]))
+
+    # 1️⃣ 건축물대장
+    if building.ok:
+        result.building_ledger = building.value
         result.success_count += 1
-        logger.info("공시지가 조회 성공")
+        logger.info("건축물대장 조회 성공")
+    else:
+        result.building_error = building.error
+        logger.warning(f"건축물대장 조회 실패: {building.error}")
 
-    except Exception as e:
-        result.land_price_error = str(e)
-        logger.warning(f"공시지가 조회 실패: {e}")
+    # 2️⃣ 실거래가 (아파트)
+    if trades.ok:
+        result.apt_trades = trades.value.get("items", [])
+        result.success_count += 1
+        logger.info(f"실거래가 조회 성공: {len(result.apt_trades)}건")
+    else:
+        result.apt_trades_error = trades.error
+        logger.warning(f"실거래가 조회 실패: {trades.error}")
 
-    logger.info(f"공공 데이터 통합 완료: {result.success_count}/{result.total_count} 성공")
+    # 3️⃣ 공시지가
+    if land.ok:
+        result.land_price = land.value
+        result.success_count += 1
+        logger.info("공시지가 조회 성공")
+    else:
+        result.land_price_error = land.error
+        logger.warning(f"공시지가 조회 실패: {land.error}")
+
+    result.total_execution_time_ms = round((time.perf_counter() - start) * 1000, 2)
+    logger.info(
+        f"공공 데이터 통합 완료: {result.success_count}/{result.total_count} 성공 "
+        f"({result.total_execution_time_ms:.0f}ms)"
+    )
     return result
 
 
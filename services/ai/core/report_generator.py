@@ -5,17 +5,19 @@
 
 새로운 아키텍처:
 1. build_risk_features_from_registry() - 등기부 → 리스크 특징 (100% 코드, LLM 없음)
-2. build_llm_prompt() - 리스크 특징 → LLM용 프롬프트
+2. build_llm_prompt() - 리스크 특징 → LLM용 프롬프트 (섹션별 토큰 예산, core/prompt_budget.py)
 3. generate_markdown_report() - 최종 마크다운 리포트 생성
 """
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from statistics import median
 from ingest.registry_parser import RegistryDocument
 from core.risk_engine import (
     RegistryRiskFeatures,
     calculate_jeonse_ratio,
     calculate_mortgage_ratio,
 )
+from core.prompt_budget import HIGH, LOW, NORMAL, REQUIRED, PromptBudget, PromptSection, assemble_prompt
 
 
 # ===========================
@@ -158,7 +160,56 @@ def build_risk_features_from_registry(
     return features
 
 
-def build_llm_prompt(
+RECENT_TRANSACTION_ROWS = 20  # 프롬프트에 그대로 싣는 최근 거래 건수 (나머지는 건수만)
+
+
+def _transaction_fields(record: Dict) -> tuple:
+    """실거래 레코드 → (계약일, 이름, 면적, 층, 금액) - 상품별 원본 필드명 / MarketRecord(name, area) 모두 지원"""
+    year, month, day = record.get("dealYear"), record.get("dealMonth"), record.get("dealDay")
+    date = f"{year}.{int(month):02d}.{int(day or 1):02d}" if year and month else "-"
+    name = next((record.get(k) for k in ("name", "aptNm", "offiNm", "mhouseNm", "houseType") if record.get(k)), None)
+    area = next((record.get(k) for k in ("area", "excluUseAr", "totalFloorAr", "contractArea") if record.get(k)), None)
+    try:
+        area = float(area) if area is not None else None
+    except (TypeError, ValueError):
+        area = None
+    amount = record.get("dealAmount") or record.get("deposit")
+    return date, name, area, record.get("floor"), amount
+
+
+def _format_transactions(recent_transactions: List[Dict]) -> str:
+    """최근 거래 목록 섹션 (계약일 내림차순 상위 RECENT_TRANSACTION_ROWS건)"""
+    rows = sorted((_transaction_fields(r) for r in recent_transactions), key=lambda row: row[0], reverse=True)
+    lines = ["## 🧾 최근 거래 내역 (비교사례)\n"]
+    for date, name, area, floor, amount in rows[:RECENT_TRANSACTION_ROWS]:
+        parts = [date, name or "-", f"{area:g}㎡" if area else "-", f"{floor}층" if floor else "-",
+                 f"{amount:,}만원" if amount else "-"]
+        lines.append(f"- {' | '.join(parts)}")
+    if len(rows) > RECENT_TRANSACTION_ROWS:
+        lines.append(f"- 외 {len(rows) - RECENT_TRANSACTION_ROWS}건")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _summarize_transactions(recent_transactions: List[Dict]) -> str:
+    """최근 거래 목록 → 통계 요약 (프롬프트 예산 초과 시 목록 대신 사용)"""
+    rows = [_transaction_fields(r) for r in recent_transactions]
+    dates = sorted(row[0] for row in rows if row[0] != "-")
+    amounts = sorted(row[4] for row in rows if row[4])
+    areas = sorted(row[2] for row in rows if row[2])
+
+    lines = ["## 🧾 최근 거래 내역 (요약)\n", f"- **거래 건수**: {len(rows)}건"]
+    if dates:
+        lines.append(f"- **계약 기간**: {dates[0]} ~ {dates[-1]}")
+    if amounts:
+        lines.append(f"- **거래금액**: 중앙값 {int(median(amounts)):,}만원 (최저 {amounts[0]:,} ~ 최고 {amounts[-1]:,}만원)")
+    if areas:
+        lines.append(f"- **전용면적**: {areas[0]:g} ~ {areas[-1]:g}㎡")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def build_llm_prompt_budget(
     risk_features: RegistryRiskFeatures,
     contract_type: str,
     contract_deposit: Optional[int] = None,
@@ -167,34 +218,38 @@ def build_llm_prompt(
     property_value_estimate: Optional[int] = None,
     jeonse_market_average: Optional[int] = None,
     recent_transactions: Optional[List[Dict]] = None,
-) -> str:
+    market_stats: Optional[Any] = None,
+    jeonse_stats: Optional[Any] = None,
+    model: str = "gpt-4o-mini",
+    max_tokens: Optional[int] = None,
+) -> PromptBudget:
     """
-    RegistryRiskFeatures → LLM용 마크다운 프롬프트
+    RegistryRiskFeatures → 섹션별 프롬프트 조립 (모델별 최대 입력 토큰 보장)
 
-    LLM은 이 프롬프트를 읽고 '해석/설명/추천'만 함.
-
-    Args:
-        risk_features: 코드로 계산된 리스크 특징
-        contract_type: 계약 유형
-        contract_deposit: 계약 보증금 (만원)
-        contract_price: 계약 금액 (만원, 매매용)
-        monthly_rent: 월세 (만원)
-        property_value_estimate: 매매 실거래가 평균 (만원)
-        jeonse_market_average: 전세 실거래가 평균 (만원)
-        recent_transactions: 최근 거래 내역 (선택)
+    인자는 build_llm_prompt()와 같고, model/max_tokens 기준으로 core/prompt_budget.py가
+    낮은 우선순위 섹션(거래 목록 → 통계 요약, 소유자/채권자 목록 → 건수만)부터 줄입니다.
 
     Returns:
-        LLM용 마크다운 프롬프트
+        PromptBudget (text: 프롬프트, to_dict(): 섹션별 토큰 계산)
     """
-    lines = []
+    sections: List[PromptSection] = []
+
+    def section(name: str, lines: List[str], priority: int, compress: Optional[List[str]] = None) -> None:
+        compressed = "\n".join(compress) if compress is not None else None
+        sections.append(PromptSection(
+            name, "\n".join(lines), priority,
+            compress=(lambda: compressed) if compressed is not None else None,
+        ))
 
     # 헤더
-    lines.append("# 부동산 계약 리스크 분석 데이터\n")
-    lines.append("당신은 부동산 계약 리스크 분석 전문가입니다.")
-    lines.append("아래 데이터를 바탕으로 사용자에게 친절하고 전문적인 분석 리포트를 작성하세요.\n")
+    section("header", [
+        "# 부동산 계약 리스크 분석 데이터\n",
+        "당신은 부동산 계약 리스크 분석 전문가입니다.",
+        "아래 데이터를 바탕으로 사용자에게 친절하고 전문적인 분석 리포트를 작성하세요.\n",
+    ], REQUIRED)
 
     # 기본 정보
-    lines.append("## 📊 계약 정보\n")
+    lines = ["## 📊 계약 정보\n"]
     lines.append(f"- **계약 유형**: {contract_type}")
     lines.append(f"- **주소**: {risk_features.property_address or '정보 없음'}")
     lines.append(f"- **건물 종류**: {risk_features.building_type or '정보 없음'}")
@@ -208,35 +263,53 @@ def build_llm_prompt(
             lines.append(f"- **월세**: {monthly_rent:,}만원")
 
     lines.append("")
+    section("contract", lines, REQUIRED)
 
-    # 시장 실거래가 정보 (새로 추가)
+    # 시장 실거래가 정보
     if contract_type == "매매" and property_value_estimate:
-        lines.append("## 💰 시장 실거래가 정보\n")
-        lines.append(f"- **평균 매매가**: {property_value_estimate:,}만원 (최근 3개월 기준, 최대/최소 제외)")
+        lines = ["## 💰 시장 실거래가 정보\n"]
+        basis = market_stats.describe() if market_stats else "최근 거래 기준"
+        lines.append(f"- **시세 추정 매매가**: {property_value_estimate:,}만원 ({basis})")
+        if market_stats and market_stats.median:
+            lines.append(f"- **비교사례 중앙값**: {market_stats.median:,}만원")
+        if market_stats and market_stats.price_per_m2:
+            lines.append(f"- **㎡당 가격**: {market_stats.price_per_m2:,.0f}만원")
         if recent_transactions:
-            lines.append(f"- **분석 건수**: {len(recent_transactions)}건")
+            lines.append(f"- **조회 건수**: {len(recent_transactions)}건")
         lines.append("")
+        section("market", lines, HIGH)
 
     if contract_type in ["전세", "월세"]:
-        lines.append("## 💰 시장 실거래가 정보\n")
+        lines = ["## 💰 시장 실거래가 정보\n"]
         if jeonse_market_average:
-            lines.append(f"- **전세 시장 평균**: {jeonse_market_average:,}만원 (최근 6개월 기준, 100% 시장가)")
+            basis = jeonse_stats.describe() if jeonse_stats else "최근 6개월 기준"
+            lines.append(f"- **전세 시세**: {jeonse_market_average:,}만원 ({basis}, 100% 시장가)")
         if property_value_estimate:
-            lines.append(f"- **매매 평균**: {property_value_estimate:,}만원 (최근 3개월 기준)")
+            basis = market_stats.describe() if market_stats else "최근 3개월 기준"
+            lines.append(f"- **매매 시세**: {property_value_estimate:,}만원 ({basis})")
             if jeonse_market_average and property_value_estimate:
                 market_jeonse_ratio = (jeonse_market_average / property_value_estimate) * 100
-                lines.append(f"- **시장 전세가율**: {market_jeonse_ratio:.1f}% (시장 전체 평균)")
+                lines.append(f"- **시장 전세가율**: {market_jeonse_ratio:.1f}% (비교사례 시세 기준)")
         lines.append("")
+        section("market", lines, HIGH)
+
+    # 최근 거래 내역 (예산 초과 시 통계 요약)
+    if recent_transactions:
+        sections.append(PromptSection(
+            "transactions", _format_transactions(recent_transactions), LOW,
+            compress=lambda: _summarize_transactions(recent_transactions),
+        ))
 
     # 소유권 정보
-    lines.append("## 👤 소유권 정보\n")
+    lines = ["## 👤 소유권 정보\n"]
     lines.append(f"- **소유자 수**: {risk_features.owner_count}명")
     if risk_features.owner_names_masked:
         lines.append(f"- **소유자**: {', '.join(risk_features.owner_names_masked)}")
     lines.append("")
+    section("ownership", lines, HIGH, compress=[line for line in lines if not line.startswith("- **소유자**")])
 
     # 근저당권 정보
-    lines.append("## 💰 근저당권 설정\n")
+    lines = ["## 💰 근저당권 설정\n"]
     lines.append(f"- **건수**: {risk_features.mortgage_count}건")
     lines.append(f"- **총 근저당액**: {risk_features.total_mortgage_amount:,}만원")
     if risk_features.max_mortgage_ltv:
@@ -244,32 +317,38 @@ def build_llm_prompt(
     if risk_features.mortgage_creditors:
         lines.append(f"- **채권자**: {', '.join(risk_features.mortgage_creditors)}")
     lines.append("")
+    section("mortgage", lines, HIGH, compress=[line for line in lines if not line.startswith("- **채권자**")])
 
     # 압류/가압류/가처분
-    lines.append("## ⚖️ 압류 및 가압류\n")
+    lines = ["## ⚖️ 압류 및 가압류\n"]
     lines.append(f"- **압류**: {'있음 🚨' if risk_features.has_seizure else '없음 ✅'}")
     lines.append(f"- **가압류**: {'있음 🚨' if risk_features.has_provisional_attachment else '없음 ✅'}")
     lines.append(f"- **가처분**: {'있음 🚨' if risk_features.has_provisional_disposition else '없음 ✅'}")
     lines.append(f"- **총 건수**: {risk_features.seizure_count}건")
     lines.append(f"- **총 금액**: {risk_features.seizure_total_amount:,}만원")
     lines.append("")
+    section("seizure", lines, HIGH)
 
     # 질권
     if risk_features.pledge_count > 0:
-        lines.append("## 🔒 질권 설정\n")
-        lines.append(f"- **건수**: {risk_features.pledge_count}건")
-        lines.append(f"- **총 금액**: {risk_features.pledge_total_amount:,}만원")
-        lines.append("")
+        section("pledge", [
+            "## 🔒 질권 설정\n",
+            f"- **건수**: {risk_features.pledge_count}건",
+            f"- **총 금액**: {risk_features.pledge_total_amount:,}만원",
+            "",
+        ], NORMAL)
 
     # 전세권
     if risk_features.lease_right_count > 0:
-        lines.append("## 🏘️ 전세권 설정\n")
-        lines.append(f"- **건수**: {risk_features.lease_right_count}건")
-        lines.append(f"- **총 전세금**: {risk_features.lease_right_total_amount:,}만원")
-        lines.append("")
+        section("lease_right", [
+            "## 🏘️ 전세권 설정\n",
+            f"- **건수**: {risk_features.lease_right_count}건",
+            f"- **총 전세금**: {risk_features.lease_right_total_amount:,}만원",
+            "",
+        ], NORMAL)
 
     # 리스크 지표
-    lines.append("## 📈 리스크 지표 (코드로 계산됨)\n")
+    lines = ["## 📈 리스크 지표 (코드로 계산됨)\n"]
     if risk_features.jeonse_ratio:
         lines.append(f"- **전세가율**: {risk_features.jeonse_ratio:.1f}% (점수: {risk_features.jeonse_ratio_score}점 / 40점)")
     if risk_features.mortgage_ratio:
@@ -279,27 +358,85 @@ def build_llm_prompt(
     if risk_features.encumbrance_score is not None:
         lines.append(f"- **권리하자 점수**: {risk_features.encumbrance_score}점 / 30점")
     lines.append("")
+    section("risk_indicators", lines, REQUIRED)
 
     # 종합 리스크 평가
-    lines.append("## ⚠️ 종합 리스크 평가\n")
-    lines.append(f"- **리스크 레벨**: {risk_features.risk_level}")
-    lines.append(f"- **총점**: {risk_features.risk_score}점 / 100점")
-    lines.append("")
+    section("risk_summary", [
+        "## ⚠️ 종합 리스크 평가\n",
+        f"- **리스크 레벨**: {risk_features.risk_level}",
+        f"- **총점**: {risk_features.risk_score}점 / 100점",
+        "",
+    ], REQUIRED)
 
     # LLM 지침
-    lines.append("---\n")
-    lines.append("## 📝 분석 리포트 작성 지침\n")
-    lines.append("위 데이터를 바탕으로 다음 내용을 포함한 분석 리포트를 작성하세요:\n")
-    lines.append("1. **리스크 요약**: 주요 위험 요인을 3-5개 항목으로 요약")
-    lines.append("2. **협상 포인트**: 계약 시 활용할 수 있는 협상 카드 제시")
-    lines.append("3. **권장 조치**: 계약 전 반드시 해야 할 조치 사항 (법무사 상담, 전세보증금반환보증 가입 등)")
-    lines.append("4. **종합 의견**: 전문가 관점에서의 계약 진행 여부 조언\n")
-    lines.append("**주의사항**:")
-    lines.append("- 법률 단정 표현은 피하고 '~할 수 있습니다', '~것으로 보입니다' 등 완곡한 표현 사용")
-    lines.append("- 반드시 '법무사 또는 변호사 상담'을 권장할 것")
-    lines.append("- 사용자가 이해하기 쉽게 설명할 것")
+    section("instructions", [
+        "---\n",
+        "## 📝 분석 리포트 작성 지침\n",
+        "위 데이터를 바탕으로 다음 내용을 포함한 분석 리포트를 작성하세요:\n",
+        "1. **리스크 요약**: 주요 위험 요인을 3-5개 항목으로 요약",
+        "2. **협상 포인트**: 계약 시 활용할 수 있는 협상 카드 제시",
+        "3. **권장 조치**: 계약 전 반드시 해야 할 조치 사항 (법무사 상담, 전세보증금반환보증 가입 등)",
+        "4. **종합 의견**: 전문가 관점에서의 계약 진행 여부 조언\n",
+        "**주의사항**:",
+        "- 법률 단정 표현은 피하고 '~할 수 있습니다', '~것으로 보입니다' 등 완곡한 표현 사용",
+        "- 반드시 '법무사 또는 변호사 상담'을 권장할 것",
+        "- 사용자가 이해하기 쉽게 설명할 것",
+    ], REQUIRED)
+
+    return assemble_prompt(sections, model=model, max_tokens=max_tokens, label="analysis")
 
-    return "\n".join(lines)
+
+def build_llm_prompt(
+    risk_features: RegistryRiskFeatures,
+    contract_type: str,
+    contract_deposit: Optional[int] = None,
+    contract_price: Optional[int] = None,
+    monthly_rent: Optional[int] = None,
+    property_value_estimate: Optional[int] = None,
+    jeonse_market_average: Optional[int] = None,
+    recent_transactions: Optional[List[Dict]] = None,
+    market_stats: Optional[Any] = None,
+    jeonse_stats: Optional[Any] = None,
+    model: str = "gpt-4o-mini",
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    RegistryRiskFeatures → LLM용 마크다운 프롬프트
+
+    LLM은 이 프롬프트를 읽고 '해석/설명/추천'만 함.
+    섹션 단위로 조립되어 model의 최대 입력 토큰을 넘지 않습니다 (build_llm_prompt_budget 참고).
+
+    Args:
+        risk_features: 코드로 계산된 리스크 특징
+        contract_type: 계약 유형
+        contract_deposit: 계약 보증금 (만원)
+        contract_price: 계약 금액 (만원, 매매용)
+        monthly_rent: 월세 (만원)
+        property_value_estimate: 매매 실거래가 평균 (만원)
+        jeonse_market_average: 전세 실거래가 평균 (만원)
+        recent_transactions: 최근 거래 내역 (선택)
+        market_stats: 매매 시세 비교사례 통계 (core.market_stats.MarketStats, 선택)
+        jeonse_stats: 전세 시세 비교사례 통계 (선택)
+        model: 프롬프트를 받을 모델 (토큰 계산/예산 기준)
+        max_tokens: 최대 입력 토큰 (None이면 settings.llm_max_input_tokens)
+
+    Returns:
+        LLM용 마크다운 프롬프트
+    """
+    return build_llm_prompt_budget(
+        risk_features=risk_features,
+        contract_type=contract_type,
+        contract_deposit=contract_deposit,
+        contract_price=contract_price,
+        monthly_rent=monthly_rent,
+        property_value_estimate=property_value_estimate,
+        jeonse_market_average=jeonse_market_average,
+        recent_transactions=recent_transactions,
+        market_stats=market_stats,
+        jeonse_stats=jeonse_stats,
+        model=model,
+        max_tokens=max_tokens,
+    ).text
 
 
 # ===========================
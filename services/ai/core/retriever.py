@@ -1,13 +1,16 @@
 """Vector store and retriever configuration."""
+from functools import lru_cache
+
 from langchain_community.vectorstores.pgvector import PGVector
-from langchain_core.vectorstores import VectorStoreRetriever
+from langchain_core.retrievers import BaseRetriever
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 
-from .embeddings import get_embedder
+from .embeddings import embedding_collection_name, get_embedder
 from .settings import settings
 
 
+@lru_cache(maxsize=1)
 def get_pg_connection() -> Engine:
     """
     Create PostgreSQL connection engine with optimized pool settings.
@@ -21,6 +24,7 @@ def get_pg_connection() -> Engine:
         - max_overflow=5: Additional connections during peak
         - pool_pre_ping=True: Verify connections before use
         - prepare_threshold=0: Disable prepared statements (required for Supabase connection pooler)
+        The engine (and its pool) is shared process-wide.
     """
     return create_engine(
         settings.database_url,
@@ -30,6 +34,7 @@ def get_pg_connection() -> Engine:
     )
 
 
+@lru_cache(maxsize=None)
 def get_vectorstore(collection_name: str = "v2_contract_docs") -> PGVector:
     """
     Get or create a PGVector vectorstore instance.
@@ -43,13 +48,16 @@ def get_vectorstore(collection_name: str = "v2_contract_docs") -> PGVector:
     Note:
         Requires pgvector extension to be enabled in Postgres:
         CREATE EXTENSION IF NOT EXISTS vector;
+        Non-OpenAI embedding backends use a separate collection
+        (see embedding_collection_name).
+        Instances are cached per collection (table/collection setup runs once).
     """
     engine = get_pg_connection()
     embeddings = get_embedder()
 
     return PGVector(
         connection=engine,
-        collection_name=collection_name,
+        collection_name=embedding_collection_name(collection_name),
         embedding_function=embeddings,
         # PGVector will create tables if they don't exist
         # Table schema: id, collection_id, embedding (vector), document, cmetadata
@@ -59,15 +67,16 @@ def get_vectorstore(collection_name: str = "v2_contract_docs") -> PGVector:
 def get_retriever(
     k: int = 6,
     collection_name: str = "v2_contract_docs",
-    search_type: str = "similarity",
-) -> VectorStoreRetriever:
+    search_type: str | None = None,
+) -> BaseRetriever:
     """
     Get a configured retriever for vector search.
 
     Args:
         k: Number of top results to retrieve
         collection_name: Vector collection name
-        search_type: Type of search ("similarity", "mmr", "similarity_score_threshold")
+        search_type: Type of search ("similarity", "mmr", "similarity_score_threshold",
+            "hybrid"; default: settings.retrieval_search_type)
 
     Returns:
         Configured retriever instance
@@ -78,6 +87,13 @@ def get_retriever(
         - search_type: "mmr" for diverse results, "similarity" for most relevant
         - score_threshold: Filter by similarity score if using similarity_score_threshold
     """
+    search_type = search_type or settings.retrieval_search_type
+
+    if search_type == "hybrid":
+        from .hybrid_retriever import HybridRetriever
+
+        return HybridRetriever(collection_name=collection_name, k=k)
+
     vectorstore = get_vectorstore(collection_name=collection_name)
 
     return vectorstore.as_retriever(
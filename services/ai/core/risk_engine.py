@@ -332,8 +332,11 @@ def evaluate_property_value_with_llm(
     import os
     from openai import OpenAI
     import json
+    from core.llm_clients import get_llm_registry
+    from core.llm_governor import llm_priority
 
-    client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    # 공유 커넥션 풀 + LLM 허가 (부가 평가라 채팅/분석보다 뒤에 처리)
+    client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), http_client=get_llm_registry().sync_http_client("openai"))
 
     # LLM 프롬프트
     prompt = f"""
@@ -383,21 +386,22 @@ def evaluate_property_value_with_llm(
 
     try:
         # OpenAI API 호출 (웹 검색 가능한 모델 사용)
-        response = client.chat.completions.create(
-            model="gpt-4o",  # 웹 검색 가능 모델
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 부동산 전문가입니다. 웹 검색을 통해 최신 정보를 확인하고 정확한 분석을 제공하세요."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.3,
-            max_tokens=1000,
-        )
+        with llm_priority("background"):
+            response = client.chat.completions.create(
+                model="gpt-4o",  # 웹 검색 가능 모델
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "당신은 부동산 전문가입니다. 웹 검색을 통해 최신 정보를 확인하고 정확한 분석을 제공하세요."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.3,
+                max_tokens=1000,
+            )
 
         # 응답 파싱
         result_text = response.choices[0].message.content.strip()
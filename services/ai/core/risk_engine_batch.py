@@ -0,0 +1,395 @@
+"""
+배치 리스크 엔진 (Vectorized Risk Engine)
+
+core/risk_engine의 스칼라 규칙을 NumPy 컬럼 배열로 옮긴 배치 버전.
+수천 건의 과거 케이스를 한 번에 재채점하거나, 기준값/낙찰가율 가정을 바꿔가며
+백테스트할 때 사용합니다.
+
+- 기본 임계값(DEFAULT_THRESHOLDS)에서 결과는 스칼라 경로와 정확히 일치
+  (calculate_risk_score / calculate_sale_risk_score / calculate_sale_legal_risk)
+- 금액 단위는 스칼라 엔진과 동일 (만원), 값이 없으면 0 (스칼라의 None/0과 동일 취급)
+- 리스크 요인 문자열(risk_factors)은 만들지 않음 → 숫자/레벨만 계산
+"""
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core.risk_engine import (
+    ContractData,
+    RegistryData,
+    MarketData,
+    PropertyValueAssessment,
+    RiskScore,
+)
+
+
+# 리스크 레벨 코드 → 라벨 (코드가 클수록 위험)
+RISK_LEVELS: Tuple[str, ...] = ("안전", "주의", "위험", "심각")
+
+
+@dataclass(frozen=True)
+class RiskThresholds:
+    """
+    리스크 판정 기준값
+
+    기본값은 core/risk_engine 스칼라 엔진과 동일합니다.
+    구간(bands)은 높은 값부터, 점수(points)는 구간 순서 + 구간 미만 점수입니다.
+    """
+    # 임대차: 전세가율 (%) → 90/80/70 이상, 그 미만
+    jeonse_bands: Tuple[float, ...] = (90, 80, 70)
+    jeonse_points: Tuple[int, ...] = (40, 30, 20, 10)
+
+    # 임대차: 근저당 비율 (%) → 80/60/40 이상, 그 미만
+    mortgage_bands: Tuple[float, ...] = (80, 60, 40)
+    mortgage_points: Tuple[int, ...] = (30, 20, 10, 0)
+
+    # 임대차: 권리하자 (압류/가압류/소유권 분쟁 각각)
+    encumbrance_points: int = 10
+
+    # 매매: 가격 프리미엄 (%) → -10/0/10/20 미만, 그 이상
+    premium_bands: Tuple[float, ...] = (-10, 0, 10, 20)
+    premium_points: Tuple[int, ...] = (0, 10, 20, 30, 40)
+    price_neutral_points: int = 20  # 실거래가 데이터 없음
+    value_neutral_points: int = 20  # 부동산 가치 평가 없음
+
+    # 매매: 법적 리스크
+    sale_seizure_points: int = 10
+    sale_provisional_points: int = 5
+    sale_dispute_points: int = 10
+    sale_lease_rights_points: int = 5
+    sale_mortgage_excess_ratio: float = 60  # 초과 시 가산
+    sale_mortgage_excess_points: int = 5
+    sale_legal_cap: int = 20
+
+    # 공통: 총점 → 레벨 (71/51/31 이상)
+    level_bands: Tuple[float, ...] = (71, 51, 31)
+
+
+DEFAULT_THRESHOLDS = RiskThresholds()
+
+
+# ===========================
+# 입력 컬럼
+# ===========================
+def _amounts(values) -> np.ndarray:
+    """금액 컬럼 정규화 (None/NaN → 0, float64)"""
+    arr = np.asarray(values, dtype=np.float64)
+    return np.nan_to_num(arr, nan=0.0)
+
+
+def _flags(values) -> np.ndarray:
+    return np.asarray(values, dtype=bool)
+
+
+@dataclass
+class RentalRiskBatch:
+    """임대차 배치 입력 (계약서 + 등기부, 컬럼 단위)"""
+    is_jeonse: np.ndarray  # contract_type == "전세"
+    deposit: np.ndarray
+    property_value: np.ndarray
+    mortgage_total: np.ndarray
+    seizure_exists: np.ndarray
+    provisional_attachment_exists: np.ndarray
+    ownership_disputes: np.ndarray
+
+    def __post_init__(self):
+        self.is_jeonse = _flags(self.is_jeonse)
+        self.deposit = _amounts(self.deposit)
+        self.property_value = _amounts(self.property_value)
+        self.mortgage_total = _amounts(self.mortgage_total)
+        self.seizure_exists = _flags(self.seizure_exists)
+        self.provisional_attachment_exists = _flags(self.provisional_attachment_exists)
+        self.ownership_disputes = _flags(self.ownership_disputes)
+
+    def __len__(self) -> int:
+        return len(self.deposit)
+
+    @classmethod
+    def from_models(
+        cls,
+        cases: Iterable[Tuple[ContractData, RegistryData]]
+    ) -> "RentalRiskBatch":
+        """(ContractData, RegistryData) 목록을 컬럼 배열로 변환"""
+        rows = []
+        for contract, registry in cases:
+            if registry is None:
+                raise ValueError("임대차 계약은 등기부 데이터가 필수입니다.")
+            rows.append((
+                contract.contract_type == "전세",
+                contract.deposit or 0,
+                registry.property_value or 0,
+                registry.mortgage_total or 0,
+                registry.seizure_exists,
+                registry.provisional_attachment_exists,
+                registry.ownership_disputes,
+            ))
+        columns = list(zip(*rows)) if rows else [()] * 7
+        return cls(*columns)
+
+
+@dataclass
+class SaleRiskBatch:
+    """
+    매매 배치 입력 (계약서 + 시장 데이터 + 가치 평가 + 등기부(선택), 컬럼 단위)
+
+    value_score: PropertyValueAssessment.total_score (평가 없음 = NaN)
+    has_registry: 등기부 유무 (False면 법적 리스크 0점)
+    """
+    price: np.ndarray
+    avg_trade_price: np.ndarray
+    value_score: np.ndarray
+    has_registry: np.ndarray
+    property_value: np.ndarray
+    mortgage_total: np.ndarray
+    seizure_exists: np.ndarray
+    provisional_attachment_exists: np.ndarray
+    ownership_disputes: np.ndarray
+    lease_rights_exists: np.ndarray
+
+    def __post_init__(self):
+        self.price = _amounts(self.price)
+        self.avg_trade_price = _amounts(self.avg_trade_price)
+        self.value_score = np.asarray(self.value_score, dtype=np.float64)
+        self.has_registry = _flags(self.has_registry)
+        self.property_value = _amounts(self.property_value)
+        self.mortgage_total = _amounts(self.mortgage_total)
+        self.seizure_exists = _flags(self.seizure_exists)
+        self.provisional_attachment_exists = _flags(self.provisional_attachment_exists)
+        self.ownership_disputes = _flags(self.ownership_disputes)
+        self.lease_rights_exists = _flags(self.lease_rights_exists)
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @classmethod
+    def from_models(
+        cls,
+        cases: Iterable[Tuple[
+            ContractData,
+            Optional[RegistryData],
+            Optional[MarketData],
+            Optional[PropertyValueAssessment],
+        ]]
+    ) -> "SaleRiskBatch":
+        """(ContractData, RegistryData?, MarketData?, PropertyValueAssessment?) 목록을 컬럼 배열로 변환"""
+        rows = []
+        for contract, registry, market, property_value in cases:
+            reg = registry or RegistryData()
+            rows.append((
+                contract.price or 0,
+                (market.avg_trade_price or 0) if market else 0,
+                property_value.total_score if property_value else np.nan,
+                registry is not None,
+                reg.property_value or 0,
+                reg.mortgage_total or 0,
+                reg.seizure_exists,
+                reg.provisional_attachment_exists,
+                reg.ownership_disputes,
+                reg.lease_rights_exists,
+            ))
+        columns = list(zip(*rows)) if rows else [()] * 10
+        return cls(*columns)
+
+
+# ===========================
+# 결과
+# ===========================
+@dataclass
+class RiskBatchResult:
+    """
+    배치 채점 결과 (컬럼 단위)
+
+    비율 컬럼은 스칼라 엔진에서 None인 행이 NaN입니다.
+    세부 점수 컬럼은 해당 계약 유형에서만 채워집니다.
+    """
+    total_score: np.ndarray
+    risk_level_code: np.ndarray  # RISK_LEVELS 인덱스
+    jeonse_ratio: np.ndarray
+    mortgage_ratio: np.ndarray
+    sub_scores: dict = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.total_score)
+
+    @property
+    def risk_levels(self) -> np.ndarray:
+        """리스크 레벨 라벨 배열 ("안전" | "주의" | "위험" | "심각")"""
+        return np.asarray(RISK_LEVELS, dtype=object)[self.risk_level_code]
+
+    def level_counts(self) -> dict:
+        """레벨별 건수 (임계값 변경 전후 비교용)"""
+        counts = np.bincount(self.risk_level_code, minlength=len(RISK_LEVELS))
+        return {label: int(n) for label, n in zip(RISK_LEVELS, counts)}
+
+    def to_risk_scores(self) -> List[RiskScore]:
+        """
+        RiskScore 목록으로 변환 (숫자 필드만, risk_factors는 빈 리스트)
+
+        스칼라 결과와 비교하거나 기존 리포트 코드에 넘길 때 사용합니다.
+        """
+        levels = self.risk_levels
+        results = []
+        for i in range(len(self)):
+            fields = {
+                name: int(values[i])
+                for name, values in self.sub_scores.items()
+            }
+            results.append(RiskScore(
+                total_score=float(self.total_score[i]),
+                jeonse_ratio=_optional(self.jeonse_ratio[i]),
+                mortgage_ratio=_optional(self.mortgage_ratio[i]),
+                risk_level=levels[i],
+                risk_factors=[],
+                **fields,
+            ))
+        return results
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+# ===========================
+# 규칙 (벡터화)
+# ===========================
+def _band_points(values: np.ndarray, bands, points) -> np.ndarray:
+    """values >= bands[i] 인 첫 구간의 점수 (없으면 마지막 점수)"""
+    conditions = [values >= band for band in bands]
+    return np.select(conditions, points[:-1], default=points[-1])
+
+
+def _risk_level_codes(total_score: np.ndarray, thresholds: RiskThresholds) -> np.ndarray:
+    level_points = list(range(len(RISK_LEVELS) - 1, -1, -1))  # 3, 2, 1, 0
+    return _band_points(total_score, thresholds.level_bands, level_points).astype(np.int8)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """mask인 행만 (numerator / denominator) * 100, 나머지는 NaN"""
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=mask)
+    out[mask] *= 100
+    return out
+
+
+def property_value_from_market(market_value, auction_rate) -> np.ndarray:
+    """
+    시세 × 낙찰가율 → 물건 가치 (만원, 정수 절사)
+
+    스칼라 경로의 int(property_value_estimate * auction_rate)와 동일.
+    auction_rate는 스칼라 또는 케이스별 배열 (낙찰가율 가정 백테스트용).
+    """
+    value = _amounts(market_value) * np.asarray(auction_rate, dtype=np.float64)
+    return np.trunc(value)
+
+
+def score_rental_batch(
+    batch: RentalRiskBatch,
+    thresholds: RiskThresholds = DEFAULT_THRESHOLDS
+) -> RiskBatchResult:
+    """
+    임대차 리스크 배치 채점 (calculate_risk_score의 벡터 버전)
+
+    점수 = 전세가율 점수 + 근저당 점수 + 권리하자 점수
+    """
+    has_value = batch.property_value != 0
+
+    # 1. 전세가율 점수
+    jeonse_mask = batch.is_jeonse & (batch.deposit != 0) & has_value
+    jeonse_ratio = _ratio(batch.deposit, batch.property_value, jeonse_mask)
+    jeonse_score = np.where(
+        jeonse_mask,
+        _band_points(np.nan_to_num(jeonse_ratio), thresholds.jeonse_bands, thresholds.jeonse_points),
+        0,
+    )
+
+    # 2. 근저당 비율 점수
+    mortgage_mask = (batch.mortgage_total != 0) & has_value
+    mortgage_ratio = _ratio(batch.mortgage_total, batch.property_value, mortgage_mask)
+    mortgage_score = np.where(
+        mortgage_mask,
+        _band_points(np.nan_to_num(mortgage_ratio), thresholds.mortgage_bands, thresholds.mortgage_points),
+        0,
+    )
+
+    # 3. 권리하자 점수
+    encumbrance_score = thresholds.encumbrance_points * (
+        batch.seizure_exists.astype(np.int64)
+        + batch.provisional_attachment_exists
+        + batch.ownership_disputes
+    )
+
+    total_score = (jeonse_score + mortgage_score + encumbrance_score).astype(np.float64)
+
+    return RiskBatchResult(
+        total_score=total_score,
+        risk_level_code=_risk_level_codes(total_score, thresholds),
+        jeonse_ratio=jeonse_ratio,
+        mortgage_ratio=mortgage_ratio,
+    )
+
+
+def score_sale_batch(
+    batch: SaleRiskBatch,
+    thresholds: RiskThresholds = DEFAULT_THRESHOLDS
+) -> RiskBatchResult:
+    """
+    매매 리스크 배치 채점 (calculate_sale_risk_score의 벡터 버전)
+
+    점수 = 가격 적정성 + 부동산 가치 평가 + 법적 리스크
+    """
+    n = len(batch)
+
+    # 1. 가격 적정성
+    has_market = batch.avg_trade_price != 0
+    premium = np.zeros(n)
+    np.divide(batch.price - batch.avg_trade_price, batch.avg_trade_price, out=premium, where=has_market)
+    premium *= 100
+    price_score = np.where(
+        has_market,
+        np.select(
+            [premium < band for band in thresholds.premium_bands],
+            thresholds.premium_points[:-1],
+            default=thresholds.premium_points[-1],
+        ),
+        thresholds.price_neutral_points,
+    )
+
+    # 2. 부동산 가치 평가
+    value_score = np.where(
+        np.isnan(batch.value_score),
+        thresholds.value_neutral_points,
+        np.nan_to_num(batch.value_score),
+    ).astype(np.int64)
+
+    # 3. 법적 리스크 (등기부 있는 경우만)
+    mortgage_mask = (batch.mortgage_total != 0) & (batch.property_value != 0)
+    mortgage_ratio = _ratio(batch.mortgage_total, batch.property_value, mortgage_mask)
+    mortgage_excess = mortgage_mask & (np.nan_to_num(mortgage_ratio) > thresholds.sale_mortgage_excess_ratio)
+
+    legal_score = (
+        thresholds.sale_seizure_points * batch.seizure_exists
+        + thresholds.sale_provisional_points * batch.provisional_attachment_exists
+        + thresholds.sale_dispute_points * batch.ownership_disputes
+        + thresholds.sale_lease_rights_points * batch.lease_rights_exists
+        + thresholds.sale_mortgage_excess_points * mortgage_excess
+    )
+    legal_score = np.where(
+        batch.has_registry,
+        np.minimum(legal_score, thresholds.sale_legal_cap),
+        0,
+    )
+
+    total_score = (price_score + value_score + legal_score).astype(np.float64)
+
+    return RiskBatchResult(
+        total_score=total_score,
+        risk_level_code=_risk_level_codes(total_score, thresholds),
+        jeonse_ratio=np.full(n, np.nan),  # 매매는 전세가율/근저당 비율 미보고
+        mortgage_ratio=np.full(n, np.nan),
+        sub_scores={
+            "price_fairness_score": price_score,
+            "property_value_score": value_score,
+            "legal_risk_score": legal_score,
+        },
+    )
@@ -0,0 +1,367 @@
+"""
+RTMS(실거래가) 응답 XML 스트리밍 파싱 → 슬롯 레코드
+
+xmltodict.parse는 응답 전체를 중첩 dict 트리로 만들고, 각 클라이언트의 정규화 단계가
+item마다 dict를 한 번 더 만듭니다 (수천 건 응답이면 할당이 두 배).
+여기서는 XMLPullParser로 바이트 청크를 받는 대로 파싱하고, </item>마다 상품별 스키마에 따라
+바로 정규화된 결과(슬롯 레코드 또는 dict)를 만든 뒤 원소를 버립니다.
+
+- 상품별 스키마 (RecordSchema): 출력 필드 / 타입(str|int) / 원본 태그 후보(구 API 한글 태그 포함)
+  - str: strip, 없으면 ""
+  - int: 공백/쉼표 제거 후 int, 없거나 변환 실패 시 None
+  - 태그 후보는 앞에서부터 값이 있는 첫 번째 사용 (기존 `a or b` 정규화와 동일)
+- 레코드 (TransactionRecord): __slots__ 객체. get()/[]를 지원해 dict item을 받던 코드
+  (market_stats 등)에 그대로 넘길 수 있음
+- 컬럼 뷰 (as_columns): 통계용 필드별 배열 (int 필드는 array('d'), 값 없음 = NaN)
+
+사용 예:
+    parser = RTMSStreamParser(APT_TRADE_SCHEMA)
+    async for chunk in response.aiter_bytes():
+        parser.feed(chunk)
+    result = parser.close()  # result.records, result.result_code, ...
+"""
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from xml.etree.ElementTree import XMLPullParser
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """출력 필드 1개 (sources: 원본 태그 후보, 앞쪽 우선)"""
+
+    name: str
+    kind: str = "str"  # str | int
+    sources: Tuple[str, ...] = ()
+
+
+def S(name: str, *sources: str) -> FieldSpec:
+    return FieldSpec(name, "str", sources or (name,))
+
+
+def I(name: str, *sources: str) -> FieldSpec:
+    return FieldSpec(name, "int", sources or (name,))
+
+
+def _to_int(text: Optional[str]) -> Optional[int]:
+    if not text:
+        return None
+    digits = text.replace(" ", "").replace(",", "")
+    try:
+        return int(digits) if digits else None
+    except ValueError:
+        return None
+
+
+# ===========================
+# 레코드 / 스키마
+# ===========================
+
+class TransactionRecord:
+    """슬롯 레코드 베이스 (필드는 스키마별 하위 클래스의 __slots__)"""
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    FIELD_SET: frozenset = frozenset()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.FIELD_SET else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELD_SET
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TransactionRecord):
+            return type(self) is type(other) and all(
+                getattr(self, name) == getattr(other, name) for name in self.FIELDS
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({values})"
+
+
+class RecordSchema:
+    """상품별 스키마: 원본 태그 → 정규화 필드 (슬롯 레코드 클래스 생성)"""
+
+    def __init__(self, name: str, fields: Sequence[FieldSpec]):
+        self.name = name
+        self.fields = tuple(fields)
+        names = tuple(f.name for f in self.fields)
+        self.record_type = type(
+            name, (TransactionRecord,), {"__slots__": names, "FIELDS": names, "FIELD_SET": frozenset(names)}
+        )
+
+        # 원본 태그 → 값 버퍼 인덱스 (여러 필드가 같은 태그를 공유할 수 있음)
+        self.tag_index: Dict[str, int] = {}
+        for f in self.fields:
+            for tag in f.sources:
+                self.tag_index.setdefault(tag, len(self.tag_index))
+        self._plan = tuple(
+            (f.name, f.kind == "int", tuple(self.tag_index[tag] for tag in f.sources))
+            for f in self.fields
+        )
+
+    def _resolve(self, values: List[Optional[str]]) -> Iterable[Tuple[str, Any]]:
+        for name, is_int, indexes in self._plan:
+            text = None
+            for index in indexes:
+                if values[index]:
+                    text = values[index]
+                    break
+            yield name, (_to_int(text) if is_int else (text or ""))
+
+    def make_record(self, values: List[Optional[str]]) -> TransactionRecord:
+        record = self.record_type.__new__(self.record_type)
+        for name, value in self._resolve(values):
+            setattr(record, name, value)
+        return record
+
+    def make_dict(self, values: List[Optional[str]]) -> Dict[str, Any]:
+        return dict(self._resolve(values))
+
+    def from_mapping(self, item: Mapping[str, Any], as_records: bool = True) -> Union[TransactionRecord, Dict[str, Any]]:
+        """이미 dict로 파싱된 item (xmltodict 등) → 레코드/dict"""
+        values: List[Optional[str]] = [None] * len(self.tag_index)
+        for tag, index in self.tag_index.items():
+            value = item.get(tag)
+            if value is not None:
+                values[index] = str(value).strip()
+        return self.make_record(values) if as_records else self.make_dict(values)
+
+
+# ===========================
+# 스트리밍 파서
+# ===========================
+
+@dataclass
+class RTMSParseResult:
+    result_code: Optional[str] = None
+    result_msg: Optional[str] = None
+    total_count: Optional[int] = None
+    records: List[Any] = field(default_factory=list)
+
+
+# 헤더 태그 (정상 응답: response/header, 오류 응답: OpenAPI_ServiceResponse/cmmMsgHeader)
+_CODE_TAGS = ("resultCode", "returnReasonCode")
+_MSG_TAGS = ("resultMsg", "returnAuthMsg", "errMsg")
+
+CHUNK_SIZE = 64 * 1024
+
+
+class RTMSStreamParser:
+    """
+    바이트 청크 → RTMSParseResult
+
+    Args:
+        schema: 상품별 RecordSchema
+        as_records: True면 슬롯 레코드, False면 정규화 dict (기존 응답 형식)
+    """
+
+    def __init__(self, schema: RecordSchema, as_records: bool = True):
+        self.schema = schema
+        self.result = RTMSParseResult()
+        self._make: Callable[[List[Optional[str]]], Any] = schema.make_record if as_records else schema.make_dict
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._container = None  # <items> 원소 (처리한 <item>을 떼어 내 트리가 커지지 않게)
+        self._in_item = False
+
+    def feed(self, chunk: Union[bytes, str]) -> None:
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self) -> RTMSParseResult:
+        self._parser.close()
+        self._drain()
+        return self.result
+
+    def _drain(self) -> None:
+        tag_index = self.schema.tag_index
+        result = self.result
+
+        for event, elem in self._parser.read_events():
+            tag = elem.tag
+            if event == "start":
+                if tag == "items":
+                    self._container = elem
+                elif tag == "item":
+                    self._in_item = True
+                continue
+
+            if tag == "item":
+                values: List[Optional[str]] = [None] * len(tag_index)
+                for child in elem:
+                    index = tag_index.get(child.tag)
+                    if index is not None and child.text:
+                        values[index] = child.text.strip()
+                result.records.append(self._make(values))
+                self._in_item = False
+                if self._container is not None:
+                    self._container.remove(elem)
+                else:
+                    elem.clear()
+            elif self._in_item:
+                continue
+            elif tag in _CODE_TAGS:
+                result.result_code = result.result_code or (elem.text or "").strip() or None
+            elif tag in _MSG_TAGS:
+                result.result_msg = result.result_msg or (elem.text or "").strip() or None
+            elif tag == "totalCount":
+                result.total_count = _to_int(elem.text)
+
+
+def parse_rtms_xml(content: Union[bytes, str], schema: RecordSchema, as_records: bool = True) -> RTMSParseResult:
+    """응답 본문 전체 → RTMSParseResult (ParseError: XML 형식 오류)"""
+    parser = RTMSStreamParser(schema, as_records=as_records)
+    # 한 번에 feed하면 모든 원소가 이벤트 큐에 쌓인 뒤에야 처리됨 → 청크 단위로
+    for offset in range(0, len(content), CHUNK_SIZE):
+        parser.feed(content[offset:offset + CHUNK_SIZE])
+    return parser.close()
+
+
+def as_columns(
+    records: Sequence[Any],
+    fields: Optional[Sequence[str]] = None,
+    schema: Optional[RecordSchema] = None,
+) -> Dict[str, Union[array, List[str]]]:
+    """
+    레코드 목록 → 컬럼 뷰 (통계용)
+
+    int 필드는 array('d') (값 없음 = NaN, numpy.frombuffer로 복사 없이 변환 가능),
+    str 필드는 list.
+
+    Args:
+        records: 슬롯 레코드 또는 정규화 dict 목록
+        fields: 포함할 필드 (기본값: 스키마 전체)
+        schema: dict 목록일 때 필드 타입 판단용 (레코드면 생략 가능)
+    """
+    if not records:
+        return {}
+    if schema is None:
+        schema = next((s for s in _SCHEMAS if isinstance(records[0], s.record_type)), None)
+    kinds = {f.name: f.kind for f in schema.fields} if schema else {}
+    names = list(fields) if fields else [f.name for f in schema.fields] if schema else list(records[0].keys())
+
+    columns: Dict[str, Union[array, List[str]]] = {}
+    nan = math.nan
+    for name in names:
+        if kinds.get(name) == "int":
+            values = (record.get(name) for record in records)
+            columns[name] = array("d", (nan if value is None else value for value in values))
+        else:
+            columns[name] = [record.get(name) for record in records]
+    return columns
+
+
+# ===========================
+# 상품별 스키마 (기존 _normalize_*_items 출력 필드 / 순서와 동일)
+# ===========================
+
+APT_TRADE_SCHEMA = RecordSchema("AptTradeRecord", [
+    # 기본 거래 정보 (PDF 스펙, 괄호 안은 최대 길이)
+    S("sggCd"),  # 지역코드 (5자리)
+    S("umdNm", "umdNm", "dong", "법정동", "읍면동"),  # 법정동 (60자)
+    S("aptNm", "aptNm", "아파트", "단지명"),  # 단지명 (100자)
+    S("jibun", "지번", "jibun"),  # 지번 (20자)
+    S("excluUseAr", "excluUseAr", "전용면적"),  # 전용면적 (22자)
+    # 계약 정보
+    I("dealYear", "년", "dealYear"),  # 계약년도 (4자)
+    I("dealMonth", "월", "dealMonth"),  # 계약월 (2자)
+    I("dealDay", "일", "dealDay"),  # 계약일 (2자)
+    I("dealAmount", "거래금액", "dealAmount"),  # 거래금액(만원) (40자)
+    # 건물 정보
+    S("floor", "층", "floor"),  # 층 (10자)
+    I("buildYear", "건축년도", "buildYear"),  # 건축년도 (4자)
+    S("aptDong"),  # 아파트 동명 (400자)
+    # 거래 상세 정보
+    S("cdealType", "해제여부", "cancelDealType", "cdealType"),  # 해제여부 (1자)
+    S("cdealDay", "해제사유발생일", "cancelDealDate", "cdealDay"),  # 해제사유발생일 (8자)
+    S("dealingGbn", "dealingGbn", "거래유형", "거래구분", "중개구분"),  # 거래유형 중개 및 직거래여부 (10자)
+    S("estateAgentSggNm"),  # 중개사소재지 시군구단위 (3000자)
+    S("rgstDate"),  # 등기일자 (8자)
+    # 거래 주체 정보
+    S("slerGbn"),  # 매도자 거래주체정보 (100자)
+    S("buyerGbn"),  # 매수자 거래주체정보 (100자)
+    S("landLeaseholdGbn"),  # 토지임대부 아파트 여부 (1자)
+    # 하위 호환성을 위한 기존 필드명 유지
+    S("aptName", "aptNm", "아파트", "단지명"),
+    S("dong", "dong", "법정동", "읍면동"),
+    I("exclusiveArea", "전용면적", "exclusiveArea", "excluUseAr"),
+    S("cancelDealType", "해제여부", "cancelDealType", "cdealType"),
+    S("cancelDealDate", "해제사유발생일", "cancelDealDate", "cdealDay"),
+])
+
+APT_RENT_SCHEMA = RecordSchema("AptRentRecord", [
+    S("sggCd"),  # 지역코드 (5자리)
+    S("umdNm"),  # 법정동 (30자)
+    S("aptNm"),  # 아파트명 (100자)
+    S("jibun"),  # 지번 (20자)
+    S("excluUseAr"),  # 전용면적 (22자)
+    I("dealYear"),  # 계약년도 (4자)
+    I("dealMonth"),  # 계약월 (2자)
+    I("dealDay"),  # 계약일 (2자)
+    I("deposit"),  # 보증금액(만원) (40자)
+    I("monthlyRent"),  # 월세금액(만원) (40자)
+    S("floor"),  # 층 (10자)
+    I("buildYear"),  # 건축년도 (4자)
+    S("contractTerm"),  # 계약기간 (12자)
+    S("contractType"),  # 계약구분 (4자)
+    S("useRRRight"),  # 갱신요구권사용 (4자)
+    I("preDeposit"),  # 종전계약보증금 (40자)
+    I("preMonthlyRent"),  # 종전계약월세 (40자)
+])
+
+OFFI_TRADE_SCHEMA = RecordSchema("OffiTradeRecord", [
+    S("sggCd"), S("umdNm"), S("offiNm"), S("jibun"), S("excluUseAr"),
+    I("dealYear"), I("dealMonth"), I("dealDay"), I("dealAmount"),
+    S("floor"), I("buildYear"), S("cdealType"), S("cdealDay"),
+])
+
+OFFI_RENT_SCHEMA = RecordSchema("OffiRentRecord", [
+    S("sggCd"), S("umdNm"), S("offiNm"), S("jibun"), S("excluUseAr"),
+    I("dealYear"), I("dealMonth"), I("dealDay"), I("deposit"), I("monthlyRent"),
+    S("floor"), I("buildYear"), S("contractTerm"), S("contractType"),
+])
+
+RH_TRADE_SCHEMA = RecordSchema("RHTradeRecord", [
+    S("sggCd"), S("umdNm"), S("mhouseNm"), S("jibun"), S("excluUseAr"),
+    I("dealYear"), I("dealMonth"), I("dealDay"), I("dealAmount"),
+    S("floor"), I("buildYear"), S("cdealType"), S("cdealDay"),
+])
+
+RH_RENT_SCHEMA = RecordSchema("RHRentRecord", [
+    S("sggCd"), S("umdNm"), S("mhouseNm"), S("jibun"), S("excluUseAr"),
+    I("dealYear"), I("dealMonth"), I("dealDay"), I("deposit"), I("monthlyRent"),
+    S("floor"), I("buildYear"), S("contractTerm"), S("contractType"),
+])
+
+SH_TRADE_SCHEMA = RecordSchema("SHTradeRecord", [
+    S("sggCd"), S("umdNm"), S("houseType"),  # 주택유형
+    S("jibun"), S("totalFloorAr"), S("plottageAr"),  # 연면적, 대지면적
+    I("dealYear"), I("dealMonth"), I("dealDay"), I("dealAmount"),
+    I("buildYear"), S("cdealType"), S("cdealDay"),
+])
+
+SH_RENT_SCHEMA = RecordSchema("SHRentRecord", [
+    S("sggCd"), S("umdNm"), S("jibun"), S("contractArea"),  # 계약면적
+    I("dealYear"), I("dealMonth"), I("dealDay"), I("deposit"), I("monthlyRent"),
+    I("buildYear"), S("contractTerm"), S("contractType"),
+])
+
+_SCHEMAS = (
+    APT_TRADE_SCHEMA, APT_RENT_SCHEMA, OFFI_TRADE_SCHEMA, OFFI_RENT_SCHEMA,
+    RH_TRADE_SCHEMA, RH_RENT_SCHEMA, SH_TRADE_SCHEMA, SH_RENT_SCHEMA,
+)
@@ -0,0 +1,581 @@
+"""
+RTMS 실거래가 로컬 웨어하우스
+
+지난달 이전의 실거래가는 (해제 신고 기간이 지나면) 더 이상 바뀌지 않는데,
+분석마다 data.go.kr을 다시 호출하고 있어 느리고 일일 호출 한도를 소모합니다.
+
+(상품, 법정동코드 5자리, 계약년월) 단위 파티션으로 거래를 로컬 SQLite 파일에 저장하고,
+- 확정 파티션 (계약월 + settle_months 이후 동기화): 다시 조회하지 않음
+- 미확정 파티션 (당월/최근월): ttl_minutes 경과 시에만 다시 조회
+API 실패 시 저장된 (오래된) 파티션이 있으면 그대로 사용합니다.
+
+대상 엔드포인트: core/*_trade_api.py, core/*_rent_api.py (RTMS_SOURCES)
+저장 형식: 정규화된 item dict (core/public_data_api와 동일한 필드명, 금액/년월일은 int)
+
+사용 예:
+    items = await fetch_transactions("apt_trade", "11680", ["202501", "202412"])
+    trend = get_rtms_warehouse().monthly_trend("apt_trade", "11680", "202201", "202412", umd_nm="역삼동")
+
+동기화 작업: scripts/sync_rtms_warehouse.py
+"""
+import asyncio
+import importlib
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RTMSSource:
+    """RTMS 엔드포인트 정의 (클라이언트 모듈/클래스/조회 메서드)"""
+    module: str
+    client_class: str
+    method: str
+    kind: str  # "trade" | "rent"
+
+    @property
+    def amount_field(self) -> str:
+        return "deposit" if self.kind == "rent" else "dealAmount"
+
+
+# 상품 키 → 엔드포인트
+RTMS_SOURCES: Dict[str, RTMSSource] = {
+    "apt_trade": RTMSSource("core.apt_trade_detail_api", "AptTradeDetailAPIClient", "get_apt_trade_detail", "trade"),
+    "apt_rent": RTMSSource("core.apt_rent_api", "AptRentAPIClient", "get_apt_rent", "rent"),
+    "apt_silv_trade": RTMSSource("core.apt_silv_trade_api", "AptSilvTradeAPIClient", "get_apt_silv_trade", "trade"),
+    "officetel_trade": RTMSSource("core.officetel_trade_api", "OfficetelTradeAPIClient", "get_officetel_trade", "trade"),
+    "officetel_rent": RTMSSource("core.officetel_rent_api", "OfficetelRentAPIClient", "get_officetel_rent", "rent"),
+    "rh_trade": RTMSSource("core.rh_trade_api", "RHTradeAPIClient", "get_rh_trade", "trade"),
+    "rh_rent": RTMSSource("core.rh_rent_api", "RHRentAPIClient", "get_rh_rent", "rent"),
+    "sh_trade": RTMSSource("core.sh_trade_api", "SHTradeAPIClient", "get_sh_trade", "trade"),
+    "sh_rent": RTMSSource("core.sh_rent_api", "SHRentAPIClient", "get_sh_rent", "rent"),
+    "indu_trade": RTMSSource("core.indu_trade_api", "InduTradeAPIClient", "get_indu_trade", "trade"),
+    "land_trade": RTMSSource("core.land_trade_api", "LandTradeAPIClient", "get_land_trade", "trade"),
+    "nrg_trade": RTMSSource("core.nrg_trade_api", "NrgTradeAPIClient", "get_nrg_trade", "trade"),
+}
+
+# 정수로 변환하는 필드 (금액은 "82,500" 형태)
+INT_FIELDS = (
+    "dealAmount", "deposit", "monthlyRent", "preDeposit", "preMonthlyRent",
+    "dealYear", "dealMonth", "dealDay", "buildYear",
+)
+
+# 단지/건물명 필드 (상품별로 다름)
+NAME_FIELDS = ("aptNm", "offiNm", "mhouseNm")
+
+# 면적 필드 (아파트/오피스텔/연립다세대: 전용, 단독다가구: 연면적, 토지: 거래면적, 상업용: 건물면적)
+AREA_FIELDS = ("excluUseAr", "totalFloorAr", "dealArea", "buildingAr")
+
+PAGE_SIZE = 1000  # data.go.kr RTMS numOfRows 최대값
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rtms_partitions (
+    property_type TEXT NOT NULL,
+    lawd_cd TEXT NOT NULL,
+    deal_ymd TEXT NOT NULL,
+    item_count INTEGER NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (property_type, lawd_cd, deal_ymd)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rtms_transactions (
+    property_type TEXT NOT NULL,
+    lawd_cd TEXT NOT NULL,
+    deal_ymd TEXT NOT NULL,
+    umd_nm TEXT,
+    name TEXT,
+    area_m2 REAL,
+    amount INTEGER,
+    monthly_rent INTEGER,
+    cancelled INTEGER NOT NULL DEFAULT 0,
+    item TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_rtms_tx_partition
+    ON rtms_transactions (property_type, lawd_cd, deal_ymd);
+CREATE INDEX IF NOT EXISTS idx_rtms_tx_complex
+    ON rtms_transactions (property_type, lawd_cd, umd_nm, name, deal_ymd);
+"""
+
+
+# ===========================
+# 정규화 / 날짜 헬퍼
+# ===========================
+
+def normalize_item(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    RTMS 원본 item → 정규화 dict
+
+    문자열은 strip, INT_FIELDS는 int (쉼표 제거, 변환 실패 시 None).
+    """
+    item: Dict[str, Any] = {}
+    for key, value in raw.items():
+        text = str(value).strip() if value is not None else ""
+        if key in INT_FIELDS:
+            digits = text.replace(",", "").replace(" ", "")
+            try:
+                item[key] = int(digits) if digits else None
+            except ValueError:
+                item[key] = None
+        else:
+            item[key] = text
+    return item
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(str(value).replace(",", "")) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def _month_start(deal_ymd: str) -> datetime:
+    return datetime(int(deal_ymd[:4]), int(deal_ymd[4:6]), 1)
+
+
+def add_months(deal_ymd: str, months: int) -> str:
+    """YYYYMM + months → YYYYMM"""
+    index = int(deal_ymd[:4]) * 12 + int(deal_ymd[4:6]) - 1 + months
+    return f"{index // 12}{index % 12 + 1:02d}"
+
+
+def recent_months(count: int, now: Optional[datetime] = None) -> List[str]:
+    """당월부터 과거로 count개월 (YYYYMM, 최신순)"""
+    now = now or datetime.now()
+    current = f"{now.year}{now.month:02d}"
+    return [add_months(current, -i) for i in range(count)]
+
+
+def month_range(start_ymd: str, end_ymd: str) -> List[str]:
+    """start_ymd ~ end_ymd (포함, 오래된순)"""
+    months = []
+    ymd = start_ymd
+    while ymd <= end_ymd:
+        months.append(ymd)
+        ymd = add_months(ymd, 1)
+    return months
+
+
+# ===========================
+# 웨어하우스
+# ===========================
+
+class RTMSWarehouse:
+    """
+    (상품, 법정동코드, 계약년월) 파티션 단위 로컬 실거래가 저장소
+
+    SQLite는 연결을 짧게 열고 닫으며 (WAL), 쓰기는 파티션 단위 트랜잭션으로
+    교체합니다. 같은 파티션의 동시 동기화는 asyncio.Lock으로 한 번만 수행합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        settle_months: int = 3,
+        ttl_minutes: int = 360,
+    ):
+        self.path = path
+        self.settle_months = settle_months
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+        self._memory_lock = threading.Lock()  # 인메모리 DB 연결은 스레드 간 공유 → 직렬화
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False) if path == ":memory:" else None
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        if self._memory_conn is not None:
+            # 테스트용 인메모리 DB는 단일 연결 공유
+            with self._memory_lock, self._memory_conn:
+                yield self._memory_conn
+            return
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ---------- 파티션 상태 ----------
+
+    def partition_synced_at(self, property_type: str, lawd_cd: str, deal_ymd: str) -> Optional[datetime]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_at FROM rtms_partitions "
+                "WHERE property_type = ? AND lawd_cd = ? AND deal_ymd = ?",
+                (property_type, lawd_cd, deal_ymd),
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def is_fresh(
+        self,
+        property_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        파티션을 API 재조회 없이 사용할 수 있는지
+
+        - 계약월 + settle_months 이후에 동기화됨 → 확정 (항상 True)
+        - 그 외 → 마지막 동기화 후 ttl 이내면 True
+        """
+        synced_at = self.partition_synced_at(property_type, lawd_cd, deal_ymd)
+        if synced_at is None:
+            return False
+
+        settled_at = _month_start(add_months(deal_ymd, self.settle_months))
+        if synced_at >= settled_at:
+            return True
+
+        now = now or datetime.now()
+        return now - synced_at < self.ttl
+
+    def stale_months(
+        self,
+        property_type: str,
+        lawd_cd: str,
+        deal_ymds: Iterable[str],
+        now: Optional[datetime] = None,
+    ) -> List[str]:
+        """재동기화가 필요한 계약년월 목록"""
+        return [ymd for ymd in deal_ymds if not self.is_fresh(property_type, lawd_cd, ymd, now)]
+
+    # ---------- 읽기/쓰기 ----------
+
+    def write_partition(
+        self,
+        property_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        items: Sequence[Dict[str, Any]],
+        synced_at: Optional[datetime] = None,
+    ) -> int:
+        """파티션 전체 교체 (정규화된 items)"""
+        source = RTMS_SOURCES[property_type]
+        synced_at = synced_at or datetime.now()
+
+        rows = []
+        for item in items:
+            name = next((item[f] for f in NAME_FIELDS if item.get(f)), None)
+            area = next((_to_float(item[f]) for f in AREA_FIELDS if item.get(f)), None)
+            rows.append((
+                property_type, lawd_cd, deal_ymd,
+                item.get("umdNm") or None,
+                name,
+                area,
+                item.get(source.amount_field),
+                item.get("monthlyRent"),
+                1 if item.get("cdealType") == "O" else 0,
+                json.dumps(item, ensure_ascii=False),
+            ))
+
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM rtms_transactions WHERE property_type = ? AND lawd_cd = ? AND deal_ymd = ?",
+                (property_type, lawd_cd, deal_ymd),
+            )
+            conn.executemany(
+                "INSERT INTO rtms_transactions "
+                "(property_type, lawd_cd, deal_ymd, umd_nm, name, area_m2, amount, monthly_rent, cancelled, item) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO rtms_partitions "
+                "(property_type, lawd_cd, deal_ymd, item_count, synced_at) VALUES (?, ?, ?, ?, ?)",
+                (property_type, lawd_cd, deal_ymd, len(rows), synced_at.isoformat()),
+            )
+        return len(rows)
+
+    def read_items(self, property_type: str, lawd_cd: str, deal_ymds: Sequence[str]) -> List[Dict[str, Any]]:
+        """저장된 거래 (정규화 dict, 계약년월 입력 순서)"""
+        if not deal_ymds:
+            return []
+
+        placeholders = ",".join("?" * len(deal_ymds))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT deal_ymd, item FROM rtms_transactions "
+                f"WHERE property_type = ? AND lawd_cd = ? AND deal_ymd IN ({placeholders})",
+                (property_type, lawd_cd, *deal_ymds),
+            ).fetchall()
+
+        order = {ymd: i for i, ymd in enumerate(deal_ymds)}
+        rows.sort(key=lambda row: order[row[0]])
+        return [json.loads(item) for _, item in rows]
+
+    def monthly_trend(
+        self,
+        property_type: str,
+        lawd_cd: str,
+        start_ymd: str,
+        end_ymd: str,
+        umd_nm: Optional[str] = None,
+        name: Optional[str] = None,
+        min_area: Optional[float] = None,
+        max_area: Optional[float] = None,
+        jeonse_only: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        월별 시세 추이 (로컬 데이터만 사용, 동기화되지 않은 월은 결과에서 빠짐)
+
+        Returns:
+            [{"deal_ymd", "count", "median", "mean", "price_per_m2"}, ...] (오래된순)
+        """
+        sql = (
+            "SELECT deal_ymd, amount, area_m2 FROM rtms_transactions "
+            "WHERE property_type = ? AND lawd_cd = ? AND deal_ymd BETWEEN ? AND ? "
+            "AND cancelled = 0 AND amount > 0"
+        )
+        params: List[Any] = [property_type, lawd_cd, start_ymd, end_ymd]
+        if umd_nm:
+            sql += " AND umd_nm = ?"
+            params.append(umd_nm)
+        if name:
+            sql += " AND name = ?"
+            params.append(name)
+        if min_area is not None:
+            sql += " AND area_m2 >= ?"
+            params.append(min_area)
+        if max_area is not None:
+            sql += " AND area_m2 < ?"
+            params.append(max_area)
+        if jeonse_only:
+            sql += " AND COALESCE(monthly_rent, 0) = 0"
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        if not rows:
+            return []
+
+        months = np.array([r[0] for r in rows])
+        amounts = np.array([r[1] for r in rows], dtype=np.float64)
+        areas = np.array([r[2] if r[2] else np.nan for r in rows], dtype=np.float64)
+
+        trend = []
+        for ymd in np.unique(months):
+            mask = months == ymd
+            values = amounts[mask]
+            per_m2 = values / areas[mask]
+            per_m2 = per_m2[np.isfinite(per_m2)]
+            trend.append({
+                "deal_ymd": str(ymd),
+                "count": int(mask.sum()),
+                "median": int(np.median(values)),
+                "mean": int(values.mean()),
+                "price_per_m2": round(float(np.median(per_m2)), 1) if per_m2.size else None,
+            })
+        return trend
+
+    def coverage(self, property_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """동기화된 파티션 요약 (상품/지역별 기간, 건수)"""
+        sql = (
+            "SELECT property_type, lawd_cd, MIN(deal_ymd), MAX(deal_ymd), COUNT(*), SUM(item_count) "
+            "FROM rtms_partitions"
+        )
+        params: List[Any] = []
+        if property_type:
+            sql += " WHERE property_type = ?"
+            params.append(property_type)
+        sql += " GROUP BY property_type, lawd_cd ORDER BY property_type, lawd_cd"
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            {"property_type": r[0], "lawd_cd": r[1], "from": r[2], "to": r[3], "months": r[4], "items": r[5]}
+            for r in rows
+        ]
+
+    def partition_lock(self, property_type: str, lawd_cd: str, deal_ymd: str) -> asyncio.Lock:
+        key = (property_type, lawd_cd, deal_ymd)
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+
+# ===========================
+# 동기화
+# ===========================
+
+def source_url(property_type: str) -> str:
+    """상품 키 → data.go.kr 엔드포인트 URL (호출 한도 식별용)"""
+    source = RTMS_SOURCES[property_type]
+    module = importlib.import_module(source.module)
+    return getattr(module, source.client_class).BASE_URL
+
+
+async def fetch_partition_from_api(
+    property_type: str,
+    lawd_cd: str,
+    deal_ymd: str,
+    api_key: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    data.go.kr에서 파티션 전체 조회 (모든 페이지) → 정규화 items
+
+    오류 응답(비성공 resultCode)은 0건으로 저장되면 확정 파티션으로 남아 다시 조회되지
+    않으므로 ValueError로 올려 파티션을 동기화하지 않은 상태로 둡니다.
+    """
+    from core.data_go_kr import SUCCESS_CODES
+
+    source = RTMS_SOURCES[property_type]
+    module = importlib.import_module(source.module)
+    client = getattr(module, source.client_class)(api_key=api_key)
+    method = getattr(client, source.method)
+
+    items: List[Dict[str, Any]] = []
+    page_no = 1
+    while True:
+        result = await method(lawd_cd=lawd_cd, deal_ymd=deal_ymd, page_no=page_no, num_of_rows=PAGE_SIZE)
+        header = result.get("header") or {}
+        if header.get("resultCode") not in SUCCESS_CODES:
+            raise ValueError(
+                f"RTMS 응답 오류 ({property_type} {lawd_cd} {deal_ymd}): "
+                f"[{header.get('resultCode')}] {header.get('resultMsg')}"
+            )
+        page_items = result["body"]["items"]
+        items.extend(normalize_item(item) for item in page_items)
+
+        total_count = result["body"].get("totalCount") or 0
+        if not page_items or len(items) >= total_count:
+            break
+        page_no += 1
+
+    return items
+
+
+async def sync_partition(
+    warehouse: RTMSWarehouse,
+    property_type: str,
+    lawd_cd: str,
+    deal_ymd: str,
+    api_key: Optional[str] = None,
+    force: bool = False,
+) -> Optional[int]:
+    """
+    파티션 동기화 (신선하면 건너뜀)
+
+    Returns:
+        저장한 건수 (건너뛰면 None)
+    """
+    async with warehouse.partition_lock(property_type, lawd_cd, deal_ymd):
+        # 락 대기 중 다른 요청이 동기화했을 수 있음
+        if not force and await asyncio.to_thread(warehouse.is_fresh, property_type, lawd_cd, deal_ymd):
+            return None
+
+        items = await fetch_partition_from_api(property_type, lawd_cd, deal_ymd, api_key=api_key)
+        count = await asyncio.to_thread(warehouse.write_partition, property_type, lawd_cd, deal_ymd, items)
+        logger.info(f"RTMS 동기화: {property_type} {lawd_cd} {deal_ymd} → {count}건")
+        return count
+
+
+async def sync_region(
+    lawd_cd: str,
+    property_types: Optional[Sequence[str]] = None,
+    months: int = 24,
+    api_key: Optional[str] = None,
+    force: bool = False,
+    warehouse: Optional[RTMSWarehouse] = None,
+) -> Dict[str, int]:
+    """
+    지역 증분 동기화 (배치 작업용)
+
+    확정된 과거 파티션은 건너뛰고 새 월/미확정 월만 조회합니다.
+
+    Returns:
+        {property_type: 조회한 파티션 수}
+    """
+    warehouse = warehouse or get_rtms_warehouse()
+    property_types = property_types or list(RTMS_SOURCES)
+
+    fetched: Dict[str, int] = {}
+    for property_type in property_types:
+        fetched[property_type] = 0
+        for deal_ymd in recent_months(months):
+            try:
+                if await sync_partition(warehouse, property_type, lawd_cd, deal_ymd, api_key=api_key, force=force) is not None:
+                    fetched[property_type] += 1
+            except Exception as e:
+                logger.warning(f"RTMS 동기화 실패 ({property_type} {lawd_cd} {deal_ymd}): {e}")
+    return fetched
+
+
+async def fetch_transactions(
+    property_type: str,
+    lawd_cd: str,
+    deal_ymds: Sequence[str],
+    api_key: Optional[str] = None,
+    warehouse: Optional[RTMSWarehouse] = None,
+) -> List[Dict[str, Any]]:
+    """
+    웨어하우스 우선 거래 조회 (분석 파이프라인용)
+
+    신선하지 않은 월만 API로 동기화하고, 동기화 실패 시 저장된 데이터를 그대로 사용합니다.
+    data.go.kr 일일 예산이 부족하면 저장된 적 없는 월만 조회합니다 (오래된 파티션 그대로 사용).
+    """
+    from core.data_go_kr_quota import is_budget_low
+
+    warehouse = warehouse or get_rtms_warehouse()
+
+    stale = await asyncio.to_thread(warehouse.stale_months, property_type, lawd_cd, deal_ymds)
+    if stale and await is_budget_low(source_url(property_type)):
+        stored = [
+            ymd for ymd in stale
+            if await asyncio.to_thread(warehouse.partition_synced_at, property_type, lawd_cd, ymd)
+        ]
+        if stored:
+            logger.info(f"data.go.kr 예산 부족 → 저장된 파티션 사용: {property_type} {lawd_cd} {stored}")
+            stale = [ymd for ymd in stale if ymd not in stored]
+
+    async def sync(deal_ymd: str) -> None:
+        try:
+            await sync_partition(warehouse, property_type, lawd_cd, deal_ymd, api_key=api_key)
+        except Exception as e:
+            logger.warning(f"RTMS 조회 실패, 저장된 데이터 사용 ({property_type} {lawd_cd} {deal_ymd}): {e}")
+
+    # 월별 파티션 동시 조회 (호출 속도는 data.go.kr 토큰 버킷이 제한)
+    await asyncio.gather(*(sync(deal_ymd) for deal_ymd in stale))
+
+    items = await asyncio.to_thread(warehouse.read_items, property_type, lawd_cd, list(deal_ymds))
+    logger.info(
+        f"RTMS 웨어하우스 조회: {property_type} {lawd_cd} {len(deal_ymds)}개월 "
+        f"(API {len(stale)}개월) → {len(items)}건"
+    )
+    return items
+
+
+# 전역 웨어하우스 인스턴스
+_warehouse: RTMSWarehouse | None = None
+
+
+def get_rtms_warehouse() -> RTMSWarehouse:
+    """전역 RTMSWarehouse 인스턴스를 가져옵니다."""
+    global _warehouse
+    if _warehouse is None:
+        from core.settings import settings
+
+        _warehouse = RTMSWarehouse(
+            settings.rtms_warehouse_path,
+            settle_months=settings.rtms_warehouse_settle_months,
+            ttl_minutes=settings.rtms_warehouse_ttl_minutes,
+        )
+    return _warehouse
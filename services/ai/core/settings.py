@@ -48,6 +48,34 @@ class Settings(BaseSettings):
         """아파트 매매 기본 API 키 (data_go_kr_api_key와 동일 - 법정동과 함께 승인됨)."""
         return self.data_go_kr_api_key
 
+    # data.go.kr 호출 한도 (core/data_go_kr_quota.py)
+    public_data_quota_enabled: bool = Field(default=True, description="data.go.kr 속도 제한/일일 한도 관리 사용")
+    public_data_daily_quota: int = Field(default=10000, ge=0, description="API(서비스)별 기본 일일 호출 한도")
+    public_data_daily_quotas: dict[str, int] = Field(
+        default_factory=dict,
+        description='API별 일일 한도 (JSON, 예: {"RTMSDataSvcAptTradeDev": 1000})'
+    )
+    public_data_rate_per_sec: float = Field(default=8.0, gt=0, description="API별 초당 호출 수 (워커 단위)")
+    public_data_rate_burst: int = Field(default=16, ge=1, description="API별 순간 최대 호출 수")
+    public_data_rate_max_wait_sec: float = Field(default=10.0, ge=0, description="속도 제한 시 최대 대기 시간 (초)")
+    public_data_low_budget_ratio: float = Field(
+        default=0.1, ge=0.0, le=1.0,
+        description="남은 일일 예산 비율이 이보다 낮으면 저장된 데이터 우선 사용"
+    )
+
+    # 업스트림 엔드포인트 서킷 브레이커 (core/endpoint_health.py)
+    endpoint_breaker_failure_threshold: int = Field(default=2, ge=1, description="연속 실패 횟수 → 엔드포인트 건너뜀")
+    endpoint_breaker_open_sec: float = Field(default=120.0, gt=0, description="건너뛴 엔드포인트 회복 확인 주기 (초)")
+
+    # 공공데이터 동시 호출 (core/fanout.py)
+    public_data_call_timeout_sec: float = Field(default=30.0, gt=0, description="공공데이터 API 호출별 제한 시간 (초)")
+    public_data_max_concurrency: int = Field(default=8, ge=1, description="공공데이터 API 동시 호출 수")
+
+    # 주소 변환 캐시 (core/address_converter.py)
+    address_cache_size: int = Field(default=4096, ge=0, description="주소 변환 메모 캐시 최대 항목 수 (0이면 비활성)")
+    address_cache_ttl_sec: float = Field(default=86400.0, gt=0, description="주소 변환 캐시 TTL (법정동코드는 거의 바뀌지 않음)")
+    address_max_concurrency: int = Field(default=4, ge=1, description="convert_many 동시 API 조회 수")
+
     # OAuth Configuration (MVP 선택사항)
     # Kakao OAuth
     kakao_client_id: str | None = Field(default=None, description="카카오 클라이언트 ID")
@@ -110,6 +138,53 @@ class Settings(BaseSettings):
         default=1536,
         description="Embedding dimensions (1536 for small, 3072 for large)"
     )
+    embed_backend: Literal["openai", "local"] = Field(
+        default="openai",
+        description="Embedding backend: openai (API) or local (sentence-transformers on CPU)"
+    )
+    local_embed_model: str = Field(
+        default="intfloat/multilingual-e5-small",
+        description="sentence-transformers model for the local embedding backend"
+    )
+    local_embed_onnx_file: str | None = Field(
+        default=None,
+        description="ONNX model file inside the model repo (e.g. onnx/model_qint8_avx2.onnx); None = PyTorch"
+    )
+    local_embed_batch_tokens: int = Field(
+        default=8192,
+        ge=256,
+        description="Approximate token budget per local encode batch (dynamic batch size)"
+    )
+    embed_query_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="LRU cache size for query embeddings (0 = disabled)"
+    )
+    retrieval_search_type: Literal["similarity", "mmr", "hybrid"] = Field(
+        default="hybrid",
+        description="Default retriever: vector similarity, MMR, or hybrid (vector + Postgres full-text, RRF)"
+    )
+    retrieval_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="LRU cache entries for retrieval results (0 = disabled)"
+    )
+    retrieval_cache_ttl_sec: int = Field(
+        default=300,
+        ge=1,
+        description="TTL for cached retrieval results (cross-process upserts are not signalled)"
+    )
+    embed_batch_size: int = Field(
+        default=64,
+        ge=1,
+        le=2048,
+        description="Chunks per embedding request during ingest"
+    )
+    embed_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum concurrent embedding requests during ingest"
+    )
 
     # Model Parameters
     llm_temperature: float = Field(
@@ -136,6 +211,51 @@ class Settings(BaseSettings):
         default="high",
         description="Vision API detail level (high for OCR, low for cost savings)"
     )
+    page_render_dpi: int = Field(
+        default=200,
+        ge=72,
+        le=400,
+        description="Default OCR render DPI (core/page_render.py, adaptive per page)"
+    )
+    page_render_dpi_min: int = Field(
+        default=150,
+        ge=72,
+        le=400,
+        description="Render DPI for sparse pages"
+    )
+    page_render_dpi_max: int = Field(
+        default=250,
+        ge=72,
+        le=400,
+        description="Render DPI for dense small-print pages"
+    )
+    page_render_format: Literal["jpeg", "webp", "png"] = Field(
+        default="jpeg",
+        description="Encoding for rendered OCR pages"
+    )
+    page_render_quality: int = Field(
+        default=85,
+        ge=30,
+        le=100,
+        description="JPEG/WebP quality for rendered OCR pages"
+    )
+    page_render_cache_mb: int = Field(
+        default=128,
+        ge=0,
+        description="In-memory cache size for rendered pages, keyed by document hash"
+    )
+    vision_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Concurrent page extraction calls for multi-page scanned contracts"
+    )
+    vision_page_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        le=5,
+        description="Attempts per page before the page is dropped from the merge"
+    )
 
     # Streaming Timeouts
     draft_timeout_sec: int = Field(
@@ -151,12 +271,149 @@ class Settings(BaseSettings):
         description="Claude Sonnet validation timeout (seconds)"
     )
 
+    # POST /analyze 요청 기한 (core/llm_router.call_with_deadline)
+    analyze_attempt_timeout_sec: float = Field(default=40.0, gt=0, description="분석 시도 1회 제한 시간 (초, 초과 시 호출 취소)")
+    analyze_deadline_sec: float = Field(default=110.0, gt=0, description="재시도 포함 분석 요청 전체 기한 (초)")
+    analyze_max_attempts: int = Field(default=3, ge=1, description="분석 시도 횟수")
+
+    # LLM 클라이언트 커넥션 풀 (core/llm_clients.py, 제공자별 공유)
+    llm_pool_max_connections: int = Field(default=100, ge=1, description="제공자별 최대 동시 연결 수")
+    llm_pool_max_keepalive: int = Field(default=20, ge=0, description="제공자별 유지할 유휴 연결 수")
+    llm_pool_keepalive_expiry_sec: float = Field(
+        default=60.0,
+        ge=0,
+        description="유휴 연결 유지 시간 (초) - 요청 간격이 이보다 짧으면 TCP/TLS 핸드셰이크 생략"
+    )
+
+    # LLM 동시 호출 제어 (core/llm_governor.py, 제공자별, 워커 단위)
+    llm_governor_enabled: bool = Field(default=True, description="LLM 호출 예산/우선순위 대기열 사용")
+    llm_max_concurrency: dict[str, int] = Field(
+        default_factory=lambda: {"openai": 32, "claude": 16, "gemini": 8},
+        description="제공자별 최대 동시 요청 수 (429 응답 시 자동으로 줄었다가 회복)"
+    )
+    llm_requests_per_min: dict[str, int] = Field(
+        default_factory=lambda: {"openai": 500, "claude": 50, "gemini": 60},
+        description="제공자별 분당 요청 수"
+    )
+    llm_tokens_per_min: dict[str, int] = Field(
+        default_factory=lambda: {"openai": 200_000, "claude": 40_000, "gemini": 1_000_000},
+        description="제공자별 분당 토큰 수 (프롬프트 추정 + max_tokens)"
+    )
+    llm_queue_max_wait_sec: dict[str, float] = Field(
+        default_factory=lambda: {"interactive": 30.0, "analysis": 120.0, "background": 300.0},
+        description="우선순위별 대기열 최대 대기 시간 (초, 초과 시 LLMQueueTimeoutError)"
+    )
+    llm_priority_aging_sec: float = Field(
+        default=10.0, gt=0, description="대기 시간이 이만큼 지날 때마다 우선순위 한 단계 상승 (기아 방지)"
+    )
+
+    # LLM 헤징 (core/dual_provider.py HedgeRouter) - 주 제공자가 느리면 보조 제공자에도 요청
+    llm_hedge_enabled: bool = Field(default=True, description="첫 토큰 지연 기반 헤징 사용")
+    llm_hedge_percentile: float = Field(
+        default=0.95, gt=0.0, le=1.0, description="헤징 기준: 호출부별 최근 첫 토큰 지연의 백분위"
+    )
+    llm_hedge_min_samples: int = Field(default=20, ge=1, description="백분위 계산에 필요한 최소 표본 수")
+    llm_hedge_default_delay_sec: float = Field(default=2.0, gt=0, description="표본이 부족할 때 헤징 대기 시간 (초)")
+    llm_hedge_min_delay_sec: float = Field(default=0.3, ge=0, description="헤징 대기 시간 하한 (초)")
+    llm_hedge_max_ratio: float = Field(
+        default=0.2, ge=0.0, le=1.0, description="최근 요청 중 헤징 비율 상한 (초과 시 주 제공자만 대기, 비용 제한)"
+    )
+    llm_breaker_failure_threshold: int = Field(
+        default=3, ge=1, description="연속 실패/헤징 패배 횟수 → 해당 제공자 건너뜀"
+    )
+    llm_breaker_open_sec: float = Field(default=60.0, gt=0, description="건너뛴 제공자 회복 확인 주기 (초)")
+
+    # LLM 응답 캐시 (core/llm_cache.py) - 같은 프롬프트의 리포트 초안/검증 재사용
+    llm_cache_enabled: bool = Field(default=True, description="LLM 응답 캐시 사용 (요청별 bypass_cache로 우회)")
+    llm_cache_ttl_sec: float = Field(default=86400.0, gt=0, description="캐시 항목 유효 시간 (초, 메모리/Postgres 공통)")
+    llm_cache_memory_size: int = Field(default=256, ge=0, description="워커별 메모리 캐시 최대 항목 수")
+    llm_cache_persist: bool = Field(default=True, description="Postgres v2_llm_response_cache에도 저장 (워커/재시작 간 공유)")
+    llm_cache_replay_chunk_chars: int = Field(default=100, ge=1, description="캐시 응답 재생 시 이벤트당 글자 수")
+    llm_cache_replay_interval_sec: float = Field(
+        default=0.05, ge=0, description="캐시 응답 재생 이벤트 간격 (초) - 실제 스트리밍과 비슷한 진행 표시"
+    )
+
+    # 프롬프트 토큰 예산 (core/prompt_budget.py) - 모델별 최대 입력 크기 보장
+    llm_max_input_tokens: dict[str, int] = Field(
+        default_factory=lambda: {
+            "gpt-4o-mini": 6000,
+            "gpt-4o": 6000,
+            "claude-3-5-sonnet": 8000,
+            "claude-3-5-haiku": 6000,
+        },
+        description="모델별 최대 입력 토큰 (정확한 이름 또는 접두사, 초과 시 낮은 우선순위 섹션부터 압축/제외)"
+    )
+    llm_max_input_tokens_default: int = Field(default=6000, ge=256, description="목록에 없는 모델의 최대 입력 토큰")
+    llm_judge_draft_max_tokens: int = Field(
+        default=3000, ge=100, description="검증 프롬프트에 넣는 초안 최대 토큰 (초과 시 앞/뒤만 남기고 중략)"
+    )
+    chat_history_max_tokens: int = Field(
+        default=1500, ge=0, description="/chat/stream 컨텍스트의 최근 대화 최대 토큰 (오래된 메시지부터 제외)"
+    )
+
     # Dual Streaming Control
     dual_llm_streaming_enabled: bool = Field(
         default=True,
         description="Enable parallel Draft + Judge LLM streaming for /api/chat/stream"
     )
 
+    # Chat history
+    chat_history_limit: int = Field(
+        default=5,
+        ge=1,
+        le=50,
+        description="Number of recent messages loaded as context for /chat/stream"
+    )
+
+    # RTMS 실거래가 로컬 웨어하우스
+    rtms_warehouse_path: str = Field(
+        default="/tmp/zipcheck/rtms_warehouse.db",
+        description="SQLite file for locally stored RTMS transactions (core/rtms_warehouse.py)"
+    )
+    rtms_warehouse_settle_months: int = Field(
+        default=3,
+        ge=1,
+        description="Months after the contract month after which a partition is treated as final"
+    )
+    rtms_warehouse_ttl_minutes: int = Field(
+        default=360,
+        ge=1,
+        description="Refresh interval for partitions that are not final yet (current/recent months)"
+    )
+
+    # Multi-product market query (core/market_query.py)
+    market_query_cache_size: int = Field(
+        default=512,
+        ge=0,
+        description="Max cached (product, region, period) transaction sets"
+    )
+    market_query_cache_ttl_sec: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds a cached transaction set is reused before re-reading the warehouse"
+    )
+
+    # Startup warm-up (core/warmup.py, GET /ready)
+    warmup_enabled: bool = Field(
+        default=True,
+        description="Run the parallel warm-up phase at startup; /ready returns 503 until it finishes"
+    )
+    warmup_step_timeout_sec: float = Field(
+        default=20.0,
+        gt=0,
+        description="Per-step warm-up timeout (a timed-out step does not block readiness)"
+    )
+
+    # Optional routers (not needed for user traffic; off → smaller cold start)
+    enable_dev_routes: bool = Field(
+        default=True,
+        description="Mount /dev debugging endpoints (routes/dev.py)"
+    )
+    enable_test_routes: bool = Field(
+        default=True,
+        description="Mount /api-tester and /crawler-test tool endpoints"
+    )
+
     # API Configuration
     ai_allowed_origins: str = Field(
         default="*",
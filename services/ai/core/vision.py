@@ -1,13 +1,17 @@
 """GPT-4o Vision API for scanned PDF processing with Structured Outputs."""
+import asyncio
 import base64
 import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from pydantic import BaseModel, Field
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
 
+from .llm_clients import get_chat_model
 from .settings import settings
 
 logger = logging.getLogger(__name__)
@@ -61,29 +65,95 @@ class RealEstateContract(BaseModel):
     original_text: str | None = Field(default=None, description="원본 텍스트 (필요시)")
 
 
-def encode_image_to_base64(image_path: str) -> str:
+# 이미지 입력: 파일 경로 또는 메모리 버퍼 (PNG/JPEG/WebP bytes)
+ImageInput = Union[str, bytes]
+
+EXTRACTION_PROMPT = """다음은 부동산 계약서 이미지입니다.
+계약서에서 모든 정보를 정확하게 추출하여 구조화된 JSON으로 반환하세요.
+
+주의사항:
+- 모든 날짜는 YYYY-MM-DD 형식으로 변환하세요
+- 금액은 숫자만 입력하세요 (쉼표 제외, 예: 50000000)
+- 확실하지 않은 정보는 null로 표시하세요
+- 특약 사항은 모두 추출하세요
+"""
+
+
+def encode_image_to_base64(image: ImageInput) -> str:
     """
-    이미지 파일을 base64로 인코딩합니다.
+    이미지 파일(또는 메모리 버퍼)을 base64로 인코딩합니다.
 
     Args:
-        image_path: 이미지 파일 경로
+        image: 이미지 파일 경로 또는 이미지 bytes
 
     Returns:
         base64 인코딩된 문자열
     """
-    with open(image_path, "rb") as f:
+    if isinstance(image, bytes):
+        return base64.b64encode(image).decode("utf-8")
+    with open(image, "rb") as f:
         return base64.b64encode(f.read()).decode("utf-8")
 
 
+def _image_mime_type(image: ImageInput) -> str:
+    """매직 바이트(버퍼) 또는 확장자(경로)로 MIME 타입 판별 (기본 PNG)"""
+    if isinstance(image, bytes):
+        if image[:3] == b"\xff\xd8\xff":
+            return "image/jpeg"
+        if image[:4] == b"RIFF" and image[8:12] == b"WEBP":
+            return "image/webp"
+        return "image/png"
+    suffix = Path(image).suffix.lower()
+    return {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp"}.get(suffix, "image/png")
+
+
+def _image_label(image: ImageInput) -> str:
+    return f"<{len(image):,} bytes>" if isinstance(image, bytes) else image
+
+
+def _check_image(image: ImageInput) -> None:
+    if isinstance(image, str) and not Path(image).exists():
+        raise FileNotFoundError(f"이미지 파일을 찾을 수 없음: {image}")
+
+
+def _build_extraction_message(image: ImageInput, detail: str) -> HumanMessage:
+    """Vision API 메시지 구성 (추출 프롬프트 + data URL 이미지)"""
+    base64_image = encode_image_to_base64(image)
+    return HumanMessage(
+        content=[
+            {"type": "text", "text": EXTRACTION_PROMPT},
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:{_image_mime_type(image)};base64,{base64_image}",
+                    "detail": detail,
+                },
+            },
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_structured_llm():
+    """GPT-4o Vision + Structured Outputs (프로세스 내 재사용, HTTP 커넥션 풀 공유)"""
+    llm = get_chat_model(
+        "openai",
+        settings.openai_vision_model,
+        temperature=0.0,  # 정확한 추출을 위해 0으로 설정
+        max_tokens=settings.vision_max_tokens,
+    )
+    return llm.with_structured_output(RealEstateContract)
+
+
 def extract_contract_with_vision(
-    image_path: str,
+    image_path: ImageInput,
     detail: str | None = None,
 ) -> Dict[str, Any]:
     """
     GPT-4o Vision API로 스캔된 계약서를 구조화된 JSON으로 추출합니다.
 
     Args:
-        image_path: 계약서 이미지 파일 경로 (PDF → PNG 변환 필요)
+        image_path: 계약서 이미지 파일 경로 또는 이미지 bytes (PDF 페이지 렌더링 결과)
         detail: Vision API detail level ("low", "high", "auto")
 
     Returns:
@@ -98,56 +168,19 @@ def extract_contract_with_vision(
         >>> print(result["property"]["address"])
         >>> print(result["terms"]["deposit"])
     """
-    if not Path(image_path).exists():
-        raise FileNotFoundError(f"이미지 파일을 찾을 수 없음: {image_path}")
+    _check_image(image_path)
 
     detail = detail or settings.vision_detail
-    logger.info(f"Vision API 호출: {image_path}, detail={detail}")
-
-    # 이미지를 base64로 인코딩
-    base64_image = encode_image_to_base64(image_path)
-
-    # GPT-4o Vision LLM 생성 (Structured Outputs 지원)
-    llm = ChatOpenAI(
-        model=settings.openai_vision_model,
-        temperature=0.0,  # 정확한 추출을 위해 0으로 설정
-        max_tokens=settings.vision_max_tokens,
-        api_key=settings.openai_api_key,
-    )
-
-    # Structured Outputs 활성화
-    structured_llm = llm.with_structured_output(RealEstateContract)
+    label = _image_label(image_path)
+    logger.info(f"Vision API 호출: {label}, detail={detail}")
 
-    # Vision API 메시지 구성
-    message = HumanMessage(
-        content=[
-            {
-                "type": "text",
-                "text": """다음은 부동산 계약서 이미지입니다.
-계약서에서 모든 정보를 정확하게 추출하여 구조화된 JSON으로 반환하세요.
-
-주의사항:
-- 모든 날짜는 YYYY-MM-DD 형식으로 변환하세요
-- 금액은 숫자만 입력하세요 (쉼표 제외, 예: 50000000)
-- 확실하지 않은 정보는 null로 표시하세요
-- 특약 사항은 모두 추출하세요
-""",
-            },
-            {
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/png;base64,{base64_image}",
-                    "detail": detail,
-                },
-            },
-        ]
-    )
+    message = _build_extraction_message(image_path, detail)
 
     try:
         # Structured Outputs로 응답 받기
-        result = structured_llm.invoke([message])
+        result = _get_structured_llm().invoke([message])
 
-        logger.info(f"Vision API 성공: {image_path}")
+        logger.info(f"Vision API 성공: {label}")
         return result.model_dump()
 
     except Exception as e:
@@ -155,67 +188,186 @@ def extract_contract_with_vision(
         raise ValueError(f"Vision API 처리 실패: {str(e)}")
 
 
-def extract_contract_from_pdf_images(
-    image_paths: List[str],
+async def aextract_contract_with_vision(
+    image: ImageInput,
+    detail: str | None = None,
+) -> Dict[str, Any]:
+    """
+    extract_contract_with_vision의 비동기 버전 (이벤트 루프 블로킹 없음).
+
+    Raises:
+        FileNotFoundError: 이미지 파일을 찾을 수 없음
+        ValueError: Vision API 처리 실패
+    """
+    _check_image(image)
+
+    detail = detail or settings.vision_detail
+    # base64 인코딩은 수 MB 단위일 수 있어 스레드에서 처리
+    message = await asyncio.to_thread(_build_extraction_message, image, detail)
+
+    try:
+        result = await _get_structured_llm().ainvoke([message])
+        return result.model_dump()
+    except Exception as e:
+        raise ValueError(f"Vision API 처리 실패: {str(e)}")
+
+
+class ContractPageMerger:
+    """
+    페이지 결과 점진 병합기
+
+    페이지는 완료 순서대로 add() 되지만, 병합은 페이지 순서대로 진행됩니다
+    (앞 페이지가 끝나는 즉시 이어지는 완료 페이지까지 병합, 실패 페이지는 건너뜀).
+    첫 번째 성공 페이지를 기준으로 나머지 페이지의 특약/당사자 정보를 추가합니다.
+    """
+
+    def __init__(self, page_count: int):
+        self.page_count = page_count
+        self.merged: Dict[str, Any] | None = None
+        self.pages: Dict[int, Dict[str, Any] | None] = {}
+        self._next = 0
+
+    def add(self, index: int, page_data: Dict[str, Any] | None) -> None:
+        """index번째 페이지 결과 추가 (None = 실패 페이지)"""
+        self.pages[index] = page_data
+        while self._next in self.pages:
+            data = self.pages[self._next]
+            if data is not None:
+                self._merge(data)
+            self._next += 1
+
+    def _merge(self, page_data: Dict[str, Any]) -> None:
+        if self.merged is None:
+            self.merged = page_data
+            return
+
+        # 특약 사항 병합
+        self.merged["special_provisions"].extend(page_data.get("special_provisions", []))
+
+        # 당사자 정보 병합 (중복 제거)
+        existing_parties = {p["name"] for p in self.merged["parties"]}
+        for party in page_data.get("parties", []):
+            if party["name"] not in existing_parties:
+                self.merged["parties"].append(party)
+
+    @property
+    def results(self) -> List[Dict[str, Any]]:
+        """성공한 페이지 결과 (페이지 순서)"""
+        return [self.pages[i] for i in sorted(self.pages) if self.pages[i] is not None]
+
+
+async def _extract_page_with_retry(
+    index: int,
+    image: ImageInput,
+    semaphore: asyncio.Semaphore,
+    max_attempts: int,
+) -> Dict[str, Any] | None:
+    """페이지 하나 추출 (실패 시 해당 페이지만 지수 백오프 재시도, 최종 실패 시 None)"""
+    for attempt in range(1, max_attempts + 1):
+        try:
+            async with semaphore:
+                return await aextract_contract_with_vision(image)
+        except FileNotFoundError as e:
+            logger.warning(f"페이지 {index + 1} 처리 실패: {e}")
+            return None
+        except Exception as e:
+            if attempt == max_attempts:
+                logger.warning(f"페이지 {index + 1} 처리 실패 ({attempt}회 시도): {e}")
+                return None
+            delay = min(2 ** (attempt - 1), 8) + random.uniform(0, 0.5)
+            logger.info(f"페이지 {index + 1} 재시도 {attempt}/{max_attempts - 1} ({delay:.1f}s 후): {e}")
+            await asyncio.sleep(delay)
+    return None
+
+
+async def aextract_contract_from_pages(
+    images: List[ImageInput],
     combine: bool = True,
+    max_concurrency: int | None = None,
+    max_attempts: int | None = None,
 ) -> Dict[str, Any] | List[Dict[str, Any]]:
     """
-    여러 페이지의 계약서 이미지를 처리합니다.
+    여러 페이지의 계약서 이미지를 동시에 처리합니다.
 
     Args:
-        image_paths: 계약서 이미지 파일 경로 목록 (페이지 순서대로)
+        images: 페이지 이미지 (파일 경로 또는 bytes, 페이지 순서대로)
         combine: True면 모든 페이지 정보를 하나로 병합, False면 페이지별 반환
+        max_concurrency: 동시 Vision 호출 수 (기본값: settings.vision_max_concurrency)
+        max_attempts: 페이지별 최대 시도 횟수 (기본값: settings.vision_page_max_attempts)
 
     Returns:
         combine=True: 병합된 계약서 데이터
         combine=False: 페이지별 계약서 데이터 목록
 
-    Example:
-        >>> images = ["page1.png", "page2.png"]
-        >>> result = extract_contract_from_pdf_images(images)
-        >>> print(result["parties"])
+    Raises:
+        ValueError: 모든 페이지 처리 실패
     """
-    results = []
+    semaphore = asyncio.Semaphore(max_concurrency or settings.vision_max_concurrency)
+    attempts = max_attempts or settings.vision_page_max_attempts
+    merger = ContractPageMerger(len(images))
 
-    for i, image_path in enumerate(image_paths, 1):
-        logger.info(f"페이지 {i}/{len(image_paths)} 처리 중: {image_path}")
-        try:
-            result = extract_contract_with_vision(image_path)
-            results.append(result)
-        except Exception as e:
-            logger.warning(f"페이지 {i} 처리 실패: {e}")
-            continue
+    async def run(index: int, image: ImageInput):
+        return index, await _extract_page_with_retry(index, image, semaphore, attempts)
 
-    if not results:
+    tasks = [asyncio.create_task(run(i, image)) for i, image in enumerate(images)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            index, page_data = await finished
+            logger.info(f"페이지 {index + 1}/{len(images)} {'완료' if page_data else '실패'}")
+            merger.add(index, page_data)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if merger.merged is None:
         raise ValueError("모든 페이지 처리 실패")
 
     if not combine:
-        return results
+        return merger.results
 
-    # 여러 페이지 정보를 하나로 병합
-    # 첫 페이지를 기준으로 하고 나머지 페이지의 특약/당사자 정보 추가
-    merged = results[0]
+    logger.info(f"총 {len(merger.results)}개 페이지 병합 완료")
+    return merger.merged
 
-    for page_data in results[1:]:
-        # 특약 사항 병합
-        merged["special_provisions"].extend(page_data.get("special_provisions", []))
 
-        # 당사자 정보 병합 (중복 제거)
-        existing_parties = {p["name"] for p in merged["parties"]}
-        for party in page_data.get("parties", []):
-            if party["name"] not in existing_parties:
-                merged["parties"].append(party)
+def _run_coroutine_sync(coro):
+    """동기 호출부용: 실행 중인 이벤트 루프가 있으면 별도 스레드에서 실행"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
-    logger.info(f"총 {len(results)}개 페이지 병합 완료")
-    return merged
 
+def extract_contract_from_pdf_images(
+    image_paths: List[ImageInput],
+    combine: bool = True,
+) -> Dict[str, Any] | List[Dict[str, Any]]:
+    """
+    여러 페이지의 계약서 이미지를 처리합니다 (aextract_contract_from_pages 동기 래퍼).
 
-def classify_document_type(image_path: str) -> str:
+    Args:
+        image_paths: 계약서 이미지 파일 경로 또는 bytes 목록 (페이지 순서대로)
+        combine: True면 모든 페이지 정보를 하나로 병합, False면 페이지별 반환
+
+    Returns:
+        combine=True: 병합된 계약서 데이터
+        combine=False: 페이지별 계약서 데이터 목록
+
+    Example:
+        >>> images = ["page1.png", "page2.png"]
+        >>> result = extract_contract_from_pdf_images(images)
+        >>> print(result["parties"])
+    """
+    return _run_coroutine_sync(aextract_contract_from_pages(image_paths, combine=combine))
+
+
+def classify_document_type(image_path: ImageInput) -> str:
     """
     GPT-4o-mini로 문서 유형을 빠르게 분류합니다.
 
     Args:
-        image_path: 문서 이미지 파일 경로
+        image_path: 문서 이미지 파일 경로 또는 이미지 bytes
 
     Returns:
         문서 유형: "real_estate_contract", "lease_contract", "sales_contract",
@@ -226,18 +378,12 @@ def classify_document_type(image_path: str) -> str:
         >>> if doc_type == "real_estate_contract":
         >>>     result = extract_contract_with_vision("doc.png")
     """
-    if not Path(image_path).exists():
-        raise FileNotFoundError(f"이미지 파일을 찾을 수 없음: {image_path}")
+    _check_image(image_path)
 
     base64_image = encode_image_to_base64(image_path)
 
     # GPT-4o-mini로 빠른 분류
-    llm = ChatOpenAI(
-        model=settings.openai_classification_model,
-        temperature=0.0,
-        max_tokens=50,
-        api_key=settings.openai_api_key,
-    )
+    llm = get_chat_model("openai", settings.openai_classification_model, temperature=0.0, max_tokens=50)
 
     message = HumanMessage(
         content=[
@@ -254,7 +400,7 @@ def classify_document_type(image_path: str) -> str:
             {
                 "type": "image_url",
                 "image_url": {
-                    "url": f"data:image/png;base64,{base64_image}",
+                    "url": f"data:{_image_mime_type(image_path)};base64,{base64_image}",
                     "detail": "low",  # 분류는 저해상도로 충분
                 },
             },
@@ -264,7 +410,7 @@ def classify_document_type(image_path: str) -> str:
     try:
         response = llm.invoke([message])
         doc_type = response.content.strip().lower()
-        logger.info(f"문서 분류: {image_path} → {doc_type}")
+        logger.info(f"문서 분류: {_image_label(image_path)} → {doc_type}")
         return doc_type
     except Exception as e:
         logger.error(f"문서 분류 실패: {e}")
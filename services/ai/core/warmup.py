@@ -0,0 +1,227 @@
+"""
+서비스 워밍업 (lifespan 시작 후 백그라운드 실행, /ready로 트래픽 게이트)
+
+첫 사용자 요청이 떠안던 초기화 비용을 미리 병렬로 처리합니다:
+- DB 커넥션 풀 (SQLAlchemy 엔진 + 첫 커넥션)
+- Supabase 클라이언트 (service role / anon)
+- 암호화 키 (PBKDF2 100,000회 파생)
+- Supabase JWKS (JWT 서명 검증 공개키)
+- LLM 클라이언트 (LangChain/OpenAI SDK import + 클라이언트 생성)
+- 등기부 파서 정규식 (샘플 텍스트로 re 캐시 채움)
+- 로컬 인덱스 (RTMS 웨어하우스 SQLite, 로컬 임베딩 모델)
+
+단계별 소요 시간은 로그와 GET /ready 응답으로 확인합니다.
+실패한 단계는 기록만 하고 준비 완료를 막지 않습니다 (첫 사용 시 다시 시도됨).
+"""
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupStep:
+    name: str
+    status: str = "pending"  # pending | ok | skipped | failed | timeout
+    duration_ms: float = 0.0
+    detail: Optional[str] = None
+
+
+@dataclass
+class WarmupState:
+    started: bool = False
+    finished: bool = False
+    total_ms: float = 0.0
+    steps: List[WarmupStep] = field(default_factory=list)
+
+    @property
+    def ready(self) -> bool:
+        return self.finished or not settings.warmup_enabled
+
+    def to_dict(self) -> Dict:
+        return {
+            "ready": self.ready,
+            "started": self.started,
+            "total_ms": round(self.total_ms, 1),
+            "steps": [asdict(step) for step in self.steps],
+        }
+
+
+class SkipStep(Exception):
+    """설정 미비 등으로 건너뛰는 단계"""
+
+
+# ===========================
+# 워밍업 단계
+# ===========================
+
+def _warm_db_pool() -> str:
+    from sqlalchemy import text
+    from .database import get_engine
+
+    with get_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+    return "pool connected"
+
+
+def _warm_supabase() -> str:
+    if not settings.supabase_url:
+        raise SkipStep("SUPABASE_URL not set")
+    from .supabase_client import get_supabase_client
+
+    clients = []
+    if settings.supabase_service_role_key:
+        get_supabase_client(service_role=True)
+        clients.append("service_role")
+    if settings.supabase_anon_key:
+        get_supabase_client()
+        clients.append("anon")
+    if not clients:
+        raise SkipStep("no Supabase keys")
+    return ", ".join(clients)
+
+
+def _warm_encryption() -> str:
+    if not settings.encryption_key:
+        raise SkipStep("ENCRYPTION_KEY not set")
+    from .encryption import get_encryption_manager
+
+    get_encryption_manager()
+    return "key derived"
+
+
+def _warm_jwks() -> str:
+    from .auth import JWKS_URL, get_jwks
+
+    if not JWKS_URL:
+        raise SkipStep("SUPABASE_URL not set")
+    keys = get_jwks().get("keys", [])
+    return f"{len(keys)} keys"
+
+
+def _warm_llm_clients() -> str:
+    from .llm_factory import create_llm
+
+    create_llm(provider="openai")
+    warmed = ["openai"]
+    if settings.anthropic_api_key:
+        create_llm(provider="claude")
+        warmed.append("claude")
+    # 체인/하이브리드 검색 모듈 (LangChain 프롬프트, PGVector)
+    from . import chains  # noqa: F401
+
+    return ", ".join(warmed)
+
+
+_SAMPLE_REGISTRY = """등기사항전부증명서(말소사항 포함) - 집합건물
+[집합건물] 서울특별시 강남구 역삼동 123-45 래미안아파트 제101동 제1001호
+【 표 제 부 】 (전유부분의 건물의 표시)
+1 2015년3월2일 제10층 제1001호 철근콘크리트구조 84.95㎡
+【 갑 구 】 (소유권에 관한 사항)
+1 소유권보존 2015년3월2일 제12345호 소유자 홍길동 800101-*******
+2 압류 2023년5월1일 제5555호 권리자 국민건강보험공단
+【 을 구 】 (소유권 이외의 권리에 관한 사항)
+1 근저당권설정 2020년6월1일 제23456호 채권최고액 금360,000,000원 채무자 홍길동 근저당권자 주식회사국민은행
+2 전세권설정 2021년1월5일 제34567호 전세금 금200,000,000원
+"""
+
+
+def _warm_parser_patterns() -> str:
+    # 파서 정규식은 인라인 re.search 호출 → 샘플 파싱으로 re 모듈 캐시에 컴파일
+    from ingest.registry_parser import parse_with_regex
+
+    parse_with_regex(_SAMPLE_REGISTRY)
+    return "registry patterns compiled"
+
+
+def _warm_local_indexes() -> str:
+    from .rtms_warehouse import get_rtms_warehouse
+
+    warmed = [f"rtms_warehouse({len(get_rtms_warehouse().coverage())} partitions)"]
+    if settings.embed_backend != "openai":
+        from .embeddings import get_embedder
+
+        get_embedder().embed_query("워밍업")
+        warmed.append(f"{settings.embed_backend} embedder")
+    return ", ".join(warmed)
+
+
+WARMUP_STEPS: List[Tuple[str, Callable[[], str]]] = [
+    ("db_pool", _warm_db_pool),
+    ("supabase_client", _warm_supabase),
+    ("encryption_key", _warm_encryption),
+    ("jwks", _warm_jwks),
+    ("llm_clients", _warm_llm_clients),
+    ("parser_patterns", _warm_parser_patterns),
+    ("local_indexes", _warm_local_indexes),
+]
+
+
+# ===========================
+# 실행
+# ===========================
+
+_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    return _state
+
+
+async def _run_step(step: WarmupStep, func: Callable[[], str], timeout_sec: float) -> None:
+    start = time.perf_counter()
+    try:
+        # 블로킹 I/O / CPU 작업 → 스레드에서 병렬 실행
+        step.detail = await asyncio.wait_for(asyncio.to_thread(func), timeout=timeout_sec)
+        step.status = "ok"
+    except SkipStep as e:
+        step.status = "skipped"
+        step.detail = str(e)
+    except asyncio.TimeoutError:
+        step.status = "timeout"
+        step.detail = f"> {timeout_sec:.1f}s"
+    except Exception as e:
+        step.status = "failed"
+        step.detail = f"{type(e).__name__}: {e}"
+    step.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    log = logger.warning if step.status in ("failed", "timeout") else logger.info
+    log(f"[warmup] {step.name}: {step.status} ({step.duration_ms:.0f}ms) {step.detail or ''}")
+
+
+async def run_warmup(
+    steps: Optional[List[Tuple[str, Callable[[], str]]]] = None,
+    timeout_sec: Optional[float] = None,
+) -> WarmupState:
+    """
+    모든 워밍업 단계를 병렬 실행하고 완료 후 준비 상태로 전환
+
+    Args:
+        steps: (이름, 함수) 목록 (기본값: WARMUP_STEPS)
+        timeout_sec: 단계별 제한 시간 (기본값: settings.warmup_step_timeout_sec)
+    """
+    steps = steps if steps is not None else WARMUP_STEPS
+    timeout_sec = timeout_sec or settings.warmup_step_timeout_sec
+
+    _state.started = True
+    _state.finished = False
+    _state.steps = [WarmupStep(name) for name, _ in steps]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _run_step(step, func, timeout_sec) for step, (_, func) in zip(_state.steps, steps)
+    ))
+    _state.total_ms = (time.perf_counter() - start) * 1000
+    _state.finished = True
+
+    failed = [s.name for s in _state.steps if s.status in ("failed", "timeout")]
+    logger.info(
+        f"[warmup] 완료 {_state.total_ms:.0f}ms"
+        + (f" (실패: {', '.join(failed)})" if failed else "")
+    )
+    return _state
@@ -212,12 +212,13 @@ async def collect_public_data(
         PublicDataResult: 수집 결과
     """
     from core.supabase_client import get_supabase_client
-    from core.public_data_api import AptTradeAPIClient, LegalDongCodeAPIClient, AptRentAPIClient
+    from core.public_data_api import LegalDongCodeAPIClient
     from core.address_converter import AddressConverter
     from core.building_ledger_api import BuildingLedgerAPIClient
+    from core.market_stats import summarize_market
+    from core.rtms_warehouse import fetch_transactions, recent_months
     from core.settings import settings
     from datetime import datetime
-    from dateutil.relativedelta import relativedelta
 
     with StepLogger(case_id, "collect_public_data", {"force": force}):
         start_time = datetime.now()
@@ -363,153 +364,58 @@ async def collect_public_data(
                 else:
                     errors.append("법정동코드 조회 실패")
 
-                # 실거래가 조회
+                # 실거래가 조회 (로컬 웨어하우스 우선, 확정된 과거 월은 API 호출 없음)
                 property_value_estimate = None
                 jeonse_market_average = None
                 recent_transactions = []
 
                 if lawd_cd:
-                    now = datetime.now()
+                    async def fetch_logged(property_type: str, months: int, label: str) -> list:
+                        """웨어하우스 조회 + dev 로그"""
+                        deal_ymds = recent_months(months)
+                        step = f"rtms_warehouse_{property_type}"
+                        dev_logger.log_api_call(case_id, "collect_public_data", step,
+                                                {"lawd_cd": lawd_cd, "deal_ymds": deal_ymds})
+                        api_start = datetime.now()
+                        try:
+                            items = await fetch_transactions(
+                                property_type, lawd_cd, deal_ymds, api_key=settings.public_data_api_key
+                            )
+                        except Exception as e:
+                            errors.append(f"{label} 실거래가 조회 실패: {e}")
+                            return []
+
+                        api_time = int((datetime.now() - api_start).total_seconds() * 1000)
+                        dev_logger.log_api_response(case_id, "collect_public_data", step,
+                                                   response_time_ms=api_time,
+                                                   success=bool(items))
+                        # 느린 작업 감지
+                        if api_time > 2000:
+                            dev_logger.log_slow_operation(
+                                case_id, "collect_public_data",
+                                f"{label} 실거래가 조회 ({months}개월)", api_time, threshold_ms=2000
+                            )
+                        return items
 
-                    # 전세/월세: 듀얼 API
+                    # 전세/월세: 전세 6개월 + 매매 3개월
                     if contract_type in ["전세", "월세"]:
-                        # (1) 전세 실거래가
-                        apt_rent_client = AptRentAPIClient(
-                            api_key=settings.public_data_api_key,
-                            client=client
+                        rent_items = await fetch_logged("apt_rent", 6, "전세")
+                        jeonse_stats = summarize_market(
+                            rent_items, property_address,
+                            amount_field="deposit", exclude_monthly_rent=True
                         )
+                        if jeonse_stats:
+                            jeonse_market_average = jeonse_stats.estimate
 
-                        jeonse_amounts = []
-                        for months_back in range(6):
-                            current_date = datetime(now.year, now.month, 1)
-                            target_date = current_date - relativedelta(months=months_back)
-                            deal_ymd = f"{target_date.year}{target_date.month:02d}"
-
-                            try:
-                                dev_logger.log_api_call(case_id, "collect_public_data",
-                                                       f"apt_rent_api_{deal_ymd}",
-                                                       {"lawd_cd": lawd_cd, "deal_ymd": deal_ymd})
-                                api_start = datetime.now()
-
-                                rent_result = await apt_rent_client.get_apt_rent_transactions(
-                                    lawd_cd=lawd_cd,
-                                    deal_ymd=deal_ymd
-                                )
-
-                                api_time = int((datetime.now() - api_start).total_seconds() * 1000)
-                                dev_logger.log_api_response(case_id, "collect_public_data",
-                                                           f"apt_rent_api_{deal_ymd}",
-                                                           response_time_ms=api_time,
-                                                           success=bool(rent_result['body']['items']))
-
-                                # 느린 작업 감지
-                                if api_time > 2000:
-                                    dev_logger.log_slow_operation(
-                                        case_id, "collect_public_data",
-                                        f"전세 실거래가 조회 ({deal_ymd})", api_time, threshold_ms=2000
-                                    )
-
-                                if rent_result['body']['items']:
-                                    for item in rent_result['body']['items']:
-                                        if item.get('deposit') and not item.get('monthlyRent'):
-                                            jeonse_amounts.append(item['deposit'])
-                            except Exception as e:
-                                errors.append(f"전세 실거래가 조회 실패 ({deal_ymd}): {e}")
-
-                        if jeonse_amounts:
-                            jeonse_market_average = sum(jeonse_amounts) // len(jeonse_amounts)
-
-                        # (2) 매매 실거래가
-                        apt_trade_client = AptTradeAPIClient(
-                            api_key=settings.public_data_api_key,
-                            client=client
-                        )
+                        recent_transactions = await fetch_logged("apt_trade", 3, "매매")
 
-                        sale_amounts = []
-                        for months_back in range(3):
-                            current_date = datetime(now.year, now.month, 1)
-                            target_date = current_date - relativedelta(months=months_back)
-                            deal_ymd = f"{target_date.year}{target_date.month:02d}"
-
-                            try:
-                                dev_logger.log_api_call(case_id, "collect_public_data",
-                                                       f"apt_trade_api_{deal_ymd}",
-                                                       {"lawd_cd": lawd_cd, "deal_ymd": deal_ymd})
-                                api_start = datetime.now()
-
-                                trade_result = await apt_trade_client.get_apt_trades(
-                                    lawd_cd=lawd_cd,
-                                    deal_ymd=deal_ymd
-                                )
-
-                                api_time = int((datetime.now() - api_start).total_seconds() * 1000)
-                                dev_logger.log_api_response(case_id, "collect_public_data",
-                                                           f"apt_trade_api_{deal_ymd}",
-                                                           response_time_ms=api_time,
-                                                           success=bool(trade_result['body']['items']))
-
-                                # 느린 작업 감지
-                                if api_time > 2000:
-                                    dev_logger.log_slow_operation(
-                                        case_id, "collect_public_data",
-                                        f"매매 실거래가 조회 ({deal_ymd})", api_time, threshold_ms=2000
-                                    )
-
-                                if trade_result['body']['items']:
-                                    recent_transactions.extend(trade_result['body']['items'])
-                                    for item in trade_result['body']['items']:
-                                        if item.get('dealAmount'):
-                                            sale_amounts.append(item['dealAmount'])
-                            except Exception as e:
-                                errors.append(f"매매 실거래가 조회 실패 ({deal_ymd}): {e}")
-
-                        # 최대/최소 제외 평균
-                        if len(sale_amounts) > 2:
-                            sorted_amounts = sorted(sale_amounts)
-                            filtered_amounts = sorted_amounts[1:-1]
-                            property_value_estimate = sum(filtered_amounts) // len(filtered_amounts)
-                        elif sale_amounts:
-                            property_value_estimate = sum(sale_amounts) // len(sale_amounts)
-
-                    # 매매 계약: 단일 API
+                    # 매매 계약: 현재 월
                     else:
-                        apt_trade_client = AptTradeAPIClient(
-                            api_key=settings.public_data_api_key,
-                            client=client
-                        )
-                        deal_ymd = f"{now.year}{now.month:02d}"
+                        recent_transactions = await fetch_logged("apt_trade", 1, "매매")
 
-                        try:
-                            dev_logger.log_api_call(case_id, "collect_public_data",
-                                                   f"apt_trade_api_{deal_ymd}",
-                                                   {"lawd_cd": lawd_cd, "deal_ymd": deal_ymd})
-                            api_start = datetime.now()
-
-                            trade_result = await apt_trade_client.get_apt_trades(
-                                lawd_cd=lawd_cd,
-                                deal_ymd=deal_ymd
-                            )
-
-                            api_time = int((datetime.now() - api_start).total_seconds() * 1000)
-                            dev_logger.log_api_response(case_id, "collect_public_data",
-                                                       f"apt_trade_api_{deal_ymd}",
-                                                       response_time_ms=api_time,
-                                                       success=bool(trade_result['body']['items']))
-
-                            # 느린 작업 감지
-                            if api_time > 2000:
-                                dev_logger.log_slow_operation(
-                                    case_id, "collect_public_data",
-                                    f"매매 실거래가 조회 ({deal_ymd})", api_time, threshold_ms=2000
-                                )
-
-                            if trade_result['body']['items']:
-                                recent_transactions = trade_result['body']['items']
-                                amounts = [item['dealAmount'] for item in recent_transactions if item['dealAmount']]
-                                if amounts:
-                                    property_value_estimate = sum(amounts) // len(amounts)
-                        except Exception as e:
-                            errors.append(f"매매 실거래가 조회 실패: {e}")
+                    market_stats = summarize_market(recent_transactions, property_address)
+                    if market_stats:
+                        property_value_estimate = market_stats.estimate
 
             execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
 
@@ -91,47 +91,41 @@ def parse_pdf_with_metadata(path: str) -> List[Dict[str, Any]]:
 # ----------------------------------------
 # 3) PDF → 이미지 변환 (Vision API 용)
 # ----------------------------------------
-def pdf_to_images(path: str, output_dir: str | None = None, dpi: int = 200) -> List[str]:
+def pdf_to_image_bytes(path: str, dpi: int | None = None) -> List[bytes]:
     """
-    PDF 페이지를 이미지로 변환합니다.
-    """
-    file_path = Path(path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {path}")
-
-    if output_dir is None:
-        output_dir = tempfile.mkdtemp(prefix="pdf_images_")
+    PDF 페이지를 메모리 내 이미지 bytes로 변환합니다 (임시 파일 없음).
 
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    core.page_render 공용 렌더러 사용: 적응 DPI(dpi=None), 그레이스케일 JPEG,
+    빈/중복 페이지 제외, 문서 해시 단위 캐시.
+    """
+    from core.page_render import render_pages
 
-    logger.info(f"PDF → 이미지 변환 시작: {path}, DPI={dpi}")
+    return [page.data for page in render_pages(path, dpi=dpi)]
 
-    try:
-        doc = fitz.open(str(file_path))  # type: ignore[attr-defined]
-        image_paths = []
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+def pdf_to_images(path: str, output_dir: str | None = None, dpi: int | None = None) -> List[str]:
+    """
+    PDF 페이지를 이미지 파일로 저장합니다 (파일 경로가 필요한 외부 도구용).
 
-            zoom = dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
+    Vision/OCR 경로는 pdf_to_image_bytes를 사용하세요.
+    """
+    from core.page_render import render_pages
 
-            image_filename = f"page_{page_num + 1:03d}.png"
-            image_path = output_path / image_filename
-            pix.save(str(image_path))
+    if output_dir is None:
+        output_dir = tempfile.mkdtemp(prefix="pdf_images_")
 
-            image_paths.append(str(image_path))
-            logger.debug(f"페이지 {page_num + 1} → {image_path}")
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
 
-        doc.close()
-        logger.info(f"PDF → 이미지 변환 완료: {len(image_paths)}개 페이지")
-        return image_paths
+    image_paths = []
+    for page in render_pages(path, dpi=dpi):
+        extension = page.mime_type.split("/")[1].replace("jpeg", "jpg")
+        image_path = output_path / f"page_{page.index + 1:03d}.{extension}"
+        image_path.write_bytes(page.data)
+        image_paths.append(str(image_path))
 
-    except Exception as e:
-        logger.error(f"PDF → 이미지 변환 실패: {e}")
-        raise ValueError(f"PDF를 이미지로 변환 중 오류 발생: {e}") from e
+    logger.info(f"PDF → 이미지 저장 완료: {len(image_paths)}개 페이지 → {output_path}")
+    return image_paths
 
 
 # ----------------------------------------
@@ -140,24 +134,17 @@ def pdf_to_images(path: str, output_dir: str | None = None, dpi: int = 200) -> L
 def parse_scanned_pdf_with_vision(path: str) -> Dict[str, Any]:
     """
     스캔 PDF를 Vision AI로 JSON 파싱합니다.
+
+    페이지는 메모리에서 렌더링되어 동시에 추출됩니다 (core.vision.aextract_contract_from_pages).
     """
-    from ..core.vision import extract_contract_from_pdf_images
+    from core.vision import extract_contract_from_pdf_images
 
     logger.info(f"스캔 PDF Vision 파싱 시작: {path}")
 
-    image_paths = pdf_to_images(path, dpi=200)
-
-    try:
-        result = extract_contract_from_pdf_images(image_paths, combine=True)
-        logger.info(f"스캔 PDF Vision 파싱 완료: {path}")
-        return cast(Dict[str, Any], result)
-
-    finally:
-        for img_path in image_paths:
-            try:
-                Path(img_path).unlink()
-            except Exception as e:
-                logger.warning(f"임시 이미지 삭제 실패: {img_path}, {e}")
+    images = pdf_to_image_bytes(path)
+    result = extract_contract_from_pdf_images(images, combine=True)
+    logger.info(f"스캔 PDF Vision 파싱 완료: {path}")
+    return cast(Dict[str, Any], result)
 
 
 # ----------------------------------------
@@ -7,6 +7,7 @@
 
 LLM으로 구조화 절대 금지! (hallucination + 불필요한 비용)
 """
+import asyncio
 import logging
 import re
 from typing import Optional, List, Dict, Any
@@ -18,8 +19,6 @@ from core.audit_logger import (
     log_parsing_warning,
     EventType
 )
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
 
 logger = logging.getLogger(__name__)
 
@@ -1134,26 +1133,18 @@ async def ocr_with_gemini_vision(pdf_path: str) -> str:
     """
     import google.generativeai as genai
     import os
-    from PIL import Image
 
     # Gemini API 키 설정
     genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
     model = genai.GenerativeModel('gemini-1.5-flash')
 
-    # PDF → 이미지 변환 (첫 페이지만 or 전체)
-    doc = fitz.open(pdf_path)  # type: ignore
-    texts = []
-
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        # PDF 페이지를 이미지로 렌더링
-        pix = page.get_pixmap(dpi=150)
-        img_bytes = pix.tobytes("png")
+    from core.page_render import render_pages
 
-        # PIL Image로 변환
-        from io import BytesIO
-        img = Image.open(BytesIO(img_bytes))
+    # PDF → 메모리 렌더링 (적응 DPI, 그레이스케일 JPEG, 빈/중복 페이지 제외, 문서 해시 캐시)
+    pages = await asyncio.to_thread(render_pages, pdf_path)
+    texts = []
 
+    for page in pages:
         # Gemini Vision으로 OCR
         prompt = """이 등기부등본 이미지에서 모든 텍스트를 정확히 추출하라.
 
@@ -1162,11 +1153,9 @@ async def ocr_with_gemini_vision(pdf_path: str) -> str:
 - 표 형식은 그대로 유지
 - 숫자, 날짜, 이름 등 정확히 추출"""
 
-        response = model.generate_content([prompt, img])
+        response = model.generate_content([prompt, {"mime_type": page.mime_type, "data": page.data}])
         texts.append(response.text)
 
-    doc.close()
-
     extracted_text = "\n\n".join(texts)
     logger.info(f"Gemini OCR 완료: {len(extracted_text)}자")
 
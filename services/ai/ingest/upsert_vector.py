@@ -1,21 +1,248 @@
-"""벡터 DB에 문서 업서트."""
+"""벡터 DB에 문서 업서트.
+
+청크 단위 diff 업서트:
+- 청크 ID = doc_id + 내용 해시 → 같은 문서 재업로드 시 바뀐 청크만 쓰기/삭제
+- 같은 내용(공백 정규화 후 sha256)의 청크가 컬렉션에 이미 있으면 저장된 임베딩 재사용
+  (표준 계약서 문구 등 반복 boilerplate는 임베딩 API 호출 없음)
+- 새 청크만 배치 단위로 임베딩 (동시 요청 수 제한 + Rate limit 시 Retry-After 존중 백오프)
+"""
+import hashlib
 import logging
-from typing import Dict, List, Any
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
     retry_if_exception_type,
 )
-from openai import RateLimitError, APIError
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
 
+from core.hybrid_retriever import invalidate_retrieval_cache
 from core.retriever import get_vectorstore
+from core.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class UpsertReport:
+    """업서트 결과 (청크 수 집계)"""
+    doc_id: str
+    total_chunks: int = 0
+    embedded: int = 0  # 임베딩 API로 새로 계산
+    reused: int = 0  # 컬렉션에 저장된 동일 청크의 임베딩 재사용
+    unchanged: int = 0  # 이 문서에 이미 저장되어 있어 쓰기 없음
+    deleted: int = 0  # 문서에서 사라져 삭제된 청크
+
+    @property
+    def skipped(self) -> int:
+        """임베딩 API 호출을 건너뛴 청크 수"""
+        return self.reused + self.unchanged
+
+    def summary(self) -> str:
+        return (
+            f"청크 {self.total_chunks}개: 임베딩 {self.embedded}, 건너뜀 {self.skipped} "
+            f"(재사용 {self.reused}, 변경 없음 {self.unchanged}), 삭제 {self.deleted}"
+        )
+
+
+def chunk_hash(text: str) -> str:
+    """청크 내용 해시 (공백 정규화 후 sha256)"""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _chunk_ids(doc_id: str, hashes: List[str]) -> List[str]:
+    """doc_id + 내용 해시 기반 결정적 청크 ID (문서 내 중복 청크는 순번 부여)"""
+    seen: Dict[str, int] = {}
+    ids = []
+    for h in hashes:
+        n = seen.get(h, 0)
+        seen[h] = n + 1
+        ids.append(f"{doc_id}:{h[:32]}" + (f":{n}" if n else ""))
+    return ids
+
+
+def _rate_limit_wait(retry_state) -> float:
+    """RateLimitError의 Retry-After 헤더를 우선 사용, 없으면 지수 백오프 + jitter"""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), 60.0)
+        except ValueError:
+            pass
+    return min(2 ** retry_state.attempt_number, 30) + random.uniform(0, 1)
+
+
+@retry(
+    stop=stop_after_attempt(5),
+    wait=_rate_limit_wait,
+    # 일시적 오류만 재시도 (400/401 등 요청 자체 오류는 재시도해도 같은 결과)
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)),
+    reraise=True,
+)
+def _embed_batch(embedder, texts: List[str]) -> List[List[float]]:
+    return embedder.embed_documents(texts)
+
+
+def embed_texts_batched(embedder, texts: List[str]) -> List[List[float]]:
+    """
+    배치 임베딩 (settings.embed_batch_size 단위, 최대 embed_max_concurrency개 동시 요청)
+
+    Returns:
+        입력 순서와 같은 임베딩 목록
+    """
+    if not texts:
+        return []
+
+    batch_size = settings.embed_batch_size
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    workers = min(settings.embed_max_concurrency, len(batches))
+
+    if workers == 1:
+        results = [_embed_batch(embedder, batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda batch: _embed_batch(embedder, batch), batches))
+
+    return [vector for batch in results for vector in batch]
+
+
+def _load_stored_chunks(
+    vectorstore,
+    doc_id: str,
+    hashes: List[str],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[float]]]:
+    """
+    저장된 청크 조회
+
+    Returns:
+        (이 문서의 {청크 ID: 메타데이터}, 컬렉션 전체의 {내용 해시: 임베딩})
+    """
+    store = vectorstore.EmbeddingStore
+
+    with vectorstore._make_session() as session:
+        collection = vectorstore.get_collection(session)
+        if collection is None:
+            return {}, {}
+
+        doc_rows = (
+            session.query(store.custom_id, store.cmetadata)
+            .filter(store.collection_id == collection.uuid)
+            .filter(store.cmetadata["doc_id"].astext == doc_id)
+            .all()
+        )
+
+        vectors: Dict[str, List[float]] = {}
+        unique_hashes = list(set(hashes))
+        for i in range(0, len(unique_hashes), 500):
+            hash_rows = (
+                session.query(store.cmetadata["content_hash"].astext, store.embedding)
+                .filter(store.collection_id == collection.uuid)
+                .filter(store.cmetadata["content_hash"].astext.in_(unique_hashes[i:i + 500]))
+                .all()
+            )
+            for content_hash, embedding in hash_rows:
+                vectors.setdefault(content_hash, list(embedding))
+
+    return {custom_id: cmetadata or {} for custom_id, cmetadata in doc_rows}, vectors
+
+
+def _update_chunk_metadata(vectorstore, stale_meta: Dict[str, Dict[str, Any]]) -> None:
+    """청크 메타데이터 갱신 (이 컬렉션만 - 같은 custom_id가 다른 컬렉션에 있어도 건드리지 않음)"""
+    store = vectorstore.EmbeddingStore
+
+    with vectorstore._make_session() as session:
+        collection = vectorstore.get_collection(session)
+        if collection is None:
+            return
+        for custom_id, cmetadata in stale_meta.items():
+            (
+                session.query(store)
+                .filter(store.collection_id == collection.uuid)
+                .filter(store.custom_id == custom_id)
+                .update({store.cmetadata: cmetadata}, synchronize_session=False)
+            )
+        session.commit()
+
+
+def _upsert_documents(
+    doc_id: str,
+    documents: List[Document],
+    collection_name: str,
+) -> UpsertReport:
+    """
+    문서 청크 diff 업서트 (공통)
+
+    1. 청크별 내용 해시 + 결정적 ID 계산
+    2. 이 문서의 기존 청크와 비교 → 사라진 청크 삭제, 변경 없는 청크는 메타데이터만 갱신
+    3. 새 청크: 컬렉션에 같은 해시가 있으면 임베딩 재사용, 없으면 배치 임베딩
+    """
+    report = UpsertReport(doc_id=doc_id, total_chunks=len(documents))
+
+    hashes = [chunk_hash(doc.page_content) for doc in documents]
+    ids = _chunk_ids(doc_id, hashes)
+    for doc, content_hash in zip(documents, hashes):
+        doc.metadata["content_hash"] = content_hash
+
+    vectorstore = get_vectorstore(collection_name=collection_name)
+    existing, stored_vectors = _load_stored_chunks(vectorstore, doc_id, hashes)
+
+    # 사라진 청크 삭제
+    id_set = set(ids)
+    removed = [custom_id for custom_id in existing if custom_id not in id_set]
+    if removed:
+        vectorstore.delete(ids=removed, collection_only=True)
+    report.deleted = len(removed)
+
+    # 변경 없는 청크: 메타데이터(chunk_index 등)가 달라졌을 때만 갱신
+    stale_meta = {
+        custom_id: doc.metadata
+        for custom_id, doc in zip(ids, documents)
+        if custom_id in existing and existing[custom_id] != doc.metadata
+    }
+    if stale_meta:
+        _update_chunk_metadata(vectorstore, stale_meta)
+
+    new_entries = [
+        (custom_id, doc, content_hash)
+        for custom_id, doc, content_hash in zip(ids, documents, hashes)
+        if custom_id not in existing
+    ]
+    report.unchanged = len(documents) - len(new_entries)
+
+    # 새로 임베딩할 내용 (문서 내 중복은 1회만)
+    to_embed: Dict[str, str] = {}
+    for _, doc, content_hash in new_entries:
+        if content_hash not in stored_vectors and content_hash not in to_embed:
+            to_embed[content_hash] = doc.page_content
+
+    if to_embed:
+        embedded = embed_texts_batched(vectorstore.embeddings, list(to_embed.values()))
+        stored_vectors.update(zip(to_embed.keys(), embedded))
+    report.embedded = len(to_embed)
+    report.reused = len(new_entries) - len(to_embed)
+
+    if new_entries:
+        vectorstore.add_embeddings(
+            texts=[doc.page_content for _, doc, _ in new_entries],
+            embeddings=[stored_vectors[h] for _, _, h in new_entries],
+            metadatas=[doc.metadata for _, doc, _ in new_entries],
+            ids=[custom_id for custom_id, _, _ in new_entries],
+        )
+    if new_entries or removed or stale_meta:
+        invalidate_retrieval_cache(collection_name)
+
+    logger.info(f"벡터 DB 업서트 완료: doc_id={doc_id}, collection={collection_name}, {report.summary()}")
+    return report
+
+
 def upsert_contract_text(
     doc_id: str,
     text: str,
@@ -23,7 +250,7 @@ def upsert_contract_text(
     chunk_size: int = 1200,
     chunk_overlap: int = 150,
     collection_name: str = "v2_contract_docs",
-) -> int:
+) -> UpsertReport:
     """
     계약서 텍스트를 청크로 분할하고 벡터 DB에 업서트합니다.
 
@@ -36,13 +263,13 @@ def upsert_contract_text(
         collection_name: 벡터 컬렉션 이름
 
     Returns:
-        업서트된 청크 개수
+        UpsertReport (임베딩/건너뜀/삭제 청크 수)
 
     Example:
         >>> text = "계약서 내용..."
         >>> metadata = {"addr": "서울시 강남구", "contract_type": "매매"}
-        >>> count = upsert_contract_text("contract_001", text, metadata)
-        >>> print(f"{count}개 청크 저장됨")
+        >>> report = upsert_contract_text("contract_001", text, metadata)
+        >>> print(report.summary())
     """
     if not text or not text.strip():
         raise ValueError("텍스트가 비어있습니다")
@@ -79,27 +306,9 @@ def upsert_contract_text(
         doc = Document(page_content=chunk, metadata=chunk_metadata)
         documents.append(doc)
 
-    # 벡터 스토어에 추가 (재시도 로직 포함)
+    # 벡터 스토어에 diff 업서트
     try:
-        vectorstore = get_vectorstore(collection_name=collection_name)
-
-        # 임베딩 재시도 래퍼
-        @retry(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=1, min=2, max=10),
-            retry=retry_if_exception_type((RateLimitError, APIError)),
-            reraise=True,
-        )
-        def add_documents_with_retry():
-            return vectorstore.add_documents(documents)
-
-        add_documents_with_retry()
-
-        logger.info(
-            f"벡터 DB 업서트 완료: {len(documents)}개 청크, "
-            f"collection={collection_name}"
-        )
-        return len(documents)
+        return _upsert_documents(doc_id, documents, collection_name)
 
     except Exception as e:
         logger.error(f"벡터 DB 업서트 실패: {e}")
@@ -111,7 +320,7 @@ def upsert_contract_pages(
     pages_data: List[Dict[str, Any]],
     metadata: Dict[str, Any] | None = None,
     collection_name: str = "v2_contract_docs",
-) -> int:
+) -> UpsertReport:
     """
     페이지별 데이터를 벡터 DB에 업서트합니다.
 
@@ -123,12 +332,12 @@ def upsert_contract_pages(
         collection_name: 벡터 컬렉션 이름
 
     Returns:
-        업서트된 총 청크 개수
+        UpsertReport (임베딩/건너뜀/삭제 청크 수)
 
     Example:
         >>> from ingest.pdf_parse import parse_pdf_with_metadata
         >>> pages = parse_pdf_with_metadata("contract.pdf")
-        >>> count = upsert_contract_pages("contract_001", pages)
+        >>> report = upsert_contract_pages("contract_001", pages)
     """
     if not pages_data:
         raise ValueError("페이지 데이터가 비어있습니다")
@@ -167,16 +376,15 @@ def upsert_contract_pages(
 
         total_chunks += len(chunks)
 
-    # 벡터 스토어에 추가
+    # 벡터 스토어에 diff 업서트
     try:
-        vectorstore = get_vectorstore(collection_name=collection_name)
-        vectorstore.add_documents(documents)
+        report = _upsert_documents(doc_id, documents, collection_name)
 
         logger.info(
             f"페이지별 업서트 완료: {len(pages_data)} 페이지, "
             f"{total_chunks}개 청크"
         )
-        return total_chunks
+        return report
 
     except Exception as e:
         logger.error(f"페이지별 업서트 실패: {e}")
@@ -190,7 +398,7 @@ def upsert_document_embeddings(
     metadata: Dict[str, Any] | None = None,
     chunk_size: int = 1200,
     chunk_overlap: int = 150,
-) -> int:
+) -> UpsertReport:
     """
     문서 텍스트를 청크로 분할하고 v2_embeddings 테이블에 직접 저장합니다.
     (등기부등본 등 document_type='registry'인 문서용)
@@ -204,7 +412,7 @@ def upsert_document_embeddings(
         chunk_overlap: 청크 간 오버랩 (문자 수)
 
     Returns:
-        업서트된 청크 개수
+        UpsertReport (임베딩/건너뜀/삭제 청크 수)
     """
     if not text or not text.strip():
         raise ValueError("텍스트가 비어있습니다")
@@ -242,28 +450,13 @@ def upsert_document_embeddings(
         doc = Document(page_content=chunk, metadata=chunk_metadata)
         documents.append(doc)
 
-    # 벡터 스토어에 추가 (재시도 로직 포함)
+    # 벡터 스토어에 diff 업서트
     try:
-        # pgvector collection은 자동으로 v2_embeddings 테이블에 저장됨
-        vectorstore = get_vectorstore(collection_name="v2_embeddings")
-
-        # 임베딩 재시도 래퍼
-        @retry(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=1, min=2, max=10),
-            retry=retry_if_exception_type((RateLimitError, APIError)),
-            reraise=True,
-        )
-        def add_documents_with_retry():
-            return vectorstore.add_documents(documents)
+        # pgvector collection "v2_embeddings" (langchain_pg_embedding 테이블)
+        report = _upsert_documents(doc_id, documents, "v2_embeddings")
 
-        add_documents_with_retry()
-
-        logger.info(
-            f"문서 임베딩 완료: {len(documents)}개 청크, "
-            f"doc_id={doc_id}"
-        )
-        return len(documents)
+        logger.info(f"문서 임베딩 완료: doc_id={doc_id}, {report.summary()}")
+        return report
 
     except Exception as e:
         logger.error(f"문서 임베딩 실패: {e}")
@@ -284,23 +477,16 @@ def delete_document_chunks(
     Returns:
         삭제 성공 여부
 
-    Note:
-        실제 구현은 PGVector의 delete 기능에 따라 달라질 수 있습니다.
-        현재는 메타데이터 필터링을 통한 삭제를 가정합니다.
     """
     try:
         vectorstore = get_vectorstore(collection_name=collection_name)
+        existing, _ = _load_stored_chunks(vectorstore, doc_id, [])
 
-        # PGVector에서는 직접적인 메타데이터 기반 삭제가 제한적일 수 있음
-        # 필요시 SQL 쿼리로 직접 삭제
-        logger.warning(
-            f"문서 삭제 요청: doc_id={doc_id}. "
-            "PGVector의 삭제 기능은 제한적일 수 있습니다."
-        )
-
-        # TODO: 실제 삭제 로직 구현
-        # vectorstore.delete(filter={"doc_id": doc_id})
+        if existing:
+            vectorstore.delete(ids=list(existing), collection_only=True)
+            invalidate_retrieval_cache(collection_name)
 
+        logger.info(f"문서 삭제 완료: doc_id={doc_id}, {len(existing)}개 청크")
         return True
 
     except Exception as e:
@@ -12,12 +12,8 @@ from pydantic import BaseModel
 from core.supabase_client import get_supabase_client, supabase_storage
 from core.auth import get_current_user
 from core.risk_engine import analyze_risks  # ✅ 구현 완료
-from core.llm_router import dual_model_analyze  # ✅ 구현 완료
 from core.prompts import build_judge_prompt
 from core.analysis_pipeline import build_analysis_context
-from core.llm_streaming import dual_stream_analysis
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import SystemMessage, HumanMessage
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +45,7 @@ async def merge_dual_streams(
         Tuple[str, str, dict]: (draft_content, validation_content, last_validation_event)
     """
     import json
+    from core.llm_streaming import StreamPoller
 
     draft_content = ""
     validation_content = ""
@@ -56,7 +53,7 @@ async def merge_dual_streams(
     validation_done = False
     last_validation_event = None
 
-    draft_gen = draft_generator
+    draft_gen = StreamPoller(draft_generator)
     validation_gen = None
     draft_start_time = asyncio.get_event_loop().time()
 
@@ -65,7 +62,7 @@ async def merge_dual_streams(
             # GPT 초안 스트림 처리
             if not draft_done:
                 try:
-                    draft_event = await asyncio.wait_for(draft_gen.__anext__(), timeout=0.1)
+                    draft_event = await draft_gen.next(timeout=0.1)
 
                     if draft_event.get('done'):
                         draft_done = True
@@ -85,7 +82,7 @@ async def merge_dual_streams(
 
                         # Claude 검증 시작
                         if validation_gen is None:
-                            validation_gen = validation_generator_factory(draft_content)
+                            validation_gen = StreamPoller(validation_generator_factory(draft_content))
                             data = {
                                 'step': step_base + 0.2,
                                 'phase': 'validation',
@@ -115,7 +112,7 @@ async def merge_dual_streams(
             # Claude 검증 스트림 처리
             if validation_gen is not None and not validation_done:
                 try:
-                    validation_event = await asyncio.wait_for(validation_gen.__anext__(), timeout=0.1)
+                    validation_event = await validation_gen.next(timeout=0.1)
                     last_validation_event = validation_event
 
                     if validation_event.get('done'):
@@ -156,7 +153,7 @@ async def merge_dual_streams(
             # 병렬 검증 시작 (초안 시작 3초 후)
             if validation_gen is None and (asyncio.get_event_loop().time() - draft_start_time) > 3:
                 if draft_content:
-                    validation_gen = validation_generator_factory(draft_content)
+                    validation_gen = StreamPoller(validation_generator_factory(draft_content))
                     data = {
                         'step': step_base + 0.2,
                         'phase': 'validation',
@@ -171,6 +168,10 @@ async def merge_dual_streams(
             logger.error(f"병렬 스트리밍 루프 오류: {e}")
             break
 
+    for poller in (draft_gen, validation_gen):
+        if poller is not None:
+            await poller.aclose()
+
     # 최종 결과를 yield (async generator는 return 불가)
     yield (draft_content, validation_content, last_validation_event)
 
@@ -181,6 +182,7 @@ async def merge_dual_streams(
 class StartAnalysisRequest(BaseModel):
     """분석 시작 요청"""
     case_id: str
+    bypass_cache: bool = False  # True면 LLM 응답 캐시를 쓰지 않고 새로 생성
 
 
 class AnalysisStatusResponse(BaseModel):
@@ -289,17 +291,21 @@ async def simple_chat_analysis(
 구체적인 계약서나 등기부 분석이 필요한 경우, 정식 케이스 분석을 권장합니다.
 """
 
-        # single_model_analyze는 동기 함수이므로 실행기에서 실행
-        from core.llm_router import single_model_analyze
-        loop = asyncio.get_running_loop()
-        single = await loop.run_in_executor(
-            None,
-            lambda: single_model_analyze(
-                question=request.question,
-                context=context,
-                provider="openai",
-            ),
-        )
+        # 비동기 호출 (기한 초과 시 LLM 요청도 취소), 채팅 우선순위로 LLM 허가
+        from core.llm_governor import llm_priority
+        from core.llm_router import asingle_model_analyze, call_with_deadline
+        from core.settings import settings
+        with llm_priority("interactive"):
+            single = await call_with_deadline(
+                lambda: asingle_model_analyze(
+                    question=request.question,
+                    context=context,
+                    provider="openai",
+                ),
+                attempt_timeout_sec=settings.analyze_attempt_timeout_sec,
+                deadline_sec=settings.analyze_attempt_timeout_sec,
+                label="간단 채팅 분석",
+            )
 
         logger.info("간단 답변 생성 완료 (provider=openai)")
 
@@ -352,7 +358,7 @@ async def start_analysis(
 
     # 백그라운드에서 분석 파이프라인 실행 (비블로킹)
     import asyncio
-    asyncio.create_task(execute_analysis_pipeline(request.case_id))
+    asyncio.create_task(execute_analysis_pipeline(request.case_id, bypass_cache=request.bypass_cache))
 
     return AnalysisStatusResponse(
         case_id=request.case_id,
@@ -365,6 +371,7 @@ async def start_analysis(
 @router.get("/stream/{case_id}")
 async def stream_analysis(
     case_id: str,
+    bypass_cache: bool = False,
     user: dict = Depends(get_current_user)
 ):
     """
@@ -372,6 +379,7 @@ async def stream_analysis(
 
     - 등기부 파싱, 리스크 계산, LLM 생성 과정을 실시간으로 스트리밍
     - ChatGPT처럼 생각하는 과정을 보여줌
+    - 같은 프롬프트의 초안/검증은 LLM 응답 캐시에서 같은 이벤트로 재생 (?bypass_cache=true로 새로 생성)
     """
     from fastapi.responses import StreamingResponse
     import json
@@ -478,18 +486,25 @@ async def stream_analysis(
                         client=client
                     )
                     now = datetime.now()
+                    # 시세 통계에만 사용 → dict 대신 슬롯 레코드로 받음
                     trade_result = await apt_trade_client.get_apt_trades(
                         lawd_cd=lawd_cd,
-                        deal_ymd=f"{now.year}{now.month:02d}"
+                        deal_ymd=f"{now.year}{now.month:02d}",
+                        as_records=True,
                     )
 
                     if trade_result['body']['items']:
-                        amounts = [item['dealAmount'] for item in trade_result['body']['items']
-                                  if item['dealAmount']]
-                        if amounts:
-                            property_value_estimate = sum(amounts) // len(amounts)
-                            message = f'✅ 평균 실거래가: {property_value_estimate:,}만원 ({len(amounts)}건 분석)'
-                            yield f"data: {json.dumps({'step': 4, 'message': message, 'progress': 0.6}, ensure_ascii=False)}\n\n"
+                        from core.market_stats import summarize_market
+
+                        market_stats = summarize_market(
+                            trade_result['body']['items'],
+                            case['property_address'],
+                            area_m2=registry_doc.area_m2 if registry_doc else None,
+                        )
+                        if market_stats:
+                            property_value_estimate = market_stats.estimate
+                            message = f'✅ 시세 추정: {property_value_estimate:,}만원 ({market_stats.describe()})'
+                            yield f"data: {json.dumps({'step': 4, 'message': message, 'progress': 0.6, 'market_stats': market_stats.model_dump()}, ensure_ascii=False)}\n\n"
                             await asyncio.sleep(0.5)
 
             # registry_data 업데이트
@@ -577,9 +592,8 @@ async def stream_analysis(
             #   1) GPT-4o-mini 초안 생성 (📝 초안 생성 중... → ✅ 초안 완료)
             #   2) 3초 대기 후 Claude Sonnet 검증 시작 (🔍 검증 시작... → 🔍 검증 중... → ✅ 검증 완료)
 
-            from core.report_generator import build_risk_features_from_registry, build_llm_prompt
-            from langchain_openai import ChatOpenAI
-            from langchain_anthropic import ChatAnthropic
+            from core.report_generator import build_risk_features_from_registry, build_llm_prompt_budget
+            from core.llm_clients import get_chat_model
             from langchain_core.messages import HumanMessage, SystemMessage
 
             # 프롬프트 준비
@@ -593,14 +607,18 @@ async def stream_analysis(
                 )
 
             llm_prompt = None
+            prompt_budget = None
             if risk_features:
-                llm_prompt = build_llm_prompt(
+                budget = build_llm_prompt_budget(
                     risk_features=risk_features,
                     contract_type=contract_type,
                     contract_deposit=case.get('metadata', {}).get('deposit'),
                     contract_price=case.get('metadata', {}).get('price'),
-                    monthly_rent=case.get('metadata', {}).get('monthly_rent')
+                    monthly_rent=case.get('metadata', {}).get('monthly_rent'),
+                    model="gpt-4o-mini",
                 )
+                llm_prompt = budget.text
+                prompt_budget = budget.to_dict()
             else:
                 llm_prompt = f"""# 부동산 계약 분석 요청
 
@@ -616,7 +634,7 @@ async def stream_analysis(
             # ===========================
             async def stream_gpt_draft():
                 """GPT-4o-mini 초안 생성 스트리밍"""
-                llm_draft = ChatOpenAI(model="gpt-4o-mini", temperature=0.3, max_tokens=4096, streaming=True)
+                llm_draft = get_chat_model("openai", "gpt-4o-mini", temperature=0.3, max_tokens=4096, streaming=True)
                 draft_content = ""
                 chunk_count = 0
 
@@ -662,7 +680,9 @@ async def stream_analysis(
 
                 judge_prompt = build_judge_prompt(draft_content)
 
-                llm_judge = ChatAnthropic(model="claude-3-5-sonnet-latest", temperature=0.1, max_tokens=4096, streaming=True)
+                llm_judge = get_chat_model(
+                    "claude", "claude-3-5-sonnet-latest", temperature=0.1, max_tokens=4096, streaming=True
+                )
                 validation_content = ""
                 chunk_count = 0
 
@@ -698,7 +718,9 @@ async def stream_analysis(
                     if "NotFound" in msg or "not_found_error" in msg or "model:" in msg:
                         logger.warning("Claude Sonnet 실패, Haiku로 폴백")
 
-                        llm_haiku = ChatAnthropic(model="claude-3-5-haiku-latest", temperature=0.1, max_tokens=4096, streaming=True)
+                        llm_haiku = get_chat_model(
+                            "claude", "claude-3-5-haiku-latest", temperature=0.1, max_tokens=4096, streaming=True
+                        )
                         validation_content = ""
 
                         async for chunk in llm_haiku.astream([HumanMessage(content=judge_prompt)]):
@@ -732,9 +754,28 @@ async def stream_analysis(
             # ===========================
             # 병렬 스트리밍 실행 (공통 함수 사용)
             # ===========================
+            from core.llm_cache import cached_llm_stream
+
+            def cached_claude_validation(draft_content):
+                return cached_llm_stream(
+                    lambda: stream_claude_validation(draft_content),
+                    model="claude-3-5-sonnet-latest",
+                    params={"temperature": 0.1, "max_tokens": 4096},
+                    prompt=build_judge_prompt(draft_content),
+                    phase="validation",
+                    bypass=bypass_cache,
+                )
+
             async for event in merge_dual_streams(
-                draft_generator=stream_gpt_draft(),
-                validation_generator_factory=stream_claude_validation,
+                draft_generator=cached_llm_stream(
+                    stream_gpt_draft,
+                    model="gpt-4o-mini",
+                    params={"temperature": 0.3, "max_tokens": 4096},
+                    prompt=llm_prompt,
+                    phase="draft",
+                    bypass=bypass_cache,
+                ),
+                validation_generator_factory=cached_claude_validation,
                 step_base=6.0,
                 progress_base=0.78
             ):
@@ -809,6 +850,7 @@ async def stream_analysis(
                     "draft_length": len(draft_content),
                     "validation_length": len(validation_content),
                     "analysis_method": "parallel_streaming",
+                    "prompt_budget": prompt_budget,
                 }
             }).execute()
 
@@ -1013,13 +1055,16 @@ async def crosscheck_draft(
     """
     Guide 호환용: Claude로 초안을 교차검증.
     """
+    from core.llm_clients import get_chat_model
+    from langchain_core.messages import SystemMessage, HumanMessage
+
     judge_prompt = build_judge_prompt(request.draft)
-    llm = ChatAnthropic(model="claude-3-5-sonnet-latest", temperature=0.1, max_tokens=4096)
+    llm = get_chat_model("claude", "claude-3-5-sonnet-latest", temperature=0.1, max_tokens=4096)
     msgs = [
         SystemMessage(content=judge_prompt),
         HumanMessage(content="검��을 수행하세요."),
     ]
-    resp = llm.invoke(msgs)
+    resp = await llm.ainvoke(msgs)
     return CrosscheckResponse(validation=resp.content)
 
 
@@ -1101,7 +1146,7 @@ async def get_audit_logs(
 # 헬퍼 함수 (향후 구현)
 # ===========================
 
-async def execute_analysis_pipeline(case_id: str):
+async def execute_analysis_pipeline(case_id: str, bypass_cache: bool = False):
     """
     분석 파이프라인 실행
 
@@ -1109,7 +1154,7 @@ async def execute_analysis_pipeline(case_id: str):
     2. 등기부 파싱 및 구조화
     3. 공공 데이터 수집
     4. 리스크 엔진 실행 → 위험 점수 계산
-    5. LLM 듀얼 시스템 실행 → 초안 생성 + 검증
+    5. LLM 듀얼 시스템 실행 → 초안 생성 + 검증 (bypass_cache=False면 같은 프롬프트의 캐시된 응답 재사용)
     6. 리포트 생성 및 저장
     7. 상태 전환: analysis → report → completed
     """
@@ -1394,7 +1439,6 @@ async def execute_analysis_pipeline(case_id: str):
 
         # 5️⃣ 새 아키텍처: RegistryRiskFeatures 변환 + LLM 프롬프트 생성
         from core.report_generator import build_risk_features_from_registry, build_llm_prompt
-        from langchain_openai import ChatOpenAI
         from langchain_core.messages import HumanMessage
 
         # ===========================
@@ -1428,8 +1472,11 @@ async def execute_analysis_pipeline(case_id: str):
         logger.info(f"컨텍스트 준비 완료: 등기부={bool(context.registry_doc)}, 시장데이터={bool(property_value_estimate)}")
 
         # Step 3: LLM 호출 (해석만 수행, 파싱/계산 없음)
+        # 백그라운드 작업 (/start에서 create_task) - 대화형 요청보다 낮은 우선순위로 LLM 허가 대기
+        from core.llm_governor import llm_priority
         from core.llm_streaming import simple_llm_analysis
-        final_answer = await simple_llm_analysis(llm_prompt)
+        with llm_priority("background"):
+            final_answer = await simple_llm_analysis(llm_prompt, bypass_cache=bypass_cache)
 
         # 6️⃣ 리포트 저장 (v2_reports 테이블)
         report_data_payload = {
@@ -1459,6 +1506,7 @@ async def execute_analysis_pipeline(case_id: str):
                 "confidence": 0.85,
                 "jeonse_market_average": jeonse_market_average if contract_type in ["전세", "월세"] else None,
                 "property_value_estimate": property_value_estimate,
+                "prompt_budget": context.prompt_budget,
             }
         }).execute()
 
@@ -39,6 +39,7 @@ class AllAPITestResult(BaseModel):
     fail_count: int
     total_execution_time_ms: float
     results: List[APITestResult]
+    latency_table: List[Dict[str, Any]] = []  # API별 상태/소요 시간 (느린 순)
 
 
 # ===========================
@@ -831,6 +832,95 @@ async def test_building_ledger(
         )
 
 
+# ===========================
+# 일괄 실행 (동시 호출)
+# ===========================
+def _all_api_calls(
+    legal_dong_keyword: str,
+    lawd_cd: str,
+    deal_ymd: str,
+    sigungu_cd: str,
+    bjdong_cd: str,
+    bun: str,
+    ji: str,
+) -> List[tuple]:
+    """15개 API 테스트 호출 목록 [(api_name, api_name_kr, 코루틴 생성 함수), ...]"""
+    rtms_tests = [
+        ("AptTradeAPIClient", "아파트 매매 기본", test_apt_trade),
+        ("AptTradeDetailAPIClient", "아파트 매매 실거래가 상세", test_apt_trade_detail),
+        ("AptRentAPIClient", "아파트 전월세 실거래가", test_apt_rent),
+        ("AptSilvTradeAPIClient", "아파트 분양권 전매 실거래가", test_apt_silv_trade),
+        ("InduTradeAPIClient", "공장·창고 등 매매 실거래가", test_indu_trade),
+        ("LandTradeAPIClient", "토지 매매 실거래가", test_land_trade),
+        ("NrgTradeAPIClient", "상업업무용 매매 실거래가", test_nrg_trade),
+        ("OfficetelRentAPIClient", "오피스텔 전월세 실거래가", test_officetel_rent),
+        ("OfficetelTradeAPIClient", "오피스텔 매매 실거래가", test_officetel_trade),
+        ("RHRentAPIClient", "연립다세대 전월세 실거래가", test_rh_rent),
+        ("RHTradeAPIClient", "연립다세대 매매 실거래가", test_rh_trade),
+        ("SHRentAPIClient", "단독다가구 전월세 실거래가", test_sh_rent),
+        ("SHTradeAPIClient", "단독다가구 매매 실거래가", test_sh_trade),
+    ]
+    return [
+        # 1. 법정동코드
+        ("LegalDongCodeAPIClient", "법정동코드 조회", lambda: test_legal_dong_code(keyword=legal_dong_keyword)),
+        # 2-14. 실거래가 APIs
+        *[
+            (api_name, api_name_kr, lambda test=test: test(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
+            for api_name, api_name_kr, test in rtms_tests
+        ],
+        # 15. 건축물대장
+        ("BuildingLedgerAPIClient", "건축물대장 정보", lambda: test_building_ledger(
+            sigungu_cd=sigungu_cd,
+            bjdong_cd=bjdong_cd,
+            bun=bun,
+            ji=ji
+        )),
+    ]
+
+
+async def _run_api_tests(calls: List[tuple]) -> List[APITestResult]:
+    """
+    API 테스트 동시 실행 (호출별 타임아웃, 부분 결과)
+
+    전체 소요 시간은 가장 느린 API 1개 수준 (순차 실행 시 15개의 합).
+    타임아웃/예외가 난 API는 실패 결과로 채워 넣습니다.
+    """
+    from core.fanout import fan_out
+
+    outcomes = await fan_out(
+        [(api_name, factory) for api_name, _, factory in calls],
+        timeout_sec=settings.public_data_call_timeout_sec,
+        max_concurrency=settings.public_data_max_concurrency,
+    )
+
+    results: List[APITestResult] = []
+    for (api_name, api_name_kr, _), outcome in zip(calls, outcomes):
+        if outcome.ok:
+            results.append(outcome.value)
+        else:
+            results.append(APITestResult(
+                success=False,
+                api_name=api_name,
+                api_name_kr=api_name_kr,
+                execution_time_ms=outcome.elapsed_ms,
+                error=outcome.error,
+            ))
+    return results
+
+
+def _latency_table(results: List[APITestResult]) -> List[Dict[str, Any]]:
+    """API별 소요 시간 (느린 순)"""
+    return [
+        {
+            "api_name": r.api_name,
+            "api_name_kr": r.api_name_kr,
+            "success": r.success,
+            "execution_time_ms": r.execution_time_ms,
+        }
+        for r in sorted(results, key=lambda r: r.execution_time_ms, reverse=True)
+    ]
+
+
 # ===========================
 # 케이스 기반 API 테스트 (실제 주소 사용)
 # ===========================
@@ -889,8 +979,8 @@ async def test_apis_by_case(case_id: str):
         )
 
     # Step 2: 주소 변환 (AddressConverter)
-    converter = AddressConverter()
-    addr_result = await converter.convert(property_address)
+    async with AddressConverter() as converter:
+        addr_result = await converter.convert(property_address)
 
     # 주소 변환 결과를 첫 번째 결과로 추가
     results.append(APITestResult(
@@ -931,32 +1021,17 @@ async def test_apis_by_case(case_id: str):
 
     logger.info(f"[API Tester] 케이스 기반 테스트: address={property_address}, lawd_cd={lawd_cd}, sigungu_cd={sigungu_cd}, bjdong_cd={bjdong_cd}")
 
-    # Step 3: 15개 API 호출 (실제 코드 사용)
-    # 1. 법정동코드
-    results.append(await test_legal_dong_code(keyword=property_address))
-
-    # 2-14. 실거래가 APIs
-    results.append(await test_apt_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_apt_trade_detail(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_apt_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_apt_silv_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_indu_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_land_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_nrg_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_officetel_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_officetel_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_rh_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_rh_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_sh_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_sh_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-
-    # 15. 건축물대장
-    results.append(await test_building_ledger(
+    # Step 3: 15개 API 동시 호출 (실제 코드 사용)
+    api_results = await _run_api_tests(_all_api_calls(
+        legal_dong_keyword=property_address,
+        lawd_cd=lawd_cd,
+        deal_ymd=deal_ymd,
         sigungu_cd=sigungu_cd,
         bjdong_cd=bjdong_cd,
         bun=bun,
-        ji=ji
+        ji=ji,
     ))
+    results.extend(api_results)
 
     total_execution_time = (time.time() - total_start_time) * 1000
     success_count = sum(1 for r in results if r.success)
@@ -967,7 +1042,8 @@ async def test_apis_by_case(case_id: str):
         success_count=success_count,
         fail_count=fail_count,
         total_execution_time_ms=round(total_execution_time, 2),
-        results=results
+        results=results,
+        latency_table=_latency_table(api_results)
     )
 
 
@@ -984,39 +1060,21 @@ async def test_all_apis(
     """
     전체 15개 API 일괄 테스트
 
-    - 모든 API를 순차적으로 호출
-    - 성공/실패 통계 반환
+    - 모든 API를 동시에 호출 (호출별 타임아웃, 실패한 API만 실패로 기록)
+    - 성공/실패 통계 + API별 소요 시간 표 반환
     """
     if deal_ymd is None:
         deal_ymd = get_current_deal_ymd()
 
     total_start_time = time.time()
-    results: List[APITestResult] = []
-
-    # 1. 법정동코드
-    results.append(await test_legal_dong_code(keyword="서울특별시 강남구"))
-
-    # 2-14. 실거래가 APIs
-    results.append(await test_apt_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_apt_trade_detail(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_apt_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_apt_silv_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_indu_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_land_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_nrg_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_officetel_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_officetel_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_rh_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_rh_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_sh_rent(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-    results.append(await test_sh_trade(lawd_cd=lawd_cd, deal_ymd=deal_ymd))
-
-    # 15. 건축물대장
-    results.append(await test_building_ledger(
+    results = await _run_api_tests(_all_api_calls(
+        legal_dong_keyword="서울특별시 강남구",
+        lawd_cd=lawd_cd,
+        deal_ymd=deal_ymd,
         sigungu_cd=sigungu_cd,
         bjdong_cd=bjdong_cd,
         bun=DEFAULT_BUN,
-        ji=DEFAULT_JI
+        ji=DEFAULT_JI,
     ))
 
     total_execution_time = (time.time() - total_start_time) * 1000
@@ -1028,7 +1086,8 @@ async def test_all_apis(
         success_count=success_count,
         fail_count=fail_count,
         total_execution_time_ms=round(total_execution_time, 2),
-        results=results
+        results=results,
+        latency_table=_latency_table(results)
     )
 
 
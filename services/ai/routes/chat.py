@@ -16,6 +16,7 @@ from datetime import datetime
 from core.auth import get_current_user
 from core.supabase_client import get_supabase_client
 from core.settings import settings
+from core.pagination import apply_keyset, split_page, InvalidCursorError
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +103,7 @@ class GetMessagesResponse(BaseModel):
     conversation_id: str
     messages: List[Message]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class RecentConversation(BaseModel):
@@ -382,14 +384,18 @@ async def send_message(
 async def get_messages(
     conversation_id: str,
     limit: int = 100,
-    offset: int = 0,
+    cursor: Optional[str] = None,
     user: dict = Depends(get_current_user)
 ):
     """
     대화의 채팅 메시지 조회
+
+    - 시간순 (created_at ASC, id ASC) keyset 페이지네이션
+    - 다음 페이지는 응답의 next_cursor를 cursor로 전달
     """
     user_id = user["sub"]
     logger.info(f"메시지 조회: user_id={user_id}, conversation_id={conversation_id}")
+    limit = max(1, min(limit, 500))
 
     try:
         supabase = get_supabase_client(service_role=True)
@@ -404,15 +410,18 @@ async def get_messages(
         if not conv_check.data:
             raise HTTPException(404, "대화를 찾을 수 없거나 권한이 없습니다")
 
-        # 2. 메시지 조회
-        result = supabase.table("messages") \
+        # 2. 메시지 조회 (limit + 1개로 다음 페이지 존재 여부 판단)
+        query = supabase.table("messages") \
             .select("id, role, content, meta, created_at") \
-            .eq("conversation_id", conversation_id) \
-            .order("created_at", desc=False) \
-            .limit(limit) \
-            .execute()
+            .eq("conversation_id", conversation_id)
+
+        try:
+            query = apply_keyset(query, cursor, desc=False)
+        except InvalidCursorError:
+            raise HTTPException(400, "잘못된 커서입니다")
 
-        messages = result.data or []
+        result = query.limit(limit + 1).execute()
+        messages, next_cursor = split_page(result.data or [], limit)
 
         # meta에서 컴포넌트/확장 정보 추출
         formatted_messages = []
@@ -432,7 +441,8 @@ async def get_messages(
         return GetMessagesResponse(
             conversation_id=conversation_id,
             messages=formatted_messages,
-            total=len(formatted_messages)
+            total=len(formatted_messages),
+            next_cursor=next_cursor
         )
 
     except HTTPException:
@@ -666,12 +676,13 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
 
             user_message_id = user_msg_result.data[0]["id"]
 
-            # 3. 대화 히스토리 조회 (최근 10개 메시지)
+            # 3. 대화 히스토리 조회 (최근 N개 메시지만, 대화 길이와 무관하게 고정 비용)
             history_result = supabase.table("messages") \
                 .select("role, content") \
                 .eq("conversation_id", request.conversation_id) \
                 .order("created_at", desc=True) \
-                .limit(10) \
+                .order("id", desc=True) \
+                .limit(settings.chat_history_limit) \
                 .execute()
 
             history = history_result.data or []
@@ -684,16 +695,30 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
             if conversation.get("contract_type"):
                 context_parts.append(f"**계약 유형**: {conversation['contract_type']}")
 
+            # 최근 대화: 토큰 예산 안에서 최신 메시지부터 (오래된 메시지부터 제외)
+            from core.prompt_budget import count_tokens, take_recent
+
+            history_lines = [
+                f"- {'사용자' if msg['role'] == 'user' else 'AI'}: {msg['content']}"
+                for msg in history
+            ]
+            history_lines = take_recent(
+                history_lines,
+                settings.chat_history_max_tokens,
+                model=settings.openai_analysis_model,
+                max_item_tokens=max(1, settings.chat_history_max_tokens // 3),
+            )
             context_parts.append("\n**최근 대화**:")
-            for msg in history[-5:]:  # 최근 5개만
-                role_label = "사용자" if msg["role"] == "user" else "AI"
-                context_parts.append(f"- {role_label}: {msg['content'][:100]}")
+            context_parts.extend(history_lines)
 
             context = "\n".join(context_parts)
+            logger.info(
+                f"채팅 컨텍스트: 대화 {len(history_lines)}/{len(history)}개, "
+                f"{count_tokens(context, settings.openai_analysis_model)}토큰"
+            )
 
             # 5. 듀얼 LLM 스트리밍 준비
-            from langchain_openai import ChatOpenAI
-            from langchain_anthropic import ChatAnthropic
+            from core.llm_clients import get_chat_model
             from langchain_core.messages import SystemMessage, HumanMessage
 
             # 시스템 프롬프트
@@ -710,26 +735,51 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
 - 출처 정보는 절대 노출하지 말 것
 """
 
+            models = {"openai": settings.openai_analysis_model, "claude": "claude-3-5-sonnet-latest"}
+            provider_labels = {"openai": "ChatGPT", "claude": "Claude"}
+            # 초안 제공자 (헤징에서 Claude가 이기면 검증은 OpenAI가 맡아 자기 검증을 피함)
+            roles = {"draft": "openai"}
+
+            def judge_provider() -> str:
+                return "openai" if roles["draft"] == "claude" else "claude"
+
             # GPT-4o-mini 초안 생성기
             async def stream_gpt_draft():
-                """GPT-4o-mini 초안 스트리밍"""
-                llm = ChatOpenAI(model=settings.openai_analysis_model, temperature=0.3, max_tokens=2048, streaming=True)
+                """GPT-4o-mini 초안 스트리밍 (첫 토큰이 늦으면 Claude에도 요청, 먼저 나온 쪽 사용)"""
+                from core.dual_provider import approx_prompt_tokens, get_hedge_router
+                from core.llm_streaming import ensure_text
+
                 messages = [
                     SystemMessage(content=system_prompt.format(context=context)),
                     HumanMessage(content=request.content)
                 ]
 
-                async for chunk in llm.astream(messages):
+                def draft_stream(provider: str):
+                    llm = get_chat_model(provider, models[provider], temperature=0.3, max_tokens=2048, streaming=True)
+                    return llm.astream(messages)
+
+                if settings.llm_hedge_enabled:
+                    chunks = get_hedge_router().astream(
+                        "chat_draft", draft_stream, primary="openai",
+                        models=models, prompt_tokens=approx_prompt_tokens(messages),
+                        on_select=lambda provider: roles.update(draft=provider),
+                    )
+                else:
+                    chunks = draft_stream("openai")
+
+                async for chunk in chunks:
                     if hasattr(chunk, 'content') and chunk.content:
-                        yield chunk.content
+                        yield ensure_text(chunk.content)
 
             # Claude Sonnet 검증 생성기 팩토리
             def stream_claude_validation(draft_content: str):
-                """Claude Sonnet 검증 스트리밍 (팩토리)"""
+                """Claude Sonnet 검증 스트리밍 (팩토리, Claude가 초안을 썼으면 OpenAI가 검증)"""
                 async def _generator():
+                    from core.prompt_budget import truncate_tokens
+
                     judge_prompt = """너는 부동산 계약 리스크 점검 검증자이다.
 
-다음은 ChatGPT가 생성한 초안이다:
+다음은 {draft_label}가 생성한 초안이다:
 
 {draft}
 
@@ -749,10 +799,15 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
 ### 최종 권장사항
 ...
 """
-                    judge_model = settings.claude_analysis_model
-                    llm = ChatAnthropic(model=judge_model, temperature=0.1, max_tokens=2048, streaming=True)
+                    judge = judge_provider()
+                    judge_model = models[judge]
+                    llm = get_chat_model(judge, judge_model, temperature=0.1, max_tokens=2048, streaming=True)
+                    max_draft_tokens = settings.llm_judge_draft_max_tokens
+                    draft = truncate_tokens(draft_content, max_draft_tokens, judge_model, tail_tokens=max_draft_tokens // 3)
                     messages = [
-                        SystemMessage(content=judge_prompt.format(draft=draft_content)),
+                        SystemMessage(content=judge_prompt.format(
+                            draft_label=provider_labels[roles["draft"]], draft=draft,
+                        )),
                         HumanMessage(content=request.content)
                     ]
 
@@ -762,9 +817,11 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
                                 yield chunk.content
                     except Exception as e:
                         # Fallback to Haiku
-                        if "NotFound" in str(e) or "not_found_error" in str(e):
+                        if judge == "claude" and ("NotFound" in str(e) or "not_found_error" in str(e)):
                             logger.warning(f"Claude Sonnet 실패, Haiku로 fallback: {e}")
-                            llm = ChatAnthropic(model="claude-3-5-haiku-latest", temperature=0.1, max_tokens=2048, streaming=True)
+                            llm = get_chat_model(
+                                "claude", "claude-3-5-haiku-latest", temperature=0.1, max_tokens=2048, streaming=True
+                            )
                             async for chunk in llm.astream(messages):
                                 if hasattr(chunk, 'content') and chunk.content:
                                     yield chunk.content
@@ -798,21 +855,22 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
 
             # 7. AI 응답 저장
             # 불일치 항목 추출
+            draft_label, judge_label = provider_labels[roles["draft"]], provider_labels[judge_provider()]
             conflicts = []
             if "수정 필요" in validation_content:
-                conflicts.append("Claude가 초안에 수정이 필요하다고 판단했습니다.")
+                conflicts.append(f"{judge_label}가 초안에 수정이 필요하다고 판단했습니다.")
             if "추가 필요" in validation_content:
-                conflicts.append("Claude가 누락된 항목이 있다고 판단했습니다.")
+                conflicts.append(f"{judge_label}가 누락된 항목이 있다고 판단했습니다.")
 
             # 최종 답변 생성
             if len(conflicts) == 0:
                 final_answer = draft_content
                 confidence = 0.95
             else:
-                final_answer = f"""### ChatGPT 초안
+                final_answer = f"""### {draft_label} 초안
 {draft_content}
 
-### Claude 검증 의견
+### {judge_label} 검증 의견
 {validation_content}
 
 ⚠️ 두 모델 간 견해 차이가 있습니다. 최종 판단은 법무사 또는 변호사와 상담하세요.
@@ -828,8 +886,8 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
                     "topic": "contract_analysis",
                     "extension": "chat",
                     "dual_llm": {
-                        "draft_model": "gpt-4o-mini",
-                        "validation_model": last_validation_event.get("model", "claude-3-5-sonnet-latest"),
+                        "draft_model": models[roles["draft"]],
+                        "validation_model": last_validation_event.get("model", models[judge_provider()]),
                         "confidence": confidence,
                         "conflicts": conflicts
                     }
@@ -845,8 +903,11 @@ async def stream_chat(request: StreamChatRequest, user: dict = Depends(get_curre
             logger.error(f"채팅 스트리밍 오류: {e}", exc_info=True)
             yield f"data: {json.dumps({'error': f'답변 생성 중 오류 발생: {str(e)}'}, ensure_ascii=False)}\n\n"
 
+    # 채팅은 분석/부가 작업보다 먼저 LLM 허가를 받음
+    from core.llm_governor import with_llm_priority
+
     return StreamingResponse(
-        event_generator(),
+        with_llm_priority(event_generator(), "interactive"),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -8,16 +8,18 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel, Field
-from openai import AsyncOpenAI
 from core.auth import get_current_user
+from core.llm_governor import llm_priority
 from core.supabase_client import get_supabase_client
-from core.settings import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat/v2", tags=["chat-v2"])
 
-# OpenAI 클라이언트 초기화
-client = AsyncOpenAI(api_key=settings.openai_api_key)
+def get_openai_client():
+    """OpenAI SDK 클라이언트 (첫 요청 시 생성, core/llm_clients의 공유 커넥션 풀 사용)"""
+    from core.llm_clients import get_llm_registry
+
+    return get_llm_registry().openai_sdk_client()
 
 # ===========================
 # Request/Response Models
@@ -251,14 +253,15 @@ async def chat_with_gpt(
         # GPT-4o-mini 호출 with Function Calling
         logger.info(f"Calling GPT-4o-mini with {len(messages)} messages")
 
-        completion = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            tools=get_tool_definitions(),
-            tool_choice="auto",
-            temperature=0.7,
-            max_tokens=1000
-        )
+        with llm_priority("interactive"):
+            completion = await get_openai_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                tools=get_tool_definitions(),
+                tool_choice="auto",
+                temperature=0.7,
+                max_tokens=1000
+            )
 
         response_message = completion.choices[0].message
 
@@ -400,14 +403,15 @@ async def chat_with_conversation(
         logger.info(f"Calling GPT-4o-mini with {len(messages)} messages (recent_context: {bool(request.recent_context)})")
 
         # 4. GPT-4o-mini 호출
-        completion = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            tools=get_tool_definitions(),
-            tool_choice="auto",
-            temperature=0.7,
-            max_tokens=1000
-        )
+        with llm_priority("interactive"):
+            completion = await get_openai_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                tools=get_tool_definitions(),
+                tool_choice="auto",
+                temperature=0.7,
+                max_tokens=1000
+            )
 
         response_message = completion.choices[0].message
 
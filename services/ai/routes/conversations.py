@@ -7,11 +7,12 @@ import logging
 import asyncio
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from core.supabase_client import get_supabase_client
 from core.auth import get_current_user
+from core.pagination import apply_keyset, split_page, InvalidCursorError
 from core.llm_router import single_model_analyze
 import json
 import ulid
@@ -65,7 +66,7 @@ class MessageResponse(BaseModel):
 
 class PaginationParams(BaseModel):
     """페이지네이션 파라미터"""
-    cursor: Optional[str] = None  # 마지막 메시지 ID (ULID 정렬)
+    cursor: Optional[str] = None  # 불투명 keyset 커서 (X-Next-Cursor 헤더 값)
     limit: int = Field(default=50, ge=1, le=100)
 
 
@@ -171,6 +172,7 @@ async def get_conversation(
 @router.get("/{conversation_id}/messages", response_model=List[MessageResponse])
 async def list_messages(
     conversation_id: str,
+    response: Response,
     cursor: Optional[str] = None,
     limit: int = 50,
     user: dict = Depends(get_current_user)
@@ -179,9 +181,11 @@ async def list_messages(
     메시지 목록 조회 (페이지네이션)
 
     - RLS: 참여자만 조회 가능
-    - 커서 기반 페이지네이션 (created_at DESC, id)
+    - Keyset 페이지네이션 (created_at DESC, id DESC), 페이지당 쿼리 1회
+    - 다음 페이지 커서는 X-Next-Cursor 응답 헤더로 전달 (마지막 페이지면 없음)
     """
     supabase = get_supabase_client()
+    limit = max(1, min(limit, 100))
 
     try:
         # 대화방 참여자 확인 (RLS가 자동으로 처리하지만 명시적 확인)
@@ -193,27 +197,21 @@ async def list_messages(
         if not conv_check.data:
             raise HTTPException(404, "Conversation not found or access denied")
 
-        # 메시지 조회
+        # 메시지 조회 (limit + 1개로 다음 페이지 존재 여부 판단)
         query = supabase.table("messages") \
             .select("*") \
-            .eq("conversation_id", conversation_id) \
-            .order("created_at", desc=True) \
-            .limit(limit)
-
-        # 커서 기반 페이지네이션
-        if cursor:
-            # cursor는 이전 조회의 마지막 메시지 ID
-            # created_at이 cursor 메시지보다 작은 것만 조회
-            cursor_msg = supabase.table("messages") \
-                .select("created_at") \
-                .eq("id", cursor) \
-                .execute()
+            .eq("conversation_id", conversation_id)
+
+        try:
+            query = apply_keyset(query, cursor, desc=True)
+        except InvalidCursorError:
+            raise HTTPException(400, "Invalid cursor")
 
-            if cursor_msg.data:
-                cursor_time = cursor_msg.data[0]['created_at']
-                query = query.lt("created_at", cursor_time)
+        query_response = query.limit(limit + 1).execute()
+        rows, next_cursor = split_page(query_response.data or [], limit)
 
-        response = query.execute()
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
 
         messages = [
             MessageResponse(
@@ -228,7 +226,7 @@ async def list_messages(
                 created_at=msg['created_at'],
                 updated_at=msg['updated_at']
             )
-            for msg in response.data
+            for msg in rows
         ]
 
         logger.info(f"메시지 조회 완료: {len(messages)}개, conversation={conversation_id}")
@@ -165,3 +165,100 @@ async def prepare_summary_endpoint(request: PrepareSummaryRequest):
     except Exception as e:
         logger.error(f"[Dev] 요약 리포트 생성 오류: {e}", exc_info=True)
         raise HTTPException(500, f"요약 리포트 생성 중 오류 발생: {str(e)}")
+
+
+@router.get("/retrieval-stats")
+async def retrieval_stats_endpoint():
+    """
+    하이브리드 검색 통계 (디버깅 전용)
+
+    - 요청 수 / 캐시 적중률
+    - 평균·최근 검색 지연 시간 (캐시 미스 기준)
+    - 전문 검색 실패 횟수
+    """
+    from core.hybrid_retriever import get_retrieval_stats
+
+    return get_retrieval_stats()
+
+
+@router.get("/public-data-quota")
+async def public_data_quota_endpoint():
+    """
+    data.go.kr 호출 한도 현황 (디버깅 전용)
+
+    - API별 오늘 사용량 / 일일 한도 / 남은 예산 비율
+    - 예산 부족 여부 (저장된 데이터 우선 사용 중)
+    - 토큰 버킷 잔여 토큰, 카운터 저장소 (redis | memory)
+    """
+    from core.data_go_kr_quota import get_public_data_quota
+
+    return await get_public_data_quota().metrics()
+
+
+@router.get("/endpoint-health")
+async def endpoint_health_endpoint():
+    """
+    업스트림 엔드포인트 상태 (디버깅 전용)
+
+    - 그룹별(new/old URL 등) 서킷 상태: closed | open | half_open
+    - 연속 실패 횟수, 지연 시간 EWMA, 회복 확인까지 남은 시간
+    """
+    from core.endpoint_health import get_endpoint_registry
+
+    return get_endpoint_registry().snapshot()
+
+
+@router.get("/llm-clients")
+async def llm_clients_endpoint():
+    """
+    LLM 클라이언트 레지스트리 현황 (디버깅 전용)
+
+    - 캐시된 모델 인스턴스 수, 생성/재사용 횟수
+    - 제공자별 HTTP 요청 수 / 새 연결 수 / 연결 재사용률
+    - 모델별 첫 토큰 지연(TTFT) / 응답 시간 EWMA
+    """
+    from core.llm_clients import get_llm_registry
+
+    return get_llm_registry().snapshot()
+
+
+@router.get("/llm-governor")
+async def llm_governor_endpoint():
+    """
+    LLM 동시 호출 제어 현황 (디버깅 전용)
+
+    - 제공자별 현재 동시 요청 한도 / 진행 중 / 대기열 길이 (우선순위별)
+    - 남은 분당 요청/토큰 예산, 속도 제한(429) 응답 수, 일시 중지 남은 시간
+    - 우선순위별 허가 수 / 대기 시간 EWMA / 최대 대기 시간 / 대기 시간 초과 수
+    """
+    from core.llm_governor import get_llm_governor
+
+    return get_llm_governor().snapshot()
+
+
+@router.get("/llm-hedging")
+async def llm_hedging_endpoint():
+    """
+    LLM 헤징 현황 (디버깅 전용)
+
+    - 호출부별 요청 수 / 헤징 비율 / 보조 제공자 승리 / 오류 fallback / 건너뛴 요청
+    - 사용자가 받은 첫 토큰 지연 p50/p95/p99, 제공자별 첫 토큰 지연과 현재 헤징 대기 시간
+    - 취소된 요청의 추가 토큰 / 추가 비용 (USD), 제공자 서킷 브레이커 상태
+    """
+    from core.dual_provider import get_hedge_router
+
+    return get_hedge_router().snapshot()
+
+
+@router.get("/llm-cache")
+async def llm_cache_endpoint():
+    """
+    LLM 응답 캐시 현황 (디버깅 전용)
+
+    - 메모리 계층 항목 수 / 적중률, Postgres 계층 적중 / 오류, 우회 요청 수
+    - operation별(draft / validation / summary) 적중률, 절약 토큰, 절약 비용 (CostMonitor)
+    """
+    from core.cost_monitor import get_cost_monitor
+    from core.llm_cache import get_llm_cache
+
+    return {**get_llm_cache().stats(), "savings": get_cost_monitor().get_cache_stats()}
@@ -10,10 +10,8 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 
 from core.auth import get_current_user
-from core.public_data_api import (
-    LegalDongCodeAPIClient,
-    AptTradeAPIClient,
-)
+from core.public_data_api import LegalDongCodeAPIClient
+from core.rtms_warehouse import fetch_transactions
 from core.settings import settings
 import httpx
 
@@ -64,9 +62,9 @@ async def fetch_public_data(
                 now = datetime.now()
                 deal_ymd = f"{now.year}{now.month:02d}"
                 try:
-                    apt = AptTradeAPIClient(settings.public_data_api_key, client=client)
-                    trades = await apt.get_apt_trades(lawd_cd=lawd5, deal_ymd=deal_ymd)
-                    items = trades.get("body", {}).get("items", [])
+                    items = await fetch_transactions(
+                        "apt_trade", lawd5, [deal_ymd], api_key=settings.public_data_api_key
+                    )
                     amounts = [i.get("dealAmount") for i in items if i.get("dealAmount")]
                     avg = int(sum(amounts) / len(amounts)) if amounts else None
                     market = {
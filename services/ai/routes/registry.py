@@ -14,7 +14,6 @@ from core.database import get_db_session, create_contract, create_document
 from core.encryption import encrypt
 from core.auth import get_current_user
 from ingest.pdf_parse import parse_pdf_to_text
-from ingest.upsert_vector import upsert_document_embeddings
 from ingest.registry_parser import parse_registry_pdf
 from core.supabase_client import get_supabase_client, supabase_storage
 from core.settings import settings
@@ -195,6 +194,8 @@ async def upload_registry(
 
         # 7. 벡터 임베딩 생성 (비동기 처리 가능)
         try:
+            from ingest.upsert_vector import upsert_document_embeddings  # PGVector/임베딩 스택은 첫 사용 시 로드
+
             upsert_document_embeddings(
                 doc_id=str(document.id),
                 user_id=str(user_uuid),
@@ -0,0 +1,115 @@
+"""
+Cold start 프로파일: `import app` 모듈별 import 시간
+
+python -X importtime 결과를 누적 시간 순으로 정리합니다.
+Cloud Run cold start에서 첫 요청을 막는 무거운 모듈을 찾을 때 사용하세요.
+
+사용법:
+    python scripts/startup_profile.py              # 상위 30개 모듈
+    python scripts/startup_profile.py --top 60 --depth 3
+    python scripts/startup_profile.py --json > startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List
+
+SERVICE_ROOT = Path(__file__).resolve().parent.parent
+
+# 시작 시 로드되면 안 되는 무거운 모듈 (엔드포인트 첫 호출 시 로드)
+LAZY_MODULES = [
+    "openai",
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_community",
+    "sentence_transformers",
+    "google.generativeai",
+    "anthropic",
+]
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    depth: int  # import 트리 깊이 (0 = target)
+    self_ms: float
+    cumulative_ms: float
+
+
+def profile_imports(target: str = "app", env: dict | None = None) -> List[ImportTiming]:
+    """
+    새 인터프리터에서 target을 import하며 모듈별 시간 측정
+
+    Raises:
+        RuntimeError: target import 실패
+    """
+    process_env = {**os.environ, **(env or {})}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=SERVICE_ROOT,
+        env=process_env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {target} 실패:\n{result.stderr[-2000:]}")
+
+    timings: List[ImportTiming] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        stripped = name.lstrip()
+        timings.append(ImportTiming(
+            module=stripped.strip(),
+            depth=(len(name) - len(stripped) - 1) // 2,
+            self_ms=int(self_us) / 1000,
+            cumulative_ms=int(cumulative_us) / 1000,
+        ))
+    return timings
+
+
+def total_ms(timings: List[ImportTiming], target: str = "app") -> float:
+    return next((t.cumulative_ms for t in timings if t.module == target), 0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="app")
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument("--depth", type=int, default=2, help="이 깊이까지의 모듈만 표시")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    timings = profile_imports(args.target)
+    loaded = {t.module for t in timings}
+    rows = sorted(
+        (t for t in timings if t.depth <= args.depth),
+        key=lambda t: t.cumulative_ms,
+        reverse=True,
+    )[: args.top]
+
+    if args.json:
+        print(json.dumps({
+            "target": args.target,
+            "total_ms": total_ms(timings, args.target),
+            "modules": [asdict(t) for t in rows],
+            "eager_heavy_modules": [m for m in LAZY_MODULES if m in loaded],
+        }, ensure_ascii=False, indent=2))
+        return
+
+    print(f"import {args.target}: {total_ms(timings, args.target):,.0f} ms ({len(timings)} modules)\n")
+    print(f"{'cumulative':>11} {'self':>8}  module")
+    for t in rows:
+        print(f"{t.cumulative_ms:>9.1f}ms {t.self_ms:>6.1f}ms  {'  ' * t.depth}{t.module}")
+
+    eager = [m for m in LAZY_MODULES if m in loaded]
+    print(f"\n시작 시 로드된 무거운 모듈: {', '.join(eager) if eager else '없음'}")
+
+
+if __name__ == "__main__":
+    main()
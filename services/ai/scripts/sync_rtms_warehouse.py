@@ -0,0 +1,54 @@
+"""
+RTMS 실거래가 웨어하우스 증분 동기화 스크립트
+
+확정된 과거 월은 건너뛰고 새 월/미확정 월만 data.go.kr에서 조회합니다.
+cron / Cloud Scheduler 등에서 주기적으로 실행하세요.
+
+사용법:
+    python scripts/sync_rtms_warehouse.py 11680 11650 --months 36
+    python scripts/sync_rtms_warehouse.py 11680 --types apt_trade apt_rent
+    python scripts/sync_rtms_warehouse.py --coverage
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import core modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.rtms_warehouse import RTMS_SOURCES, get_rtms_warehouse, sync_region
+
+
+async def main(args: argparse.Namespace) -> None:
+    warehouse = get_rtms_warehouse()
+
+    for lawd_cd in args.lawd_cds:
+        fetched = await sync_region(
+            lawd_cd,
+            property_types=args.types,
+            months=args.months,
+            force=args.force,
+            warehouse=warehouse,
+        )
+        for property_type, count in fetched.items():
+            print(f"{lawd_cd} {property_type:16s} API 조회 {count}개월")
+
+    if args.coverage or not args.lawd_cds:
+        print(f"\n웨어하우스: {warehouse.path}")
+        for row in warehouse.coverage():
+            print(f"{row['property_type']:16s} {row['lawd_cd']} {row['from']}~{row['to']} "
+                  f"({row['months']}개월, {row['items']:,}건)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RTMS 실거래가 웨어하우스 증분 동기화")
+    parser.add_argument("lawd_cds", nargs="*", help="법정동코드 5자리 (시군구)")
+    parser.add_argument("--types", nargs="+", choices=sorted(RTMS_SOURCES), help="상품 (기본: 전체)")
+    parser.add_argument("--months", type=int, default=24, help="당월부터 과거 개월 수 (기본: 24)")
+    parser.add_argument("--force", action="store_true", help="확정 파티션도 다시 조회")
+    parser.add_argument("--coverage", action="store_true", help="동기화 현황 출력")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,171 @@
+"""
+주소 변환 캐시 / 일괄 변환 테스트 (API 호출 없이 조회 함수 대체)
+
+- 같은 주소(공백만 다른 경우 포함) 반복 변환 시 API 1회
+- 실패 결과는 캐시하지 않음
+- convert_many: 중복 제거, 입력 순서 유지, 동시 조회 수 제한, 같은 키워드 조회 공유
+- 공유 조회: 첫 호출이 취소되어도 계속 실행, 캐시된 조회 결과는 복사본 반환
+- TTL 만료
+
+사용법:
+    python test_address_converter_cache.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.address_converter import AddressCache, AddressConverter, clear_address_cache, get_address_cache
+
+REGIONS = {
+    "서울특별시 강남구 역삼동": {"regionCd": "1168010100", "locataddNm": "서울특별시 강남구 역삼동", "lawd5": "11680"},
+    "경기도 파주시 법원읍": {"regionCd": "4139025000", "locataddNm": "경기도 파주시 법원읍", "lawd5": "41390"},
+}
+
+
+class FakeConverter(AddressConverter):
+    """법정동코드 API 대신 지연 + 호출 기록"""
+
+    def __init__(self, delay: float = 0.05):
+        super().__init__(juso_api_key="", public_data_api_key="test")
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def _fetch_legal_dong_code(self, address):
+        self.calls.append(address)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return REGIONS.get(address)
+        finally:
+            self.active -= 1
+
+
+def test_convert_is_memoized():
+    clear_address_cache()
+    converter = FakeConverter()
+
+    async def run():
+        first = await converter.convert("서울 강남구 역삼동 123-45")
+        second = await converter.convert("  서울   강남구 역삼동  123-45 ")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.success and first.sigungu_cd == "11680" and first.bjdong_cd == "10100"
+    assert second.model_dump() == first.model_dump()
+    assert converter.calls == ["서울특별시 강남구 역삼동"]
+
+    # 캐시된 결과를 수정해도 다음 호출에 영향 없음
+    second.parsed["bun"] = "999"
+    third = asyncio.run(converter.convert("서울 강남구 역삼동 123-45"))
+    assert third.parsed["bun"] == "123"
+
+
+def test_failures_not_cached():
+    clear_address_cache()
+    converter = FakeConverter()
+
+    async def run():
+        await converter.convert("부산 해운대구 우동 1")
+        await converter.convert("부산 해운대구 우동 1")
+
+    asyncio.run(run())
+    assert len(converter.calls) == 2
+
+
+def test_parse_returns_copy():
+    clear_address_cache()
+    converter = AddressConverter(juso_api_key="", public_data_api_key="")
+    parsed = converter.parse_address_regex("경기도 수원시 영통구 매탄동 1234")
+    parsed.bun = "0"
+    again = converter.parse_address_regex("경기도  수원시 영통구 매탄동 1234")
+    assert again.sigungu == "수원시 영통구" and again.bun == "1234"
+    assert again.raw_address == "경기도  수원시 영통구 매탄동 1234"
+
+
+def test_convert_many_dedupes_and_limits_concurrency():
+    clear_address_cache()
+    converter = FakeConverter(delay=0.1)
+    addresses = [
+        "서울 강남구 역삼동 123-45",
+        "경기도 파주시 법원읍 동문리 356-2",
+        "서울  강남구 역삼동 123-45",
+        "서울 강남구 역삼동 10",
+        "경기도 파주시 법원읍 동문리 1",
+        "서울 강남구 역삼동 11",
+    ]
+
+    start = time.perf_counter()
+    results = asyncio.run(converter.convert_many(addresses, max_concurrency=2))
+    elapsed = time.perf_counter() - start
+
+    assert [r.bun for r in results] == ["123", "356", "123", "10", "1", "11"]
+    assert all(r.success for r in results)
+    # 같은 동 키워드는 진행 중인 조회를 공유 → 법정동 API 2회 (순차 변환이면 6회)
+    assert sorted(converter.calls) == ["경기도 파주시 법원읍", "서울특별시 강남구 역삼동"], converter.calls
+    assert converter.max_active <= 2
+    assert elapsed < 0.4, f"동시 조회 → ~0.1s (순차 0.6s): {elapsed:.2f}s"
+    assert converter.client is None  # 일괄 변환이 만든 클라이언트는 닫힘
+
+
+def test_shared_lookup_survives_cancel_and_returns_copies():
+    clear_address_cache()
+    converter = FakeConverter(delay=0.05)
+    keyword = "서울특별시 강남구 역삼동"
+
+    async def run():
+        first = asyncio.create_task(converter.lookup_legal_dong_code(keyword))
+        await asyncio.sleep(0)  # 첫 호출이 공유 조회 시작
+        follower = asyncio.create_task(converter.lookup_legal_dong_code(keyword))
+        await asyncio.sleep(0)
+        first.cancel()
+        result = await follower
+        try:
+            await first
+            raise AssertionError("첫 호출은 취소되어야 함")
+        except asyncio.CancelledError:
+            pass
+        return result
+
+    result = asyncio.run(run())
+    assert result == REGIONS[keyword] and converter.calls == [keyword]  # 취소와 무관하게 1회 조회 후 공유
+    assert not converter._inflight
+
+    # 반환값을 수정해도 캐시는 그대로
+    result["lawd5"] = "00000"
+    cached = asyncio.run(converter.lookup_legal_dong_code(keyword))
+    assert cached == REGIONS[keyword] and cached is not REGIONS[keyword]
+    assert converter.calls == [keyword]
+
+
+def test_ttl_and_size_bounds():
+    cache = AddressCache(max_size=2, ttl_sec=0.05)
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+    cache.put(("c",), 3)
+    assert cache.get(("a",)) is None and cache.get(("c",)) == 3
+    time.sleep(0.06)
+    assert cache.get(("c",)) is None
+    assert cache.stats()["entries"] == 1
+
+
+if __name__ == "__main__":
+    test_convert_is_memoized()
+    print("[OK] 같은 주소 반복 변환 → API 1회")
+    test_failures_not_cached()
+    print("[OK] 실패 결과는 캐시하지 않음")
+    test_parse_returns_copy()
+    print("[OK] 정규식 파싱 캐시 (복사본 반환)")
+    test_convert_many_dedupes_and_limits_concurrency()
+    print("[OK] convert_many 중복 제거 / 동시 조회 제한")
+    test_shared_lookup_survives_cancel_and_returns_copies()
+    print("[OK] 공유 조회: 첫 호출 취소에도 유지, 복사본 반환")
+    test_ttl_and_size_bounds()
+    print("[OK] TTL / 최대 항목 수")
+    print(f"\n캐시 통계: {get_address_cache().stats()}")
@@ -0,0 +1,171 @@
+"""
+비동기 분석 경로 테스트 (core/llm_router.py, core/chains.py, POST /analyze - 외부 API 호출 없음)
+
+- call_with_deadline: 시도별 제한 시간 초과 시 코루틴 취소, 재시도는 전체 기한 안에서만
+- adual_model_analyze: 초안(OpenAI) → 검증(Claude) 비동기 호출 (로컬 가짜 LLM 서버)
+- 기한 초과 → 진행 중인 HTTP 요청이 실제로 끊김 (실행기 스레드처럼 남지 않음)
+- POST /analyze: 실행기 없이 기한 내 503, 진행 중인 분석 코루틴 취소
+
+사용법:
+    python test_async_analyze.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import core.llm_clients as llm_clients
+from core.llm_clients import LLMClientRegistry
+from core.llm_router import adual_model_analyze, asingle_model_analyze, call_with_deadline
+from core.settings import settings
+from test_llm_clients import FakeLLMServer, _point_to
+
+
+def test_deadline_cancels_and_retries():
+    cancelled = []
+    calls = []
+
+    async def slow():
+        calls.append(time.perf_counter())
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def run():
+        start = time.perf_counter()
+        try:
+            await call_with_deadline(slow, attempts=3, attempt_timeout_sec=0.1, deadline_sec=1.5)
+            raise AssertionError("기한 초과 시 TimeoutError")
+        except asyncio.TimeoutError:
+            pass
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    # 0.1 + 백오프 1 + 0.1 → 남은 0.3초는 두 번째 백오프에 소진, 세 번째 시도 없음
+    assert len(calls) == 2 and len(cancelled) == 2  # 시도마다 취소됨
+    assert 1.4 <= elapsed < 1.7
+
+    # 두 번째 시도에 성공
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("일시 오류")
+        return "ok"
+
+    assert asyncio.run(call_with_deadline(flaky, attempts=3, attempt_timeout_sec=1, deadline_sec=5)) == "ok"
+
+    # 호출한 쪽이 취소되면 재시도 없이 전파
+    async def outer():
+        task = asyncio.ensure_future(call_with_deadline(slow, attempts=3, attempt_timeout_sec=5, deadline_sec=10))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+
+    calls.clear()
+    assert asyncio.run(outer()) and len(calls) == 1
+
+
+def _with_fake_server(coro_factory, response_delay_sec: float = 0.0):
+    async def run():
+        async with FakeLLMServer(response_delay_sec=response_delay_sec) as server:
+            _point_to(server.url)
+            original = llm_clients._registry
+            llm_clients._registry = LLMClientRegistry()
+            try:
+                return await coro_factory(), server
+            finally:
+                await llm_clients._registry.aclose()
+                llm_clients._registry = original
+
+    return asyncio.run(run())
+
+
+def test_async_dual_and_single():
+    result, server = _with_fake_server(lambda: adual_model_analyze("전세 리스크는?", "제1조 전세금 5억"))
+    assert result.draft.content == "초안 완료" and result.draft.provider == "openai"
+    assert result.validation.content == "검증 완료" and result.validation.model == "claude-3-5-sonnet-latest"
+    assert result.confidence == 0.95 and result.final_answer == "초안 완료"
+    assert [body["model"] for body in server.bodies] == ["gpt-4o-mini", "claude-3-5-sonnet-latest"]
+    assert "초안 완료" in str(server.bodies[1]["system"])  # 검증 모델에 초안 전달
+
+    single, _ = _with_fake_server(lambda: asingle_model_analyze("질문", "컨텍스트", provider="claude"))
+    assert single.content == "검증 완료" and single.provider == "claude"
+
+
+def test_deadline_aborts_upstream_request():
+    async def analyze():
+        try:
+            await call_with_deadline(
+                lambda: adual_model_analyze("질문", "컨텍스트"),
+                attempts=2, attempt_timeout_sec=0.2, deadline_sec=1.5,
+            )
+        except asyncio.TimeoutError:
+            await asyncio.sleep(0.1)  # 서버가 연결 종료를 감지할 시간
+            return "timeout"
+
+    start = time.perf_counter()
+    outcome, server = _with_fake_server(analyze, response_delay_sec=5)
+    elapsed = time.perf_counter() - start
+    assert outcome == "timeout" and elapsed < 2.5  # 응답 지연 5초를 기다리지 않음
+    assert server.aborted == len(server.bodies) == 2  # 두 시도 모두 응답 전에 연결을 끊음
+
+
+def test_analyze_endpoint_deadline():
+    import app as app_module
+    import core.chains as chains
+    from fastapi import HTTPException
+
+    cancelled = []
+
+    async def slow_analyze(question, provider=None, k=6):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(question)
+            raise
+
+    original = (chains.asingle_model_analyze, settings.analyze_attempt_timeout_sec,
+                settings.analyze_deadline_sec, settings.analyze_max_attempts)
+    chains.asingle_model_analyze = slow_analyze
+    settings.analyze_attempt_timeout_sec, settings.analyze_deadline_sec, settings.analyze_max_attempts = 0.2, 1.5, 3
+
+    async def run():
+        # 라우터의 POST /analyze(케이스 분석)와 경로가 겹쳐 핸들러를 직접 호출
+        request = app_module.AnalyzeRequest(question="보증금 위험은?", mode="single")
+        start = time.perf_counter()
+        try:
+            await app_module.analyze_contract(request, user={"sub": "test-user"})
+            raise AssertionError("기한 초과 시 503")
+        except HTTPException as e:
+            return e.status_code, time.perf_counter() - start
+
+    try:
+        status_code, elapsed = asyncio.run(run())
+    finally:
+        chains.asingle_model_analyze, settings.analyze_attempt_timeout_sec, \
+            settings.analyze_deadline_sec, settings.analyze_max_attempts = original
+
+    assert status_code == 503
+    assert elapsed < 1.7  # 시도 0.2초 × 2 + 백오프 1초, 전체 기한 안에서 끝남
+    assert len(cancelled) == 2  # 시도마다 분석 코루틴이 취소됨 (남아서 실행되지 않음)
+
+
+if __name__ == "__main__":
+    test_deadline_cancels_and_retries()
+    print("[OK] 시도별 취소 / 전체 기한 / 재시도")
+    test_async_dual_and_single()
+    print("[OK] 비동기 듀얼 / 단일 분석")
+    test_deadline_aborts_upstream_request()
+    print("[OK] 기한 초과 → 업스트림 요청 중단")
+    test_analyze_endpoint_deadline()
+    print("[OK] POST /analyze 기한 내 503 + 분석 취소")
@@ -0,0 +1,129 @@
+"""
+OCR 컨센서스 유사도 벤치마크 (API 호출 없음)
+
+1. 긴 합성 등기부 텍스트에서 shingle 유사도 vs difflib.SequenceMatcher 속도/점수 비교
+2. 줄 단위 불일치 보고
+3. Gemini/Claude OCR 동시 실행 + 공통 마감 시간
+
+사용법:
+    python test_consensus_benchmark.py
+"""
+import asyncio
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.consensus import calculate_similarity, find_line_disagreements, parallel_ocr_with_consensus
+
+SIZES = [5_000, 20_000, 60_000]  # 문자 수 (실제 등기부 전문은 수십 KB)
+DIFFLIB_MAX_CHARS = 20_000  # 그 이상은 difflib이 수 분 걸려 생략 (60K ≈ 150초)
+
+
+def synthetic_registry(chars: int, seed: int = 0) -> str:
+    """등기사항전부증명서 형태의 합성 텍스트"""
+    rng = random.Random(seed)
+    lines = ["등기사항전부증명서(말소사항 포함) - 집합건물", "【 표 제 부 】 (1동의 건물의 표시)"]
+    n = 1
+    while sum(len(line) + 1 for line in lines) < chars:
+        kind = rng.choice(["근저당권설정", "소유권이전", "전세권설정", "압류", "가압류"])
+        lines.append(
+            f"{n} {kind} 20{rng.randint(10, 24)}년{rng.randint(1, 12)}월{rng.randint(1, 28)}일 "
+            f"제{rng.randint(10000, 99999)}호 채권최고액 금{rng.randint(1, 90) * 10_000_000:,}원 "
+            f"채무자 홍길동 서울특별시 강남구 테헤란로 {rng.randint(1, 500)}"
+        )
+        n += 1
+    return "\n".join(lines)[:chars]
+
+
+def ocr_noise(text: str, rate: float, seed: int = 1) -> str:
+    """OCR 오인식 흉내: 일부 문자 치환 + 일부 줄 누락"""
+    rng = random.Random(seed)
+    lines = []
+    for line in text.splitlines():
+        if rng.random() < rate / 2:
+            continue
+        lines.append("".join(
+            rng.choice("0O1l") if rng.random() < rate / 10 else ch for ch in line
+        ))
+    return "\n".join(lines)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    value = func(*args)
+    return value, (time.perf_counter() - start) * 1000
+
+
+def test_similarity_scale():
+    assert calculate_similarity("근저당권 설정", "근저당권  설정") == 1.0
+    assert calculate_similarity("", "") == 1.0
+    assert calculate_similarity("abcdefgh", "zyxwvuts") == 0.0
+
+    base = synthetic_registry(5_000)
+    noisy = ocr_noise(base, 0.1)
+    # autojunk=False: 기본값은 200자 이상에서 빈출 문자를 무시해 점수가 크게 낮아짐
+    reference = SequenceMatcher(None, base, noisy, autojunk=False).ratio()
+    assert abs(calculate_similarity(base, noisy) - reference) < 0.15
+
+
+def test_line_disagreements():
+    gemini = "갑구\n1 소유권이전 홍길동\n2 근저당권설정 금1억원\n을구"
+    claude = "갑구\n1 소유권이전 홍길동\n2 근저당권설정 금7억원\n을구\n3 압류"
+    diffs = find_line_disagreements(gemini, claude)
+    assert len(diffs) == 2
+    assert diffs[0].gemini_line.endswith("금1억원") and diffs[0].claude_line.endswith("금7억원")
+    assert diffs[1].gemini_line is None and diffs[1].claude_line == "3 압류"
+
+
+def test_parallel_ocr():
+    def slow_gemini(path):
+        time.sleep(0.3)
+        return "근저당권설정 채권최고액 금1억원"
+
+    async def slow_claude(path):
+        await asyncio.sleep(0.3)
+        return "근저당권설정 채권최고액 금1억원"
+
+    start = time.perf_counter()
+    result = asyncio.run(parallel_ocr_with_consensus("x.pdf", "pdf", slow_gemini, slow_claude))
+    elapsed = time.perf_counter() - start
+    assert result.confidence == "high"
+    assert elapsed < 0.5, f"OCR calls ran sequentially ({elapsed:.2f}s)"
+
+    async def hung_claude(path):
+        await asyncio.sleep(5)
+        return ""
+
+    result = asyncio.run(parallel_ocr_with_consensus("x.pdf", "pdf", slow_gemini, hung_claude, timeout_sec=0.5))
+    assert result.needs_review and result.agreed_text.startswith("근저당권")
+
+
+if __name__ == "__main__":
+    test_similarity_scale()
+    print("[OK] 유사도 스케일 (SequenceMatcher와 근사)")
+    test_line_disagreements()
+    print("[OK] 줄 단위 불일치 보고")
+    test_parallel_ocr()
+    print("[OK] OCR 동시 실행 + 마감 시간")
+
+    print("\n" + "=" * 60)
+    print(f"{'chars':>8} {'shingle':>10} {'difflib':>10} {'shingle/difflib score':>22} {'diff lines':>11}")
+    print("=" * 60)
+    for size in SIZES:
+        base = synthetic_registry(size)
+        noisy = ocr_noise(base, 0.1)
+        fast, fast_ms = _timed(calculate_similarity, base, noisy)
+        diffs, diff_ms = _timed(find_line_disagreements, base, noisy)
+        if size > DIFFLIB_MAX_CHARS:
+            print(f"{size:>8,} {fast_ms + diff_ms:>8.1f}ms {'skipped':>10} {fast:>14.3f}/{'-':<7} {len(diffs):>11}")
+            continue
+        slow, slow_ms = _timed(lambda a, b: SequenceMatcher(None, a, b, autojunk=False).ratio(), base, noisy)
+        print(
+            f"{size:>8,} {fast_ms + diff_ms:>8.1f}ms {slow_ms:>8.1f}ms "
+            f"{fast:>14.3f}/{slow:<7.3f} {len(diffs):>11}"
+        )
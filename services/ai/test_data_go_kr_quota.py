@@ -0,0 +1,174 @@
+"""
+data.go.kr 호출 한도 관리 테스트 (core/data_go_kr_quota.py)
+
+- 토큰 버킷: 버스트 이후 대기(실패하지 않음), 최대 대기 초과 시 예외
+- 일일 한도: 소진 시 QuotaExhaustedError, 카운터 키는 API/날짜(KST)별
+- 남은 예산은 공유 저장소 기준 (다른 워커의 사용량 포함)
+- 카운터 저장소 장애 → 잠시 메모리 카운터로 전환, 대기 시간 후 저장소 재시도
+- 예산 부족 시 RTMS 웨어하우스가 저장된 파티션 우선 사용
+
+사용법:
+    python test_data_go_kr_quota.py
+"""
+import asyncio
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import core.data_go_kr_quota as quota_module
+import core.rtms_warehouse as rtms
+from core.data_go_kr_quota import (
+    MemoryQuotaStore,
+    PublicDataQuota,
+    QuotaExhaustedError,
+    RateLimitExceededError,
+    TokenBucket,
+    quota_key,
+)
+from core.rtms_warehouse import RTMSWarehouse, fetch_transactions, recent_months
+
+APT_TRADE_URL = "https://apis.data.go.kr/1613000/RTMSDataSvcAptTradeDev/getRTMSDataSvcAptTradeDev"
+
+
+def test_quota_key():
+    assert quota_key(APT_TRADE_URL) == "RTMSDataSvcAptTradeDev"
+    assert quota_key("http://apis.data.go.kr/1613000/BldRgstHubService/getBrTitleInfo") == "BldRgstHubService"
+    assert quota_key("http://apis.data.go.kr/1741000/StanReginCd/getStanReginCdList") == "StanReginCd"
+
+
+def test_token_bucket_queues_then_fails():
+    async def run():
+        bucket = TokenBucket(rate=20, burst=2)
+        start = time.perf_counter()
+        waits = [await bucket.acquire(max_wait=1.0) for _ in range(4)]
+        elapsed = time.perf_counter() - start
+
+        assert waits[:2] == [0.0, 0.0]  # 버스트
+        assert 0.08 <= elapsed < 0.3, elapsed  # 2개 × 50ms 대기
+
+        slow = TokenBucket(rate=1, burst=1)
+        await slow.acquire(max_wait=0)
+        try:
+            await slow.acquire(max_wait=0.1)
+            raise AssertionError("대기 시간 초과 시 예외여야 함")
+        except RateLimitExceededError:
+            pass
+        # 실패한 예약은 취소됨 → 1초 후 바로 획득 가능한 상태
+        assert -0.01 < slow.tokens < 0.1
+
+    asyncio.run(run())
+
+
+def test_daily_quota_and_low_budget():
+    quota = PublicDataQuota(MemoryQuotaStore(), daily_quota=10, daily_quotas={"StanReginCd": 3},
+                            rate_per_sec=1000, burst=100, low_budget_ratio=0.2)
+
+    async def run():
+        for _ in range(3):
+            await quota.acquire("StanReginCd")
+        try:
+            await quota.acquire("StanReginCd")
+            raise AssertionError("한도 소진 시 예외여야 함")
+        except QuotaExhaustedError:
+            pass
+
+        for _ in range(8):
+            await quota.acquire("RTMSDataSvcAptTradeDev")
+        return await quota.metrics()
+
+    metrics = asyncio.run(run())
+    assert metrics["apis"]["StanReginCd"] == {
+        "used": 3, "limit": 3, "remaining": 0, "remaining_ratio": 0.0, "low": True,
+        "tokens": metrics["apis"]["StanReginCd"]["tokens"],
+    }
+    assert metrics["apis"]["RTMSDataSvcAptTradeDev"]["remaining"] == 2
+    assert asyncio.run(quota.is_low("RTMSDataSvcAptTradeDev")) is False  # 2/10 = 0.2 (경계 미만 아님)
+    assert metrics["backend"] == "memory"
+
+    # 같은 저장소를 쓰는 다른 워커: 자신은 호출하지 않았어도 공유 사용량으로 판정
+    other_worker = PublicDataQuota(quota.store, daily_quota=10, low_budget_ratio=0.2)
+    assert asyncio.run(other_worker.remaining("RTMSDataSvcAptTradeDev")) == 2
+    asyncio.run(quota.acquire("RTMSDataSvcAptTradeDev"))
+    assert asyncio.run(other_worker.is_low("RTMSDataSvcAptTradeDev")) is True  # 1/10
+
+
+def test_store_failure_falls_back_to_memory():
+    class FlakyStore:
+        name = "redis"
+        down = True
+
+        def __init__(self):
+            self.counts = MemoryQuotaStore()
+
+        async def incr(self, key, ttl_sec):
+            if self.down:
+                raise ConnectionError("redis down")
+            return await self.counts.incr(key, ttl_sec)
+
+        async def get(self, key):
+            if self.down:
+                raise ConnectionError("redis down")
+            return await self.counts.get(key)
+
+    store = FlakyStore()
+    quota = PublicDataQuota(store, daily_quota=5, rate_per_sec=1000, burst=100, store_retry_sec=0.05)
+    asyncio.run(quota.acquire("StanReginCd"))
+    assert asyncio.run(quota.remaining("StanReginCd")) == 4
+    assert asyncio.run(quota.metrics())["backend"] == "memory"
+
+    # 대기 시간이 지나면 저장소 재시도 → 복구되면 다시 공유 카운터 사용
+    store.down = False
+    assert asyncio.run(quota.metrics())["backend"] == "memory"  # 대기 시간 안에서는 메모리
+    time.sleep(0.06)
+    asyncio.run(quota.acquire("StanReginCd"))
+    assert asyncio.run(store.get(quota._counter_key("StanReginCd"))) == 1
+    assert asyncio.run(quota.metrics())["backend"] == "redis"
+
+
+def test_warehouse_prefers_stored_partitions_when_budget_low():
+    warehouse = RTMSWarehouse(":memory:", ttl_minutes=60)
+    months = recent_months(2)
+    warehouse.write_partition("apt_trade", "11680", months[0], [])
+    warehouse.ttl = timedelta(0)  # 저장된 파티션도 모두 오래됨
+    calls = []
+
+    async def fake_fetch(property_type, lawd_cd, deal_ymd, api_key=None):
+        calls.append(deal_ymd)
+        return []
+
+    original_fetch = rtms.fetch_partition_from_api
+    original_quota = quota_module._quota
+    rtms.fetch_partition_from_api = fake_fetch
+    try:
+        store = MemoryQuotaStore()
+        quota_module._quota = PublicDataQuota(store, daily_quota=10, low_budget_ratio=0.5)
+        key = quota_module._quota._counter_key("RTMSDataSvcAptTradeDev")
+        store._counts[key] = 9  # 남은 예산 10% (다른 워커 사용량 포함)
+
+        asyncio.run(fetch_transactions("apt_trade", "11680", months, warehouse=warehouse))
+        assert calls == [months[1]], calls  # 저장된 적 없는 월만 조회
+
+        calls.clear()
+        store._counts[key] = 0  # 예산 충분 → 오래된 월 다시 조회
+        asyncio.run(fetch_transactions("apt_trade", "11680", months, warehouse=warehouse))
+        assert sorted(calls) == sorted(months)
+    finally:
+        rtms.fetch_partition_from_api = original_fetch
+        quota_module._quota = original_quota
+
+
+if __name__ == "__main__":
+    test_quota_key()
+    print("[OK] URL → API 식별자")
+    test_token_bucket_queues_then_fails()
+    print("[OK] 토큰 버킷 대기 / 최대 대기 초과")
+    test_daily_quota_and_low_budget()
+    print("[OK] 일일 한도 / 예산 부족 판정")
+    test_store_failure_falls_back_to_memory()
+    print("[OK] 카운터 저장소 장애 → 메모리 카운터 → 재시도/복구")
+    test_warehouse_prefers_stored_partitions_when_budget_low()
+    print("[OK] 예산 부족 시 저장된 파티션 우선")
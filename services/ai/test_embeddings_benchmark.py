@@ -0,0 +1,150 @@
+"""
+임베딩 백엔드 벤치마크 (로컬 CPU vs OpenAI)
+
+1. 처리량: 계약서 청크 임베딩 속도 (청크/초), 쿼리 캐시 효과
+2. 검색 일치도: 같은 질문에 대해 OpenAI top-k 결과를 기준으로 로컬 top-k recall
+
+사용법:
+    python test_embeddings_benchmark.py                 # 내장 샘플 청크
+    python test_embeddings_benchmark.py contracts/*.pdf # 계약서 PDF/텍스트 청크
+    python test_embeddings_benchmark.py --local-only    # OpenAI 호출 없이 로컬만
+
+필요: embed_backend=local 용 sentence-transformers (requirements-full.txt)
+"""
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.embeddings import CachedQueryEmbeddings, create_embedder
+
+TOP_K = 5
+
+SAMPLE_CLAUSES = [
+    "임대인은 임차인에게 계약 체결 시 임대차 목적물을 사용·수익할 수 있는 상태로 인도하여야 한다.",
+    "임차인은 임대인의 동의 없이 임차주택의 구조를 변경하거나 전대, 임차권 양도를 할 수 없다.",
+    "보증금은 계약금, 중도금, 잔금으로 나누어 지급하며 잔금 지급일에 주택을 인도한다.",
+    "임대인은 잔금 지급일 다음날까지 저당권 등 담보권을 설정하지 않기로 한다.",
+    "계약 종료 시 임차인은 주택을 원상으로 회복하여 반환하고, 임대인은 보증금을 반환한다.",
+    "임차인이 2기의 차임액에 달하도록 연체하는 경우 임대인은 계약을 해지할 수 있다.",
+    "중도금 지급 전까지 임대인은 계약금의 배액을 상환하고, 임차인은 계약금을 포기하고 해제할 수 있다.",
+    "선순위 근저당권 채권최고액은 등기사항증명서 을구에 기재된 금액으로 확인한다.",
+    "임차인은 전입신고와 확정일자를 받아 대항력과 우선변제권을 확보한다.",
+    "관리비는 월 15만원으로 하며 수도, 전기, 가스 요금은 임차인이 부담한다.",
+    "주택임대차보호법에 따라 임차인은 1회에 한하여 계약갱신을 요구할 수 있다.",
+    "매도인은 잔금 수령과 동시에 소유권이전등기에 필요한 서류를 매수인에게 교부한다.",
+    "매매 목적물에 설정된 압류, 가압류, 가처분은 잔금 지급일까지 말소하기로 한다.",
+    "공인중개사는 중개대상물 확인·설명서를 작성하여 거래당사자에게 교부한다.",
+    "특약사항: 임대인은 계약 기간 중 주택을 매도하는 경우 임차인에게 사전 통지한다.",
+    "특약사항: 전세보증금 반환보증 가입에 임대인은 적극 협조한다.",
+    "임대차 기간은 인도일로부터 24개월로 한다.",
+    "신탁등기된 주택은 수탁자의 동의 없는 임대차 계약이 무효가 될 수 있다.",
+    "건축물대장상 용도가 주택이 아닌 경우 전세자금대출이 제한될 수 있다.",
+    "다가구주택은 선순위 임차인의 보증금 합계를 확인하여야 한다.",
+]
+
+QUERIES = [
+    "보증금 돌려받을 때 조건",
+    "근저당 채권최고액 확인 방법",
+    "계약 갱신 요구권",
+    "월세 밀리면 계약 해지되나요",
+    "압류 가압류 말소",
+    "전입신고 확정일자 대항력",
+    "계약금 포기하고 해제",
+    "신탁 주택 임대 위험",
+]
+
+
+def load_chunks(paths: List[str]) -> List[str]:
+    """PDF/텍스트 파일 → 계약서 청크 (ingest와 같은 분할 설정)"""
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1200, chunk_overlap=150)
+    chunks: List[str] = []
+    for path in paths:
+        if path.lower().endswith(".pdf"):
+            from ingest.pdf_parse import parse_pdf_to_text
+
+            text = parse_pdf_to_text(path)
+        else:
+            text = Path(path).read_text(encoding="utf-8")
+        chunks.extend(splitter.split_text(text))
+    return chunks
+
+
+def top_k(query_vectors: np.ndarray, doc_vectors: np.ndarray, k: int) -> np.ndarray:
+    q = query_vectors / np.linalg.norm(query_vectors, axis=1, keepdims=True)
+    d = doc_vectors / np.linalg.norm(doc_vectors, axis=1, keepdims=True)
+    return np.argsort(-(q @ d.T), axis=1)[:, :k]
+
+
+def run_backend(name: str, chunks: List[str]):
+    embedder = CachedQueryEmbeddings(create_embedder(name))
+
+    start = time.perf_counter()
+    doc_vectors = np.asarray(embedder.embed_documents(chunks))
+    doc_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    query_vectors = np.asarray([embedder.embed_query(q) for q in QUERIES])
+    query_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for q in QUERIES:
+        embedder.embed_query(q)
+    cached_time = time.perf_counter() - start
+
+    print(f"\n[{name}] dim={doc_vectors.shape[1]}")
+    print(f"  문서: {len(chunks)}개 {doc_time * 1000:8.1f} ms ({len(chunks) / doc_time:,.1f} 청크/초)")
+    print(f"  쿼리: {len(QUERIES)}개 {query_time * 1000:8.1f} ms, 캐시 적중 {cached_time * 1000:.3f} ms")
+    return top_k(query_vectors, doc_vectors, min(TOP_K, len(chunks)))
+
+
+def test_cached_query_embeddings():
+    class Counter:
+        calls = 0
+
+        def embed_documents(self, texts):
+            return [[1.0] for _ in texts]
+
+        def embed_query(self, text):
+            Counter.calls += 1
+            return [float(len(text))]
+
+    cached = CachedQueryEmbeddings(Counter(), max_size=2)
+    cached.embed_query("a")
+    cached.embed_query("a")
+    cached.embed_query("bb")
+    cached.embed_query("ccc")  # "a" 밀려남
+    cached.embed_query("a")
+    assert Counter.calls == 4
+    assert cached.hits == 1
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    local_only = "--local-only" in sys.argv
+
+    test_cached_query_embeddings()
+    print("[OK] 쿼리 임베딩 LRU 캐시")
+
+    chunks = load_chunks(args) if args else SAMPLE_CLAUSES
+    print("\n" + "=" * 60)
+    print(f"BENCHMARK: {len(chunks)} chunks, {len(QUERIES)} queries, top-{TOP_K}")
+    print("=" * 60)
+
+    local_top = run_backend("local", chunks)
+    if local_only:
+        sys.exit(0)
+
+    openai_top = run_backend("openai", chunks)
+    recall = np.mean([
+        len(set(local_row) & set(openai_row)) / len(openai_row)
+        for local_row, openai_row in zip(local_top, openai_top)
+    ])
+    print(f"\nrecall@{TOP_K} (OpenAI top-{TOP_K} 기준): {recall:.2%}")
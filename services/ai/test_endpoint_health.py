@@ -0,0 +1,217 @@
+"""
+엔드포인트 상태 기억 테스트 (core/endpoint_health.py)
+
+- 연속 실패 → open: 시도 목록에서 제외 (장애 중인 URL에 타임아웃만큼 기다리지 않음)
+- open_sec 경과 → half_open 회복 확인 1건만 허용, 성공 시 closed
+- closed 엔드포인트는 지연 시간 짧은 순
+- AptTradeAPIClient: new URL 장애 시 두 번째 호출부터 old URL 먼저, 모두 open이면 즉시 실패
+- 4xx / 결과 코드 오류: 다음 버전은 시도하되 서킷에는 반영하지 않음
+
+사용법:
+    python test_endpoint_health.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+
+import core.endpoint_health as endpoint_module
+from core.endpoint_health import CLOSED, HALF_OPEN, OPEN, EndpointHealthRegistry
+from core.public_data_api import AptTradeAPIClient, PublicDataAPIError
+from core.settings import settings
+
+NO_DATA_XML = (
+    "<response><header><resultCode>03</resultCode><resultMsg>NO_DATA</resultMsg></header>"
+    "<body><items></items><totalCount>0</totalCount></body></response>"
+)
+
+
+def test_open_after_consecutive_failures():
+    registry = EndpointHealthRegistry(failure_threshold=2, open_sec=60)
+    assert registry.order("g", ["new", "old"]) == ["new", "old"]
+
+    registry.record_failure("g", "new", "timeout")
+    assert registry.order("g", ["new", "old"]) == ["old", "new"]  # 1회 실패는 뒤로만
+    registry.record_failure("g", "new", "timeout")
+    assert registry.order("g", ["new", "old"]) == ["old"]
+    assert registry.snapshot()["g"]["new"]["state"] == OPEN
+
+    registry.record_failure("g", "old", "timeout")
+    registry.record_failure("g", "old", "timeout")
+    assert registry.order("g", ["new", "old"]) == []  # 모두 장애 → 즉시 실패
+
+
+def test_half_open_probe():
+    registry = EndpointHealthRegistry(failure_threshold=1, open_sec=0.05)
+    registry.record_failure("g", "new")
+    assert registry.order("g", ["new", "old"]) == ["old"]
+
+    time.sleep(0.06)
+    assert registry.order("g", ["new", "old"]) == ["new", "old"]  # 회복 확인 요청 먼저
+    assert registry.order("g", ["new", "old"]) == ["old"]  # 확인 중에는 1건만
+    assert registry._groups["g"]["new"].state == HALF_OPEN
+
+    registry.record_failure("g", "new")  # 확인 실패 → 다시 open
+    assert registry._groups["g"]["new"].state == OPEN
+    assert registry.order("g", ["new", "old"]) == ["old"]
+
+    time.sleep(0.06)
+    assert registry.order("g", ["new", "old"])[0] == "new"
+    registry.record_success("g", "new", 120.0)
+    assert registry._groups["g"]["new"].state == CLOSED
+
+
+def test_closed_ordered_by_latency():
+    registry = EndpointHealthRegistry()
+    registry.record_success("g", "new", 900.0)
+    assert registry.order("g", ["new", "old"]) == ["new", "old"]  # old 측정 전 → 뒤로
+    registry.record_success("g", "old", 100.0)
+    assert registry.order("g", ["new", "old"]) == ["old", "new"]
+
+
+def test_apt_trade_client_skips_failing_endpoint():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if "RTMSDataSvcAptTrade/" in request.url.path:  # new URL 장애
+            return httpx.Response(503)
+        return httpx.Response(200, text=NO_DATA_XML)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = AptTradeAPIClient("key", client=http)
+            for _ in range(3):
+                result = await client.get_apt_trades("11680", "202401")
+                assert result["body"]["totalCount"] == 0
+
+    original_registry = endpoint_module._registry
+    original_quota = settings.public_data_quota_enabled
+    endpoint_module._registry = EndpointHealthRegistry(failure_threshold=2, open_sec=60)
+    settings.public_data_quota_enabled = False
+    try:
+        asyncio.run(run())
+        new_calls = [path for path in calls if "RTMSDataSvcAptTrade/" in path]
+        assert len(new_calls) == 1, calls  # 실패 1회 후 old 우선 → new에 다시 기다리지 않음
+        assert len(calls) == 4, calls
+
+        for health in endpoint_module._registry._groups["apt_trade"].values():
+            health.state = OPEN
+            health.opened_at = time.monotonic()
+        try:
+            asyncio.run(run())
+            raise AssertionError("모든 엔드포인트 open이면 즉시 실패해야 함")
+        except PublicDataAPIError as e:
+            assert "circuit open" in str(e)
+        assert len(calls) == 4  # 네트워크 호출 없음
+    finally:
+        endpoint_module._registry = original_registry
+        settings.public_data_quota_enabled = original_quota
+
+
+def test_caller_errors_leave_breaker_closed():
+    from core.data_go_kr_quota import QuotaExhaustedError
+    import core.public_data_api as public_data_api
+
+    error_xml = (
+        "<response><header><resultCode>11</resultCode><resultMsg>NO_MANDATORY_REQUEST_PARAMETERS_ERROR</resultMsg>"
+        "</header></response>"
+    )
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, text=error_xml)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return await AptTradeAPIClient("key", client=http).get_apt_trades("11680", "202401")
+
+    original_registry = endpoint_module._registry
+    original_quota = settings.public_data_quota_enabled
+    original_acquire = public_data_api.acquire_data_go_kr
+    endpoint_module._registry = EndpointHealthRegistry(failure_threshold=2, open_sec=60)
+    settings.public_data_quota_enabled = False
+    try:
+        # 결과 코드 오류 (잘못된 파라미터 등): 다음 버전도 시도, 모두 실패하면 PublicDataAPIError, 서킷 closed 유지
+        for _ in range(3):
+            try:
+                asyncio.run(run())
+                raise AssertionError("결과 코드 오류는 PublicDataAPIError")
+            except PublicDataAPIError as e:
+                assert "NO_MANDATORY" in str(e)
+        assert len(calls) == 6  # 호출마다 new + old
+        states = {name: h.state for name, h in endpoint_module._registry._groups["apt_trade"].items()}
+        assert set(states.values()) == {CLOSED}, states
+        assert all(h.failures == 0 for h in endpoint_module._registry._groups["apt_trade"].values())
+
+        # 일일 한도 소진: 요청 전 실패 → 서킷 반영 없음
+        async def exhausted(url):
+            raise QuotaExhaustedError("daily quota")
+
+        public_data_api.acquire_data_go_kr = exhausted
+        try:
+            asyncio.run(run())
+            raise AssertionError("한도 소진은 QuotaExhaustedError")
+        except QuotaExhaustedError:
+            pass
+        assert all(h.state == CLOSED for h in endpoint_module._registry._groups["apt_trade"].values())
+    finally:
+        endpoint_module._registry = original_registry
+        settings.public_data_quota_enabled = original_quota
+        public_data_api.acquire_data_go_kr = original_acquire
+
+
+def test_service_error_falls_back_to_old_endpoint():
+    rejected = [
+        httpx.Response(403, text="Forbidden"),
+        httpx.Response(200, text=(
+            "<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+            "<returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>"
+            "<returnReasonCode>30</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+        )),
+    ]
+    original_registry = endpoint_module._registry
+    original_quota = settings.public_data_quota_enabled
+    settings.public_data_quota_enabled = False
+    try:
+        for response in rejected:
+            endpoint_module._registry = EndpointHealthRegistry(failure_threshold=1, open_sec=60)
+            calls = []
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                calls.append(request.url.path)
+                return response if "RTMSDataSvcAptTrade/" in request.url.path else httpx.Response(200, text=NO_DATA_XML)
+
+            async def run():
+                async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                    return await AptTradeAPIClient("key", client=http).get_apt_trades("11680", "202401")
+
+            # new 버전의 서비스 오류 (403 / 서비스 키 미등록) → old 버전으로 조회
+            assert asyncio.run(run())["header"]["resultCode"] == "03"
+            assert len(calls) == 2 and "RTMSObsvService" in calls[1]
+            groups = endpoint_module._registry._groups["apt_trade"]
+            assert groups["new"].state == CLOSED and groups["new"].failures == 0  # 서킷 미반영
+    finally:
+        endpoint_module._registry = original_registry
+        settings.public_data_quota_enabled = original_quota
+
+
+if __name__ == "__main__":
+    test_open_after_consecutive_failures()
+    print("[OK] 연속 실패 → open / 모두 장애 시 빈 목록")
+    test_half_open_probe()
+    print("[OK] half_open 회복 확인 1건")
+    test_closed_ordered_by_latency()
+    print("[OK] 지연 시간 순 정렬")
+    test_apt_trade_client_skips_failing_endpoint()
+    print("[OK] AptTradeAPIClient 장애 URL 건너뜀")
+    test_caller_errors_leave_breaker_closed()
+    print("[OK] 결과 코드 / 한도 오류는 서킷에 반영하지 않음")
+    test_service_error_falls_back_to_old_endpoint()
+    print("[OK] 서비스 오류 (403 / 키 미등록) → 다음 버전, 서킷 미반영")
@@ -0,0 +1,127 @@
+"""
+동시 호출(fan-out) 테스트 - 공공데이터 통합 / API 테스터
+
+- 전체 소요 시간 ≈ 가장 느린 호출 (순차 합계 아님)
+- 호출별 타임아웃, 예외 → 부분 결과
+- 결과 순서 유지, 동시 실행 수 제한
+
+사용법:
+    python test_fanout.py
+"""
+import asyncio
+import sys
+import time
+import types
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.fanout import fan_out, latency_table
+
+
+def _delayed(seconds: float, value=None, error: Exception = None):
+    async def call():
+        await asyncio.sleep(seconds)
+        if error:
+            raise error
+        return value
+    return call
+
+
+def test_wall_time_is_slowest_call():
+    calls = [(f"api{i}", _delayed(0.05 * (i % 4 + 1), value=i)) for i in range(15)]
+    start = time.perf_counter()
+    results = asyncio.run(fan_out(calls, timeout_sec=5))
+    elapsed = time.perf_counter() - start
+
+    assert [r.value for r in results] == list(range(15))
+    assert all(r.ok for r in results)
+    total = sum(r.elapsed_ms for r in results) / 1000
+    assert elapsed < 0.35, f"최장 0.2s 근처여야 함 (순차 합계 {total:.2f}s): {elapsed:.2f}s"
+
+
+def test_timeouts_and_errors_are_partial():
+    results = asyncio.run(fan_out(
+        [
+            ("fast", _delayed(0.01, value="ok")),
+            ("slow", _delayed(1.0, value="late")),
+            ("broken", _delayed(0.01, error=ValueError("resultCode=99"))),
+        ],
+        timeout_sec=0.1,
+    ))
+    assert [r.status for r in results] == ["ok", "timeout", "error"]
+    assert results[0].value == "ok"
+    assert "ValueError" in results[2].error
+    table = latency_table(results)
+    assert [row["name"] for row in table] == ["fast", "slow", "broken"]
+    assert table[1]["elapsed_ms"] < 500
+
+    # 호출 내부의 TimeoutError는 fan-out 제한 시간 초과가 아니라 오류 (제한 시간 없음 포함)
+    for timeout_sec in (None, 5):
+        inner = asyncio.run(fan_out(
+            [("inner", _delayed(0.01, error=asyncio.TimeoutError()))], timeout_sec=timeout_sec,
+        ))
+        assert inner[0].status == "error" and "TimeoutError" in inner[0].error
+
+
+def test_max_concurrency():
+    active = 0
+    peak = 0
+
+    def call():
+        async def run():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+        return run()
+
+    asyncio.run(fan_out([(str(i), call) for i in range(10)], max_concurrency=3))
+    assert peak == 3
+
+
+def test_fetch_all_public_data_concurrent():
+    """routes 모듈의 조회 함수를 지연 함수로 대체해 통합 조회 동시성 확인"""
+    from core.public_data_integrator import fetch_all_public_data
+
+    fakes = {
+        "routes.building": ("fetch_building_ledger_data", _delayed(0.2, value={"bldNm": "테스트"})),
+        "routes.apt_trade": ("fetch_apt_trade_data", _delayed(0.2, value={"items": [{"거래금액": "80,000"}]})),
+        "routes.land_price": ("fetch_land_price_data", _delayed(0.05, error=RuntimeError("API down"))),
+    }
+    saved = {name: sys.modules.get(name) for name in fakes}
+    try:
+        for name, (attr, func) in fakes.items():
+            module = types.ModuleType(name)
+            setattr(module, attr, lambda *args, _func=func, **kwargs: _func())
+            sys.modules[name] = module
+
+        start = time.perf_counter()
+        result = asyncio.run(fetch_all_public_data("서울 강남구 역삼동 1", "11680", "10100"))
+        elapsed = time.perf_counter() - start
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+    assert result.success_count == 2
+    assert result.building_ledger == {"bldNm": "테스트"}
+    assert result.apt_trades == [{"거래금액": "80,000"}]
+    assert "API down" in result.land_price_error
+    assert [row["status"] for row in result.latencies] == ["ok", "ok", "error"]
+    assert elapsed < 0.35, f"순차 0.45s → 동시 ~0.2s: {elapsed:.2f}s"
+
+
+if __name__ == "__main__":
+    test_wall_time_is_slowest_call()
+    print("[OK] 전체 소요 시간 ≈ 가장 느린 호출")
+    test_timeouts_and_errors_are_partial()
+    print("[OK] 타임아웃/예외 → 부분 결과")
+    test_max_concurrency()
+    print("[OK] 동시 실행 수 제한")
+    test_fetch_all_public_data_concurrent()
+    print("[OK] fetch_all_public_data 동시 조회")
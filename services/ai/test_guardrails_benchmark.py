@@ -0,0 +1,155 @@
+"""
+가드레일 키워드 매칭 테스트 + 마이크로벤치마크
+
+1. 정확성: Aho-Corasick 오토마톤 결과 == 키워드별 `in` 검사 (겹치는 키워드 포함)
+2. 동등성: check_question 결과가 기존 순차 스캔 방식과 동일
+3. 벤치마크: 기본 키워드 / 대량 키워드(수천 개)에서 순차 스캔 vs 오토마톤
+
+사용법:
+    python test_guardrails_benchmark.py
+    python test_guardrails_benchmark.py 20000   # 대량 키워드 개수
+"""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.guardrails import (
+    FORBIDDEN_KEYWORDS,
+    REAL_ESTATE_KEYWORDS,
+    REAL_ESTATE_PATTERNS,
+    KeywordAutomaton,
+    RealEstateGuardrail,
+    check_questions,
+)
+
+QUESTIONS = [
+    "전세 계약서에 근저당이 설정되어 있는데 보증금 돌려받을 수 있을까요?",
+    "확정일자와 전입신고를 하면 대항력이 생기나요",
+    "매매계약 잔금일 전에 가압류가 들어오면 어떻게 하나요",
+    "아파트 누수 하자담보책임은 누구에게 있나요",
+    "파이썬 코드 좀 짜줘",
+    "오늘 날씨 어때요",
+    "등기부 을구에 전세권 설정이 있으면 위험한가요",
+    "양도세 계산 방법 알려주세요",
+    "상가 임대차 계약 갱신 요구권 관련 법 조항",
+    "맛있는 요리 레시피 추천",
+    "오피스텔 분양계약 해제 시 위약금",
+    "hello world in JAVA",
+]
+
+
+def naive_check(guardrail: RealEstateGuardrail, question: str):
+    """기존 방식 (키워드마다 `in` 검사, 매번 re.search)"""
+    question_lower = question.lower()
+    if any(keyword in question_lower for keyword in FORBIDDEN_KEYWORDS):
+        return False, "무관한 질문", 0.0
+    keyword_score = min(sum(1 for kw in REAL_ESTATE_KEYWORDS if kw in question_lower) / 3.0, 1.0)
+    pattern_score = min(sum(0.2 for p in REAL_ESTATE_PATTERNS if re.search(p, question)), 1.0)
+    score = keyword_score * 0.7 + pattern_score * 0.3
+    if score < guardrail.min_confidence_threshold:
+        category = "무관한 질문"
+    elif any(kw in question for kw in ["계약서", "계약", "특약"]):
+        category = "계약서 관련"
+    elif any(kw in question for kw in ["법", "소송", "권리", "의무"]):
+        category = "부동산 법률 관련"
+    else:
+        category = "부동산 관련"
+    return score >= guardrail.min_confidence_threshold, category, score
+
+
+def test_automaton_matches_substring_scan():
+    automaton = KeywordAutomaton(["계약", "계약서", "약서", "서", "abc", "bc", "c", "전세권", "세권"])
+    text = "전세권 계약서 abcd"
+    assert automaton.matches(text) == sorted(kw for kw in automaton.keywords if kw in text)
+    assert automaton.matches("무관") == []
+
+    rng = random.Random(7)
+    alphabet = "가나다라ab"
+    keywords = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(300)}
+    automaton = KeywordAutomaton(keywords)
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        expected = sorted(kw for kw in keywords if kw in text)
+        assert automaton.matches(text) == expected, text
+
+
+def test_guardrail_equivalent_to_naive_scan():
+    for strict in (True, False):
+        guardrail = RealEstateGuardrail(strict_mode=strict)
+        for question in QUESTIONS:
+            response = guardrail.check_question(question)
+            allowed, category, score = naive_check(guardrail, question)
+            assert response.is_allowed == allowed, question
+            assert response.category.value == category, question
+            assert abs(response.confidence - score) < 1e-9, question
+
+
+def test_check_questions_batch():
+    results = check_questions(QUESTIONS + QUESTIONS[:3])
+    assert len(results) == len(QUESTIONS) + 3
+    assert results[-1] == results[2]
+    assert results[4]["allowed"] is False and "message" in results[4]
+
+
+def benchmark(keyword_count: int = 5000, repeat: int = 2000):
+    rng = random.Random(0)
+    syllables = "가각간갈감강개거건검게격견결경계고곡공과관광교구국군권규균그근금기길김"
+    extra = {"".join(rng.choice(syllables) for _ in range(rng.randint(2, 5))) for _ in range(keyword_count)}
+    questions = [rng.choice(QUESTIONS) + f" {i}" for i in range(repeat)]  # 일괄 검사 중복 제거 방지
+    lowered = [q.lower() for q in questions]
+
+    for label, keywords in [
+        (f"기본 ({len(REAL_ESTATE_KEYWORDS | FORBIDDEN_KEYWORDS)}개)", REAL_ESTATE_KEYWORDS | FORBIDDEN_KEYWORDS),
+        (f"대량 ({len(extra | REAL_ESTATE_KEYWORDS)}개)", extra | REAL_ESTATE_KEYWORDS),
+    ]:
+        keyword_list = list(keywords)
+
+        start = time.perf_counter()
+        naive = [sum(1 for kw in keyword_list if kw in q) for q in lowered]
+        naive_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        automaton = KeywordAutomaton(keyword_list)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = [automaton.scan(q).bit_count() for q in lowered]
+        fast_time = time.perf_counter() - start
+
+        assert naive == fast
+        print(
+            f"{label:>16}: 순차 스캔 {naive_time / repeat * 1e6:8.1f} µs/질문 | "
+            f"오토마톤 {fast_time / repeat * 1e6:6.1f} µs/질문 (빌드 {build_time * 1000:.0f}ms) | "
+            f"{naive_time / fast_time:5.1f}x"
+        )
+
+    guardrail = RealEstateGuardrail()
+    start = time.perf_counter()
+    for question in questions:
+        naive_check(guardrail, question)
+    naive_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for question in questions:
+        guardrail.check_question(question)
+    fast_time = time.perf_counter() - start
+    print(
+        f"{'check_question':>16}: 기존 {naive_time / repeat * 1e6:8.1f} µs/질문 | "
+        f"오토마톤+컴파일 패턴 {fast_time / repeat * 1e6:6.1f} µs/질문 | {naive_time / fast_time:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    test_automaton_matches_substring_scan()
+    print("[OK] 오토마톤 == 부분 문자열 검사")
+    test_guardrail_equivalent_to_naive_scan()
+    print("[OK] check_question 결과 기존 방식과 동일")
+    test_check_questions_batch()
+    print("[OK] check_questions 일괄 검사")
+
+    print("\n" + "=" * 60)
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
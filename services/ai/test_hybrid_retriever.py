@@ -0,0 +1,82 @@
+"""
+하이브리드 검색 검증 스크립트 (DB/API 호출 없음)
+
+1. 검색어 추출 (조사/불용어 제거)
+2. RRF 융합: 양쪽 모두 상위인 청크가 먼저
+3. 결과 캐시: 컬렉션 무효화 / TTL 만료
+4. 검색어 중심 발췌
+
+사용법:
+    python test_hybrid_retriever.py
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from langchain_core.documents import Document
+
+from core.hybrid_retriever import RetrievalCache, focus_excerpt, lexical_terms, reciprocal_rank_fusion
+
+
+def _doc(name: str) -> Document:
+    return Document(page_content=name, metadata={"doc_id": "d1", "content_hash": name})
+
+
+def test_lexical_terms():
+    assert lexical_terms("근저당권이 설정된 주택은 위험한가요?") == ["근저당권", "설정된", "주택", "위험한가요"]
+    assert lexical_terms("보증금을 어떻게 돌려받나요") == ["보증금", "돌려받"]
+    assert lexical_terms("a 의 ?") == []
+
+
+def test_rrf():
+    a, b, c, d = (_doc(x) for x in "abcd")
+    fused = reciprocal_rank_fusion([([a, b, c], 1.0), ([c, d, b], 1.0)], k=3)
+    assert [doc.page_content for doc in fused] == ["c", "b", "a"]
+
+    # 전문 검색 결과 없음 → 벡터 순서 유지
+    fused = reciprocal_rank_fusion([([a, b], 1.0), ([], 1.0)], k=5)
+    assert [doc.page_content for doc in fused] == ["a", "b"]
+
+
+def test_cache_invalidation():
+    cache = RetrievalCache(max_size=2, ttl_sec=60)
+    key = ("보증금", "v2_contract_docs", 6)
+    cache.put(key, [_doc("a")])
+    assert cache.get(key) is not None
+
+    cache.invalidate("other_collection")
+    assert cache.get(key) is not None
+    cache.invalidate("v2_contract_docs")
+    assert cache.get(key) is None
+
+    cache.put(("q1", "c", 6), [])
+    cache.put(("q2", "c", 6), [])
+    cache.put(("q3", "c", 6), [])  # q1 밀려남
+    assert cache.get(("q1", "c", 6)) is None
+
+    expiring = RetrievalCache(max_size=2, ttl_sec=0.01)
+    expiring.put(key, [])
+    time.sleep(0.02)
+    assert expiring.get(key) is None
+
+
+def test_focus_excerpt():
+    text = "가" * 2000 + "근저당권 설정 금액" + "나" * 2000
+    excerpt = focus_excerpt(text, "근저당 금액", limit=800)
+    assert "근저당권" in excerpt and len(excerpt) == 801
+    assert focus_excerpt(text, "없는단어", limit=800) == text[:800]
+    assert focus_excerpt("짧은 청크", "근저당") == "짧은 청크"
+
+
+if __name__ == "__main__":
+    test_lexical_terms()
+    print("[OK] 검색어 추출")
+    test_rrf()
+    print("[OK] RRF 융합")
+    test_cache_invalidation()
+    print("[OK] 캐시 무효화 / LRU / TTL")
+    test_focus_excerpt()
+    print("[OK] 검색어 중심 발췌")
@@ -0,0 +1,299 @@
+"""
+LLM 응답 캐시 테스트 (core/llm_cache.py, 로컬 가짜 LLM 서버 / SQLite - 외부 API·Postgres 호출 없음)
+
+- 캐시 키: 모델 + 파라미터 + 정규화된 프롬프트 (줄 끝 공백 / 줄바꿈 차이는 같은 키)
+- 미스: 원래 이벤트 그대로 전달 후 저장 / 적중: LLM 호출 없이 같은 형식 이벤트로 재생
+- 우회(bypass): 새로 생성해 캐시 갱신, 오류 응답은 저장하지 않음
+- Postgres 계층: 워커 간 공유, TTL 만료, DB 오류 시 메모리만 사용
+- CostMonitor: 적중률 / 절약 토큰 / 절약 비용
+- 듀얼 스트림 폴링: 첫 이벤트가 폴링 간격보다 늦어도 스트림이 끊기지 않음
+- stream_gpt_draft / dual_stream_analysis / simple_llm_analysis 재실행 시 API 호출 없음
+
+사용법:
+    python test_llm_cache.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+import core.cost_monitor as cost_monitor
+import core.llm_cache as llm_cache
+import core.llm_clients as llm_clients
+from core.llm_cache import CachedResponse, LLMResponseCache, cache_key, cached_llm_stream
+from core.llm_clients import LLMClientRegistry
+from core.settings import settings
+from test_llm_clients import FakeLLMServer, _point_to
+
+PROMPT = "# 부동산 계약 분석 요청\n\n**주소**: 서울 강남구 역삼동 1  \n**계약 유형**: 전세\n"
+
+
+def _reset(cache: LLMResponseCache = None) -> LLMResponseCache:
+    llm_cache._cache = cache or LLMResponseCache(persist=False)
+    cost_monitor._global_monitor = None
+    settings.llm_cache_replay_interval_sec = 0.0
+    return llm_cache._cache
+
+
+def _events(content: str, error: str = None, model: str = "gpt-4o-mini"):
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        if error:
+            yield {"phase": "draft", "model": model, "error": error, "done": True}
+            return
+        for end in range(10, len(content) + 10, 10):
+            yield {"phase": "draft", "model": model, "content": content[end - 10:end],
+                   "total_length": min(end, len(content)), "done": False}
+        yield {"phase": "draft", "model": model, "content": "", "total_length": len(content),
+               "done": True, "final_content": content}
+
+    return factory, calls
+
+
+def _collect(factory, bypass: bool = False, prompt: str = PROMPT):
+    async def run():
+        return [
+            event async for event in cached_llm_stream(
+                factory, model="gpt-4o-mini", params={"temperature": 0.3}, prompt=prompt, phase="draft", bypass=bypass
+            )
+        ]
+
+    return asyncio.run(run())
+
+
+def test_cache_key():
+    params = {"temperature": 0.3}
+    same = "\r\n# 부동산 계약 분석 요청\r\n\r\n**주소**: 서울 강남구 역삼동 1\n**계약 유형**: 전세   "
+    assert cache_key("gpt-4o-mini", params, PROMPT) == cache_key("gpt-4o-mini", params, same)
+    assert cache_key("gpt-4o-mini", params, PROMPT) != cache_key("gpt-4o", params, PROMPT)
+    assert cache_key("gpt-4o-mini", params, PROMPT) != cache_key("gpt-4o-mini", {"temperature": 0.7}, PROMPT)
+    assert cache_key("gpt-4o-mini", params, PROMPT) != cache_key("gpt-4o-mini", params, PROMPT + "보증금 5억")
+
+
+def test_miss_store_and_replay():
+    cache = _reset()
+    settings.llm_cache_replay_chunk_chars = 100
+    content = "전세가율 85%로 높은 편입니다. " * 19  # 361자
+    factory, calls = _events(content)
+
+    first = _collect(factory)
+    assert len(calls) == 1 and first[-1]["final_content"] == content
+    assert not any(event.get("cached") for event in first)  # 미스: 원래 이벤트 그대로
+
+    second = _collect(factory)
+    assert len(calls) == 1  # 적중: LLM 호출 없음
+    assert all(event["cached"] and event["phase"] == "draft" and event["model"] == "gpt-4o-mini" for event in second)
+    assert len(content) == 361 and [event["total_length"] for event in second] == [100, 200, 300, 361, 361]
+    assert "".join(event["content"] for event in second) == content
+    assert second[-1]["done"] and second[-1]["final_content"] == content
+
+    # 절약 토큰 / 비용 → CostMonitor
+    stats = cost_monitor.get_cost_monitor().get_cache_stats()["operations"]["draft"]
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_ratio"] == 0.5
+    assert stats["saved_output_tokens"] == len(content) // 3 and stats["saved_cost"] > 0
+    assert cache.stats()["stores"] == 1
+
+    # 재생 간격 (프론트엔드 진행 표시가 실제 스트리밍처럼 보이도록)
+    settings.llm_cache_replay_interval_sec = 0.05
+    start = time.perf_counter()
+    _collect(factory)
+    assert time.perf_counter() - start >= 0.15  # 조각 4개 사이 간격 3번
+
+
+def test_bypass_and_errors():
+    cache = _reset()
+    factory, calls = _events("첫 번째 답변")
+    _collect(factory)
+
+    refreshed, refreshed_calls = _events("새로 생성한 답변")
+    events = _collect(refreshed, bypass=True)
+    assert len(refreshed_calls) == 1 and events[-1]["final_content"] == "새로 생성한 답변"
+    assert _collect(factory)[-1]["final_content"] == "새로 생성한 답변"  # 우회 결과로 캐시 갱신
+    assert len(calls) == 1 and cache.stats()["bypassed"] == 1
+
+    failing, failing_calls = _events("", error="Rate limit")
+    prompt = PROMPT + "다른 케이스"
+    assert _collect(failing, prompt=prompt)[-1]["error"] == "Rate limit"
+    _collect(failing, prompt=prompt)
+    assert len(failing_calls) == 2  # 오류 응답은 저장하지 않음
+
+    settings.llm_cache_enabled = False
+    try:
+        _collect(factory)
+        assert len(calls) == 2
+    finally:
+        settings.llm_cache_enabled = True
+
+
+def test_fallback_model_not_stored():
+    cache = _reset()
+
+    async def collect(factory, model):
+        return [
+            event async for event in cached_llm_stream(
+                factory, model=model, params={"temperature": 0.3}, prompt=PROMPT, phase="validation"
+            )
+        ]
+
+    # Sonnet 요청에 Haiku 폴백이 응답 → Sonnet 키로 저장하지 않음
+    fallback, fallback_calls = _events("Haiku 검증 결과", model="claude-3-5-haiku")
+    asyncio.run(collect(fallback, "claude-3-5-sonnet-latest"))
+    asyncio.run(collect(fallback, "claude-3-5-sonnet-latest"))
+    assert len(fallback_calls) == 2 and cache.stats()["stores"] == 0
+
+    # 요청 모델이 응답 ('-latest' 없는 이벤트 표기) → 저장 후 적중
+    primary, primary_calls = _events("Sonnet 검증 결과", model="claude-3-5-sonnet")
+    asyncio.run(collect(primary, "claude-3-5-sonnet-latest"))
+    replay = asyncio.run(collect(primary, "claude-3-5-sonnet-latest"))
+    assert len(primary_calls) == 1 and replay[-1]["cached"] and replay[-1]["final_content"] == "Sonnet 검증 결과"
+
+
+def _sqlite_engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE v2_llm_response_cache (cache_key TEXT PRIMARY KEY, request_model TEXT NOT NULL, "
+            "model TEXT NOT NULL, content TEXT NOT NULL, input_tokens INTEGER NOT NULL DEFAULT 0, "
+            "output_tokens INTEGER NOT NULL DEFAULT 0, hit_count INTEGER NOT NULL DEFAULT 0, "
+            "expires_at TIMESTAMP NOT NULL, created_at TIMESTAMP, last_accessed_at TIMESTAMP)"
+        ))
+    return engine
+
+
+def test_persistent_layer():
+    engine = _sqlite_engine()
+    response = CachedResponse(content="검증 완료", model="claude-3-5-haiku", input_tokens=400, output_tokens=3)
+
+    writer = LLMResponseCache(engine_factory=lambda: engine)
+    writer.put("k1", response, request_model="claude-3-5-sonnet-latest")
+
+    # 다른 워커 (메모리 비어 있음) → Postgres에서 조회 후 메모리에 적재
+    reader = LLMResponseCache(engine_factory=lambda: engine)
+    assert asyncio.run(reader.aget("k1")) == response
+    assert reader.get("k1") == response
+    assert reader.stats()["db_hits"] == 1 and reader.stats()["memory"]["hits"] == 1
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT hit_count, request_model FROM v2_llm_response_cache")).first()
+    assert tuple(row) == (1, "claude-3-5-sonnet-latest")
+
+    # 같은 키 재저장 → 갱신 (ON CONFLICT)
+    writer.put("k1", CachedResponse("새 검증", "claude-3-5-sonnet", 400, 2))
+    assert LLMResponseCache(engine_factory=lambda: engine).get("k1").content == "새 검증"
+
+    # TTL 만료
+    expired = LLMResponseCache(ttl_sec=-1, engine_factory=lambda: engine)
+    expired.put("k2", response)
+    assert LLMResponseCache(engine_factory=lambda: engine).get("k2") is None
+
+    # DB 오류 → 메모리만 사용, 재시도 대기 동안 DB 호출 없음
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise ConnectionError("connection refused")
+
+    fallback = LLMResponseCache(engine_factory=broken)
+    fallback.put("k3", response)
+    assert fallback.get("k3") == response and fallback.get("missing") is None
+    assert len(attempts) == 1 and fallback.stats()["db_errors"] == 1 and not fallback.stats()["db_available"]
+
+
+def test_poller_survives_slow_first_event():
+    from core.llm_streaming import StreamPoller
+
+    async def slow_events():
+        await asyncio.sleep(0.3)  # 캐시 DB 조회 / 콜드 스타트
+        yield {"done": True, "final_content": "초안"}
+
+    async def run():
+        poller, timeouts = StreamPoller(slow_events()), 0
+        while True:
+            try:
+                return await poller.next(timeout=0.1), timeouts
+            except asyncio.TimeoutError:
+                timeouts += 1  # 진행 중인 생성기는 취소하지 않고 다음 폴링에서 이어서 대기
+
+    event, timeouts = asyncio.run(run())
+    assert event["final_content"] == "초안" and timeouts >= 2
+
+
+def _with_fake_server(coro_factory):
+    async def run():
+        async with FakeLLMServer() as server:
+            _point_to(server.url)
+            original = llm_clients._registry
+            llm_clients._registry = LLMClientRegistry()
+            try:
+                return await coro_factory(), server
+            finally:
+                await llm_clients._registry.aclose()
+                llm_clients._registry = original
+
+    return asyncio.run(run())
+
+
+def test_streaming_and_summary_reuse():
+    from core.llm_streaming import dual_stream_analysis, simple_llm_analysis, stream_gpt_draft
+
+    _reset()
+    settings.llm_cache_replay_chunk_chars = 2
+
+    async def run_all():
+        draft = [event async for event in stream_gpt_draft(PROMPT)]
+        replay = [event async for event in stream_gpt_draft(PROMPT + "\n")]  # 정규화 후 같은 프롬프트
+        summaries = [await simple_llm_analysis(PROMPT, timeout=5), await simple_llm_analysis(PROMPT, timeout=5)]
+        return draft, replay, summaries
+
+    (draft, replay, summaries), server = _with_fake_server(run_all)
+    assert draft[-1]["final_content"] == replay[-1]["final_content"] == "초안 완료"
+    assert replay[-1]["cached"] and [e["content"] for e in replay] == ["초안", " 완", "료", ""]  # 2글자씩 재생
+    assert summaries == ["초안 완료", "초안 완료"]
+    assert len(server.bodies) == 1  # 스트리밍 / 비스트리밍 구분 없이 (모델, 파라미터, 프롬프트)가 같으면 공유
+
+    async def dual():
+        events = []
+        async for event in dual_stream_analysis(PROMPT):
+            events.append(event)
+        return events
+
+    start = time.perf_counter()
+    first, server = _with_fake_server(dual)
+    first_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    second, server = _with_fake_server(dual)
+    second_elapsed = time.perf_counter() - start
+
+    assert first[-1][:2] == second[-1][:2] == ("초안 완료", "검증")
+    assert len(server.bodies) == 0  # 두 번째 분석: 초안 / 검증 모두 캐시
+    assert second_elapsed < first_elapsed - 2  # 검증 3초 대기 생략
+    phases = lambda events: [e for e in events if isinstance(e, str) and "완료" in e]
+    assert len(phases(first)) == len(phases(second)) == 2  # 같은 SSE 완료 이벤트
+
+    stats = cost_monitor.get_cost_monitor().get_cache_stats()
+    assert stats["operations"]["validation"]["hits"] == 1 and stats["operations"]["summary"]["hits"] == 2
+    assert stats["total"]["saved_cost"] > 0
+
+
+if __name__ == "__main__":
+    test_cache_key()
+    print("[OK] 캐시 키 (모델 + 파라미터 + 정규화된 프롬프트)")
+    test_miss_store_and_replay()
+    print("[OK] 미스 저장 → 적중 재생 + 절약 토큰/비용")
+    test_bypass_and_errors()
+    print("[OK] 우회 갱신 / 오류 미저장 / 비활성")
+    test_fallback_model_not_stored()
+    print("[OK] 폴백 모델 응답은 요청 모델 키로 저장하지 않음")
+    test_persistent_layer()
+    print("[OK] Postgres 계층 공유 / TTL / DB 오류 시 메모리만")
+    test_poller_survives_slow_first_event()
+    print("[OK] 첫 이벤트가 느린 스트림 폴링 (취소 없이 대기)")
+    test_streaming_and_summary_reuse()
+    print("[OK] 초안 / 듀얼 분석 / 요약 재실행 시 API 호출 없음")
@@ -0,0 +1,315 @@
+"""
+LLM 클라이언트 레지스트리 테스트 (core/llm_clients.py, 로컬 가짜 LLM 서버 - 외부 API 호출 없음)
+
+- 같은 (제공자, 모델, 연결 설정) → 인스턴스 1개, temperature 등은 요청별로 덮어씀
+- 순차 스트리밍 요청이 연결 1개를 재사용 (새 연결마다 핸드셰이크 지연을 흉내 냄)
+- OpenAI / Claude 모두 공유 풀 사용, TTFT / 연결 재사용률 계측
+- asyncio.run을 여러 번 호출해도 (루프가 바뀌어도) 동작
+- 측정: 요청마다 ChatOpenAI를 새로 만드는 기존 방식 대비 연결 수 / TTFT
+
+사용법:
+    python test_llm_clients.py
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from langchain_core.messages import HumanMessage
+
+from core.llm_clients import LLMClientRegistry
+
+HANDSHAKE_DELAY_SEC = 0.05  # 새 연결 1개당 TCP/TLS 핸드셰이크 비용 (흉내)
+
+
+def _sse(events) -> bytes:
+    return "".join(
+        (f"event: {name}\n" if name else "") + f"data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+        for name, data in events
+    ).encode("utf-8")
+
+
+def openai_stream(model: str) -> bytes:
+    chunk = {"id": "c1", "object": "chat.completion.chunk", "created": 1, "model": model}
+    return _sse([
+        (None, {**chunk, "choices": [{"index": 0, "delta": {"role": "assistant", "content": "초안"}, "finish_reason": None}]}),
+        (None, {**chunk, "choices": [{"index": 0, "delta": {"content": " 완료"}, "finish_reason": None}]}),
+        (None, {**chunk, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}),
+        (None, "[DONE]"),
+    ])
+
+
+def openai_completion(model: str) -> bytes:
+    return json.dumps({
+        "id": "c1", "object": "chat.completion", "created": 1, "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "초안 완료"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7},
+    }).encode("utf-8")
+
+
+def anthropic_message(model: str) -> bytes:
+    return json.dumps({
+        "id": "m1", "type": "message", "role": "assistant", "model": model,
+        "content": [{"type": "text", "text": "검증 완료"}], "stop_reason": "end_turn", "stop_sequence": None,
+        "usage": {"input_tokens": 5, "output_tokens": 2},
+    }).encode("utf-8")
+
+
+def anthropic_stream(model: str) -> bytes:
+    return _sse([
+        ("message_start", {"type": "message_start", "message": {
+            "id": "m1", "type": "message", "role": "assistant", "model": model, "content": [],
+            "stop_reason": None, "stop_sequence": None, "usage": {"input_tokens": 5, "output_tokens": 1},
+        }}),
+        ("content_block_start", {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}),
+        ("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "검증"}}),
+        ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                           "usage": {"output_tokens": 2}}),
+        ("message_stop", {"type": "message_stop"}),
+    ])
+
+
+class FakeLLMServer:
+    """
+    HTTP/1.1 keep-alive 서버: /v1/chat/completions (OpenAI), /v1/messages (Anthropic)
+
+    response_delay_sec: 응답 전 대기 (그 사이 클라이언트가 연결을 끊으면 aborted 증가)
+    rate_limit_first: 처음 n개 요청은 429 + retry-after-ms (rate_limit_retry_after_ms)
+    max_active: 동시에 처리 중이던 요청 수의 최댓값
+    """
+
+    def __init__(self, response_delay_sec: float = 0.0, rate_limit_first: int = 0, rate_limit_retry_after_ms: int = 300):
+        self.connections = 0
+        self.aborted = 0
+        self.active = 0
+        self.max_active = 0
+        self.response_delay_sec = response_delay_sec
+        self.rate_limit_first = rate_limit_first
+        self.rate_limit_retry_after_ms = rate_limit_retry_after_ms
+        self.bodies = []
+        self._server = None
+        self._handlers = set()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.url = f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+
+    async def _handle(self, reader, writer):
+        self._handlers.add(asyncio.current_task())
+        self.connections += 1
+        await asyncio.sleep(HANDSHAKE_DELAY_SEC)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                path = request_line.decode().split()[1]
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, value = line.decode().split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+                body = json.loads(await reader.readexactly(int(headers.get("content-length", 0))))
+                self.bodies.append(body)
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                try:
+                    if len(self.bodies) <= self.rate_limit_first:
+                        payload = json.dumps({"error": {"message": "rate limited", "type": "rate_limit_error"}}).encode()
+                        writer.write(
+                            b"HTTP/1.1 429 Too Many Requests\r\ncontent-type: application/json\r\n"
+                            + f"retry-after-ms: {self.rate_limit_retry_after_ms}\r\n".encode()
+                            + f"content-length: {len(payload)}\r\n\r\n".encode()
+                            + payload
+                        )
+                        await writer.drain()
+                        continue
+
+                    if self.response_delay_sec:
+                        try:
+                            if not await asyncio.wait_for(reader.read(1), self.response_delay_sec):
+                                self.aborted += 1  # 응답 전에 클라이언트가 연결 종료 (호출 취소)
+                                break
+                        except asyncio.TimeoutError:
+                            pass
+
+                    if path.endswith("/messages"):
+                        payload = (anthropic_stream if body.get("stream") else anthropic_message)(body["model"])
+                    else:
+                        payload = (openai_stream if body.get("stream") else openai_completion)(body["model"])
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+                        + f"content-length: {len(payload)}\r\n\r\n".encode()
+                        + payload
+                    )
+                    await writer.drain()
+                finally:
+                    self.active -= 1
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _stream(llm) -> tuple:
+    start = time.perf_counter()
+    ttft, text = None, ""
+    async for chunk in llm.astream([HumanMessage(content="질문")]):
+        if chunk.content:
+            ttft = ttft if ttft is not None else (time.perf_counter() - start) * 1000
+            text += chunk.content if isinstance(chunk.content, str) else "".join(
+                part.get("text", "") for part in chunk.content if isinstance(part, dict)
+            )
+    return ttft, text
+
+
+def _point_to(url: str) -> None:
+    os.environ["OPENAI_API_BASE"] = f"{url}/v1"
+    os.environ["ANTHROPIC_API_URL"] = url
+
+
+def test_instances_shared_with_overrides():
+    async def run():
+        async with FakeLLMServer() as server:
+            _point_to(server.url)
+            registry = LLMClientRegistry()
+            warm = registry.get("openai", "gpt-4o-mini", temperature=0.7, streaming=True)
+            cold = registry.get("openai", "gpt-4o-mini", temperature=0.1, max_tokens=64)
+            assert registry.created == 1 and registry.reused == 1
+            assert warm.async_client is cold.async_client  # 같은 SDK 클라이언트 / HTTP 풀
+            assert registry.get("openai", "gpt-4o-mini") is registry.get("openai", "gpt-4o-mini")
+            assert registry.get("openai", "gpt-4o-mini", timeout=5) is not registry.get("openai", "gpt-4o-mini")
+
+            await _stream(warm)
+            await cold.ainvoke([HumanMessage(content="질문")])
+            assert server.bodies[0]["temperature"] == 0.7
+            assert server.bodies[1]["temperature"] == 0.1
+            assert server.connections == 1
+
+            try:
+                registry.get("openai", "gpt-4o-mini", top_p=0.5)
+                raise AssertionError("지원하지 않는 override는 ValueError")
+            except ValueError:
+                pass
+            await registry.aclose()
+
+    asyncio.run(run())
+
+
+def test_connection_reuse_and_ttft(requests: int = 8):
+    async def run():
+        async with FakeLLMServer() as server:
+            _point_to(server.url)
+            registry = LLMClientRegistry()
+
+            for model in ("gpt-4o-mini", "gpt-4o"):  # 모델이 달라도 제공자 풀 공유
+                for _ in range(requests // 2):
+                    llm = registry.get("openai", model, temperature=0.3, streaming=True)
+                    _, text = await _stream(llm)
+                    assert text == "초안 완료"
+            for _ in range(2):
+                llm = registry.get("claude", "claude-3-5-haiku-latest", timeout=60, temperature=0.1, streaming=True)
+                _, text = await _stream(llm)
+                assert text == "검증"
+
+            snapshot = registry.snapshot()
+            openai_stats = snapshot["transports"]["openai"]
+            assert openai_stats["requests"] == requests and openai_stats["connections_opened"] == 1, snapshot
+            assert openai_stats["reuse_ratio"] == round((requests - 1) / requests, 3)
+            claude_stats = snapshot["transports"]["claude"]
+            assert claude_stats["requests"] == 2 and claude_stats["connections_opened"] == 1
+            assert claude_stats["reuse_ratio"] == 0.5
+            assert snapshot["created"] == 3 and snapshot["reused"] == requests + 2 - 3
+            for name in ("openai:gpt-4o-mini", "openai:gpt-4o"):
+                latency = snapshot["latency"][name]
+                assert latency["calls"] == requests // 2 and latency["errors"] == 0
+                assert latency["ttft_ms"] > 0 and latency["last_ttft_ms"] > 0
+                assert latency["latency_ms"] >= latency["last_ttft_ms"]
+            assert snapshot["latency"]["claude:claude-3-5-haiku-latest"]["calls"] == 2
+            assert server.connections == 2  # openai 1 + claude 1
+            await registry.aclose()
+
+    asyncio.run(run())
+
+
+def test_survives_new_event_loop():
+    # 서버는 별도 스레드 루프에서 실행, 클라이언트는 asyncio.run마다 새 루프 (vision의 동기 래퍼와 같은 상황)
+    server = FakeLLMServer()
+    server_loop = asyncio.new_event_loop()
+    threading.Thread(target=server_loop.run_forever, daemon=True).start()
+    asyncio.run_coroutine_threadsafe(server.__aenter__(), server_loop).result()
+    _point_to(server.url)
+
+    registry = LLMClientRegistry()
+    try:
+        for _ in range(2):
+            llm = registry.get("openai", "gpt-4o-mini", streaming=True)
+            assert asyncio.run(_stream(llm))[1] == "초안 완료"
+        assert registry.created == 1
+        assert server.connections == 2  # 루프별 풀 (닫힌 루프의 연결은 재사용하지 않음)
+    finally:
+        asyncio.run_coroutine_threadsafe(server.__aexit__(), server_loop).result()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+
+
+def benchmark(requests: int = 6, idle_sec: float = 5.5):
+    """
+    요청마다 ChatOpenAI 생성 (기존) vs 레지스트리: 새 연결 수 / 평균 TTFT
+
+    요청 사이에 한 번 idle_sec만큼 쉼 - httpx 기본 유휴 연결 유지 시간(5초)을 넘기면
+    기존 방식은 연결을 다시 맺고, 레지스트리는 llm_pool_keepalive_expiry_sec(60초) 동안 유지
+    """
+    from langchain_openai import ChatOpenAI
+
+    async def session(make_llm):
+        async with FakeLLMServer() as server:
+            ttfts = []
+            for i in range(requests):
+                if i == requests // 2:
+                    await asyncio.sleep(idle_sec)
+                ttfts.append((await _stream(make_llm(server.url)))[0])
+            return server.connections, sum(ttfts) / len(ttfts), max(ttfts)
+
+    registry = LLMClientRegistry()
+
+    def legacy(url):
+        return ChatOpenAI(model="gpt-4o-mini", api_key="test", base_url=f"{url}/v1", temperature=0.3, streaming=True)
+
+    def pooled(url):
+        _point_to(url)
+        return registry.get("openai", "gpt-4o-mini", temperature=0.3, streaming=True)
+
+    async def run():
+        results = await asyncio.gather(session(legacy), session(pooled))
+        await registry.aclose()
+        return results
+
+    (legacy_conn, legacy_avg, legacy_max), (pooled_conn, pooled_avg, pooled_max) = asyncio.run(run())
+    print(f"  순차 스트리밍 {requests}회 (중간 {idle_sec}초 유휴), 새 연결당 지연 {HANDSHAKE_DELAY_SEC * 1000:.0f}ms")
+    print(f"  요청마다 ChatOpenAI 생성 : 새 연결 {legacy_conn}개, TTFT 평균 {legacy_avg:5.1f}ms / 최대 {legacy_max:5.1f}ms")
+    print(f"  레지스트리 (공유 풀)     : 새 연결 {pooled_conn}개, TTFT 평균 {pooled_avg:5.1f}ms / 최대 {pooled_max:5.1f}ms")
+    assert pooled_conn == 1 and pooled_conn < legacy_conn
+
+
+if __name__ == "__main__":
+    test_instances_shared_with_overrides()
+    print("[OK] 인스턴스 공유 + 요청별 temperature/max_tokens")
+    test_connection_reuse_and_ttft()
+    print("[OK] 연결 재사용 / TTFT 계측")
+    test_survives_new_event_loop()
+    print("[OK] 이벤트 루프가 바뀌어도 동작")
+    benchmark()
+    print("[OK] 벤치마크")
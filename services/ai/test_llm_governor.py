@@ -0,0 +1,265 @@
+"""
+LLM 동시 호출 제어 테스트 (core/llm_governor.py, 로컬 가짜 LLM 서버 - 외부 API 호출 없음)
+
+- 우선순위: 자리가 나면 interactive → analysis → background 순서로 허가
+- 분당 토큰 예산: 부족하면 실패 대신 충전될 때까지 대기
+- 429 + retry-after: 동시 요청 한도 절반, 대기 후 SDK 재시도 성공, 성공 응답으로 회복
+- 공유 HTTP 트랜스포트 경유: 동시 요청 수가 한도를 넘지 않음 (스트리밍은 스트림 종료까지)
+- 대기 시간 초과 / 취소 → 대기열에서 빠짐
+
+사용법:
+    python test_llm_governor.py
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from langchain_core.messages import HumanMessage
+
+import core.llm_clients as llm_clients
+import core.llm_governor as llm_governor
+from core.llm_clients import LLMClientRegistry
+from core.llm_governor import (
+    LLMGovernor,
+    LLMQueueTimeoutError,
+    ProviderGovernor,
+    estimate_tokens,
+    llm_priority,
+)
+from test_llm_clients import FakeLLMServer, _point_to
+
+MAX_WAIT = {"interactive": 5.0, "analysis": 5.0, "background": 5.0}
+
+
+def _governor(**kwargs) -> ProviderGovernor:
+    params = {"max_concurrency": 1, "requests_per_min": 6000, "tokens_per_min": 1_000_000, "max_wait_sec": MAX_WAIT}
+    params.update(kwargs)
+    return ProviderGovernor("openai", **params)
+
+
+def test_priority_order():
+    governor = _governor()
+    order = []
+
+    async def call(priority: str):
+        permit = await governor.acquire(priority=priority)
+        order.append(priority)
+        await asyncio.sleep(0.01)
+        permit.release()
+
+    async def run():
+        holder = await governor.acquire()
+        tasks = []
+        for priority in ("background", "analysis", "background", "interactive"):
+            tasks.append(asyncio.create_task(call(priority)))
+            await asyncio.sleep(0.01)
+        assert governor.snapshot()["queued"] == {"interactive": 1, "analysis": 1, "background": 2}
+        holder.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert order == ["interactive", "analysis", "background", "background"]
+    stats = governor.snapshot()["priorities"]
+    assert stats["background"]["admitted"] == 2 and stats["background"]["max_wait_ms"] > stats["interactive"]["max_wait_ms"]
+
+    # contextvar 우선순위 (블록을 벗어나면 기본값)
+    with llm_priority("interactive"):
+        assert llm_governor.current_priority() == "interactive"
+    assert llm_governor.current_priority() == "analysis"
+
+
+def test_aging_prevents_starvation():
+    governor = _governor(aging_sec=0.05)
+    order = []
+
+    async def call(priority: str):
+        permit = await governor.acquire(priority=priority)
+        order.append(priority)
+        permit.release()
+
+    async def run():
+        holder = await governor.acquire()
+        background = asyncio.create_task(call("background"))
+        await asyncio.sleep(0.2)  # 0.2초 대기 = 4단계 상승 → 나중에 온 interactive보다 앞
+        interactive = asyncio.create_task(call("interactive"))
+        await asyncio.sleep(0.01)
+        holder.release()
+        await asyncio.gather(background, interactive)
+
+    asyncio.run(run())
+    assert order == ["background", "interactive"]
+
+
+def test_token_budget_waits():
+    governor = _governor(max_concurrency=10, tokens_per_min=600)  # 초당 10토큰
+
+    async def run():
+        (await governor.acquire(tokens=600)).release()  # 예산 전부 사용
+        start = time.perf_counter()
+        permit = await governor.acquire(tokens=5)
+        permit.release()
+        return time.perf_counter() - start
+
+    waited = asyncio.run(run())
+    assert 0.4 <= waited < 0.9, waited
+
+    # 용량보다 큰 요청도 예산이 가득 차면 허가 (영원히 대기하지 않음)
+    assert _governor(tokens_per_min=600).acquire_sync(tokens=5000)
+
+    body = {"messages": [{"role": "user", "content": "가" * 300}], "max_tokens": 100}
+    assert estimate_tokens(body) == (300 + len("user")) // 3 + 100
+    image = {"messages": [{"role": "user", "content": [{"type": "image_url", "image_url": {"url": "data:" + "A" * 10**6}}]}]}
+    assert estimate_tokens(image) == len("user") // 3 + 1000 + 1024  # base64 길이는 세지 않음
+
+
+def test_rate_limit_adapts():
+    governor = _governor(max_concurrency=8)
+    governor.on_response(429, {"retry-after-ms": "300"})
+    governor.on_response(429, {"retry-after-ms": "300"})  # 동시에 온 429는 한 번만 반영
+    snapshot = governor.snapshot()
+    assert snapshot["limit"] == 4 and snapshot["rate_limited"] == 2 and snapshot["paused_for_sec"] > 0.2
+
+    start = time.perf_counter()
+    governor.acquire_sync().release()
+    assert time.perf_counter() - start >= 0.25  # retry-after 동안 허가 중지
+
+    for _ in range(40):
+        governor.on_response(200, {"x-ratelimit-remaining-requests": "3"})
+    snapshot = governor.snapshot()
+    assert snapshot["limit"] == 8  # 설정값까지 회복
+    assert snapshot["requests_budget"] <= 3  # 제공자가 알려준 남은 요청 수로 보정
+
+
+def test_timeout_and_cancel_leave_queue():
+    governor = _governor(max_wait_sec={"interactive": 0.1, "analysis": 0.1, "background": 0.1})
+    holder = governor.acquire_sync()
+    try:
+        governor.acquire_sync(priority="background")
+        raise AssertionError("대기 시간 초과")
+    except LLMQueueTimeoutError:
+        pass
+
+    async def cancelled():
+        task = asyncio.create_task(governor.acquire())
+        await asyncio.sleep(0.02)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(cancelled())
+    snapshot = governor.snapshot()
+    assert snapshot["queue_depth"] == 0 and snapshot["priorities"]["background"]["timeouts"] == 1
+    holder.release()
+    assert governor.snapshot()["in_flight"] == 0
+
+    # 동기 호출부(스레드)와 비동기 호출부가 같은 한도를 공유
+    results = []
+
+    def worker():
+        permit = governor.acquire_sync()
+        results.append("thread")
+        permit.release()
+
+    async def mixed():
+        permit = await governor.acquire()
+        thread = threading.Thread(target=worker)
+        thread.start()
+        await asyncio.sleep(0.05)
+        results.append("loop")
+        permit.release()
+        await asyncio.to_thread(thread.join)
+
+    asyncio.run(mixed())
+    assert results == ["loop", "thread"]
+
+    # 이벤트 루프 스레드에서 동기 허가 대기 → 루프를 멈추지 않고 즉시 오류
+    async def sync_on_loop():
+        permit = await governor.acquire()
+        start = time.monotonic()
+        try:
+            governor.acquire_sync()
+            raise AssertionError("이벤트 루프에서 acquire_sync는 RuntimeError")
+        except RuntimeError as e:
+            assert "ainvoke" in str(e) and time.monotonic() - start < 0.05
+        finally:
+            permit.release()
+
+    asyncio.run(sync_on_loop())
+    assert governor.snapshot()["queue_depth"] == 0 and governor.snapshot()["in_flight"] == 0
+
+
+def _with_governed_registry(coro_factory, governor: LLMGovernor, **server_kwargs):
+    async def run():
+        async with FakeLLMServer(**server_kwargs) as server:
+            _point_to(server.url)
+            original = (llm_clients._registry, llm_governor._governor)
+            llm_clients._registry = LLMClientRegistry()
+            llm_governor._governor = governor
+            try:
+                return await coro_factory(), server
+            finally:
+                await llm_clients._registry.aclose()
+                llm_clients._registry, llm_governor._governor = original
+
+    return asyncio.run(run())
+
+
+def test_transport_limits_concurrency():
+    governor = LLMGovernor({"openai": 2}, {"openai": 6000}, {"openai": 1_000_000}, MAX_WAIT)
+
+    async def calls():
+        llm = llm_clients.get_chat_model("openai", "gpt-4o-mini", streaming=True)
+
+        async def one(i: int):
+            with llm_priority("interactive" if i % 2 else "background"):
+                return "".join([chunk.content async for chunk in llm.astream([HumanMessage(content="질문")])])
+
+        return await asyncio.gather(*(one(i) for i in range(6)))
+
+    results, server = _with_governed_registry(calls, governor, response_delay_sec=0.1)
+    assert results == ["초안 완료"] * 6
+    assert server.max_active == 2  # 한도 2 (스트림이 끝나야 다음 요청)
+    snapshot = governor.snapshot()["openai"]
+    assert snapshot["in_flight"] == 0 and snapshot["queue_depth"] == 0
+    assert snapshot["priorities"]["interactive"]["admitted"] == 3
+    assert snapshot["priorities"]["background"]["wait_ms"] > snapshot["priorities"]["interactive"]["wait_ms"]
+
+
+def test_transport_rate_limit_retry():
+    governor = LLMGovernor({"openai": 4}, {"openai": 6000}, {"openai": 1_000_000}, MAX_WAIT)
+
+    async def call():
+        llm = llm_clients.get_chat_model("openai", "gpt-4o-mini")
+        start = time.perf_counter()
+        response = await llm.ainvoke([HumanMessage(content="질문")])
+        return response.content, time.perf_counter() - start
+
+    (content, elapsed), server = _with_governed_registry(
+        call, governor, rate_limit_first=1, rate_limit_retry_after_ms=300
+    )
+    assert content == "초안 완료" and len(server.bodies) == 2  # 429 → SDK 재시도 성공
+    assert elapsed >= 0.3
+    snapshot = governor.snapshot()["openai"]
+    assert snapshot["rate_limited"] == 1 and snapshot["in_flight"] == 0
+    assert snapshot["limit"] == 2  # 절반으로 줄어든 뒤 성공 1회로는 아직 회복 전 (2 + 1/2)
+
+
+if __name__ == "__main__":
+    test_priority_order()
+    print("[OK] 우선순위 허가 순서")
+    test_aging_prevents_starvation()
+    print("[OK] 오래 기다린 요청 우선순위 상승")
+    test_token_budget_waits()
+    print("[OK] 분당 토큰 예산 대기 / 토큰 추정")
+    test_rate_limit_adapts()
+    print("[OK] 429 → 한도 절반 + 일시 중지, 성공 → 회복")
+    test_timeout_and_cancel_leave_queue()
+    print("[OK] 대기 시간 초과 / 취소 / 스레드 공유")
+    test_transport_limits_concurrency()
+    print("[OK] 공유 트랜스포트 동시 요청 한도")
+    test_transport_rate_limit_retry()
+    print("[OK] 429 응답 → 대기 후 재시도 성공")
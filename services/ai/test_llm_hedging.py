@@ -0,0 +1,250 @@
+"""
+LLM 헤징 / fallback 테스트 (core/dual_provider.py, 가짜 스트림 - 외부 API 호출 없음)
+
+- 주 제공자 첫 토큰이 늦으면 헤징 대기 시간 뒤 보조 제공자에도 요청, 먼저 토큰을 낸 쪽 사용
+- 진 스트림은 취소 + aclose (HTTP 연결 종료), 추가 토큰 / 비용 기록
+- 주 제공자가 첫 토큰 전에 실패하면 대기 없이 바로 보조 제공자
+- 헤징 대기 시간: 최근 첫 토큰 지연의 백분위수 (샘플 부족 시 기본값)
+- 계속 지는 제공자는 서킷 브레이커로 건너뜀, 헤징 비율 상한
+- create_fallback_chain: ainvoke / astream 헤징
+
+사용법:
+    python test_llm_hedging.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableLambda
+
+from core.dual_provider import HedgeRouter, HedgeStats, ProviderError, create_fallback_chain
+from core.endpoint_health import EndpointHealthRegistry
+from core.settings import settings
+
+MODELS = {"openai": "gpt-4o-mini", "claude": "claude-3-5-sonnet-latest"}
+
+
+class FakeStream:
+    """첫 토큰까지 first_token_sec 대기하는 가짜 스트림 (aclose 여부 기록)"""
+
+    def __init__(self, provider: str, first_token_sec: float, tokens=("가", "나", "다"), error: Exception = None):
+        self.provider = provider
+        self.first_token_sec = first_token_sec
+        self.tokens = tokens
+        self.error = error
+        self.yielded = 0
+        self.closed = False
+
+    async def _generate(self):
+        try:
+            await asyncio.sleep(self.first_token_sec)
+            if self.error is not None:
+                raise self.error
+            yield AIMessageChunk(content="")  # 빈 청크는 첫 토큰이 아님
+            for token in self.tokens:
+                self.yielded += 1
+                yield AIMessageChunk(content=f"{self.provider}:{token}")
+                await asyncio.sleep(0.01)
+        finally:
+            self.closed = True
+
+    def __aiter__(self):
+        return self._generate()
+
+
+def _router(**kwargs) -> HedgeRouter:
+    params = {"default_delay_sec": 0.1, "min_delay_sec": 0.05, "min_samples": 5, "max_hedge_ratio": 1.0,
+              "breaker": EndpointHealthRegistry(failure_threshold=3, open_sec=60)}
+    params.update(kwargs)
+    return HedgeRouter(**params)
+
+
+def _stream(router: HedgeRouter, streams: dict, label: str = "chat_draft"):
+    selected = []
+
+    async def run():
+        chunks = [
+            chunk.content async for chunk in router.astream(
+                label, lambda provider: streams[provider], primary="openai",
+                models=MODELS, prompt_tokens=100, on_select=selected.append,
+            )
+        ]
+        return [c for c in chunks if c]
+
+    return asyncio.run(run()), selected
+
+
+def test_slow_primary_is_hedged():
+    router = _router()
+    streams = {"openai": FakeStream("openai", 1.0), "claude": FakeStream("claude", 0.05)}
+    start = time.perf_counter()
+    chunks, selected = _stream(router, streams)
+    elapsed = time.perf_counter() - start
+
+    assert chunks == ["claude:가", "claude:나", "claude:다"] and selected == ["claude"]
+    assert elapsed < 0.5  # 주 제공자 1초를 기다리지 않음 (0.1초 헤징 + 0.05초 첫 토큰)
+    assert streams["openai"].closed and streams["openai"].yielded == 0  # 진 쪽은 취소 + 종료
+
+    stats = router.snapshot()["labels"]["chat_draft"]
+    assert stats["requests"] == 1 and stats["hedged"] == 1 and stats["secondary_wins"] == 1
+    assert 100 <= stats["tail_latency_ms"]["p50"] < 400
+    assert stats["extra_tokens"] == {"input": 100, "output": 0}
+    assert stats["extra_cost_usd"] > 0  # gpt-4o-mini 입력 100토큰 단가
+
+    # 빠른 주 제공자: 헤징 없음, 보조 제공자 스트림은 시작조차 하지 않음
+    streams = {"openai": FakeStream("openai", 0.01), "claude": FakeStream("claude", 0.01)}
+    chunks, selected = _stream(router, streams)
+    assert selected == ["openai"] and chunks[0] == "openai:가"
+    assert not streams["claude"].closed
+    assert router.snapshot()["labels"]["chat_draft"]["hedged"] == 1
+
+
+def test_error_falls_back_immediately():
+    router = _router(default_delay_sec=5.0)
+    streams = {
+        "openai": FakeStream("openai", 0.02, error=RuntimeError("502 bad gateway")),
+        "claude": FakeStream("claude", 0.02),
+    }
+    start = time.perf_counter()
+    chunks, selected = _stream(router, streams)
+    assert selected == ["claude"] and len(chunks) == 3
+    assert time.perf_counter() - start < 1.0  # 헤징 대기 5초를 기다리지 않음
+    stats = router.snapshot()["labels"]["chat_draft"]
+    assert stats["fallbacks"] == 1 and stats["hedged"] == 0 and stats["extra_tokens"]["input"] == 0
+
+    # 둘 다 실패 → ProviderError
+    streams = {
+        "openai": FakeStream("openai", 0.01, error=RuntimeError("500")),
+        "claude": FakeStream("claude", 0.01, error=RuntimeError("529 overloaded")),
+    }
+    try:
+        _stream(router, streams)
+        raise AssertionError("모든 제공자 실패 시 ProviderError")
+    except ProviderError as e:
+        assert "529" in str(e)
+    assert router.snapshot()["labels"]["chat_draft"]["failures"] == 1
+
+
+def test_percentile_delay():
+    router = _router(percentile=0.9, min_samples=5, default_delay_sec=2.0, min_delay_sec=0.05)
+    assert router.hedge_delay_sec("analyze", "openai") == 2.0  # 샘플 부족 → 기본값
+    for ms in (100, 200, 300, 400, 500, 600, 700, 800, 900, 1000):
+        router._samples("analyze", "openai").append(ms)
+    assert router.hedge_delay_sec("analyze", "openai") == 0.9  # p90
+    assert router.hedge_delay_sec("chat_draft", "openai") == 2.0  # 호출부별로 따로
+
+    router._samples("fast", "openai").extend([1.0] * 10)
+    assert router.hedge_delay_sec("fast", "openai") == 0.05  # 하한
+
+
+def test_breaker_skips_degraded_provider():
+    router = _router()
+    for _ in range(3):  # 헤징에서 3번 연속 짐 → open
+        streams = {"openai": FakeStream("openai", 1.0), "claude": FakeStream("claude", 0.01)}
+        _stream(router, streams)
+
+    snapshot = router.snapshot()
+    assert snapshot["breaker"]["openai"]["state"] == "open"
+
+    streams = {"openai": FakeStream("openai", 0.01), "claude": FakeStream("claude", 0.01)}
+    start = time.perf_counter()
+    chunks, selected = _stream(router, streams)
+    assert selected == ["claude"] and time.perf_counter() - start < 0.3
+    assert not streams["openai"].closed  # 열린 서킷은 요청조차 보내지 않음
+    stats = router.snapshot()["labels"]["chat_draft"]
+    assert stats["skipped_degraded"] == 1 and stats["requests"] == 4
+
+
+def test_hedge_ratio_cap():
+    router = _router(max_hedge_ratio=0.5, breaker=EndpointHealthRegistry(failure_threshold=100))
+    outcomes = []
+    for _ in range(4):
+        streams = {"openai": FakeStream("openai", 0.3), "claude": FakeStream("claude", 0.01)}
+        _, selected = _stream(router, streams)
+        outcomes.append(selected[0])
+    # 최근 헤징 비율이 상한(50%) 이상이면 주 제공자를 그대로 기다림 (1/1, 1/2 → 대기, 1/3 → 헤징)
+    assert outcomes == ["claude", "openai", "openai", "claude"]
+    assert router.snapshot()["labels"]["chat_draft"]["hedge_rate"] == 0.5
+
+
+def test_hedge_cap_keeps_error_fallback():
+    router = _router(max_hedge_ratio=0.5, breaker=EndpointHealthRegistry(failure_threshold=100))
+    router.stats.setdefault("chat_draft", HedgeStats()).recent_hedges.extend([True, True])  # 상한 도달
+
+    # 헤징은 하지 않지만, 느린 주 제공자가 결국 실패하면 보조 제공자로 fallback
+    streams = {
+        "openai": FakeStream("openai", 0.3, error=RuntimeError("502 bad gateway")),
+        "claude": FakeStream("claude", 0.01),
+    }
+    chunks, selected = _stream(router, streams)
+    assert selected == ["claude"] and chunks == ["claude:가", "claude:나", "claude:다"]
+    stats = router.snapshot()["labels"]["chat_draft"]
+    assert stats["hedged"] == 0 and stats["fallbacks"] == 1 and stats["failures"] == 0
+
+
+def test_ainvoke_and_fallback_chain():
+    router = _router()
+
+    async def invoke(provider: str):
+        await asyncio.sleep(1.0 if provider == "openai" else 0.02)
+        return f"{provider} 답변"
+
+    provider, result = asyncio.run(router.ainvoke("analyze", invoke, primary="openai", models=MODELS, prompt_tokens=50))
+    assert (provider, result) == ("claude", "claude 답변")
+    assert router.snapshot()["labels"]["analyze"]["extra_tokens"]["input"] == 50
+
+    import core.dual_provider as dual_provider
+
+    delays = {"openai": 1.0, "claude": 0.02}
+
+    def make_chain(provider: str):
+        async def call(inputs):
+            await asyncio.sleep(delays[provider])
+            return f"{provider}:{inputs['question']}"
+
+        def sync_call(inputs):
+            return f"{provider}:{inputs['question']}"
+
+        return RunnableLambda(sync_call, afunc=call)
+
+    original = (dual_provider._hedge_router, settings.anthropic_api_key)
+    dual_provider._hedge_router = _router()
+    settings.anthropic_api_key = settings.anthropic_api_key or "test"
+    try:
+        chain = create_fallback_chain(make_chain, primary="openai", hedge=True, label="contract_chain")
+        assert chain.invoke({"question": "q"}) == "openai:q"  # 동기 호출은 순차 fallback 그대로
+        assert asyncio.run(chain.ainvoke({"question": "q"})) == "claude:q"
+
+        async def collect():
+            return [chunk async for chunk in chain.astream({"question": "q"})]
+
+        assert asyncio.run(collect()) == ["claude:q"]
+        assert dual_provider._hedge_router.stats["contract_chain"].hedged == 2
+
+        plain = create_fallback_chain(make_chain, primary="openai", hedge=False)
+        assert asyncio.run(plain.ainvoke({"question": "q"})) == "openai:q"
+    finally:
+        dual_provider._hedge_router, settings.anthropic_api_key = original
+
+
+if __name__ == "__main__":
+    settings.anthropic_api_key = settings.anthropic_api_key or "test"
+    test_slow_primary_is_hedged()
+    print("[OK] 느린 주 제공자 → 헤징, 진 스트림 취소 + 추가 비용 기록")
+    test_error_falls_back_immediately()
+    print("[OK] 첫 토큰 전 오류 → 즉시 fallback")
+    test_percentile_delay()
+    print("[OK] 백분위수 헤징 대기 시간")
+    test_breaker_skips_degraded_provider()
+    print("[OK] 계속 지는 제공자 서킷 open → 건너뜀")
+    test_hedge_ratio_cap()
+    print("[OK] 헤징 비율 상한")
+    test_hedge_cap_keeps_error_fallback()
+    print("[OK] 헤징 상한 도달 + 주 제공자 오류 → 보조 제공자")
+    test_ainvoke_and_fallback_chain()
+    print("[OK] ainvoke / create_fallback_chain 헤징")
@@ -0,0 +1,193 @@
+"""
+상품 통합 시세 조회 테스트 (core/market_query.py, API 호출 없음)
+
+- 한글 상품명 / 주소 속 건물명 → 상품 키
+- 상품별 필드(aptNm/offiNm/mhouseNm, 전용/연면적) → 공통 레코드
+- "unknown": 주거 상품 동시 조회 후 비교사례가 가장 가까운 상품 선택
+- 같은 (상품, 법정동, 기간) 동시 조회는 1번만 실행, 이후 캐시 (첫 요청이 취소되어도 공유 조회 유지)
+- 전세 시세: 월세 제외
+
+사용법:
+    python test_market_query.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import core.market_query as market_query
+import core.rtms_warehouse as rtms
+from core.address_converter import AddressCache
+from core.market_query import infer_property_type, query_market, resolve_property_type, to_market_record
+from core.rtms_warehouse import RTMSWarehouse, normalize_item
+
+ADDRESS = "서울 강남구 역삼동 123-4 역삼빌라 3층 301호"
+PLAIN_ADDRESS = "서울 강남구 역삼동 123-4 3층 301호"  # 건물명 없음 → 상품 추정 불가
+
+
+def _item(product: str, i: int):
+    raw = {
+        "umdNm": "역삼동", "jibun": "123-4" if product.startswith("rh") else "55",
+        "floor": str(i % 5 + 1), "dealYear": "2025", "dealMonth": "1", "dealDay": str(i + 1),
+        "cdealType": "",
+    }
+    if product.startswith("apt"):
+        raw.update(aptNm="역삼래미안", excluUseAr="84.9")
+    elif product.startswith("officetel"):
+        raw.update(offiNm="역삼오피스텔", excluUseAr="30.1")
+    elif product.startswith("rh"):
+        raw.update(mhouseNm="역삼빌라", excluUseAr="59.5")
+    else:
+        raw.update(totalFloorAr="120.0")
+    if product.endswith("rent"):
+        raw.update(deposit=f"{20000 + i * 100:,}", monthlyRent="50" if i % 4 == 0 else "0")
+    else:
+        raw.update(dealAmount=f"{50000 + i * 1000:,}")
+    return normalize_item(raw)
+
+
+def _patch_api(calls):
+    async def fake_fetch(property_type, lawd_cd, deal_ymd, api_key=None):
+        calls.append(property_type)
+        await asyncio.sleep(0.01)
+        count = {"apt": 12, "officetel": 6, "rh": 5, "sh": 3}[property_type.split("_")[0]]
+        return [_item(property_type, i) for i in range(count)]
+
+    original = rtms.fetch_partition_from_api
+    rtms.fetch_partition_from_api = fake_fetch
+    market_query._cache = AddressCache(64, 300)
+    return original
+
+
+def test_resolve_property_type():
+    assert resolve_property_type("빌라") == "rh"
+    assert resolve_property_type("오피스텔") == "officetel"
+    assert resolve_property_type("apt") == "apt"
+    assert resolve_property_type(None) == resolve_property_type("모름") == "unknown"
+    assert infer_property_type("서울 강남구 역삼동 1 역삼오피스텔 1203호") == "officetel"
+    assert infer_property_type("서울 강남구 역삼동 123-4") == "unknown"
+
+
+def test_common_record():
+    record = to_market_record(_item("rh_trade", 0), "rh_trade")
+    assert (record.product, record.name, record.area, record.dealAmount) == ("rh_trade", "역삼빌라", "59.5", 50000)
+    sh = to_market_record(_item("sh_trade", 0), "sh_trade")
+    assert not sh.name and sh.area == "120.0"  # 단독주택은 단지명 없음, 연면적
+
+
+def test_unknown_picks_closest_comparables():
+    calls = []
+    warehouse = RTMSWarehouse(":memory:")
+    original = _patch_api(calls)
+    try:
+        result = asyncio.run(query_market("11680", PLAIN_ADDRESS, property_type="unknown", months=1, warehouse=warehouse))
+        calls_unknown = list(calls)
+        calls.clear()
+        hinted = asyncio.run(query_market("11680", ADDRESS, months=1, warehouse=warehouse))
+    finally:
+        rtms.fetch_partition_from_api = original
+
+    # 주소에 "빌라" → 빌라만 조회 (위 조회 결과 캐시 사용)
+    assert hinted.property_type == "rh" and list(hinted.candidates) == ["rh"] and calls == []
+
+    # 아파트가 거래는 더 많지만 같은 지번 비교사례는 빌라 → rh
+    assert result.property_type == "rh", result.candidates
+    assert set(result.candidates) == {"apt", "officetel", "rh", "sh"}
+    assert sorted(calls_unknown) == ["apt_trade", "officetel_trade", "rh_trade", "sh_trade"]
+    assert result.stats.sample_count == 5 and all(r.product == "rh_trade" for r in result.records)
+    assert result.to_dict()["transaction_count"] == 5
+
+
+def test_concurrent_queries_deduplicated_and_cached():
+    calls = []
+    warehouse = RTMSWarehouse(":memory:")
+    original = _patch_api(calls)
+
+    async def run():
+        return await asyncio.gather(*(
+            query_market("11680", ADDRESS, property_type="빌라", months=2, warehouse=warehouse)
+            for _ in range(5)
+        ))
+
+    try:
+        results = asyncio.run(run())
+        assert len(calls) == 2, calls  # 2개월 × 1번
+        assert all(r.property_type == "rh" and r.stats.estimate == results[0].stats.estimate for r in results)
+
+        calls.clear()
+        asyncio.run(query_market("11680", ADDRESS, property_type="rh", months=2, warehouse=warehouse))
+        assert calls == []
+    finally:
+        rtms.fetch_partition_from_api = original
+
+
+def test_first_caller_cancel_keeps_shared_query():
+    calls = []
+    warehouse = RTMSWarehouse(":memory:")
+    original = _patch_api(calls)
+
+    async def run():
+        first = asyncio.create_task(
+            market_query.fetch_market_records("rh_trade", "11680", ["202501"], warehouse=warehouse)
+        )
+        await asyncio.sleep(0)  # 첫 요청이 공유 조회 시작
+        follower = asyncio.create_task(
+            market_query.fetch_market_records("rh_trade", "11680", ["202501"], warehouse=warehouse)
+        )
+        await asyncio.sleep(0)
+        first.cancel()  # 클라이언트 연결 끊김 등
+        records = await follower
+        try:
+            await first
+            raise AssertionError("첫 요청은 취소되어야 함")
+        except asyncio.CancelledError:
+            pass
+        return records
+
+    try:
+        records = asyncio.run(run())
+        assert len(records) == 5 and calls == ["rh_trade"]  # 뒤에 합류한 요청은 같은 조회 결과를 받음
+        assert not market_query._inflight
+
+        calls.clear()
+        cached = asyncio.run(market_query.fetch_market_records("rh_trade", "11680", ["202501"], warehouse=warehouse))
+        assert cached == records and calls == []  # 취소와 무관하게 결과 캐시
+    finally:
+        rtms.fetch_partition_from_api = original
+
+
+def test_rent_excludes_monthly():
+    calls = []
+    warehouse = RTMSWarehouse(":memory:")
+    original = _patch_api(calls)
+    try:
+        result = asyncio.run(query_market(
+            "11680", ADDRESS, property_type="rh", kind="rent", months=1,
+            exclude_monthly_rent=True, warehouse=warehouse,
+        ))
+    finally:
+        rtms.fetch_partition_from_api = original
+
+    assert calls == ["rh_rent"]
+    assert result.stats.sample_count == 3  # 5건 중 월세 2건 제외
+
+    # 토지는 전월세 없음 → 조회 없이 빈 결과
+    empty = asyncio.run(query_market("11680", ADDRESS, property_type="토지", kind="rent", warehouse=warehouse))
+    assert empty.stats is None and empty.property_type == "land"
+
+
+if __name__ == "__main__":
+    test_resolve_property_type()
+    print("[OK] 상품명 / 주소 → 상품 키")
+    test_common_record()
+    print("[OK] 공통 레코드")
+    test_unknown_picks_closest_comparables()
+    print("[OK] unknown → 비교사례가 가장 가까운 상품")
+    test_concurrent_queries_deduplicated_and_cached()
+    print("[OK] 동시 조회 중복 제거 + 캐시")
+    test_first_caller_cancel_keeps_shared_query()
+    print("[OK] 첫 요청 취소 시에도 공유 조회 유지")
+    test_rent_excludes_monthly()
+    print("[OK] 전세 시세 월세 제외")
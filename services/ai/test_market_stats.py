@@ -0,0 +1,126 @@
+"""
+시세 통계 엔진 검증 + 벤치마크 스크립트
+
+1. 표본 수에 따라 비교 범위(단지·면적·층 → 법정동 → 시군구)가 단계적으로 완화되는지 확인
+2. 시군구 규모 거래 목록의 인덱싱/요약 시간 측정
+
+사용법:
+    python test_market_stats.py [거래 수]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.market_stats import ComparableTarget, MarketStatsEngine, area_bucket, floor_band, trimmed_mean
+
+import numpy as np
+
+
+def _trade(umd: str, name: str, area: float, floor: int, amount: int, month: int = 1, **extra):
+    item = {
+        "umdNm": umd, "aptNm": name, "jibun": "100", "excluUseAr": area, "floor": floor,
+        "dealYear": 2025, "dealMonth": month, "dealAmount": amount, "cdealType": "",
+    }
+    item.update(extra)
+    return item
+
+
+def make_items(n: int, seed: int = 11):
+    rng = random.Random(seed)
+    dongs = ["역삼동", "삼성동", "대치동", "도곡동"]
+    complexes = [f"단지{i}" for i in range(40)]
+    items = []
+    for _ in range(n):
+        area = rng.choice([39.9, 59.9, 84.9, 114.9])
+        items.append(_trade(
+            umd=rng.choice(dongs),
+            name=rng.choice(complexes),
+            area=area,
+            floor=rng.randint(1, 30),
+            amount=int(area * rng.uniform(1500, 2500)),
+            month=rng.randint(1, 12),
+        ))
+    return items
+
+
+def test_helpers():
+    assert area_bucket(None) == -1
+    assert area_bucket(59.9) == area_bucket(55.0)
+    assert area_bucket(84.9) != area_bucket(59.9)
+    assert floor_band(None) == -1
+    assert floor_band(2) == floor_band(3)
+    assert floor_band(3) != floor_band(12)
+    assert trimmed_mean(np.array([])) is None
+    # 양 끝 10% 제거 → 극단값 영향 없음
+    assert trimmed_mean(np.array([100] * 9 + [10000] + [1]), ratio=0.1) == 100
+
+
+def test_fallback_levels():
+    items = (
+        [_trade("역삼동", "래미안", 84.9, 12, 150000 + i) for i in range(6)]
+        + [_trade("역삼동", "래미안", 59.9, 3, 100000 + i) for i in range(3)]
+        + [_trade("역삼동", "자이", 84.9, 5, 140000 + i) for i in range(6)]
+        + [_trade("삼성동", "아이파크", 59.9, 7, 120000 + i) for i in range(3)]
+        # 해제 거래는 제외
+        + [_trade("역삼동", "래미안", 84.9, 12, 999999, cdealType="O") for _ in range(3)]
+    )
+    engine = MarketStatsEngine.from_items(items)
+
+    stats = engine.summarize(ComparableTarget(umd_nm="역삼동", complex_name="래미안", area_m2=84.9, floor=14))
+    assert stats.level == "complex_area_floor"
+    assert stats.sample_count == 6
+    assert stats.max_amount < 999999
+
+    # 같은 단지 59㎡는 3건 → 단지 전체 ㎡당 가격으로 환산
+    stats = engine.summarize(ComparableTarget(umd_nm="역삼동", complex_name="래미안", area_m2=59.9, floor=3))
+    assert stats.level == "complex"
+    assert stats.area_adjusted
+
+    # 단지명 모름 → 같은 법정동 + 같은 면적
+    stats = engine.summarize(ComparableTarget(umd_nm="역삼동", area_m2=84.9))
+    assert stats.level == "dong_area"
+    assert stats.sample_count == 12
+
+    # 법정동 표본 부족 → 시군구 전체
+    stats = engine.summarize(ComparableTarget(umd_nm="삼성동", area_m2=59.9))
+    assert stats.level == "district"
+
+    assert MarketStatsEngine.from_items([]).summarize(ComparableTarget()) is None
+
+
+def benchmark(n: int):
+    """시군구 규모 거래 목록 인덱싱 + 요약 시간"""
+    print("\n" + "=" * 60)
+    print(f"BENCHMARK: {n:,} trades")
+    print("=" * 60)
+
+    items = make_items(n)
+    start = time.perf_counter()
+    engine = MarketStatsEngine.from_items(items)
+    build = time.perf_counter() - start
+
+    target = ComparableTarget(umd_nm="대치동", complex_name="단지7", area_m2=84.9, floor=15)
+    start = time.perf_counter()
+    rounds = 200
+    for _ in range(rounds):
+        stats = engine.summarize(target)
+    summarize = (time.perf_counter() - start) / rounds
+
+    print(f"인덱싱: {build * 1000:8.2f} ms")
+    print(f"요약:   {summarize * 1000:8.3f} ms / 회")
+    print(f"결과:   {stats.estimate:,}만원 ({stats.describe()})")
+
+
+if __name__ == "__main__":
+    n_trades = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    test_helpers()
+    print("[OK] 면적/층 구간, 절사평균")
+    test_fallback_levels()
+    print("[OK] 비교 범위 단계적 완화")
+
+    benchmark(n_trades)
@@ -0,0 +1,97 @@
+"""
+페이지 렌더링 서비스 검증 (API 호출 없음)
+
+1. 메모리 렌더링 + 그레이스케일 JPEG 인코딩
+2. 빈 페이지 / 중복 페이지 건너뜀 (같은 양식에 값만 다른 페이지는 유지)
+3. 텍스트 밀도 기반 적응 DPI
+4. 문서 해시 캐시 (경로/bytes 입력 동일 캐시)
+
+사용법:
+    python test_page_render.py
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import fitz  # PyMuPDF
+
+from core.page_render import clear_render_cache, render_pages
+from core.settings import settings
+
+
+def _sample_pdf() -> bytes:
+    """1: 빽빽한 텍스트, 2: 빈 페이지, 3: 1과 동일, 4: 짧은 텍스트"""
+    doc = fitz.open()
+    dense = "\n".join(f"{i} Mortgage registered 2024-01-{i % 28 + 1:02d} max claim {i * 1000}" for i in range(70))
+    for text in (dense, None, dense, "Special terms: none"):
+        page = doc.new_page()
+        if text:
+            page.insert_text((36, 40), text, fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_render_skips_and_encodes():
+    clear_render_cache()
+    pages = render_pages(_sample_pdf())
+    assert [p.index for p in pages] == [0, 3]  # 빈 페이지(1), 중복(2) 제외
+    assert all(p.data[:3] == b"\xff\xd8\xff" and p.mime_type == "image/jpeg" for p in pages)
+    assert pages[0].dpi == settings.page_render_dpi_max
+    assert pages[1].dpi == settings.page_render_dpi_min
+
+    png = render_pages(_sample_pdf(), dpi=200, image_format="png", grayscale=False)
+    jpeg = render_pages(_sample_pdf(), dpi=200)
+    print(f"  page 1 @200dpi: PNG(RGB) {len(png[0].data) // 1024}KB → JPEG(gray) {len(jpeg[0].data) // 1024}KB")
+    assert len(jpeg[0].data) < len(png[0].data)
+
+
+def test_same_form_different_values_kept():
+    """같은 양식(계약서)에서 보증금/소유자/날짜만 다른 페이지는 dHash가 거의 같아도 모두 유지"""
+    clear_render_cache()
+    doc = fitz.open()
+    form = "\n".join(f"Article {i}. The lessor and the lessee agree to the terms below." for i in range(40))
+    for deposit, owner, date in (("500,000,000", "Kim", "2025-03-05"), ("300,000,000", "Lee", "2025-04-11")):
+        page = doc.new_page()
+        page.insert_text((36, 40), f"Deposit: KRW {deposit}  Owner: {owner}  Date: {date}\n{form}", fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+
+    pages = render_pages(data)
+    assert [p.index for p in pages] == [0, 1]
+    distance = (pages[0].phash ^ pages[1].phash).bit_count()
+    print(f"  같은 양식 두 페이지 dHash 거리 {distance} → 둘 다 유지")
+    assert distance <= 4  # 유사도 기준이었다면 중복으로 버려졌을 페이지
+
+
+def test_cache_by_document_hash(tmp_path: Path):
+    clear_render_cache()
+    data = _sample_pdf()
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(data)
+
+    start = time.perf_counter()
+    first = render_pages(str(pdf_path))
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    second = render_pages(data)  # 같은 내용의 bytes → 캐시 적중
+    warm_ms = (time.perf_counter() - start) * 1000
+
+    assert first is second
+    print(f"  cold {cold_ms:.1f}ms / cached {warm_ms:.2f}ms")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_render_skips_and_encodes()
+    print("[OK] 메모리 렌더링 / 빈·중복 페이지 제외 / 적응 DPI")
+    test_same_form_different_values_kept()
+    print("[OK] 같은 양식, 다른 값 페이지 유지")
+    with tempfile.TemporaryDirectory() as tmp:
+        test_cache_by_document_hash(Path(tmp))
+    print("[OK] 문서 해시 캐시")
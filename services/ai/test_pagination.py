@@ -0,0 +1,100 @@
+"""
+Keyset 페이지네이션 테스트 (core/pagination.py, DB 호출 없음)
+
+- messages 행(TEXT ULID id)으로 만든 다음 페이지 커서 → 디코딩 → PostgREST 필터
+- 형식이 잘못된 커서 / 필터 문법을 넣은 커서 → InvalidCursorError (라우트에서 400)
+
+사용법:
+    python test_pagination.py
+"""
+import base64
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.pagination import InvalidCursorError, apply_keyset, decode_cursor, encode_cursor, split_page
+
+# routes/conversations.py의 str(ulid.new())와 같은 형식 (26자 Crockford base32)
+ULIDS = ["01HV5Z8K3M4N6P7Q8R9S0T1V2W", "01HV5Z8K3M4N6P7Q8R9S0T1V2X", "01HV5Z8K3M4N6P7Q8R9S0T1V2Y"]
+
+
+class FakeQuery:
+    def __init__(self):
+        self.orders = []
+        self.filters = []
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def or_(self, expression):
+        self.filters.append(expression)
+        return self
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def test_ulid_cursor_round_trip():
+    rows = [
+        {"id": ulid, "created_at": f"2025-03-05T12:34:5{i}.123456+00:00", "content": f"메시지 {i}"}
+        for i, ulid in enumerate(ULIDS)
+    ]
+    page, cursor = split_page(rows, limit=2)
+    assert [row["id"] for row in page] == ULIDS[:2] and cursor is not None
+    assert decode_cursor(cursor) == ("2025-03-05T12:34:51.123456+00:00", ULIDS[1])
+
+    query = apply_keyset(FakeQuery(), cursor, desc=False)
+    assert query.orders == [("created_at", False), ("id", False)]
+    assert query.filters == [
+        'created_at.gt."2025-03-05T12:34:51.123456+00:00",'
+        f'and(created_at.eq."2025-03-05T12:34:51.123456+00:00",id.gt.{ULIDS[1]})'
+    ]
+
+    # 정수 / UUID id, 'Z' 시간대 표기도 허용
+    assert decode_cursor(encode_cursor("2025-03-05T12:34:56Z", 42)) == ("2025-03-05T12:34:56Z", 42)
+    uuid_id = "96453564-2404-402a-a9ec-7e0b90413437"
+    assert decode_cursor(encode_cursor("2025-03-05T12:34:56+09:00", uuid_id))[1] == uuid_id
+
+    assert split_page(rows, limit=3) == (rows, None)
+    assert apply_keyset(FakeQuery(), None).filters == []
+
+
+def test_malformed_cursor_rejected():
+    ok_time = "2025-03-05T12:34:56+00:00"
+    bad = [
+        "%%%not-base64%%%",
+        _raw_cursor(["2025-03-05", ULIDS[0]]),                      # dict 아님
+        _raw_cursor({"t": ok_time}),                                # id 없음
+        encode_cursor('2025-03-05",id.gt.0', ULIDS[0]),             # 시각 자리에 필터 문법
+        encode_cursor("어제", ULIDS[0]),
+        encode_cursor(ok_time, f"{ULIDS[0]},or(id.gt.0)"),          # id 자리에 필터 문법
+        encode_cursor(ok_time, "a" * 65),
+        encode_cursor(ok_time, ""),
+        encode_cursor(ok_time, True),
+        encode_cursor(ok_time, 1.5),
+        encode_cursor(ok_time, None),
+    ]
+    for cursor in bad:
+        try:
+            decode_cursor(cursor)
+            raise AssertionError(f"잘못된 커서가 통과함: {cursor}")
+        except InvalidCursorError:
+            pass
+
+    try:
+        apply_keyset(FakeQuery(), bad[-6])
+        raise AssertionError("잘못된 커서로 필터를 만들면 안 됨")
+    except InvalidCursorError:
+        pass
+
+
+if __name__ == "__main__":
+    test_ulid_cursor_round_trip()
+    print("[OK] ULID 행 커서 → 디코딩 → keyset 필터")
+    test_malformed_cursor_rejected()
+    print("[OK] 잘못된 커서 거부")
@@ -0,0 +1,180 @@
+"""
+프롬프트 토큰 예산 테스트 (core/prompt_budget.py, 외부 API 호출 없음)
+
+- 예산 안이면 그대로, 넘치면 낮은 우선순위 섹션부터 압축 → 제외 → 자르기
+- build_llm_prompt: 거래 목록 → 통계 요약, 모델별 최대 입력 토큰 보장, 섹션별 토큰 계산
+  (분석 파이프라인과 같은 market_query 공통 레코드 입력 포함)
+- build_judge_prompt: 긴 초안은 앞/뒤를 남기고 중략 (끝부분 결론 유지)
+- take_recent: 최근 대화부터 예산 안에서 (오래된 메시지부터 제외)
+
+tiktoken 인코딩을 받을 수 없는 환경(오프라인)에서는 글자 수 추정치로 같은 검증을 합니다.
+
+사용법:
+    python test_prompt_budget.py
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.prompt_budget import (
+    HIGH, LOW, NORMAL, REQUIRED, PromptSection, assemble_prompt, count_tokens, max_input_tokens,
+    take_recent, truncate_tokens,
+)
+from core.prompts import build_judge_prompt
+from core.report_generator import build_llm_prompt, build_llm_prompt_budget
+from core.risk_engine import RegistryRiskFeatures
+from core.settings import settings
+
+MODEL = "gpt-4o-mini"
+
+
+def _features() -> RegistryRiskFeatures:
+    return RegistryRiskFeatures(
+        property_address="서울특별시 강남구 역삼동 123-45",
+        building_type="아파트",
+        area_m2=84.9,
+        owner_count=2,
+        owner_names_masked=[f"김*{i}" for i in range(40)],
+        mortgage_count=2,
+        total_mortgage_amount=30000,
+        mortgage_creditors=["OO은행", "OO캐피탈"],
+        jeonse_ratio=72.5,
+        risk_level="주의",
+        risk_score=42.0,
+    )
+
+
+def _transactions(n: int):
+    return [
+        {"aptNm": "래미안역삼", "excluUseAr": "84.9", "dealYear": 2024, "dealMonth": 1 + i % 6,
+         "dealDay": 1 + i % 28, "dealAmount": 90000 + i * 100, "floor": str(1 + i % 20)}
+        for i in range(n)
+    ]
+
+
+def test_assemble_order():
+    sections = [
+        PromptSection("head", "필수 " * 50, REQUIRED),
+        PromptSection("detail", "상세 " * 200, LOW, compress=lambda: "상세 요약"),
+        PromptSection("extra", "부가 " * 200, NORMAL),
+        PromptSection("empty", "", HIGH),
+    ]
+    whole = assemble_prompt(sections, model=MODEL, max_tokens=10_000)
+    assert not whole.reduced and [s["name"] for s in whole.sections] == ["head", "detail", "extra"]
+    assert whole.total_tokens <= 10_000 and "상세 요약" not in whole.text
+
+    # 예산 부족: LOW 압축 → 그래도 넘치면 NORMAL 제외, REQUIRED는 유지
+    head_tokens = count_tokens("필수 " * 50, MODEL)
+    budget = assemble_prompt(sections, model=MODEL, max_tokens=head_tokens + 20)
+    actions = {s["name"]: s["action"] for s in budget.sections}
+    assert actions == {"head": "kept", "detail": "compressed", "extra": "dropped"}
+    assert "상세 요약" in budget.text and "부가" not in budget.text
+    assert budget.total_tokens <= head_tokens + 20 < budget.original_tokens
+
+    # 필수 섹션만으로도 넘치면 잘라서라도 예산 보장
+    tiny = assemble_prompt(sections, model=MODEL, max_tokens=10)
+    assert tiny.total_tokens <= 10
+    assert {s["name"]: s["action"] for s in tiny.sections}["head"] == "truncated"
+
+
+def test_analysis_prompt_budget():
+    features = _features()
+    plain = build_llm_prompt(features, "전세", contract_deposit=50000, jeonse_market_average=52000)
+    assert plain.startswith("# 부동산 계약 리스크 분석 데이터\n\n당신은")
+    assert "\n\n## 📊 계약 정보\n\n- **계약 유형**: 전세" in plain and "최근 거래 내역" not in plain
+
+    # 예산이 넉넉하면 거래 목록 (최근 20건 + 나머지 건수)
+    roomy = build_llm_prompt_budget(
+        features, "전세", contract_deposit=50000, recent_transactions=_transactions(30), model=MODEL, max_tokens=20_000,
+    )
+    assert "래미안역삼 | 84.9㎡" in roomy.text and "- 외 10건" in roomy.text and not roomy.reduced
+
+    # 예산이 작으면 거래 목록 → 통계, 소유자 목록 → 인원수만, 지침/리스크 지표는 유지
+    limit = roomy.total_tokens - (roomy.total_tokens // 3)
+    tight = build_llm_prompt_budget(
+        features, "전세", contract_deposit=50000, recent_transactions=_transactions(30), model=MODEL, max_tokens=limit,
+    )
+    actions = {s["name"]: s["action"] for s in tight.sections}
+    assert tight.total_tokens <= limit
+    assert actions["transactions"] == "compressed" and actions["instructions"] == "kept"
+    assert "**거래 건수**: 30건" in tight.text and "중앙값" in tight.text and "래미안역삼 |" not in tight.text
+    assert "분석 리포트 작성 지침" in tight.text and "전세가율" in tight.text
+
+    trace = tight.to_dict()
+    assert trace["model"] == MODEL and trace["max_input_tokens"] == limit
+    assert all({"name", "tokens", "original_tokens", "action"} <= set(s) for s in trace["sections"])
+
+    # 모델별 기본 예산 (정확한 이름 → 접두사 → 기본값)
+    assert max_input_tokens("gpt-4o-mini") == settings.llm_max_input_tokens["gpt-4o-mini"]
+    assert max_input_tokens("claude-3-5-sonnet-latest") == settings.llm_max_input_tokens["claude-3-5-sonnet"]
+    assert max_input_tokens("unknown-model") == settings.llm_max_input_tokens_default
+
+
+def test_prompt_from_market_records():
+    """analysis_pipeline처럼 market_query 공통 레코드(name/area)의 to_dict()로 프롬프트 조립"""
+    from core.market_query import to_market_record
+    from core.rtms_warehouse import normalize_item
+
+    records = [
+        to_market_record(normalize_item({
+            "umdNm": "역삼동", "jibun": "55", "aptNm": "역삼래미안", "excluUseAr": f"{84.9 + i % 2 * 30:g}",
+            "floor": str(10 + i), "dealYear": "2025", "dealMonth": "3", "dealDay": str(5 + i),
+            "dealAmount": f"{150000 + i * 1000:,}",
+        }), "apt_trade").to_dict()
+        for i in range(12)
+    ]
+    assert "name" in records[0] and "aptNm" not in records[0]
+
+    roomy = build_llm_prompt_budget(_features(), "매매", contract_price=150000, recent_transactions=records,
+                                    model=MODEL, max_tokens=20_000)
+    assert "- 2025.03.05 | 역삼래미안 | 84.9㎡ | 10층 | 150,000만원" in roomy.text
+    assert "| - |" not in roomy.text
+
+    limit = roomy.total_tokens - 100
+    tight = build_llm_prompt_budget(_features(), "매매", contract_price=150000, recent_transactions=records,
+                                    model=MODEL, max_tokens=limit)
+    assert {s["name"]: s["action"] for s in tight.sections}["transactions"] == "compressed"
+    assert "- **전용면적**: 84.9 ~ 114.9㎡" in tight.text
+
+
+def test_judge_prompt_keeps_tail():
+    draft = "## 리스크 요약\n" + "본문 내용입니다. " * 3000 + "\n## 종합 의견\n계약 전 법무사 상담을 권장합니다."
+    prompt = build_judge_prompt(draft, max_draft_tokens=500)
+    assert "## 리스크 요약" in prompt and "법무사 상담을 권장합니다." in prompt and "(중략)" in prompt
+    assert count_tokens(prompt, "claude-3-5-sonnet-latest") < 500 + 200  # 초안 500 + 검증 지시문
+
+    short = build_judge_prompt("짧은 초안")
+    assert "짧은 초안" in short and "(중략)" not in short
+
+    assert truncate_tokens("가나다" * 100, 0) == ""
+    assert count_tokens(truncate_tokens("가나다" * 100, 20, MODEL), MODEL) <= 20
+
+
+def test_take_recent_drops_oldest():
+    items = [f"- 사용자: 질문 {i} " + "내용 " * 30 for i in range(10)]
+    per_item = count_tokens(items[-1], MODEL)
+    kept = take_recent(items, per_item * 3 + 5, MODEL)
+    assert kept == items[-3:]  # 최신 3개, 시간순 유지
+
+    # 항목 상한: 긴 답변 하나가 예산을 다 쓰지 않음
+    items = ["- 사용자: 짧은 질문", "- AI: " + "긴 답변 " * 1000, "- 사용자: 마지막 질문"]
+    kept = take_recent(items, 200, MODEL, max_item_tokens=60)
+    assert kept[0] == "- 사용자: 짧은 질문" and kept[-1] == "- 사용자: 마지막 질문"
+    assert count_tokens("\n".join(kept), MODEL) <= 200
+
+    assert take_recent(items, 0, MODEL) == []
+
+
+if __name__ == "__main__":
+    test_assemble_order()
+    print("[OK] 우선순위별 압축 → 제외 → 자르기")
+    test_analysis_prompt_budget()
+    print("[OK] 분석 프롬프트: 거래 목록 통계 요약 + 모델별 최대 입력 토큰")
+    test_prompt_from_market_records()
+    print("[OK] market_query 공통 레코드 → 거래 목록 / 요약")
+    test_judge_prompt_keeps_tail()
+    print("[OK] 검증 프롬프트: 긴 초안 앞/뒤 유지")
+    test_take_recent_drops_oldest()
+    print("[OK] 최근 대화 토큰 예산")
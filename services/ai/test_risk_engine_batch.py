@@ -0,0 +1,181 @@
+"""
+배치 리스크 엔진 검증 + 벤치마크 스크립트
+
+1. 무작위 케이스에서 core.risk_engine_batch 결과가 스칼라 엔진과 정확히 일치하는지 확인
+2. 스칼라 루프 대비 배치 채점 속도 비교
+
+사용법:
+    python test_risk_engine_batch.py [케이스 수]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.risk_engine import (
+    ContractData,
+    RegistryData,
+    MarketData,
+    PropertyValueAssessment,
+    calculate_risk_score,
+    calculate_sale_risk_score,
+)
+from core.risk_engine_batch import (
+    RentalRiskBatch,
+    SaleRiskBatch,
+    score_rental_batch,
+    score_sale_batch,
+    property_value_from_market,
+)
+
+
+def _random_amount(rng: random.Random, low: int, high: int):
+    """금액 (가끔 None/0 포함)"""
+    roll = rng.random()
+    if roll < 0.05:
+        return None
+    if roll < 0.08:
+        return 0
+    return rng.randint(low, high)
+
+
+def make_rental_cases(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(n):
+        contract = ContractData(
+            contract_type=rng.choice(["전세", "전세", "월세"]),
+            deposit=_random_amount(rng, 1000, 90000),
+        )
+        registry = RegistryData(
+            property_value=_random_amount(rng, 10000, 120000),
+            mortgage_total=_random_amount(rng, 0, 100000),
+            seizure_exists=rng.random() < 0.1,
+            provisional_attachment_exists=rng.random() < 0.1,
+            ownership_disputes=rng.random() < 0.05,
+        )
+        cases.append((contract, registry))
+    return cases
+
+
+def make_sale_cases(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(n):
+        contract = ContractData(contract_type="매매", price=_random_amount(rng, 10000, 200000))
+        market = MarketData(avg_trade_price=_random_amount(rng, 10000, 200000)) if rng.random() < 0.8 else None
+        value = None
+        if rng.random() < 0.7:
+            school, supply, job = rng.randint(0, 15), rng.randint(0, 15), rng.randint(0, 10)
+            value = PropertyValueAssessment(
+                school_score=school, supply_score=supply, job_score=job,
+                total_score=school + supply + job,
+            )
+        registry = None
+        if rng.random() < 0.6:
+            registry = RegistryData(
+                property_value=_random_amount(rng, 10000, 200000),
+                mortgage_total=_random_amount(rng, 0, 150000),
+                seizure_exists=rng.random() < 0.1,
+                provisional_attachment_exists=rng.random() < 0.1,
+                ownership_disputes=rng.random() < 0.05,
+                lease_rights_exists=rng.random() < 0.1,
+            )
+        cases.append((contract, registry, market, value))
+    return cases
+
+
+def test_rental_batch_matches_scalar():
+    cases = make_rental_cases(5000)
+    batch_scores = score_rental_batch(RentalRiskBatch.from_models(cases)).to_risk_scores()
+
+    for (contract, registry), batch in zip(cases, batch_scores):
+        scalar = calculate_risk_score(contract, registry)
+        assert batch.total_score == scalar.total_score
+        assert batch.jeonse_ratio == scalar.jeonse_ratio
+        assert batch.mortgage_ratio == scalar.mortgage_ratio
+        assert batch.risk_level == scalar.risk_level
+
+
+def test_sale_batch_matches_scalar():
+    cases = make_sale_cases(5000)
+    batch_scores = score_sale_batch(SaleRiskBatch.from_models(cases)).to_risk_scores()
+
+    for (contract, registry, market, value), batch in zip(cases, batch_scores):
+        scalar = calculate_sale_risk_score(contract, registry, market, value)
+        assert batch.total_score == scalar.total_score
+        assert batch.risk_level == scalar.risk_level
+        assert batch.price_fairness_score == scalar.price_fairness_score
+        assert batch.property_value_score == scalar.property_value_score
+        assert batch.legal_risk_score == scalar.legal_risk_score
+
+
+def test_property_value_from_market_matches_scalar():
+    rng = random.Random(3)
+    estimates = [rng.randint(10000, 300000) for _ in range(2000)]
+    rates = [rng.choice([0.6, 0.7, 0.75, 0.8, 0.85, 0.9]) for _ in estimates]
+
+    batch = property_value_from_market(estimates, rates)
+    for estimate, rate, value in zip(estimates, rates, batch):
+        assert int(estimate * rate) == int(value)
+
+
+def benchmark(n: int):
+    """스칼라 루프 vs 배치 채점 시간 비교"""
+    print("\n" + "=" * 60)
+    print(f"BENCHMARK: {n:,} cases")
+    print("=" * 60)
+
+    rental_cases = make_rental_cases(n)
+    sale_cases = make_sale_cases(n)
+
+    start = time.perf_counter()
+    for contract, registry in rental_cases:
+        calculate_risk_score(contract, registry)
+    rental_scalar = time.perf_counter() - start
+
+    rental_batch_input = RentalRiskBatch.from_models(rental_cases)
+    start = time.perf_counter()
+    rental_result = score_rental_batch(rental_batch_input)
+    rental_batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for contract, registry, market, value in sale_cases:
+        calculate_sale_risk_score(contract, registry, market, value)
+    sale_scalar = time.perf_counter() - start
+
+    sale_batch_input = SaleRiskBatch.from_models(sale_cases)
+    start = time.perf_counter()
+    score_sale_batch(sale_batch_input)
+    sale_batch = time.perf_counter() - start
+
+    print(f"임대차 스칼라: {rental_scalar * 1000:8.1f} ms")
+    print(f"임대차 배치:   {rental_batch * 1000:8.1f} ms  (x{rental_scalar / rental_batch:,.0f})")
+    print(f"매매 스칼라:   {sale_scalar * 1000:8.1f} ms")
+    print(f"매매 배치:     {sale_batch * 1000:8.1f} ms  (x{sale_scalar / sale_batch:,.0f})")
+    print(f"\n임대차 레벨 분포: {rental_result.level_counts()}")
+
+    # 낙찰가율 가정 백테스트 예시: 시세 고정, 낙찰가율만 변경
+    market_values = np.asarray([c.deposit or 0 for c, _ in rental_cases], dtype=np.float64) * 1.3
+    for rate in (0.6, 0.7, 0.8):
+        rental_batch_input.property_value = property_value_from_market(market_values, rate)
+        counts = score_rental_batch(rental_batch_input).level_counts()
+        print(f"낙찰가율 {rate:.0%}: {counts}")
+
+
+if __name__ == "__main__":
+    n_cases = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    test_rental_batch_matches_scalar()
+    print("[OK] 임대차 배치 결과 = 스칼라 결과")
+    test_sale_batch_matches_scalar()
+    print("[OK] 매매 배치 결과 = 스칼라 결과")
+    test_property_value_from_market_matches_scalar()
+    print("[OK] 물건 가치(시세 × 낙찰가율) = 스칼라 결과")
+
+    benchmark(n_cases)
@@ -0,0 +1,231 @@
+"""
+RTMS 스트리밍 XML 파싱 테스트 + 벤치마크 (core/rtms_records.py)
+
+- 정규화 결과가 xmltodict 파싱 결과와 동일 (구 API 한글 태그, 쉼표 금액, item 1건 응답)
+- 청크 단위 feed 결과 = 한 번에 파싱한 결과
+- 헤더: NO_DATA / OpenAPI_ServiceResponse 오류 응답
+- 클라이언트: dict(기본) / 슬롯 레코드(as_records=True), 레코드를 시세 엔진에 그대로 사용
+- 대용량 응답: xmltodict + item별 dict 정규화 대비 파싱 시간 / 최대 메모리
+
+사용법:
+    python test_rtms_records_benchmark.py
+"""
+import asyncio
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+import xmltodict
+
+from core.market_stats import MarketStatsEngine
+from core.public_data_api import OffiTradeAPIClient, PublicDataAPIError
+from core.rtms_records import (
+    APT_TRADE_SCHEMA,
+    OFFI_TRADE_SCHEMA,
+    RTMSStreamParser,
+    as_columns,
+    parse_rtms_xml,
+)
+from core.settings import settings
+
+
+def make_apt_trade_xml(count: int) -> bytes:
+    items = "".join(
+        "<item>"
+        f"<aptDong>{i % 12 + 101}</aptDong><aptNm>래미안{i % 40}차</aptNm><buildYear>{1990 + i % 30}</buildYear>"
+        "<buyerGbn>개인</buyerGbn><cdealDay> </cdealDay><cdealType> </cdealType>"
+        f"<dealAmount>{80000 + i * 7:,}</dealAmount><dealDay>{i % 28 + 1}</dealDay>"
+        "<dealMonth>1</dealMonth><dealYear>2025</dealYear><dealingGbn>중개거래</dealingGbn>"
+        "<estateAgentSggNm>서울 강남구</estateAgentSggNm>"
+        f"<excluUseAr>{59 + i % 50}.97</excluUseAr><floor>{i % 30 + 1}</floor><jibun>{i % 900}</jibun>"
+        "<landLeaseholdGbn>N</landLeaseholdGbn><rgstDate>25.02.10</rgstDate><sggCd>11680</sggCd>"
+        "<slerGbn>개인</slerGbn><umdNm>역삼동</umdNm>"
+        "</item>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>"
+        f"<body><items>{items}</items><numOfRows>{count}</numOfRows><pageNo>1</pageNo>"
+        f"<totalCount>{count}</totalCount></body></response>"
+    ).encode("utf-8")
+
+
+OLD_APT_TRADE_XML = (
+    "<response><header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>"
+    "<body><items><item>"
+    "<거래금액>  82,500</거래금액><건축년도>2004</건축년도><년>2024</년><월>7</월><일>15</일>"
+    "<법정동> 역삼동</법정동><아파트>역삼푸르지오</아파트><전용면적>84.9</전용면적><지번>123-4</지번><층>11</층>"
+    "<해제여부>O</해제여부><해제사유발생일>24.08.01</해제사유발생일>"
+    "</item></items><totalCount>1</totalCount></body></response>"
+).encode("utf-8")
+
+
+def xmltodict_items(content: bytes):
+    rows = xmltodict.parse(content)["response"]["body"]["items"]["item"]
+    return rows if isinstance(rows, list) else [rows]
+
+
+def test_matches_xmltodict():
+    content = make_apt_trade_xml(200)
+    expected = [APT_TRADE_SCHEMA.from_mapping(item, as_records=False) for item in xmltodict_items(content)]
+    result = parse_rtms_xml(content, APT_TRADE_SCHEMA, as_records=False)
+    assert result.records == expected
+    assert (result.result_code, result.result_msg, result.total_count) == ("000", "OK", 200)
+
+    records = parse_rtms_xml(content, APT_TRADE_SCHEMA).records
+    assert [r.to_dict() for r in records] == expected
+    first = records[0]
+    assert first.dealAmount == 80000 and first["aptNm"] == "래미안0차" and first.get("nope", "x") == "x"
+    assert first.cdealType == "" and first.exclusiveArea is None  # 공백만 있는 태그 / 소수 면적
+
+
+def test_old_korean_tags():
+    (item,) = parse_rtms_xml(OLD_APT_TRADE_XML, APT_TRADE_SCHEMA, as_records=False).records
+    assert item["dealAmount"] == 82500
+    assert (item["dealYear"], item["dealMonth"], item["dealDay"]) == (2024, 7, 15)
+    assert item["umdNm"] == item["dong"] == "역삼동"
+    assert item["aptNm"] == item["aptName"] == "역삼푸르지오"
+    assert item["excluUseAr"] == "84.9" and item["exclusiveArea"] is None
+    assert item["cdealType"] == item["cancelDealType"] == "O"
+    assert item == APT_TRADE_SCHEMA.from_mapping(xmltodict_items(OLD_APT_TRADE_XML)[0], as_records=False)
+
+
+def test_chunked_feed_and_headers():
+    content = make_apt_trade_xml(50)
+    parser = RTMSStreamParser(APT_TRADE_SCHEMA)
+    for offset in range(0, len(content), 97):  # 멀티바이트 문자 중간에서도 끊김
+        parser.feed(content[offset:offset + 97])
+    assert parser.close().records == parse_rtms_xml(content, APT_TRADE_SCHEMA).records
+
+    no_data = parse_rtms_xml(
+        b"<response><header><resultCode>03</resultCode><resultMsg>NO_DATA</resultMsg></header>"
+        b"<body><items/><totalCount>0</totalCount></body></response>",
+        APT_TRADE_SCHEMA,
+    )
+    assert (no_data.result_code, no_data.records) == ("03", [])
+
+    error = parse_rtms_xml(
+        b"<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+        b"<returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>"
+        b"<returnReasonCode>30</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>",
+        APT_TRADE_SCHEMA,
+    )
+    assert error.result_code == "30" and error.result_msg == "SERVICE ERROR"
+
+
+def test_columns():
+    records = parse_rtms_xml(make_apt_trade_xml(10), APT_TRADE_SCHEMA).records
+    columns = as_columns(records, ["dealAmount", "umdNm", "exclusiveArea"])
+    assert columns["dealAmount"].typecode == "d" and columns["dealAmount"][1] == 80007.0
+    assert columns["umdNm"] == ["역삼동"] * 10
+    assert all(math.isnan(v) for v in columns["exclusiveArea"])
+
+
+def test_client_dicts_and_records():
+    offi_xml = (
+        "<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header><body><items>"
+        + "".join(
+            f"<item><sggCd>11680</sggCd><umdNm>역삼동</umdNm><offiNm>역삼오피스텔</offiNm><jibun>1</jibun>"
+            f"<excluUseAr>{30 + i}.5</excluUseAr><dealYear>2025</dealYear><dealMonth>1</dealMonth>"
+            f"<dealDay>{i + 1}</dealDay><dealAmount>{20000 + i * 100:,}</dealAmount><floor>{i + 3}</floor>"
+            "<buildYear>2015</buildYear><cdealType></cdealType><cdealDay></cdealDay></item>"
+            for i in range(8)
+        )
+        + "</items><totalCount>8</totalCount></body></response>"
+    ).encode("utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("LAWD_CD") == "99999":
+            return httpx.Response(200, content=b"<response><header>")  # 잘린 XML
+        return httpx.Response(200, content=offi_xml)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = OffiTradeAPIClient("key", client=http)
+            as_dicts = await client.get_offi_trades("11680", "202501")
+            as_records = await client.get_offi_trades("11680", "202501", as_records=True)
+            try:
+                await client.get_offi_trades("99999", "202501")
+                raise AssertionError("XML 형식 오류는 PublicDataAPIError")
+            except PublicDataAPIError as e:
+                assert "XML parse error" in str(e)
+            return as_dicts, as_records
+
+    original_quota = settings.public_data_quota_enabled
+    settings.public_data_quota_enabled = False
+    try:
+        as_dicts, as_records = asyncio.run(run())
+    finally:
+        settings.public_data_quota_enabled = original_quota
+
+    items = as_dicts["body"]["items"]
+    assert isinstance(items[0], dict) and items[0]["dealAmount"] == 20000 and items[0]["offiNm"] == "역삼오피스텔"
+    assert [r.to_dict() for r in as_records["body"]["items"]] == items
+    assert as_records["body"]["items"][0].__class__ is OFFI_TRADE_SCHEMA.record_type
+
+    # dict / 레코드 어느 쪽이든 시세 엔진 입력으로 사용 가능
+    engine_dicts = MarketStatsEngine.from_items(items)
+    engine_records = MarketStatsEngine.from_items(as_records["body"]["items"])
+    assert len(engine_dicts) == len(engine_records) == 8
+    assert engine_dicts.amount.tolist() == engine_records.amount.tolist()
+
+
+def _measure(func, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024 / 1024, result
+
+
+def benchmark(count: int = 5000):
+    content = make_apt_trade_xml(count)
+
+    def legacy():
+        text = content.decode("utf-8").replace("﻿", "")
+        return [APT_TRADE_SCHEMA.from_mapping(item, as_records=False) for item in xmltodict_items(text)]
+
+    def streaming_dicts():
+        return parse_rtms_xml(content, APT_TRADE_SCHEMA, as_records=False).records
+
+    def streaming_records():
+        return parse_rtms_xml(content, APT_TRADE_SCHEMA).records
+
+    legacy_ms, legacy_mb, expected = _measure(legacy)
+    dict_ms, dict_mb, dicts = _measure(streaming_dicts)
+    record_ms, record_mb, records = _measure(streaming_records)
+    assert dicts == expected and len(records) == count
+
+    print(f"  응답 {len(content) / 1024 / 1024:.1f}MB, {count}건")
+    print(f"  xmltodict + dict 정규화  : {legacy_ms:7.1f}ms, 최대 {legacy_mb:6.1f}MB")
+    print(f"  스트리밍 → dict          : {dict_ms:7.1f}ms, 최대 {dict_mb:6.1f}MB")
+    print(f"  스트리밍 → 슬롯 레코드   : {record_ms:7.1f}ms, 최대 {record_mb:6.1f}MB")
+    assert record_mb < legacy_mb and dict_mb < legacy_mb
+    return legacy_ms, record_ms
+
+
+if __name__ == "__main__":
+    test_matches_xmltodict()
+    print("[OK] xmltodict 정규화 결과와 동일")
+    test_old_korean_tags()
+    print("[OK] 구 API 한글 태그")
+    test_chunked_feed_and_headers()
+    print("[OK] 청크 feed / NO_DATA / 오류 응답 헤더")
+    test_columns()
+    print("[OK] 컬럼 뷰")
+    test_client_dicts_and_records()
+    print("[OK] 클라이언트 dict / 레코드 응답")
+    benchmark()
+    print("[OK] 벤치마크")
@@ -0,0 +1,165 @@
+"""
+RTMS 웨어하우스 검증 스크립트 (API 호출 없음)
+
+1. 확정 파티션은 재조회하지 않고, 미확정 파티션은 TTL 경과 시에만 재조회하는지 확인
+2. API 실패 시 저장된 파티션으로 대체되는지 확인
+3. 월별 추이 쿼리
+
+사용법:
+    python test_rtms_warehouse.py
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import core.rtms_warehouse as rtms
+from core.rtms_warehouse import RTMSWarehouse, add_months, fetch_transactions, normalize_item, recent_months
+
+
+def _raw(umd: str, name: str, area: str, amount: str, month: int, cancelled: str = ""):
+    return {
+        "umdNm": umd, "aptNm": name, "excluUseAr": area, "floor": "7",
+        "dealYear": "2024", "dealMonth": str(month), "dealDay": "3",
+        "dealAmount": amount, "cdealType": cancelled,
+    }
+
+
+def test_normalize_item():
+    item = normalize_item({"dealAmount": " 82,500", "aptNm": " 래미안 ", "monthlyRent": "0", "deposit": None})
+    assert item["dealAmount"] == 82500
+    assert item["aptNm"] == "래미안"
+    assert item["monthlyRent"] == 0
+    assert item["deposit"] is None
+
+
+def test_month_helpers():
+    assert add_months("202401", -1) == "202312"
+    assert add_months("202312", 1) == "202401"
+    assert recent_months(3, datetime(2025, 2, 15)) == ["202502", "202501", "202412"]
+
+
+def test_freshness():
+    warehouse = RTMSWarehouse(":memory:", settle_months=3, ttl_minutes=60)
+    now = datetime(2025, 6, 10, 12, 0)
+
+    # 계약월 + 3개월 이후 동기화 → 확정
+    warehouse.write_partition("apt_trade", "11680", "202501", [], synced_at=datetime(2025, 4, 2))
+    assert warehouse.is_fresh("apt_trade", "11680", "202501", now)
+
+    # 당월 → TTL 내에서만 신선
+    warehouse.write_partition("apt_trade", "11680", "202506", [], synced_at=now - timedelta(minutes=30))
+    assert warehouse.is_fresh("apt_trade", "11680", "202506", now)
+    assert not warehouse.is_fresh("apt_trade", "11680", "202506", now + timedelta(hours=1))
+
+    assert warehouse.stale_months("apt_trade", "11680", ["202501", "202502"], now) == ["202502"]
+
+
+def test_fetch_uses_warehouse_first():
+    warehouse = RTMSWarehouse(":memory:")
+    months = recent_months(2)
+    calls = []
+
+    async def fake_fetch(property_type, lawd_cd, deal_ymd, api_key=None):
+        calls.append(deal_ymd)
+        return [normalize_item(_raw("역삼동", "래미안", "84.9", "150,000", int(deal_ymd[4:])))]
+
+    original = rtms.fetch_partition_from_api
+    rtms.fetch_partition_from_api = fake_fetch
+    try:
+        items = asyncio.run(fetch_transactions("apt_trade", "11680", months, warehouse=warehouse))
+        assert len(items) == 2 and items[0]["dealAmount"] == 150000
+        assert sorted(calls) == sorted(months)
+
+        # 두 번째 조회: 모두 TTL 이내 → API 호출 없음
+        calls.clear()
+        asyncio.run(fetch_transactions("apt_trade", "11680", months, warehouse=warehouse))
+        assert calls == []
+
+        # API 실패 → 저장된 데이터 사용
+        async def failing_fetch(*args, **kwargs):
+            raise RuntimeError("quota exceeded")
+
+        rtms.fetch_partition_from_api = failing_fetch
+        warehouse.ttl = timedelta(0)
+        items = asyncio.run(fetch_transactions("apt_trade", "11680", months, warehouse=warehouse))
+        assert len(items) == 2
+    finally:
+        rtms.fetch_partition_from_api = original
+
+
+class FakeClient:
+    """RTMS 클라이언트 대역 (응답을 순서대로 반환)"""
+    responses = []
+
+    def __init__(self, api_key=None):
+        pass
+
+    async def get_apt_trade_detail(self, **kwargs):
+        return self.responses.pop(0)
+
+
+def test_error_response_not_synced():
+    from core.data_go_kr import normalize_response, result_header
+
+    # 인증키 오류/호출 한도 초과: OpenAPI_ServiceResponse 오류 응답 (response/header 없음)
+    envelope = {"OpenAPI_ServiceResponse": {"cmmMsgHeader": {
+        "errMsg": "SERVICE ERROR", "returnAuthMsg": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+        "returnReasonCode": "22",
+    }}}
+    assert result_header(envelope) == ("22", "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR")
+    assert result_header({"response": {"header": {"resultCode": "000", "resultMsg": "OK"}}}) == ("000", "OK")
+
+    warehouse = RTMSWarehouse(":memory:")
+    original = rtms.RTMS_SOURCES["apt_trade"]
+    rtms.RTMS_SOURCES["apt_trade"] = rtms.RTMSSource(__name__, "FakeClient", "get_apt_trade_detail", "trade")
+    try:
+        # 오류 코드 → 예외, 파티션은 동기화되지 않은 상태 유지 (다음 조회에서 다시 시도)
+        FakeClient.responses = [{"header": {"resultCode": "30", "resultMsg": "SERVICE_KEY_IS_NOT_REGISTERED_ERROR"},
+                                 "body": {"items": [], "totalCount": 0}}]
+        try:
+            asyncio.run(rtms.sync_partition(warehouse, "apt_trade", "11680", "202401"))
+            raise AssertionError("오류 응답은 ValueError")
+        except ValueError as e:
+            assert "30" in str(e)
+        assert not warehouse.is_fresh("apt_trade", "11680", "202401")
+
+        # 데이터 없음(03)은 정상 0건 → 저장
+        FakeClient.responses = [normalize_response(
+            {"response": {"header": {"resultCode": "03", "resultMsg": "NO_DATA"}, "body": {"totalCount": "0"}}}
+        )]
+        assert asyncio.run(rtms.sync_partition(warehouse, "apt_trade", "11680", "202401")) == 0
+        assert warehouse.is_fresh("apt_trade", "11680", "202401")
+    finally:
+        rtms.RTMS_SOURCES["apt_trade"] = original
+
+
+def test_monthly_trend():
+    warehouse = RTMSWarehouse(":memory:")
+    for month, amounts in ((1, ["100,000", "110,000"]), (2, ["120,000"]), (3, ["130,000", "999,999"])):
+        items = [normalize_item(_raw("역삼동", "래미안", "80", a, month)) for a in amounts]
+        if month == 3:
+            items[1]["cdealType"] = "O"  # 해제 거래는 제외
+        warehouse.write_partition("apt_trade", "11680", f"2024{month:02d}", items)
+
+    trend = warehouse.monthly_trend("apt_trade", "11680", "202401", "202412", umd_nm="역삼동", name="래미안")
+    assert [row["deal_ymd"] for row in trend] == ["202401", "202402", "202403"]
+    assert trend[0]["median"] == 105000 and trend[0]["count"] == 2
+    assert trend[2]["count"] == 1 and trend[2]["price_per_m2"] == 1625.0
+
+
+if __name__ == "__main__":
+    test_normalize_item()
+    test_month_helpers()
+    print("[OK] 정규화 / 년월 계산")
+    test_freshness()
+    print("[OK] 확정/미확정 파티션 판정")
+    test_fetch_uses_warehouse_first()
+    print("[OK] 웨어하우스 우선 조회 + API 실패 시 저장 데이터 사용")
+    test_monthly_trend()
+    print("[OK] 월별 추이")
+    test_error_response_not_synced()
+    print("[OK] 오류 응답 → 파티션 미동기화")
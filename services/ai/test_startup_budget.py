@@ -0,0 +1,57 @@
+"""
+Cold start 예산 테스트
+
+1. `import app` 시간이 예산(STARTUP_BUDGET_MS, 기본 3000ms) 이내인지
+2. 무거운 모듈(LangChain, openai/anthropic SDK 등)이 시작 시 로드되지 않는지
+3. Dev/테스트 라우터가 설정 플래그로 꺼지는지
+
+사용법:
+    python test_startup_budget.py
+    STARTUP_BUDGET_MS=1500 python test_startup_budget.py
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scripts.startup_profile import LAZY_MODULES, SERVICE_ROOT, profile_imports, total_ms
+
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "3000"))
+RUNS = 3
+
+
+def test_startup_budget():
+    # 디스크 캐시 영향을 줄이기 위해 여러 번 측정 후 최솟값 사용
+    best = min(total_ms(profile_imports("app")) for _ in range(RUNS))
+    print(f"  import app: {best:,.0f}ms (예산 {STARTUP_BUDGET_MS:,.0f}ms)")
+    assert best <= STARTUP_BUDGET_MS, f"cold start 예산 초과: {best:,.0f}ms > {STARTUP_BUDGET_MS:,.0f}ms"
+
+
+def test_heavy_modules_lazy():
+    loaded = {t.module for t in profile_imports("app")}
+    eager = [m for m in LAZY_MODULES if m in loaded]
+    assert not eager, f"시작 시 로드됨 (첫 사용 시 import로 변경 필요): {eager}"
+
+
+def test_optional_routers_flag():
+    code = (
+        "import app; "
+        "paths = [r.path for r in app.app.routes]; "
+        "print(any(p.startswith('/dev') for p in paths), any(p.startswith('/api-tester') for p in paths))"
+    )
+    env = {**os.environ, "ENABLE_DEV_ROUTES": "false", "ENABLE_TEST_ROUTES": "false"}
+    result = subprocess.run([sys.executable, "-c", code], cwd=SERVICE_ROOT, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.split()[-2:] == ["False", "False"]
+
+
+if __name__ == "__main__":
+    test_heavy_modules_lazy()
+    print("[OK] 무거운 모듈 지연 로드")
+    test_optional_routers_flag()
+    print("[OK] Dev/테스트 라우터 플래그")
+    test_startup_budget()
+    print("[OK] cold start 예산")
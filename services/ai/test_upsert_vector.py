@@ -0,0 +1,235 @@
+"""
+벡터 DB diff 업서트 테스트 (ingest/upsert_vector.py, 가짜 벡터 스토어 - DB/임베딩 API 호출 없음)
+
+- 같은 문서 재업로드: 변경 없는 청크는 쓰기/임베딩 없음
+- 다른 문서에 같은 내용의 청크가 있으면 저장된 임베딩 재사용
+- 문서에서 사라진 청크 삭제, 남은 청크의 메타데이터는 이 컬렉션에서만 갱신
+- 임베딩 재시도: 일시적 오류만 (400 등 요청 오류는 즉시 실패)
+
+사용법:
+    python test_upsert_vector.py
+"""
+import sys
+import warnings
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from langchain_core.documents import Document
+from openai import BadRequestError, InternalServerError
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from langchain_community.vectorstores.pgvector import _get_embedding_collection_store
+
+import ingest.upsert_vector as upsert_vector
+from ingest.upsert_vector import _chunk_ids, _upsert_documents, chunk_hash
+
+EmbeddingStore, _ = _get_embedding_collection_store(3)
+COLLECTION_UUID = "collection-contracts"
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.0, 1.0] for text in texts]
+
+
+class FakeQuery:
+    def __init__(self, session):
+        self.session = session
+        self.filters = []
+
+    def filter(self, clause):
+        self.filters.append((clause.left.key, clause.right.value))  # column == 값
+        return self
+
+    def update(self, values, synchronize_session=None):
+        self.session.updates.append((self.filters, list(values.values())[0]))
+        return 1
+
+
+class FakeSession:
+    def __init__(self, store):
+        self.store = store
+        self.updates = store.updates
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def query(self, *entities):
+        return FakeQuery(self)
+
+    def commit(self):
+        pass
+
+
+class FakeCollection:
+    uuid = COLLECTION_UUID
+
+
+class FakeVectorStore:
+    """PGVector 대역: {custom_id: (내용, 임베딩, 메타데이터)}"""
+
+    EmbeddingStore = EmbeddingStore
+
+    def __init__(self):
+        self.rows = {}
+        self.embeddings = FakeEmbedder()
+        self.updates = []
+        self.deleted = []
+
+    def _make_session(self):
+        return FakeSession(self)
+
+    def get_collection(self, session):
+        return FakeCollection()
+
+    def delete(self, ids, collection_only=False):
+        assert collection_only
+        self.deleted.extend(ids)
+        for custom_id in ids:
+            self.rows.pop(custom_id, None)
+
+    def add_embeddings(self, texts, embeddings, metadatas, ids):
+        for text, embedding, metadata, custom_id in zip(texts, embeddings, metadatas, ids):
+            self.rows[custom_id] = (text, embedding, dict(metadata))
+
+
+def _fake_load(vectorstore, doc_id, hashes):
+    existing = {cid: dict(meta) for cid, (_, _, meta) in vectorstore.rows.items() if meta.get("doc_id") == doc_id}
+    vectors = {}
+    for _, embedding, meta in vectorstore.rows.values():
+        if meta.get("content_hash") in hashes:
+            vectors.setdefault(meta["content_hash"], list(embedding))
+    return existing, vectors
+
+
+def _documents(doc_id, chunks):
+    return [
+        Document(page_content=chunk, metadata={"doc_id": doc_id, "chunk_index": i, "chunk_total": len(chunks)})
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+def _run(store, doc_id, chunks):
+    return _upsert_documents(doc_id, _documents(doc_id, chunks), "v2_contract_docs")
+
+
+def _patched(test):
+    def wrapper():
+        store = FakeVectorStore()
+        invalidated = []
+        originals = (upsert_vector.get_vectorstore, upsert_vector._load_stored_chunks,
+                     upsert_vector.invalidate_retrieval_cache)
+        upsert_vector.get_vectorstore = lambda collection_name: store
+        upsert_vector._load_stored_chunks = _fake_load
+        upsert_vector.invalidate_retrieval_cache = invalidated.append
+        try:
+            test(store, invalidated)
+        finally:
+            (upsert_vector.get_vectorstore, upsert_vector._load_stored_chunks,
+             upsert_vector.invalidate_retrieval_cache) = originals
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+BOILERPLATE = "제1조 (목적) 본 계약은 임대인과 임차인 사이의 임대차 관계를 정한다."
+
+
+@_patched
+def test_unchanged_document_skips_everything(store, invalidated):
+    chunks = ["역삼동 123-45 아파트 전세 계약", "보증금 5억원, 계약기간 2년", BOILERPLATE]
+    report = _run(store, "doc-1", chunks)
+    assert (report.embedded, report.reused, report.unchanged, report.deleted) == (3, 0, 0, 0)
+    assert len(store.embeddings.calls) == 1 and len(store.rows) == 3
+
+    # 같은 문서 재업로드: 임베딩 호출 / 쓰기 / 캐시 무효화 없음
+    invalidated.clear()
+    report = _run(store, "doc-1", chunks)
+    assert (report.embedded, report.reused, report.unchanged, report.deleted) == (0, 0, 3, 0)
+    assert report.skipped == 3 and len(store.embeddings.calls) == 1
+    assert store.updates == [] and invalidated == []
+
+
+@_patched
+def test_reuses_stored_embeddings(store, invalidated):
+    _run(store, "doc-1", ["첫 번째 계약서 고유 내용", BOILERPLATE])
+    stored = next(emb for text, emb, _ in store.rows.values() if text == BOILERPLATE)
+
+    # 다른 문서의 같은 boilerplate 청크 (공백만 다름) → 저장된 임베딩 재사용
+    report = _run(store, "doc-2", ["두 번째 계약서 고유 내용", "  " + BOILERPLATE.replace(" ", "  ")])
+    assert (report.embedded, report.reused) == (1, 1)
+    assert store.embeddings.calls[-1] == ["두 번째 계약서 고유 내용"]
+    reused = [emb for _, emb, meta in store.rows.values() if meta["doc_id"] == "doc-2" and emb == stored]
+    assert len(reused) == 1
+
+
+@_patched
+def test_removed_chunks_deleted_and_metadata_scoped(store, invalidated):
+    _run(store, "doc-1", ["머리말", "삭제될 특약 조항", BOILERPLATE])
+    ids = _chunk_ids("doc-1", [chunk_hash(c) for c in ["머리말", "삭제될 특약 조항", BOILERPLATE]])
+
+    # 특약 조항 삭제 → 그 청크만 삭제, 남은 청크는 chunk_index/chunk_total이 바뀌어 메타데이터만 갱신
+    invalidated.clear()
+    report = _run(store, "doc-1", ["머리말", BOILERPLATE])
+    assert (report.embedded, report.unchanged, report.deleted) == (0, 2, 1)
+    assert store.deleted == [ids[1]] and ids[1] not in store.rows
+    assert invalidated == ["v2_contract_docs"]
+
+    assert len(store.updates) == 2
+    filters, metadata = store.updates[1]  # boilerplate (2 → 1)
+    assert metadata["chunk_index"] == 1 and metadata["chunk_total"] == 2
+    # 같은 custom_id가 다른 컬렉션에 있어도 이 컬렉션 행만 갱신
+    assert ("collection_id", COLLECTION_UUID) in filters and ("custom_id", ids[2]) in filters
+
+
+def test_embed_retry_only_transient():
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+
+    class Flaky:
+        def __init__(self, error):
+            self.error = error
+            self.calls = 0
+
+        def embed_documents(self, texts):
+            self.calls += 1
+            if self.calls == 1:
+                raise self.error
+            return [[0.0] for _ in texts]
+
+    original_wait = upsert_vector._embed_batch.retry.wait
+    upsert_vector._embed_batch.retry.wait = lambda retry_state: 0
+    try:
+        server_error = InternalServerError("502", response=httpx.Response(502, request=request), body=None)
+        flaky = Flaky(server_error)
+        assert upsert_vector._embed_batch(flaky, ["a"]) == [[0.0]] and flaky.calls == 2
+
+        bad_request = BadRequestError("input too long", response=httpx.Response(400, request=request), body=None)
+        flaky = Flaky(bad_request)
+        try:
+            upsert_vector._embed_batch(flaky, ["a"])
+            raise AssertionError("400은 재시도 없이 실패")
+        except BadRequestError:
+            assert flaky.calls == 1
+    finally:
+        upsert_vector._embed_batch.retry.wait = original_wait
+
+
+if __name__ == "__main__":
+    test_unchanged_document_skips_everything()
+    print("[OK] 변경 없는 문서 재업로드 → 임베딩/쓰기 없음")
+    test_reuses_stored_embeddings()
+    print("[OK] 같은 내용 청크 임베딩 재사용")
+    test_removed_chunks_deleted_and_metadata_scoped()
+    print("[OK] 사라진 청크 삭제 + 컬렉션 범위 메타데이터 갱신")
+    test_embed_retry_only_transient()
+    print("[OK] 일시적 오류만 재시도")
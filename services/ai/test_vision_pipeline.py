@@ -0,0 +1,91 @@
+"""
+다중 페이지 Vision 추출 파이프라인 검증 (API 호출 없음)
+
+1. 페이지 동시 처리 (동시 실행 수 제한)
+2. 실패 페이지만 개별 재시도
+3. 완료 순서와 무관하게 페이지 순서대로 병합
+
+사용법:
+    python test_vision_pipeline.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import core.vision as vision
+from core.vision import ContractPageMerger, _image_mime_type, aextract_contract_from_pages
+
+
+def _page(title: str, party: str, provision: str):
+    return {
+        "document_title": title,
+        "parties": [{"role": "임대인", "name": party}],
+        "special_provisions": [{"provision": provision}],
+    }
+
+
+def test_mime_sniffing():
+    assert _image_mime_type(b"\x89PNG\r\n\x1a\n...") == "image/png"
+    assert _image_mime_type(b"\xff\xd8\xff\xe0...") == "image/jpeg"
+    assert _image_mime_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+    assert _image_mime_type("scan/page_001.jpg") == "image/jpeg"
+
+
+def test_merger_keeps_page_order():
+    merger = ContractPageMerger(3)
+    merger.add(2, _page("p3", "김철수", "특약3"))
+    assert merger.merged is None  # 1페이지 대기
+    merger.add(0, _page("p1", "홍길동", "특약1"))
+    merger.add(1, None)  # 실패 페이지는 건너뜀
+    assert merger.merged["document_title"] == "p1"
+    assert [p["provision"] for p in merger.merged["special_provisions"]] == ["특약1", "특약3"]
+    assert [p["name"] for p in merger.merged["parties"]] == ["홍길동", "김철수"]
+
+
+def test_concurrent_pages_with_retry():
+    attempts = {}
+    active = 0
+    peak = 0
+
+    async def fake_extract(image, detail=None):
+        nonlocal active, peak
+        attempts[image] = attempts.get(image, 0) + 1
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0.2)
+            if image == b"page2" and attempts[image] == 1:
+                raise ValueError("Vision API 처리 실패: 429")
+            return _page(image.decode(), image.decode(), image.decode())
+        finally:
+            active -= 1
+
+    original = vision.aextract_contract_with_vision
+    vision.aextract_contract_with_vision = fake_extract
+    try:
+        pages = [f"page{i}".encode() for i in range(1, 7)]
+        start = time.perf_counter()
+        merged = asyncio.run(aextract_contract_from_pages(pages, max_concurrency=3, max_attempts=2))
+        elapsed = time.perf_counter() - start
+    finally:
+        vision.aextract_contract_with_vision = original
+
+    assert peak == 3
+    assert attempts[b"page2"] == 2 and attempts[b"page1"] == 1
+    assert merged["document_title"] == "page1"
+    assert [p["provision"] for p in merged["special_provisions"]] == [f"page{i}" for i in range(1, 7)]
+    # 순차 실행: 7회 × 0.2초 + 재시도 대기 ≥ 2.4초 / 동시 실행: 약 1.4~1.9초
+    assert elapsed < 2.2, f"pages ran sequentially ({elapsed:.2f}s)"
+
+
+if __name__ == "__main__":
+    test_mime_sniffing()
+    print("[OK] 이미지 버퍼 MIME 판별")
+    test_merger_keeps_page_order()
+    print("[OK] 페이지 순서 병합")
+    test_concurrent_pages_with_retry()
+    print("[OK] 동시 처리 + 페이지별 재시도")
@@ -0,0 +1,69 @@
+"""
+서비스 워밍업 테스트 (core/warmup.py)
+
+- 단계 병렬 실행 (총 소요 시간 ≈ 가장 느린 단계)
+- 상태 기록: ok / skipped / failed / timeout
+- 실패/타임아웃 단계가 있어도 준비 완료 (/ready 200)
+
+사용법:
+    python test_warmup.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.warmup import SkipStep, get_warmup_state, run_warmup
+
+
+def _sleep(seconds: float, detail: str = "done"):
+    def step():
+        time.sleep(seconds)
+        return detail
+    return step
+
+
+def _skip():
+    raise SkipStep("not configured")
+
+
+def _fail():
+    raise RuntimeError("boom")
+
+
+def test_statuses_and_readiness():
+    state = asyncio.run(run_warmup(
+        steps=[
+            ("ok", _sleep(0.05, "pool connected")),
+            ("skipped", _skip),
+            ("failed", _fail),
+            ("timeout", _sleep(1.0)),
+        ],
+        timeout_sec=0.2,
+    ))
+    statuses = {step.name: step.status for step in state.steps}
+    assert statuses == {"ok": "ok", "skipped": "skipped", "failed": "failed", "timeout": "timeout"}, statuses
+    assert state.steps[0].detail == "pool connected"
+    assert "RuntimeError" in state.steps[2].detail
+    assert state.ready, "실패/타임아웃 단계가 준비 완료를 막으면 안 됨"
+    assert get_warmup_state().to_dict()["ready"] is True
+
+
+def test_steps_run_in_parallel():
+    steps = [(f"step{i}", _sleep(0.3)) for i in range(4)]
+    start = time.perf_counter()
+    state = asyncio.run(run_warmup(steps=steps, timeout_sec=5))
+    elapsed = time.perf_counter() - start
+    assert all(step.status == "ok" for step in state.steps)
+    assert elapsed < 0.9, f"병렬 실행이면 ~0.3s (순차 1.2s): {elapsed:.2f}s"
+    assert all(step.duration_ms >= 300 for step in state.steps)
+
+
+if __name__ == "__main__":
+    test_statuses_and_readiness()
+    print("[OK] 단계 상태 기록 / 실패해도 준비 완료")
+    test_steps_run_in_parallel()
+    print("[OK] 단계 병렬 실행")